@@ -4,12 +4,16 @@ Muscle fatigue analytics and progressive overload endpoints
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from typing import List, Optional, Dict, Any, Tuple
-from datetime import datetime, date, timedelta
+from typing import List, Literal, Optional, Dict, Any, Tuple
+from datetime import datetime, date, timedelta, timezone
 from decimal import Decimal
 from uuid import UUID
+import asyncio
 import logging
 import json
+import time
+
+import numpy as np
 
 from app.core.dependencies import get_current_user, get_database, PaginationParams
 from app.core.database import DatabaseManager
@@ -17,6 +21,12 @@ from app.models.schemas import (
     MuscleState, MuscleStateCreate, MuscleStateUpdate,
     User, WorkoutType, Exercise
 )
+from app.services.progression import (
+    STATUS_LABELS,
+    TREND_WINDOW_SESSIONS,
+    analyze_progression,
+    load_set_history
+)
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -110,7 +120,8 @@ async def calculate_muscle_fatigue_from_workouts(
         user_id,
         start_date,
         target_date,
-        fetch_all=True
+        fetch=True,
+        read_only=True
     )
     
     # Calculate fatigue per muscle
@@ -393,7 +404,8 @@ async def get_workout_recommendations(
         GROUP BY ws.exercise_id, e.name, e.muscle_engagement, e.category, e.equipment, e.difficulty
         """,
         UUID(user_id),
-        fetch_all=True
+        fetch=True,
+        read_only=True
     )
     
     # Build recommendations
@@ -484,7 +496,8 @@ async def get_workout_recommendations(
         LIMIT 1
         """,
         UUID(user_id),
-        fetch_one=True
+        fetch_one=True,
+        read_only=True
     )
     
     next_variation = 'B' if last_workout_variation and last_workout_variation['variation'] == 'A' else 'A'
@@ -560,7 +573,8 @@ async def get_progress_analytics(
         volume_query,
         UUID(user_id),
         start_date,
-        fetch_all=True
+        fetch=True,
+        read_only=True
     )
     
     # Get strength progression by exercise
@@ -588,7 +602,8 @@ async def get_progress_analytics(
         strength_query,
         UUID(user_id),
         start_date,
-        fetch_all=True
+        fetch=True,
+        read_only=True
     )
     
     # Get personal records
@@ -613,7 +628,8 @@ async def get_progress_analytics(
     personal_records = await db.execute_query(
         pr_query,
         UUID(user_id),
-        fetch_all=True
+        fetch=True,
+        read_only=True
     )
     
     # Calculate progress metrics
@@ -716,6 +732,85 @@ async def get_progress_analytics(
     }
 
 
+@router.get("/plateaus")
+async def get_strength_plateaus(
+    exercise_id: Optional[str] = Query(None, description="Analyze one exercise instead of all"),
+    formula: Literal["epley", "brzycki"] = Query("epley", description="e1RM formula"),
+    window: int = Query(TREND_WINDOW_SESSIONS, ge=3, le=20, description="Sessions per rolling trend fit"),
+    include_sessions: bool = Query(False, description="Include the per-session e1RM series"),
+    current_user: User = Depends(get_current_user),
+    db: DatabaseManager = Depends(get_database)
+):
+    """
+    Detect strength plateaus and regressions from estimated 1RM trends
+    
+    **Per exercise:**
+    - Best e1RM of each session (Epley by default, Brzycki optional)
+    - Least-squares slope over the last `window` sessions, as % of e1RM per week
+    - Status: progressing, plateau (< 0.5%/week), regression (<= -1%/week),
+      or insufficient_data (fewer than 4 sessions)
+    
+    **Returns:** Exercises needing attention first, regressions before plateaus
+    """
+    history = await load_set_history(db, current_user.id, exercise_id)
+    
+    started = time.perf_counter()
+    # CPU-bound numpy work; on a worker thread so other requests keep being served
+    analysis = await asyncio.to_thread(
+        analyze_progression,
+        history["exercise_idx"], history["session_day"], history["weight"], history["reps"],
+        formula=formula, window=window
+    )
+    logger.info("🔧 Progression analysis computed", extra={
+        "sets": int(history["weight"].size),
+        "exercises": int(analysis.exercise_index.size),
+        "engine_ms": round((time.perf_counter() - started) * 1000, 2)
+    })
+    
+    def to_date(day: float) -> str:
+        return datetime.fromtimestamp(day * 86400.0, tz=timezone.utc).date().isoformat()
+    
+    def rounded(value: float) -> Optional[float]:
+        return None if np.isnan(value) else round(float(value), 2)
+    
+    exercises = []
+    for i, idx in enumerate(analysis.exercise_index):
+        entry = {
+            "exercise_id": str(history["exercise_ids"][idx]),
+            "exercise_name": history["exercise_names"][idx],
+            "status": STATUS_LABELS[analysis.current_status[i]],
+            "sessions": int(analysis.session_count[i]),
+            "current_e1rm": rounded(analysis.current_e1rm[i]),
+            "best_e1rm": rounded(analysis.best_e1rm[i]),
+            "slope_pct_per_week": rounded(analysis.current_slope_pct_per_week[i]),
+            "sessions_since_best": int(analysis.sessions_since_best[i]),
+            "last_session_date": to_date(analysis.last_session_day[i])
+        }
+        if include_sessions:
+            in_exercise = np.flatnonzero(analysis.session_exercise == idx)
+            entry["history"] = [
+                {
+                    "date": to_date(analysis.session_day[j]),
+                    "best_e1rm": rounded(analysis.session_best_e1rm[j]),
+                    "slope_pct_per_week": rounded(analysis.slope_pct_per_week[j]),
+                    "status": STATUS_LABELS[analysis.status[j]]
+                }
+                for j in in_exercise
+            ]
+        exercises.append(entry)
+    
+    attention_order = {"regression": 0, "plateau": 1, "progressing": 2, "insufficient_data": 3}
+    exercises.sort(key=lambda e: (attention_order[e["status"]], e["slope_pct_per_week"] or 0.0))
+    
+    return {
+        "formula": formula,
+        "window_sessions": window,
+        "sets_analyzed": int(history["weight"].size),
+        "summary": {label: sum(1 for e in exercises if e["status"] == label) for label in STATUS_LABELS},
+        "exercises": exercises
+    }
+
+
 @router.get("/muscle-heatmap/{user_id}")
 async def get_muscle_heatmap_data(
     user_id: str,
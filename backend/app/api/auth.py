@@ -10,6 +10,7 @@ All authentication operations use secure patterns and proper validation
 import logging
 from typing import Dict, Any, Optional
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.security import HTTPAuthorizationCredentials
 from pydantic import BaseModel, Field, EmailStr
 from datetime import datetime
 
@@ -17,9 +18,12 @@ from datetime import datetime
 from ..core.auth import (
     get_current_user, 
     get_auth_service, 
+    security,
     AuthenticationError,
     AuthorizationError
 )
+from ..core.cache import auth_cache
+from ..core.exceptions import ExternalServiceError
 from ..services.auth import AuthService
 
 logger = logging.getLogger(__name__)
@@ -90,7 +94,7 @@ async def login(
     SECURITY: Uses Supabase Auth for credential validation
     SCHEMA: Returns user data from verified users table structure
     """
-    logger.info(f"🔥 login ENTRY - email: {login_data.email}")
+    logger.info("🔥 login ENTRY - email: %s", login_data.email)
     
     try:
         # Authenticate user with Supabase
@@ -128,7 +132,7 @@ async def login(
             user=user_profile
         )
         
-    except HTTPException:
+    except (HTTPException, ExternalServiceError):
         raise
     except Exception as e:
         logger.error(f"🚨 login ERROR: {str(e)}")
@@ -145,19 +149,20 @@ async def login(
 
 @router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
 async def logout(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
     current_user: Dict[str, Any] = Depends(get_current_user),
     auth_service: AuthService = Depends(get_auth_service)
 ):
     """
     User logout and session invalidation
     
-    SECURITY: Invalidates Supabase session for complete logout
+    SECURITY: Drops the cached token and profile and refuses the token until
+    it expires. The denylist is per worker process, like the auth cache.
     """
-    logger.info(f"🔥 logout ENTRY - user: {current_user.get('id')}")
+    logger.info("🔥 logout ENTRY - user: %s", current_user.get('id'))
     
     try:
-        # Note: In a real implementation, you might want to maintain a token blacklist
-        # For now, we'll just log the logout action
+        auth_cache.revoke_token(credentials.credentials, current_user.get("id"))
         
         logger.info(f"🔧 User logged out successfully: {current_user.get('id')}")
         
@@ -211,7 +216,7 @@ async def refresh_token(
             expires_in=expires_in
         )
         
-    except HTTPException:
+    except (HTTPException, ExternalServiceError):
         raise
     except Exception as e:
         logger.error(f"🚨 refresh_token ERROR: {str(e)}")
@@ -228,7 +233,7 @@ async def get_current_user_profile(
     SECURITY: Uses authenticated user context
     SCHEMA: Returns data from verified users table structure
     """
-    logger.info(f"🔥 get_current_user_profile ENTRY - user: {current_user.get('id')}")
+    logger.info("🔥 get_current_user_profile ENTRY - user: %s", current_user.get('id'))
     
     try:
         # Convert database result to response model
@@ -270,11 +275,11 @@ async def signup(
     SECURITY: Uses Supabase Auth for secure user creation
     SCHEMA: Creates profile in verified users table structure
     """
-    logger.info(f"🔥 signup ENTRY - email: {signup_data.email}")
+    logger.info("🔥 signup ENTRY - email: %s", signup_data.email)
     
     try:
         # Create user with Supabase Auth
-        auth_response = auth_service.supabase.auth.sign_up({
+        auth_response = await auth_service.supabase.sign_up({
             "email": signup_data.email,
             "password": signup_data.password
         })
@@ -328,7 +333,7 @@ async def signup(
             user=user_profile
         )
         
-    except HTTPException:
+    except (HTTPException, ExternalServiceError):
         raise
     except Exception as e:
         logger.error(f"🚨 signup ERROR: {str(e)}")
@@ -356,7 +361,7 @@ async def validate_token(
     
     SECURITY: Simple endpoint to check if token is valid
     """
-    logger.info(f"🔥 validate_token ENTRY - user: {current_user.get('id')}")
+    logger.info("🔥 validate_token ENTRY - user: %s", current_user.get('id'))
     
     return {
         "valid": True,
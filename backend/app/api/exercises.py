@@ -3,7 +3,7 @@ FitForge Exercise Library API Endpoints
 Created: December 21, 2024
 Purpose: CRUD operations for exercise database with filtering and search
 
-CRITICAL: Uses exact Pydantic models from schemas/pydantic-models.py
+CRITICAL: Uses exact Pydantic models from app/models/pydantic_models.py
 All database operations follow schema-first development approach
 """
 
@@ -82,8 +82,8 @@ async def get_exercises(
     SECURITY: Uses parameterized queries to prevent SQL injection
     SCHEMA: Uses only verified database columns from exercises table
     """
-    logger.info(f"🔥 get_exercises ENTRY - inputs: category={category}, difficulty={difficulty}, "
-                f"equipment={equipment}, muscle_group={muscle_group}, limit={limit}")
+    logger.info("🔥 get_exercises ENTRY - inputs: category=%s, difficulty=%s, equipment=%s, muscle_group=%s, limit=%s",
+                category, difficulty, equipment, muscle_group, limit)
     
     try:
         # Build safe parameterized query using verified schema columns
@@ -145,10 +145,10 @@ async def get_exercises(
         # Add pagination parameters
         params.extend([limit, offset])
         
-        logger.info(f"🔧 QUERY_BUILD RESULT: {query[:200]}... with {len(params)} params")
+        logger.info("🔧 QUERY_BUILD RESULT: %.200s... with %d params", query, len(params))
         
         # Execute query using dependency injection
-        results = await db.execute_query(query, *params, fetch=True)
+        results = await db.execute_query(query, *params, fetch=True, read_only=True)
         
         # Convert database results to Pydantic models
         exercises = []
@@ -161,7 +161,7 @@ async def get_exercises(
                     logger.warning(f"Failed to convert exercise row to model: {e}")
                     continue
         
-        logger.info(f"🔧 QUERY_RESULT: Retrieved {len(exercises)} exercises")
+        logger.debug("🔧 QUERY_RESULT: Retrieved %d exercises", len(exercises))
         return exercises
         
     except Exception as e:
@@ -197,7 +197,7 @@ async def search_exercises(
     SECURITY: Uses parameterized queries to prevent SQL injection
     SCHEMA: Uses only verified database columns from exercises table
     """
-    logger.info(f"🔥 search_exercises ENTRY - query: {q}, limit: {limit}")
+    logger.info("🔥 search_exercises ENTRY - query: %s, limit: %s", q, limit)
     
     try:
         # Prepare search term for case-insensitive matching
@@ -242,9 +242,9 @@ async def search_exercises(
         
         params = [True, search_term, q, limit]
         
-        logger.info(f"🔧 Executing search query for: {q}")
+        logger.debug("🔧 Executing search query for: %s", q)
         
-        results = await db.execute_query(query, *params, fetch=True)
+        results = await db.execute_query(query, *params, fetch=True, read_only=True)
         
         # Convert to Pydantic models
         exercises = []
@@ -257,7 +257,7 @@ async def search_exercises(
                     logger.warning(f"Failed to convert exercise row to model: {e}")
                     continue
         
-        logger.info(f"🔧 Search returned {len(exercises)} results for query: {q}")
+        logger.debug("🔧 Search returned %d results for query: %s", len(exercises), q)
         
         return exercises
         
@@ -285,7 +285,7 @@ async def get_exercise(
     SECURITY: Uses parameterized query for security
     SCHEMA: Uses only verified database columns
     """
-    logger.info(f"🔥 get_exercise ENTRY - exercise_id: {exercise_id}")
+    logger.info("🔥 get_exercise ENTRY - exercise_id: %s", exercise_id)
     
     try:
         # Parameterized query using verified schema columns only
@@ -301,10 +301,8 @@ async def get_exercise(
         
         params = [exercise_id, True]
         
-        logger.info(f"🔧 QUERY_EXECUTE: {query[:100]}... with params: {params}")
-        
         # Execute query using dependency injection
-        result = await db.execute_query(query, *params, fetch_one=True)
+        result = await db.execute_query(query, *params, fetch_one=True, read_only=True)
         
         if not result:
             raise HTTPException(
@@ -320,7 +318,7 @@ async def get_exercise(
         # Convert to Pydantic model
         try:
             exercise = Exercise(**result)
-            logger.info(f"🔧 QUERY_SUCCESS: Retrieved exercise {exercise_id}")
+            logger.debug("🔧 QUERY_SUCCESS: Retrieved exercise %s", exercise_id)
             return exercise
         except Exception as e:
             logger.error(f"🚨 MODEL_CONVERSION_ERROR: {str(e)}")
@@ -360,7 +358,7 @@ async def create_exercise(
     SECURITY: Uses parameterized queries to prevent SQL injection
     SCHEMA: Uses only verified database columns from exercises table
     """
-    logger.info(f"🔥 create_exercise ENTRY - name: {exercise.name}, category: {exercise.category}")
+    logger.info("🔥 create_exercise ENTRY - name: %s, category: %s", exercise.name, exercise.category)
     
     try:
         # Verify exercise ID doesn't already exist
@@ -384,7 +382,7 @@ async def create_exercise(
         
         current_time = datetime.utcnow()
         
-        logger.info(f"🔧 Creating exercise: {exercise.id}")
+        logger.info("🔧 Creating exercise: %s", exercise.id)
         
         # Insert exercise record using parameterized query with exact column names
         insert_query = """
@@ -421,7 +419,7 @@ async def create_exercise(
             fetch_one=True
         )
         
-        logger.info(f"🔧 Exercise created successfully: {exercise.id}")
+        logger.info("🔧 Exercise created successfully: %s", exercise.id)
         
         # Convert to Pydantic model
         return Exercise(**created_exercise)
@@ -453,7 +451,7 @@ async def update_exercise(
     SECURITY: Uses parameterized queries to prevent SQL injection
     SCHEMA: Uses only verified database columns from exercises table
     """
-    logger.info(f"🔥 update_exercise ENTRY - exercise_id: {exercise_id}")
+    logger.info("🔥 update_exercise ENTRY - exercise_id: %s", exercise_id)
     
     try:
         # First verify exercise exists
@@ -496,7 +494,7 @@ async def update_exercise(
                 }
             )
         
-        logger.info(f"🔧 Update fields provided: {list(update_data.keys())}")
+        logger.debug("🔧 Update fields provided: %s", list(update_data.keys()))
         
         # Build update query dynamically
         for field, value in update_data.items():
@@ -520,7 +518,7 @@ async def update_exercise(
             RETURNING *
         """
         
-        logger.info(f"🔧 Executing update with {len(update_fields)} fields")
+        logger.info("🔧 Executing update with %d fields", len(update_fields))
         
         updated_exercise = await db.execute_query(
             update_query,
@@ -528,7 +526,7 @@ async def update_exercise(
             fetch_one=True
         )
         
-        logger.info(f"🔧 Exercise updated successfully: {exercise_id}")
+        logger.info("🔧 Exercise updated successfully: %s", exercise_id)
         
         # Convert to Pydantic model
         return Exercise(**updated_exercise)
@@ -560,7 +558,7 @@ async def delete_exercise(
     SECURITY: Uses parameterized queries to prevent SQL injection
     SCHEMA: Uses only verified database columns from exercises table
     """
-    logger.info(f"🔥 delete_exercise ENTRY - exercise_id: {exercise_id}")
+    logger.info("🔥 delete_exercise ENTRY - exercise_id: %s", exercise_id)
     
     try:
         # First verify exercise exists and is active
@@ -622,7 +620,7 @@ async def delete_exercise(
         
         current_time = datetime.utcnow()
         
-        logger.info(f"🔧 Soft deleting exercise: {exercise_id}")
+        logger.info("🔧 Soft deleting exercise: %s", exercise_id)
         
         # Perform soft delete by setting is_active to false
         delete_query = """
@@ -638,7 +636,7 @@ async def delete_exercise(
             exercise_id
         )
         
-        logger.info(f"🔧 Exercise soft deleted successfully: {exercise_id}")
+        logger.info("🔧 Exercise soft deleted successfully: %s", exercise_id)
         
         # Return 204 No Content on successful deletion
         return None
@@ -669,7 +667,7 @@ async def get_exercise_muscle_engagement(
     SECURITY: Uses parameterized queries to prevent SQL injection
     SCHEMA: Uses only verified database columns from exercises table
     """
-    logger.info(f"🔥 get_exercise_muscle_engagement ENTRY - exercise_id: {exercise_id}")
+    logger.info("🔥 get_exercise_muscle_engagement ENTRY - exercise_id: %s", exercise_id)
     
     try:
         # Get exercise with muscle engagement data
@@ -685,7 +683,8 @@ async def get_exercise_muscle_engagement(
             query,
             exercise_id,
             True,
-            fetch_one=True
+            fetch_one=True,
+            read_only=True
         )
         
         if not result:
@@ -718,7 +717,7 @@ async def get_exercise_muscle_engagement(
         secondary_engagement = {k: v for k, v in sorted_muscles if 20 <= v < 50}
         stabilizer_engagement = {k: v for k, v in sorted_muscles if 0 < v < 20}
         
-        logger.info(f"🔧 Muscle engagement data retrieved for: {exercise_id}")
+        logger.debug("🔧 Muscle engagement data retrieved for: %s", exercise_id)
         
         return {
             "exercise_id": result['id'],
@@ -781,16 +780,14 @@ async def get_exercise_categories(
         query = "SELECT DISTINCT category FROM exercises WHERE is_active = $1 ORDER BY category"
         params = [True]
         
-        logger.info(f"🔧 CATEGORIES_QUERY: {query} with params: {params}")
-        
         # Execute query using dependency injection
-        results = await db.execute_query(query, *params, fetch=True)
+        results = await db.execute_query(query, *params, fetch=True, read_only=True)
         
         categories = []
         if results:
             categories = [row['category'] for row in results]
         
-        logger.info(f"🔧 CATEGORIES_RESULT: Retrieved {len(categories)} categories")
+        logger.debug("🔧 CATEGORIES_RESULT: Retrieved %d categories", len(categories))
         return categories
         
     except Exception as e:
@@ -822,16 +819,14 @@ async def get_equipment_types(
         query = "SELECT DISTINCT equipment FROM exercises WHERE is_active = $1 ORDER BY equipment"
         params = [True]
         
-        logger.info(f"🔧 EQUIPMENT_QUERY: {query} with params: {params}")
-        
         # Execute query using dependency injection
-        results = await db.execute_query(query, *params, fetch=True)
+        results = await db.execute_query(query, *params, fetch=True, read_only=True)
         
         equipment_types = []
         if results:
             equipment_types = [row['equipment'] for row in results]
         
-        logger.info(f"🔧 EQUIPMENT_RESULT: Retrieved {len(equipment_types)} equipment types")
+        logger.debug("🔧 EQUIPMENT_RESULT: Retrieved %d equipment types", len(equipment_types))
         return equipment_types
         
     except Exception as e:
@@ -877,16 +872,14 @@ async def get_target_muscles(
         
         params = [True]
         
-        logger.info(f"🔧 MUSCLES_QUERY: {query[:100]}... with params: {params}")
-        
         # Execute query using dependency injection
-        results = await db.execute_query(query, *params, fetch=True)
+        results = await db.execute_query(query, *params, fetch=True, read_only=True)
         
         muscles = []
         if results:
             muscles = [row['muscle_name'] for row in results]
         
-        logger.info(f"🔧 MUSCLES_RESULT: Retrieved {len(muscles)} target muscles")
+        logger.debug("🔧 MUSCLES_RESULT: Retrieved %d target muscles", len(muscles))
         return muscles
         
     except Exception as e:
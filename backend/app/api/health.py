@@ -4,19 +4,30 @@ Provides health and readiness endpoints for monitoring
 """
 
 import asyncio
+import hmac
 import logging
 import time
 from datetime import datetime
-from typing import Dict, Any
+from typing import Awaitable, Callable, Dict, Any, Optional, Sequence
 
-from fastapi import APIRouter, status, HTTPException, Depends
+from fastapi import APIRouter, status, HTTPException, Depends, Header, Response
 from pydantic import BaseModel
 
+from app.core.cache import TTLCache
 from app.core.config import get_settings
+from app.core.database import db_manager
+from app.core.metrics import registry
+from app.core.redis_client import redis_manager
 
 logger = logging.getLogger("fitforge.api.health")
 router = APIRouter()
 
+HEALTH_PROBE_DURATION = registry.histogram(
+    "fitforge_health_probe_duration_seconds",
+    "Dependency probe latency by probe and result; cached results are not observed",
+    ["probe", "status"]
+)
+
 
 class HealthResponse(BaseModel):
     """Health check response model"""
@@ -40,90 +51,150 @@ _start_time = time.time()
 
 async def check_database() -> Dict[str, Any]:
     """
-    Check database connectivity
+    Check database connectivity with a round trip through the primary pool
     
     Returns:
         Database health check result
     """
-    try:
-        # TODO: Implement actual database connectivity check
-        # For now, simulate a database check
-        await asyncio.sleep(0.01)  # Simulate DB query
-        
-        return {
-            "status": "healthy",
-            "response_time_ms": 10.5,
-            "details": "Connected to PostgreSQL"
-        }
-    except Exception as exc:
-        logger.error(f"Database health check failed: {exc}")
+    pool = db_manager.pool
+    if pool is None:
         return {
             "status": "unhealthy",
-            "error": str(exc),
-            "details": "Database connection failed"
+            "details": "Database pool not initialized"
         }
+    
+    async with pool.acquire() as conn:
+        await conn.fetchval("SELECT 1")
+    
+    return {
+        "status": "healthy",
+        "details": "Connected to PostgreSQL",
+        "pool_size": pool.get_size(),
+        "pool_idle": pool.get_idle_size()
+    }
 
 
 async def check_redis() -> Dict[str, Any]:
     """
-    Check Redis connectivity (if configured)
+    Check Redis connectivity (if configured) with a PING on the shared pool
     
     Returns:
         Redis health check result
     """
-    settings = get_settings()
-    
-    if not settings.REDIS_URL:
+    if redis_manager.client is None:
         return {
             "status": "not_configured",
             "details": "Redis not configured"
         }
     
-    try:
-        # TODO: Implement actual Redis connectivity check
-        await asyncio.sleep(0.005)  # Simulate Redis ping
-        
-        return {
-            "status": "healthy",
-            "response_time_ms": 5.2,
-            "details": "Redis connection successful"
-        }
-    except Exception as exc:
-        logger.error(f"Redis health check failed: {exc}")
-        return {
-            "status": "unhealthy",
-            "error": str(exc),
-            "details": "Redis connection failed"
-        }
+    await redis_manager.client.ping()
+    
+    return {
+        "status": "healthy",
+        "details": "Redis connection successful"
+    }
 
 
 async def check_external_apis() -> Dict[str, Any]:
     """
     Check external API dependencies
     
+    Supabase is probed with a one-row REST query. OpenAI is only reported
+    as configured or not; probing it would spend API quota on every poll.
+    
     Returns:
         External APIs health check result
     """
-    try:
-        # TODO: Implement actual external API checks
-        # For now, simulate checks
-        await asyncio.sleep(0.02)
-        
-        return {
-            "status": "healthy",
-            "services": {
-                "supabase": "healthy",
-                "openai": "not_configured"
-            },
-            "details": "All configured external services are healthy"
-        }
-    except Exception as exc:
-        logger.error(f"External APIs health check failed: {exc}")
+    settings = get_settings()
+    services = {"openai": "configured" if settings.OPENAI_API_KEY else "not_configured"}
+    
+    if db_manager.supabase is None:
+        services["supabase"] = "not_configured"
+    else:
+        services["supabase"] = "healthy" if await db_manager.supabase.health_check() else "unhealthy"
+    
+    if services["supabase"] == "unhealthy":
         return {
             "status": "unhealthy",
-            "error": str(exc),
+            "services": services,
             "details": "One or more external services are unhealthy"
         }
+    return {
+        "status": "healthy",
+        "services": services,
+        "details": "All configured external services are healthy"
+    }
+
+
+PROBES: Dict[str, Callable[[], Awaitable[Dict[str, Any]]]] = {
+    "database": check_database,
+    "redis": check_redis,
+    "external_apis": check_external_apis
+}
+
+# Probes that must pass for /ready; Redis is optional (the app runs without it)
+READINESS_PROBES = ("database",)
+
+
+class ProbeCache:
+    """
+    Probe results shared by every caller for HEALTH_CACHE_SECONDS
+    
+    Orchestrators poll /ready and / every few seconds per replica. Within
+    the cache window they get the last result; a probe already in flight is
+    awaited rather than started again, so a burst of polls costs one
+    Postgres query and one Redis PING.
+    """
+    
+    def __init__(self):
+        self._results: TTLCache[Dict[str, Any]] = TTLCache(len(PROBES), get_settings().monitoring.HEALTH_CACHE_SECONDS)
+        self._inflight: Dict[str, "asyncio.Future[Dict[str, Any]]"] = {}
+    
+    async def get(self, name: str) -> Dict[str, Any]:
+        """Cached result of probe name, probing when it has expired"""
+        result = self._results.get(name)
+        if result is not None:
+            return result
+        
+        inflight = self._inflight.get(name)
+        if inflight is None:
+            inflight = asyncio.ensure_future(self._probe(name))
+            self._inflight[name] = inflight
+            inflight.add_done_callback(lambda _: self._inflight.pop(name, None))
+        # A caller that disconnects does not cancel the probe other callers share
+        return await asyncio.shield(inflight)
+    
+    async def _probe(self, name: str) -> Dict[str, Any]:
+        timeout = get_settings().monitoring.HEALTH_PROBE_TIMEOUT_SECONDS
+        started = time.perf_counter()
+        try:
+            result = await asyncio.wait_for(PROBES[name](), timeout)
+        except asyncio.TimeoutError:
+            logger.error(f"{name} health check timed out after {timeout:g}s")
+            result = {"status": "unhealthy", "error": f"Timed out after {timeout:g}s"}
+        except Exception as exc:
+            logger.error(f"{name} health check failed: {exc}")
+            result = {"status": "unhealthy", "error": str(exc)}
+        
+        elapsed = time.perf_counter() - started
+        HEALTH_PROBE_DURATION.observe(elapsed, (name, result["status"]))
+        result["response_time_ms"] = round(elapsed * 1000, 2)
+        result["checked_at"] = datetime.now()
+        self._results.set(name, result)
+        return result
+    
+    def clear(self) -> None:
+        self._results.clear()
+
+
+# Global probe cache instance
+probe_cache = ProbeCache()
+
+
+async def run_checks(names: Sequence[str]) -> Dict[str, Dict[str, Any]]:
+    """Results of the named probes, run concurrently"""
+    results = await asyncio.gather(*(probe_cache.get(name) for name in names))
+    return dict(zip(names, results))
 
 
 @router.get("/", response_model=HealthResponse)
@@ -134,12 +205,8 @@ async def health_check(settings = Depends(get_settings)):
     """
     uptime = time.time() - _start_time
     
-    # Perform health checks
-    checks = {
-        "database": await check_database(),
-        "redis": await check_redis(),
-        "external_apis": await check_external_apis()
-    }
+    # Perform health checks (concurrently, cached for HEALTH_CACHE_SECONDS)
+    checks = await run_checks(list(PROBES))
     
     # Determine overall status
     overall_status = "healthy"
@@ -164,15 +231,12 @@ async def readiness_check():
     Readiness check endpoint for Kubernetes/container orchestration
     Returns whether the application is ready to serve traffic
     """
-    checks = {
-        "database": await check_database(),
-        "redis": await check_redis()
-    }
+    checks = await run_checks(["database", "redis"])
     
     # Application is ready if critical services are healthy
     is_ready = all(
-        check.get("status") in ["healthy", "not_configured"]
-        for check in checks.values()
+        checks[name].get("status") in ["healthy", "not_configured"]
+        for name in READINESS_PROBES
     )
     
     if not is_ready:
@@ -199,23 +263,56 @@ async def liveness_check():
     }
 
 
-@router.get("/metrics")
-async def metrics():
+@router.get("/jobs")
+async def job_queue_metrics():
     """
-    Basic metrics endpoint
-    Returns application metrics for monitoring
+    Background job queue metrics
+    Returns the database backlog and recent queue wait / run latency of this process
     """
-    uptime = time.time() - _start_time
+    from app.core.jobs import job_queue
     
-    # TODO: Implement actual metrics collection
-    # This could include database connection pool stats,
-    # request counts, response times, etc.
+    try:
+        backlog = await job_queue.backlog()
+    except Exception as exc:
+        logger.error(f"Job backlog check failed: {exc}")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Job backlog unavailable"
+        )
     
     return {
-        "uptime_seconds": uptime,
-        "memory_usage": "N/A",  # TODO: Implement memory tracking
-        "cpu_usage": "N/A",     # TODO: Implement CPU tracking
-        "active_connections": "N/A",  # TODO: Implement connection tracking
-        "request_count": "N/A",  # TODO: Implement request counting
-        "error_count": "N/A"     # TODO: Implement error counting
-    }
\ No newline at end of file
+        "workers_running": job_queue.running,
+        "backlog": backlog,
+        "latency": job_queue.latency(),
+        "timestamp": datetime.now()
+    }
+
+
+@router.get("/metrics", response_class=Response)
+async def metrics(authorization: Optional[str] = Header(default=None)):
+    """
+    Prometheus metrics endpoint
+    Request latency, database and Redis pools, caches, event-loop lag and
+    process stats in text exposition format. When MONITORING_METRICS_TOKEN
+    is set, scrapers must send it as a bearer token.
+    """
+    from app.core.metrics import CONTENT_TYPE, registry
+    from app.core import monitoring  # noqa: F401 - registers the collectors
+    
+    settings = get_settings()
+    if not settings.monitoring.ENABLE_METRICS:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Metrics are disabled")
+    
+    token = settings.monitoring.METRICS_TOKEN
+    if token is not None:
+        scheme, _, supplied = (authorization or "").partition(" ")
+        if scheme.lower() != "bearer" or not hmac.compare_digest(
+            supplied.encode(), token.get_secret_value().encode()
+        ):
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid metrics token",
+                headers={"WWW-Authenticate": "Bearer"}
+            )
+    
+    return Response(content=registry.render(), media_type=CONTENT_TYPE)
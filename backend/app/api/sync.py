@@ -0,0 +1,435 @@
+"""
+Sync API Router
+Idempotent replay of offline client writes (workouts, sets and completions)
+
+The frontend buffers sessions locally while offline. On reconnect it posts its
+whole queue here; every operation carries an idempotency key so replays of an
+already-applied operation return the stored result instead of writing twice.
+"""
+
+import json
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, Literal, Optional, Tuple
+from uuid import UUID, uuid4
+
+import asyncpg
+from fastapi import APIRouter, Depends, HTTPException, status
+from pydantic import BaseModel, Field, ValidationError
+
+from app.core.database import DatabaseManager, get_database
+from app.core.dependencies import get_current_user
+from app.models.schemas import User, WorkoutCreate, WorkoutSetCreate
+from app.core.jobs import job_queue
+from app.services.workout_jobs import queue_post_completion_jobs
+from app.services.set_metrics import epley_one_rep_max, improvement_pct, is_personal_best
+
+router = APIRouter()
+logger = logging.getLogger(__name__)
+
+MAX_SYNC_OPERATIONS = 500
+
+SyncOperationType = Literal["workout.create", "set.create", "workout.complete"]
+
+
+# ============================================================================
+# REQUEST / RESPONSE MODELS
+# ============================================================================
+
+class SyncOperation(BaseModel):
+    """Single queued client write"""
+    idempotency_key: str = Field(..., min_length=1, max_length=128, description="Client-generated key, unique per user")
+    type: SyncOperationType = Field(..., description="Operation to apply")
+    payload: Dict[str, Any] = Field(default_factory=dict, description="Operation body (same fields as the REST endpoints)")
+
+
+class SyncRequest(BaseModel):
+    """Ordered batch of queued client writes"""
+    operations: List[SyncOperation] = Field(..., max_length=MAX_SYNC_OPERATIONS)
+
+
+class SyncCompletionPayload(BaseModel):
+    """Payload of a workout.complete operation"""
+    workout_id: UUID
+    ended_at: Optional[datetime] = None
+
+
+class SyncOperationResult(BaseModel):
+    """Outcome of one operation"""
+    idempotency_key: str
+    type: SyncOperationType
+    status: Literal["applied", "duplicate", "failed"]
+    result: Optional[Dict[str, Any]] = Field(None, description="Created IDs and server-computed fields")
+    error: Optional[str] = None
+
+
+class SyncResponse(BaseModel):
+    """Per-operation results in request order"""
+    applied: int = 0
+    duplicates: int = 0
+    failed: int = 0
+    results: List[SyncOperationResult] = Field(default_factory=list)
+
+
+class SyncOperationError(Exception):
+    """Operation rejected; reported in its result without aborting the batch"""
+
+
+# ============================================================================
+# SYNC ENDPOINT
+# ============================================================================
+
+@router.post(
+    "/",
+    response_model=SyncResponse,
+    summary="Replay offline writes",
+    description="Apply an ordered batch of workout, set and completion operations in one transaction. Operations whose idempotency key was already applied are skipped and return their stored result, so a reconnecting client converges in one round trip.",
+    responses={
+        200: {
+            "description": "Batch processed; inspect per-operation status",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "applied": 1,
+                        "duplicates": 1,
+                        "failed": 0,
+                        "results": [
+                            {
+                                "idempotency_key": "local-workout-1719048600000",
+                                "type": "workout.create",
+                                "status": "duplicate",
+                                "result": {"id": "123e4567-e89b-12d3-a456-426614174000"},
+                                "error": None
+                            },
+                            {
+                                "idempotency_key": "local-set-1719048700000",
+                                "type": "set.create",
+                                "status": "applied",
+                                "result": {"id": "550e8400-e29b-41d4-a716-446655440000", "set_number": 1},
+                                "error": None
+                            }
+                        ]
+                    }
+                }
+            }
+        }
+    }
+)
+async def sync_operations(
+    request: SyncRequest,
+    current_user: User = Depends(get_current_user),
+    db: DatabaseManager = Depends(get_database)
+) -> SyncResponse:
+    """Apply queued operations in order, skipping already-applied idempotency keys"""
+    logger.info("🔥 sync_operations ENTRY", extra={
+        "user_id": str(current_user.id), "operations": len(request.operations)
+    })
+
+    response = SyncResponse()
+    completed_workouts: List[str] = []
+
+    try:
+        async with db.get_connection() as conn:
+            async with conn.transaction():
+                # One lookup for every key the client has replayed
+                rows = await conn.fetch(
+                    """
+                    SELECT idempotency_key, result FROM sync_operations
+                    WHERE user_id = $1 AND idempotency_key = ANY($2::text[])
+                    """,
+                    current_user.id,
+                    [op.idempotency_key for op in request.operations]
+                )
+                applied_results = {row["idempotency_key"]: json.loads(row["result"]) for row in rows}
+
+                for op in request.operations:
+                    if op.idempotency_key in applied_results:
+                        response.duplicates += 1
+                        response.results.append(SyncOperationResult(
+                            idempotency_key=op.idempotency_key, type=op.type,
+                            status="duplicate", result=applied_results[op.idempotency_key]
+                        ))
+                        continue
+
+                    try:
+                        # Savepoint per operation: a rejected op leaves the rest of the batch intact
+                        async with conn.transaction():
+                            result = await claim_and_apply(conn, current_user.id, op)
+                    except (
+                        SyncOperationError, ValidationError,
+                        asyncpg.IntegrityConstraintViolationError, asyncpg.DataError
+                    ) as e:
+                        logger.warning("🚨 Sync operation rejected", extra={
+                            "idempotency_key": op.idempotency_key, "type": op.type, "error": str(e)
+                        })
+                        response.failed += 1
+                        response.results.append(SyncOperationResult(
+                            idempotency_key=op.idempotency_key, type=op.type,
+                            status="failed", error=describe_failure(e)
+                        ))
+                        continue
+
+                    if result is None:
+                        # Applied concurrently by another request that committed first
+                        stored = await conn.fetchval(
+                            "SELECT result FROM sync_operations WHERE user_id = $1 AND idempotency_key = $2",
+                            current_user.id,
+                            op.idempotency_key
+                        )
+                        applied_results[op.idempotency_key] = json.loads(stored)
+                        response.duplicates += 1
+                        response.results.append(SyncOperationResult(
+                            idempotency_key=op.idempotency_key, type=op.type,
+                            status="duplicate", result=applied_results[op.idempotency_key]
+                        ))
+                        continue
+
+                    applied_results[op.idempotency_key] = result
+                    response.applied += 1
+                    response.results.append(SyncOperationResult(
+                        idempotency_key=op.idempotency_key, type=op.type,
+                        status="applied", result=result
+                    ))
+                    if op.type == "workout.complete":
+                        completed_workouts.append(result["id"])
+
+        # Post-completion jobs were queued with each completion; wake the workers now they are committed
+        if completed_workouts:
+            job_queue.notify()
+
+        logger.info("🔧 Sync batch processed", extra={
+            "user_id": str(current_user.id), "applied": response.applied,
+            "duplicates": response.duplicates, "failed": response.failed
+        })
+
+        return response
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"🚨 sync_operations FAILURE - {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to sync operations"
+        )
+
+
+# ============================================================================
+# OPERATION HANDLERS
+# ============================================================================
+
+async def claim_and_apply(
+    conn: asyncpg.Connection,
+    user_id: UUID,
+    op: SyncOperation
+) -> Optional[Dict[str, Any]]:
+    """
+    Claim the idempotency key, then apply the operation
+    Returns None when another transaction already applied the key
+    """
+    # Claiming first makes a concurrent replay of the same key wait here and then skip
+    claimed = await conn.fetchval(
+        """
+        INSERT INTO sync_operations (user_id, idempotency_key, operation_type)
+        VALUES ($1, $2, $3)
+        ON CONFLICT (user_id, idempotency_key) DO NOTHING
+        RETURNING true
+        """,
+        user_id,
+        op.idempotency_key,
+        op.type
+    )
+    if not claimed:
+        return None
+
+    if op.type == "workout.create":
+        result = await apply_workout_create(conn, user_id, op.payload)
+    elif op.type == "set.create":
+        result = await apply_set_create(conn, user_id, op.payload)
+    else:
+        result = await apply_workout_complete(conn, user_id, op.payload)
+
+    await conn.execute(
+        "UPDATE sync_operations SET result = $3::jsonb WHERE user_id = $1 AND idempotency_key = $2",
+        user_id,
+        op.idempotency_key,
+        json.dumps(result)
+    )
+    return result
+
+
+def client_generated_id(payload: Dict[str, Any]) -> Tuple[UUID, Dict[str, Any]]:
+    """Use the client's offline UUID when given so later ops can reference it"""
+    fields = dict(payload)
+    raw_id = fields.pop("id", None)
+    if raw_id is None:
+        return uuid4(), fields
+    try:
+        return UUID(str(raw_id)), fields
+    except ValueError:
+        raise SyncOperationError(f"Invalid id: {raw_id}")
+
+
+async def apply_workout_create(
+    conn: asyncpg.Connection,
+    user_id: UUID,
+    payload: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Insert a workout created offline"""
+    workout_id, fields = client_generated_id(payload)
+    fields.pop("user_id", None)
+    workout = WorkoutCreate(**fields, user_id=user_id)
+
+    created = await conn.fetchrow(
+        """
+        INSERT INTO workouts (
+            id, user_id, workout_type, name, started_at,
+            variation, notes, energy_level, perceived_exertion, is_completed
+        ) VALUES (
+            $1, $2, $3, $4, $5, $6, $7, $8, $9, false
+        ) RETURNING id, started_at
+        """,
+        workout_id,
+        user_id,
+        workout.workout_type,
+        workout.name,
+        workout.started_at,
+        workout.variation,
+        workout.notes,
+        workout.energy_level,
+        workout.perceived_exertion
+    )
+
+    return {"id": str(created["id"]), "started_at": created["started_at"].isoformat()}
+
+
+async def apply_set_create(
+    conn: asyncpg.Connection,
+    user_id: UUID,
+    payload: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Insert a set logged offline, computing 1RM, PB and improvement like POST /api/workout-sets"""
+    set_id, fields = client_generated_id(payload)
+    fields.pop("user_id", None)
+    workout_set = WorkoutSetCreate(**fields, user_id=user_id)
+
+    owner_id = await conn.fetchval(
+        "SELECT user_id FROM workouts WHERE id = $1",
+        workout_set.workout_id
+    )
+    if owner_id != user_id:
+        raise SyncOperationError(f"Workout with ID {workout_set.workout_id} not found")
+
+    # Read history on this connection so sets applied earlier in the batch count
+    history = await conn.fetchrow(
+        """
+        SELECT
+            (SELECT MAX(weight_lbs) FROM workout_sets
+             WHERE user_id = $1 AND exercise_id = $2 AND reps >= $3) AS max_weight,
+            (SELECT volume_lbs FROM workout_sets
+             WHERE user_id = $1 AND exercise_id = $2 AND reps BETWEEN $3 - 2 AND $3 + 2
+             ORDER BY created_at DESC LIMIT 1) AS previous_volume
+        """,
+        user_id,
+        workout_set.exercise_id,
+        workout_set.reps
+    )
+
+    # Same rules as create_workout_set
+    estimated_1rm = epley_one_rep_max(workout_set.weight_lbs, workout_set.reps)
+    is_pb = is_personal_best(workout_set.weight_lbs, history["max_weight"])
+    improvement = improvement_pct(workout_set.weight_lbs, workout_set.reps, history["previous_volume"])
+
+    created = await conn.fetchrow(
+        """
+        INSERT INTO workout_sets (
+            id, workout_id, exercise_id, user_id, set_number,
+            reps, weight_lbs, time_under_tension_seconds, rest_seconds,
+            perceived_exertion, estimated_one_rep_max, is_personal_best,
+            improvement_vs_last
+        ) VALUES (
+            $1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13
+        ) RETURNING id, set_number, volume_lbs, estimated_one_rep_max, is_personal_best
+        """,
+        set_id,
+        workout_set.workout_id,
+        workout_set.exercise_id,
+        user_id,
+        workout_set.set_number,
+        workout_set.reps,
+        workout_set.weight_lbs,
+        workout_set.time_under_tension_seconds,
+        workout_set.rest_seconds,
+        workout_set.perceived_exertion,
+        estimated_1rm,
+        is_pb,
+        improvement
+    )
+
+    return {
+        "id": str(created["id"]),
+        "set_number": created["set_number"],
+        "volume_lbs": float(created["volume_lbs"]) if created["volume_lbs"] is not None else None,
+        "estimated_one_rep_max": float(created["estimated_one_rep_max"]) if created["estimated_one_rep_max"] is not None else None,
+        "is_personal_best": created["is_personal_best"]
+    }
+
+
+async def apply_workout_complete(
+    conn: asyncpg.Connection,
+    user_id: UUID,
+    payload: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Mark a workout finished offline as completed and queue its post-completion jobs"""
+    completion = SyncCompletionPayload(**payload)
+
+    workout = await conn.fetchrow(
+        "SELECT user_id, is_completed FROM workouts WHERE id = $1 FOR UPDATE",
+        completion.workout_id
+    )
+    if not workout or workout["user_id"] != user_id:
+        raise SyncOperationError(f"Workout with ID {completion.workout_id} not found")
+    if workout["is_completed"]:
+        raise SyncOperationError("Workout is already completed")
+
+    # Same follow-up work as POST /api/workouts/{id}/complete, queued in the same statement
+    completed = await conn.fetchrow(
+        f"""
+        WITH completed AS (
+            UPDATE workouts SET
+                is_completed = true,
+                ended_at = COALESCE($2, clock_timestamp()),
+                updated_at = NOW()
+            WHERE id = $1
+            RETURNING id, user_id, ended_at, total_volume_lbs, total_sets, total_reps, exercises_count
+        ),
+        jobs AS ({queue_post_completion_jobs("completed")})
+        SELECT * FROM completed
+        """,
+        completion.workout_id,
+        completion.ended_at
+    )
+
+    return {
+        "id": str(completed["id"]),
+        "ended_at": completed["ended_at"].isoformat(),
+        "total_volume_lbs": float(completed["total_volume_lbs"] or 0),
+        "total_sets": completed["total_sets"] or 0,
+        "total_reps": completed["total_reps"] or 0,
+        "exercises_count": completed["exercises_count"] or 0
+    }
+
+
+def describe_failure(error: Exception) -> str:
+    """Client-facing message for a rejected operation"""
+    if isinstance(error, ValidationError):
+        first = error.errors()[0]
+        location = ".".join(str(part) for part in first.get("loc", ()))
+        return f"Invalid payload: {location} {first.get('msg', '')}".strip()
+    if isinstance(error, asyncpg.exceptions.UniqueViolationError):
+        return "Resource already exists"
+    if isinstance(error, asyncpg.exceptions.ForeignKeyViolationError):
+        return "Invalid reference to related resource"
+    if isinstance(error, (asyncpg.exceptions.CheckViolationError, asyncpg.DataError)):
+        return "Data validation failed"
+    return str(error)
@@ -3,14 +3,21 @@ Users API Router
 User management and profile endpoints with comprehensive authentication
 """
 
+import csv
+import io
+import json
+import zlib
 from datetime import datetime, timezone
 from decimal import Decimal
-from typing import Dict, List, Optional, Any
+from typing import AsyncIterator, Dict, List, Literal, Optional, Any
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile, status
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
+from app.core.activity import last_active
+from app.core.cache import auth_cache
 from app.core.database import DatabaseManager, get_database
 from app.core.dependencies import (
     get_current_user,
@@ -20,6 +27,14 @@ from app.core.dependencies import (
 )
 from app.core.config import Settings
 from app.models.schemas import User, UserCreate, UserUpdate
+from app.services.user_stats import load_user_stats
+from app.services.workout_import import (
+    ImportFormatError,
+    ImportSummary,
+    WorkoutImportService,
+    iter_csv_records,
+    iter_json_records
+)
 
 
 router = APIRouter()
@@ -143,6 +158,7 @@ async def update_current_user_profile(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found"
         )
+    auth_cache.invalidate_user(updated_user["id"])
     
     # Return enhanced response
     return await get_current_user_profile(
@@ -164,156 +180,208 @@ async def get_current_user_stats(
     """
     stats = UserStats()
     
-    # Get basic workout statistics
-    workout_stats = await db.execute_query(
-        """
-        SELECT 
-            COUNT(*) as total_workouts,
-            COALESCE(SUM(total_volume_lbs), 0) as total_volume_lbs,
-            COALESCE(SUM(total_sets), 0) as total_sets,
-            COALESCE(SUM(total_reps), 0) as total_reps,
-            MAX(started_at) as last_workout_date,
-            AVG(duration_seconds) as avg_duration
-        FROM workouts
-        WHERE user_id = $1 AND is_completed = true
-        """,
-        current_user.id,
-        fetch_one=True
-    )
-    
-    if workout_stats:
-        stats.total_workouts = workout_stats['total_workouts']
-        stats.total_volume_lbs = workout_stats['total_volume_lbs'] or Decimal('0.00')
-        stats.total_sets = workout_stats['total_sets'] or 0
-        stats.total_reps = workout_stats['total_reps'] or 0
-        stats.last_workout_date = workout_stats['last_workout_date']
-        stats.average_workout_duration = int(workout_stats['avg_duration']) if workout_stats['avg_duration'] else None
+    # Lifetime totals are trigger-maintained in user_stats / user_exercise_stats
+    data = await load_user_stats(db, current_user.id)
+    summary = data["summary"]
+    exercises = data["exercises"]
     
-    # Get workout frequency by week for last 12 weeks
-    frequency_data = await db.execute_query(
-        """
-        SELECT 
-            DATE_TRUNC('week', started_at) as week,
-            COUNT(*) as workout_count
-        FROM workouts
-        WHERE user_id = $1 
-            AND is_completed = true
-            AND started_at >= NOW() - INTERVAL '12 weeks'
-        GROUP BY week
-        ORDER BY week DESC
-        """,
-        current_user.id
-    )
+    if summary:
+        stats.total_workouts = summary['total_workouts']
+        stats.total_volume_lbs = summary['total_volume_lbs']
+        stats.total_sets = summary['total_sets']
+        stats.total_reps = summary['total_reps']
+        stats.last_workout_date = summary['last_workout_at']
+        if summary['timed_workouts']:
+            stats.average_workout_duration = int(summary['total_duration_seconds'] / summary['timed_workouts'])
     
     stats.workout_frequency = {
         row['week'].strftime('%Y-%m-%d'): row['workout_count'] 
-        for row in frequency_data
+        for row in data["frequency"]
     }
     
-    # Get favorite exercises (top 5 by set count)
-    favorite_exercises = await db.execute_query(
-        """
-        SELECT 
-            e.id,
-            e.name,
-            e.category,
-            COUNT(*) as set_count,
-            SUM(ws.volume_lbs) as total_volume
-        FROM workout_sets ws
-        JOIN exercises e ON ws.exercise_id = e.id
-        WHERE ws.user_id = $1
-        GROUP BY e.id, e.name, e.category
-        ORDER BY set_count DESC
-        LIMIT 5
-        """,
-        current_user.id
-    )
-    
+    # Favorite exercises (top 5 by set count)
     stats.favorite_exercises = [
         {
-            'exercise_id': ex['id'],
+            'exercise_id': ex['exercise_id'],
             'name': ex['name'],
             'category': ex['category'],
             'set_count': ex['set_count'],
-            'total_volume': float(ex['total_volume'] or 0)
+            'total_volume': float(ex['total_volume_lbs'])
         }
-        for ex in favorite_exercises
+        for ex in sorted(exercises, key=lambda ex: ex['set_count'], reverse=True)[:5]
     ]
     
-    # Get personal records (max weight × reps for each exercise)
-    personal_records = await db.execute_query(
-        """
-        SELECT DISTINCT ON (e.id)
-            e.id,
-            e.name,
-            e.category,
-            ws.weight_lbs,
-            ws.reps,
-            ws.volume_lbs,
-            ws.created_at
-        FROM workout_sets ws
-        JOIN exercises e ON ws.exercise_id = e.id
-        WHERE ws.user_id = $1
-        ORDER BY e.id, ws.volume_lbs DESC, ws.created_at DESC
-        LIMIT 10
-        """,
-        current_user.id
-    )
-    
+    # Personal records (best volume set for each exercise, first 10 by exercise)
     stats.personal_records = [
         {
-            'exercise_id': pr['id'],
+            'exercise_id': pr['exercise_id'],
             'name': pr['name'],
             'category': pr['category'],
-            'weight_lbs': float(pr['weight_lbs']),
-            'reps': pr['reps'],
-            'volume_lbs': float(pr['volume_lbs']),
-            'achieved_date': pr['created_at'].isoformat()
+            'weight_lbs': float(pr['best_weight_lbs']),
+            'reps': pr['best_reps'],
+            'volume_lbs': float(pr['best_volume_lbs']),
+            'achieved_date': pr['best_set_at'].isoformat()
         }
-        for pr in personal_records
+        for pr in exercises[:10]
+        if pr['best_set_at'] is not None
     ]
     
-    # Get muscle group distribution
-    muscle_distribution = await db.execute_query(
-        """
-        SELECT 
-            e.category,
-            SUM(ws.volume_lbs) as category_volume
-        FROM workout_sets ws
-        JOIN exercises e ON ws.exercise_id = e.id
-        WHERE ws.user_id = $1
-        GROUP BY e.category
-        """,
-        current_user.id
-    )
-    
-    total_volume = sum(row['category_volume'] for row in muscle_distribution)
+    # Muscle group distribution
+    category_volume: Dict[str, Decimal] = {}
+    for ex in exercises:
+        category_volume[ex['category']] = category_volume.get(ex['category'], Decimal('0')) + ex['total_volume_lbs']
+    total_volume = sum(category_volume.values())
     if total_volume > 0:
         stats.muscle_group_distribution = {
-            row['category']: float(row['category_volume'] / total_volume * 100)
-            for row in muscle_distribution
+            category: float(volume / total_volume * 100)
+            for category, volume in category_volume.items()
         }
     
     # Calculate consistency score (workouts per week average)
-    if stats.total_workouts > 0:
-        weeks_since_first = await db.execute_query(
-            """
-            SELECT EXTRACT(WEEK FROM (NOW() - MIN(started_at))) as weeks
-            FROM workouts
-            WHERE user_id = $1 AND is_completed = true
-            """,
-            current_user.id,
-            fetch_one=True
-        )
-        
-        if weeks_since_first and weeks_since_first['weeks']:
-            avg_per_week = stats.total_workouts / max(1, weeks_since_first['weeks'])
-            # Score: 3+ workouts/week = 100, 2/week = 66, 1/week = 33
-            stats.consistency_score = min(100, (avg_per_week / 3) * 100)
+    if stats.total_workouts > 0 and summary['first_workout_at']:
+        weeks_since_first = (datetime.now(timezone.utc) - summary['first_workout_at']).total_seconds() / 604800
+        avg_per_week = stats.total_workouts / max(1, weeks_since_first)
+        # Score: 3+ workouts/week = 100, 2/week = 66, 1/week = 33
+        stats.consistency_score = min(100, (avg_per_week / 3) * 100)
     
     return stats
 
 
+# Column order of the export; also the CSV header
+EXPORT_COLUMNS = [
+    "workout_id", "workout_name", "workout_type", "variation", "started_at", "ended_at",
+    "set_id", "exercise_id", "exercise_name", "set_number", "reps", "weight_lbs",
+    "volume_lbs", "perceived_exertion", "rest_seconds", "estimated_one_rep_max",
+    "is_personal_best", "created_at"
+]
+
+EXPORT_QUERY = """
+    SELECT
+        w.id AS workout_id, w.name AS workout_name, w.workout_type, w.variation,
+        w.started_at, w.ended_at,
+        ws.id AS set_id, ws.exercise_id, e.name AS exercise_name, ws.set_number,
+        ws.reps, ws.weight_lbs, ws.volume_lbs, ws.perceived_exertion, ws.rest_seconds,
+        ws.estimated_one_rep_max, ws.is_personal_best, ws.created_at
+    FROM workout_sets ws
+    JOIN workouts w ON w.id = ws.workout_id
+    LEFT JOIN exercises e ON e.id = ws.exercise_id
+    WHERE ws.user_id = $1
+    ORDER BY w.started_at, ws.workout_id, ws.exercise_id, ws.set_number
+"""
+
+
+def _export_value(value: Any) -> Any:
+    """Convert DB values to JSON/CSV friendly scalars"""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, (Decimal, UUID)):
+        return str(value)
+    return value
+
+
+async def _encode_ndjson(chunks: AsyncIterator[List[Dict[str, Any]]]) -> AsyncIterator[bytes]:
+    """One JSON object per line, one network write per DB chunk"""
+    async for rows in chunks:
+        yield "".join(
+            json.dumps({column: _export_value(row[column]) for column in EXPORT_COLUMNS}) + "\n"
+            for row in rows
+        ).encode("utf-8")
+
+
+async def _encode_csv(chunks: AsyncIterator[List[Dict[str, Any]]]) -> AsyncIterator[bytes]:
+    """CSV with a header row, reusing one buffer across chunks"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_COLUMNS)
+    async for rows in chunks:
+        writer.writerows([_export_value(row[column]) for column in EXPORT_COLUMNS] for row in rows)
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate(0)
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+async def _gzip_stream(body: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """Incrementally gzip a byte stream without buffering it"""
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    async for piece in body:
+        compressed = compressor.compress(piece)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+@router.get("/me/export", summary="Export current user's workout history")
+async def export_current_user_history(
+    format: Literal["ndjson", "csv"] = Query("ndjson", description="Output format"),
+    gzip: bool = Query(False, description="Gzip-compress the download"),
+    current_user: User = Depends(get_current_user),
+    db: DatabaseManager = Depends(get_database)
+) -> StreamingResponse:
+    """Stream every logged set with its workout as NDJSON or CSV.
+    
+    Rows are read from a server-side cursor in DB_STREAM_CHUNK_SIZE chunks and
+    written out as they arrive, so memory use is constant regardless of history size.
+    Requires authentication.
+    """
+    chunks = db.stream_query(EXPORT_QUERY, current_user.id, read_only=True)
+    body = _encode_ndjson(chunks) if format == "ndjson" else _encode_csv(chunks)
+    
+    extension = "ndjson" if format == "ndjson" else "csv"
+    media_type = "application/x-ndjson" if format == "ndjson" else "text/csv"
+    if gzip:
+        body = _gzip_stream(body)
+        extension += ".gz"
+        media_type = "application/gzip"
+    
+    filename = f"fitforge-export-{datetime.now(timezone.utc):%Y%m%d}.{extension}"
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
+
+@router.post("/me/import", response_model=ImportSummary, summary="Import workout history from another tracker")
+async def import_current_user_history(
+    file: UploadFile = File(..., description="CSV, JSON array or NDJSON file, one set per row"),
+    format: Optional[Literal["csv", "json"]] = Query(None, description="Input format (inferred from the file name if omitted)"),
+    weight_unit: Literal["lbs", "kg"] = Query("lbs", description="Unit of a plain 'weight' column"),
+    current_user: User = Depends(get_current_user),
+    db: DatabaseManager = Depends(get_database)
+) -> ImportSummary:
+    """Bulk import historical sets exported from Fitbod, Strong or FitForge.
+    
+    The upload is parsed row by row and staged with COPY, exercise names are
+    mapped to catalog IDs, and workouts already imported at the same start time
+    are skipped, so re-uploading the same file is safe. Requires authentication.
+    """
+    filename = (file.filename or "").lower()
+    if format is None:
+        if filename.endswith(".csv"):
+            format = "csv"
+        elif filename.endswith((".json", ".ndjson", ".jsonl")):
+            format = "json"
+        else:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Cannot infer import format; pass format=csv or format=json"
+            )
+    
+    stream = io.TextIOWrapper(file.file, encoding="utf-8-sig", newline="")
+    records = iter_csv_records(stream) if format == "csv" else iter_json_records(stream)
+    try:
+        return await WorkoutImportService(db).import_records(current_user.id, records, weight_unit)
+    except (ImportFormatError, UnicodeDecodeError, csv.Error) as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Could not parse import file: {str(e)}"
+        )
+    finally:
+        stream.detach()
+
+
 # ============================================================================
 # ADMIN USER MANAGEMENT ENDPOINTS
 # ============================================================================
@@ -455,6 +523,7 @@ async def update_user_by_id(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found"
         )
+    auth_cache.invalidate_user(updated_user["id"])
     
     return UserResponse(**updated_user, is_premium=updated_user['feature_level'] >= 3)
 
@@ -491,6 +560,7 @@ async def deactivate_user(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found"
         )
+    auth_cache.invalidate_user(user_id)
     
     # Future implementation:
     # UPDATE users SET is_active = false, updated_at = NOW() WHERE id = $1
@@ -508,11 +578,8 @@ async def update_last_active(
 ) -> None:
     """Update the current user's last active timestamp.
     
-    Called periodically by the frontend to track user activity.
+    Called periodically by the frontend to track user activity. The write is
+    buffered and batched with other users' activity (see app/core/activity.py).
     """
-    await db.execute_query(
-        "UPDATE users SET last_active_at = $1 WHERE id = $2",
-        datetime.now(timezone.utc),
-        current_user.id
-    )
+    last_active.touch(current_user.id)
     return None
\ No newline at end of file
@@ -11,7 +11,8 @@ from uuid import UUID, uuid4
 from decimal import Decimal
 
 from app.models.schemas import WorkoutSet, WorkoutSetCreate, WorkoutSetUpdate
-from ..core.database import get_database, DatabaseManager, DatabaseUtils
+from app.services.set_metrics import epley_one_rep_max, improvement_pct, is_personal_best
+from ..core.database import get_database, DatabaseManager, DatabaseUtils, QueryExecutor
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -290,143 +291,143 @@ async def create_workout_set(
     })
     
     try:
-        # Verify workout exists
-        workout_exists = await db.execute_query(
-            "SELECT id FROM workouts WHERE id = $1",
-            workout_set.workout_id,
-            fetch_one=True
-        )
-        if not workout_exists:
-            logger.warning("🚨 Workout not found", extra={"workout_id": workout_set.workout_id})
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Workout with ID {workout_set.workout_id} not found"
-            )
-        
-        # Verify exercise exists
-        exercise_exists = await db.execute_query(
-            "SELECT id FROM exercises WHERE id = $1",
-            workout_set.exercise_id,
-            fetch_one=True
-        )
-        if not exercise_exists:
-            logger.warning("🚨 Exercise not found", extra={"exercise_id": workout_set.exercise_id})
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Exercise with ID {workout_set.exercise_id} not found"
-            )
-        
-        # Verify user exists
-        user_exists = await DatabaseUtils.verify_user_exists(workout_set.user_id, db)
-        if not user_exists:
-            logger.warning("🚨 User not found", extra={"user_id": workout_set.user_id})
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"User with ID {workout_set.user_id} not found"
-            )
-        
-        # Validate weight increment (0.25 lb increments) - handled by Pydantic
-        # Validate reps range (1-50) - handled by Pydantic
-        # Validate RPE range (1-10) if provided - handled by Pydantic
-        
-        # Get next set number if not provided
-        if not workout_set.set_number:
-            next_set_query = """
-                SELECT COALESCE(MAX(set_number), 0) + 1 as next_set_number
-                FROM workout_sets 
-                WHERE workout_id = $1 AND exercise_id = $2
-            """
-            result = await db.execute_query(
-                next_set_query,
+        # Checks, set numbering, PB lookup and the insert share one connection
+        # and commit together
+        async with db.transaction() as tx:
+            # Verify workout exists; the row lock serializes set-number assignment
+            workout_exists = await tx.execute_query(
+                "SELECT id FROM workouts WHERE id = $1 FOR UPDATE",
                 workout_set.workout_id,
-                workout_set.exercise_id,
                 fetch_one=True
             )
-            set_number = result["next_set_number"]
-        else:
-            set_number = workout_set.set_number
-            
-            # Verify set number is sequential
-            existing_set = await db.execute_query(
-                """
-                SELECT id FROM workout_sets 
-                WHERE workout_id = $1 AND exercise_id = $2 AND set_number = $3
-                """,
-                workout_set.workout_id,
+            if not workout_exists:
+                logger.warning("🚨 Workout not found", extra={"workout_id": workout_set.workout_id})
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"Workout with ID {workout_set.workout_id} not found"
+                )
+        
+            # Verify exercise exists
+            exercise_exists = await tx.execute_query(
+                "SELECT id FROM exercises WHERE id = $1",
                 workout_set.exercise_id,
-                set_number,
                 fetch_one=True
             )
-            if existing_set:
+            if not exercise_exists:
+                logger.warning("🚨 Exercise not found", extra={"exercise_id": workout_set.exercise_id})
                 raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Set number {set_number} already exists for this exercise in this workout"
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"Exercise with ID {workout_set.exercise_id} not found"
                 )
         
-        # Calculate estimated one rep max using Epley formula if weight > 0 and reps > 1
-        estimated_1rm = None
-        if workout_set.weight_lbs > 0 and workout_set.reps > 1:
-            estimated_1rm = float(workout_set.weight_lbs) * (1 + float(workout_set.reps) / 30)
-            estimated_1rm = round(estimated_1rm, 2)
-        
-        # Check for personal best
-        is_pb = await check_personal_best(
-            db, 
-            workout_set.user_id, 
-            workout_set.exercise_id, 
-            workout_set.weight_lbs,
-            workout_set.reps
-        )
+            # Verify user exists
+            user_exists = await DatabaseUtils.verify_user_exists(workout_set.user_id, tx)
+            if not user_exists:
+                logger.warning("🚨 User not found", extra={"user_id": workout_set.user_id})
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"User with ID {workout_set.user_id} not found"
+                )
         
-        # Calculate improvement vs last
-        improvement = await calculate_improvement(
-            db,
-            workout_set.user_id,
-            workout_set.exercise_id,
-            workout_set.weight_lbs,
-            workout_set.reps
-        )
+            # Validate weight increment (0.25 lb increments) - handled by Pydantic
+            # Validate reps range (1-50) - handled by Pydantic
+            # Validate RPE range (1-10) if provided - handled by Pydantic
         
-        # Generate set ID
-        set_id = str(uuid4())
-        current_time = datetime.utcnow()
+            # Get next set number if not provided
+            if not workout_set.set_number:
+                next_set_query = """
+                    SELECT COALESCE(MAX(set_number), 0) + 1 as next_set_number
+                    FROM workout_sets 
+                    WHERE workout_id = $1 AND exercise_id = $2
+                """
+                result = await tx.execute_query(
+                    next_set_query,
+                    workout_set.workout_id,
+                    workout_set.exercise_id,
+                    fetch_one=True
+                )
+                set_number = result["next_set_number"]
+            else:
+                set_number = workout_set.set_number
+            
+                # Verify set number is sequential
+                existing_set = await tx.execute_query(
+                    """
+                    SELECT id FROM workout_sets 
+                    WHERE workout_id = $1 AND exercise_id = $2 AND set_number = $3
+                    """,
+                    workout_set.workout_id,
+                    workout_set.exercise_id,
+                    set_number,
+                    fetch_one=True
+                )
+                if existing_set:
+                    raise HTTPException(
+                        status_code=status.HTTP_400_BAD_REQUEST,
+                        detail=f"Set number {set_number} already exists for this exercise in this workout"
+                    )
         
-        logger.info("🔧 Creating workout set", extra={
-            "set_id": set_id, "set_number": set_number,
-            "estimated_1rm": estimated_1rm, "is_pb": is_pb
-        })
+            # Calculate estimated one rep max using Epley formula if weight > 0 and reps > 1
+            estimated_1rm = epley_one_rep_max(workout_set.weight_lbs, workout_set.reps)
         
-        # Insert workout set record
-        insert_query = """
-            INSERT INTO workout_sets (
-                id, workout_id, exercise_id, user_id, set_number,
-                reps, weight_lbs, time_under_tension_seconds, rest_seconds,
-                perceived_exertion, estimated_one_rep_max, is_personal_best,
-                improvement_vs_last, created_at, updated_at
-            ) VALUES (
-                $1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15
-            ) RETURNING *
-        """
+            # Check for personal best
+            is_pb = await check_personal_best(
+                tx, 
+                workout_set.user_id, 
+                workout_set.exercise_id, 
+                workout_set.weight_lbs,
+                workout_set.reps
+            )
         
-        created_set = await db.execute_query(
-            insert_query,
-            set_id,
-            workout_set.workout_id,
-            workout_set.exercise_id,
-            workout_set.user_id,
-            set_number,
-            workout_set.reps,
-            workout_set.weight_lbs,
-            workout_set.time_under_tension_seconds,
-            workout_set.rest_seconds,
-            workout_set.perceived_exertion,
-            estimated_1rm,
-            is_pb,
-            improvement,
-            current_time,
-            current_time,
-            fetch_one=True
-        )
+            # Calculate improvement vs last
+            improvement = await calculate_improvement(
+                tx,
+                workout_set.user_id,
+                workout_set.exercise_id,
+                workout_set.weight_lbs,
+                workout_set.reps
+            )
+        
+            # Generate set ID
+            set_id = str(uuid4())
+            current_time = datetime.utcnow()
+        
+            logger.info("🔧 Creating workout set", extra={
+                "set_id": set_id, "set_number": set_number,
+                "estimated_1rm": estimated_1rm, "is_pb": is_pb
+            })
+        
+            # Insert workout set record
+            insert_query = """
+                INSERT INTO workout_sets (
+                    id, workout_id, exercise_id, user_id, set_number,
+                    reps, weight_lbs, time_under_tension_seconds, rest_seconds,
+                    perceived_exertion, estimated_one_rep_max, is_personal_best,
+                    improvement_vs_last, created_at, updated_at
+                ) VALUES (
+                    $1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15
+                ) RETURNING *
+            """
+        
+            created_set = await tx.execute_query(
+                insert_query,
+                set_id,
+                workout_set.workout_id,
+                workout_set.exercise_id,
+                workout_set.user_id,
+                set_number,
+                workout_set.reps,
+                workout_set.weight_lbs,
+                workout_set.time_under_tension_seconds,
+                workout_set.rest_seconds,
+                workout_set.perceived_exertion,
+                estimated_1rm,
+                is_pb,
+                improvement,
+                current_time,
+                current_time,
+                fetch_one=True
+            )
         
         logger.info("🔧 Workout set created successfully", extra={
             "set_id": set_id, "volume_lbs": created_set.get("volume_lbs")
@@ -544,8 +545,7 @@ async def update_workout_set(
         
         # Recalculate estimated 1RM if needed
         if new_weight > 0 and new_reps > 1 and ("weight_lbs" in update_data or "reps" in update_data):
-            estimated_1rm = float(new_weight) * (1 + float(new_reps) / 30)
-            estimated_1rm = round(estimated_1rm, 2)
+            estimated_1rm = epley_one_rep_max(new_weight, new_reps)
             param_count += 1
             update_fields.append(f"estimated_one_rep_max = ${param_count}")
             params.append(estimated_1rm)
@@ -680,7 +680,7 @@ async def delete_workout_set(
 
 
 async def check_personal_best(
-    db: DatabaseManager,
+    db: QueryExecutor,
     user_id: str,
     exercise_id: str,
     weight_lbs: Decimal,
@@ -705,11 +705,11 @@ async def check_personal_best(
     result = await db.execute_query(query, *params, fetch_one=True)
     max_weight = result.get("max_weight") if result else None
     
-    return max_weight is None or weight_lbs > max_weight
+    return is_personal_best(weight_lbs, max_weight)
 
 
 async def calculate_improvement(
-    db: DatabaseManager,
+    db: QueryExecutor,
     user_id: str,
     exercise_id: str,
     weight_lbs: Decimal,
@@ -740,11 +740,4 @@ async def calculate_improvement(
     if not result:
         return None
     
-    previous_volume = float(result["volume_lbs"])
-    current_volume = float(weight_lbs) * float(reps)
-    
-    if previous_volume == 0:
-        return None
-    
-    improvement = ((current_volume - previous_volume) / previous_volume) * 100
-    return round(Decimal(str(improvement)), 2)
\ No newline at end of file
+    return improvement_pct(weight_lbs, reps, result["volume_lbs"])
\ No newline at end of file
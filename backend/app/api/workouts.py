@@ -4,19 +4,22 @@ Workout session management and tracking endpoints with full database integration
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from typing import List, Optional, Dict, Any
+from typing import List, Optional
 from datetime import datetime, date
 import logging
-import sys
-import os
 from uuid import uuid4
 
 from app.models.schemas import Workout, WorkoutCreate, WorkoutUpdate, WorkoutSet, WorkoutSetCreate, WorkoutSetUpdate
-from ..core.database import get_database, DatabaseManager, DatabaseUtils
+from ..core.cache import auth_cache
+from ..core.database import get_database, register_query, DatabaseManager, DatabaseUtils
+from ..core.jobs import job_queue
+from ..services.workout_jobs import queue_post_completion_jobs
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+WORKOUT_BY_ID_QUERY = register_query("workouts.by_id", "SELECT * FROM workouts WHERE id = $1")
+
 
 @router.get(
     "/",
@@ -189,7 +192,7 @@ async def get_workout(
     try:
         # Verify workout exists
         workout = await db.execute_query(
-            "SELECT * FROM workouts WHERE id = $1",
+            WORKOUT_BY_ID_QUERY,
             workout_id,
             fetch_one=True
         )
@@ -309,90 +312,69 @@ async def complete_workout(
     workout_id: str,
     db: DatabaseManager = Depends(get_database)
 ):
-    """Mark workout as completed and calculate metrics"""
+    """Mark workout as completed; muscle states and personal bests update in the background"""
     logger.info("🔥 complete_workout ENTRY", extra={"workout_id": workout_id})
     
     try:
-        # Verify workout exists and is not already completed
-        workout = await db.execute_query(
-            "SELECT * FROM workouts WHERE id = $1",
-            workout_id,
-            fetch_one=True
-        )
-        
-        if not workout:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Workout with ID {workout_id} not found"
+        # The check and the completing statement share one connection
+        async with db.transaction() as tx:
+            # Verify workout exists and is not already completed
+            workout = await tx.execute_query(
+                WORKOUT_BY_ID_QUERY,
+                workout_id,
+                fetch_one=True
             )
         
-        if workout["is_completed"]:
-            logger.warning("🚨 Workout already completed", extra={"workout_id": workout_id})
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Workout is already completed"
-            )
-        
-        current_time = datetime.utcnow()
-        
-        # Get workout sets for muscle fatigue calculation (volume calculated by DB trigger)
-        workout_sets = await db.execute_query(
+            if not workout:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"Workout with ID {workout_id} not found"
+                )
+        
+            if workout["is_completed"]:
+                logger.warning("🚨 Workout already completed", extra={"workout_id": workout_id})
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Workout is already completed"
+                )
+        
+            current_time = datetime.utcnow()
+        
+            # Commit the completion and queue its follow-up work in one statement
+            # (let DB triggers calculate volume/sets/reps); muscle states and
+            # personal bests are brought up to date by the job workers
+            update_query = f"""
+                WITH completed AS (
+                    UPDATE workouts SET
+                        is_completed = true,
+                        ended_at = $2,
+                        updated_at = $2
+                    WHERE id = $1 AND is_completed = false
+                    RETURNING *
+                ),
+                jobs AS ({queue_post_completion_jobs("completed")})
+                SELECT completed.*, ARRAY(SELECT id FROM jobs) AS post_processing_job_ids
+                FROM completed
             """
-            SELECT ws.*, e.muscle_engagement_data
-            FROM workout_sets ws
-            JOIN exercises e ON ws.exercise_id = e.id
-            WHERE ws.workout_id = $1
-            """,
-            workout_id,
-            fetch=True
-        )
-        
-        logger.info("🔧 Processing workout completion", extra={
-            "workout_id": workout_id, "sets_count": len(workout_sets) if workout_sets else 0
-        })
         
-        # Calculate muscle fatigue data (let DB trigger handle volume calculations)
-        muscle_fatigue_data = {}
-        
-        if workout_sets:
-            for set_data in workout_sets:
-                # Use the pre-calculated volume_lbs from the set (calculated by trigger)
-                set_volume = float(set_data.get("volume_lbs", 0))
-                
-                # Process muscle engagement for fatigue calculation
-                muscle_engagement = set_data.get("muscle_engagement_data", {})
-                if isinstance(muscle_engagement, dict):
-                    for muscle, percentage in muscle_engagement.items():
-                        if muscle not in muscle_fatigue_data:
-                            muscle_fatigue_data[muscle] = 0.0
-                        # Weight fatigue contribution by muscle engagement percentage
-                        muscle_fatigue_data[muscle] += set_volume * (float(percentage) / 100.0)
-        
-        logger.info("🔧 Calculated muscle fatigue data", extra={
-            "muscles_engaged": len(muscle_fatigue_data)
-        })
+            completed_workout = await tx.execute_query(
+                update_query,
+                workout_id,
+                current_time,
+                fetch_one=True
+            )
         
-        # Update workout completion (let DB triggers calculate volume/sets/reps)
-        update_query = """
-            UPDATE workouts SET
-                is_completed = true,
-                ended_at = $2,
-                updated_at = $2
-            WHERE id = $1
-            RETURNING *
-        """
+            if not completed_workout:
+                # Completed by a concurrent request between the check and the update
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Workout is already completed"
+                )
         
-        completed_workout = await db.execute_query(
-            update_query,
-            workout_id,
-            current_time,
-            fetch_one=True
-        )
-        
-        # Update user muscle states for fatigue tracking
-        user_id = workout["user_id"]
-        if muscle_fatigue_data:
-            await update_muscle_states(user_id, muscle_fatigue_data, current_time, db)
+        job_ids = completed_workout.pop("post_processing_job_ids", None) or []
+        job_queue.notify()
+        # update_user_workout_count() moved workout_count / feature_level
+        auth_cache.invalidate_user(completed_workout["user_id"])
         
         # Use database-calculated metrics (from triggers)
         db_total_volume = float(completed_workout.get("total_volume_lbs", 0))
@@ -408,7 +390,8 @@ async def complete_workout(
             "workout_id": workout_id, 
             "total_volume_lbs": db_total_volume,
             "total_sets": db_total_sets,
-            "duration_minutes": duration_minutes
+            "duration_minutes": duration_minutes,
+            "queued_jobs": len(job_ids)
         })
         
         return {
@@ -419,8 +402,11 @@ async def complete_workout(
                 "total_sets": db_total_sets,          # From DB trigger  
                 "total_reps": db_total_reps,          # From DB trigger
                 "exercises_count": db_exercises_count, # From DB trigger
-                "duration_minutes": duration_minutes,
-                "muscle_engagement": muscle_fatigue_data
+                "duration_minutes": duration_minutes
+            },
+            "post_processing": {
+                "status": "queued",
+                "job_ids": [str(job_id) for job_id in job_ids]
             }
         }
         
@@ -434,44 +420,6 @@ async def complete_workout(
         )
 
 
-async def update_muscle_states(
-    user_id: str, 
-    muscle_fatigue_data: Dict[str, float], 
-    workout_time: datetime,
-    db: DatabaseManager
-):
-    """Update user muscle states based on workout fatigue"""
-    logger.info("🔧 Updating muscle states", extra={
-        "user_id": user_id, "muscles_count": len(muscle_fatigue_data)
-    })
-    
-    for muscle_name, fatigue_amount in muscle_fatigue_data.items():
-        # Upsert muscle state record
-        upsert_query = """
-            INSERT INTO muscle_states (
-                id, user_id, muscle_name, current_fatigue_percentage,
-                last_workout_date, total_volume_lifetime, updated_at
-            ) VALUES (
-                gen_random_uuid(), $1, $2, $3, $4, $5, $4
-            )
-            ON CONFLICT (user_id, muscle_name) 
-            DO UPDATE SET
-                current_fatigue_percentage = LEAST(100.0, muscle_states.current_fatigue_percentage + $3),
-                last_workout_date = $4,
-                total_volume_lifetime = muscle_states.total_volume_lifetime + $5,
-                updated_at = $4
-        """
-        
-        await db.execute_query(
-            upsert_query,
-            user_id,
-            muscle_name,
-            min(20.0, fatigue_amount / 100.0),  # Cap fatigue increase per workout
-            workout_time,
-            fatigue_amount
-        )
-
-
 # Workout Sets endpoints
 @router.get("/{workout_id}/sets", response_model=List[WorkoutSet])
 async def get_workout_sets(workout_id: str):
@@ -0,0 +1,129 @@
+"""
+FitForge Last-Active Tracking
+Write-behind buffer for users.last_active_at
+
+Authenticated requests only record the user in memory; a flusher task
+writes all buffered users in one UPDATE every DB_LAST_ACTIVE_FLUSH_SECONDS.
+Activity is kept at DB_LAST_ACTIVE_PRECISION_SECONDS granularity, so a user
+making many requests costs at most one row write per window per worker, and
+the UPDATE skips rows another worker already moved inside the window.
+Buffered activity is lost if the process dies before a flush; that only
+makes last_active_at older by up to one flush interval.
+"""
+
+import asyncio
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+from .config import get_settings
+from .database import DatabaseManager, db_manager
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+FLUSH_QUERY = """
+    UPDATE users u SET last_active_at = t.seen_at
+    FROM unnest($1::uuid[], $2::timestamptz[]) AS t(id, seen_at)
+    WHERE u.id = t.id
+      AND (u.last_active_at IS NULL OR u.last_active_at < t.seen_at - make_interval(secs => $3))
+"""
+
+
+class LastActiveTracker:
+    """
+    Per-process buffer of user activity, flushed periodically
+    Call touch() per request, start() at startup and stop() at shutdown
+    """
+
+    def __init__(self, db: DatabaseManager):
+        self.db = db
+        self._pending: Dict[str, datetime] = {}
+        self._recorded: Dict[str, float] = {}
+        self._wakeup = asyncio.Event()
+        self._flusher: Optional[asyncio.Task] = None
+        self._stopping = False
+
+    def touch(self, user_id: Any) -> None:
+        """Record activity for user_id; at most once per precision window"""
+        user_id = str(user_id)
+        now = time.monotonic()
+        recorded = self._recorded.get(user_id)
+        if recorded is not None and now - recorded < settings.database.LAST_ACTIVE_PRECISION_SECONDS:
+            return
+        self._recorded[user_id] = now
+        self._pending[user_id] = datetime.now(timezone.utc)
+        if len(self._pending) >= settings.database.LAST_ACTIVE_MAX_PENDING:
+            self._wakeup.set()
+
+    async def flush(self) -> int:
+        """
+        Write buffered activity in one UPDATE
+
+        Returns:
+            Number of users rows updated; 0 when nothing was pending or the
+            write failed (the batch is then kept for the next flush)
+        """
+        if not self._pending:
+            return 0
+        batch, self._pending = self._pending, {}
+
+        cutoff = time.monotonic() - settings.database.LAST_ACTIVE_PRECISION_SECONDS
+        self._recorded = {user_id: at for user_id, at in self._recorded.items() if at > cutoff}
+
+        try:
+            status = await self.db.execute_query(
+                FLUSH_QUERY,
+                list(batch.keys()),
+                list(batch.values()),
+                settings.database.LAST_ACTIVE_PRECISION_SECONDS
+            )
+        except Exception as e:
+            logger.error(f"🚨 last_active flush FAILURE - {str(e)}", extra={"users": len(batch)})
+            for user_id, seen_at in batch.items():
+                self._pending.setdefault(user_id, seen_at)
+            return 0
+
+        updated = int(status.split()[-1]) if status else 0
+        logger.debug("🔧 last_active flushed", extra={"users": len(batch), "rows_updated": updated})
+        return updated
+
+    async def start(self) -> None:
+        """Start the flusher task on the running event loop"""
+        if self._flusher:
+            return
+        self._stopping = False
+        self._flusher = asyncio.create_task(self._run(), name="fitforge-last-active-flusher")
+        logger.info("✅ last_active flusher started")
+
+    async def stop(self) -> None:
+        """Stop the flusher and write whatever is still buffered"""
+        self._stopping = True
+        if self._flusher:
+            self._flusher.cancel()
+            await asyncio.gather(self._flusher, return_exceptions=True)
+            self._flusher = None
+        await self.flush()
+        logger.info("🛑 last_active flusher stopped")
+
+    async def _run(self) -> None:
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=settings.database.LAST_ACTIVE_FLUSH_SECONDS)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
+
+    @property
+    def pending(self) -> int:
+        """Users buffered for the next flush"""
+        return len(self._pending)
+
+
+# Global last-active tracker instance
+last_active = LastActiveTracker(db_manager)
+
+
+__all__ = ["LastActiveTracker", "last_active"]
@@ -8,15 +8,19 @@ All dependencies use secure token validation and user verification
 """
 
 import logging
-from typing import Optional, Dict, Any
+from typing import TYPE_CHECKING, Optional, Dict, Any
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from supabase import Client
 
+from .activity import last_active
+from .cache import auth_cache
 from .config import get_settings
-from .database import get_database, get_supabase_client, DatabaseManager
+from .database import get_database, get_supabase_client, set_request_user, DatabaseManager, WORKOUT_OWNER_QUERY
 from ..services.auth import AuthService
 
+if TYPE_CHECKING:
+    from .supabase_client import AsyncSupabase
+
 settings = get_settings()
 logger = logging.getLogger(__name__)
 
@@ -56,7 +60,7 @@ class AuthorizationError(HTTPException):
 
 
 async def get_auth_service(
-    supabase: Client = Depends(get_supabase_client),
+    supabase: "AsyncSupabase" = Depends(get_supabase_client),
     db: DatabaseManager = Depends(get_database)
 ) -> AuthService:
     """
@@ -83,25 +87,33 @@ async def get_current_user(
         # Extract token from Authorization header
         token = credentials.credentials
         
-        # Verify JWT token
-        payload = auth_service.verify_token(token)
-        if not payload:
+        if auth_cache.is_revoked(token):
             raise AuthenticationError("Invalid or expired token")
         
+        # Verify JWT token (signature checks are skipped for a cached payload)
+        payload = auth_cache.get_payload(token)
+        if payload is None:
+            payload = auth_service.verify_token(token)
+            if not payload:
+                raise AuthenticationError("Invalid or expired token")
+            auth_cache.set_payload(token, payload)
+        
         # Extract user ID from token payload
         user_id: str = payload.get("sub")
         if not user_id:
             raise AuthenticationError("Invalid token payload")
+        # Read-your-writes routing keys on the request's user
+        set_request_user(user_id)
         
-        # Get user profile from database using verified schema
+        # Get user profile (auth_cache first, then database using verified schema)
         user_profile = await auth_service.get_user_profile(user_id)
         if not user_profile:
             raise AuthenticationError("User not found")
         
-        # Update last active timestamp
-        await auth_service.update_last_active(user_id)
+        # Buffer last active timestamp; written in batches by the flusher
+        last_active.touch(user_id)
         
-        logger.info(f"🔧 Current user retrieved successfully: {user_id}")
+        logger.debug("🔧 Current user retrieved successfully: %s", user_id)
         return user_profile
         
     except HTTPException:
@@ -149,7 +161,7 @@ async def require_admin(
     SECURITY: Checks user role/permissions for admin access
     SCHEMA: Uses verified user data structure for role checking
     """
-    logger.info(f"🔥 require_admin ENTRY - user: {current_user.get('id')}")
+    logger.info("🔥 require_admin ENTRY - user: %s", current_user.get('id'))
     
     # Check if user has admin privileges
     # Note: Add admin role logic based on your user schema
@@ -166,7 +178,7 @@ async def require_admin(
         logger.warning(f"🚨 Admin access denied for user: {current_user.get('id')}")
         raise AuthorizationError("Admin privileges required")
     
-    logger.info(f"🔧 Admin access granted for user: {current_user.get('id')}")
+    logger.debug("🔧 Admin access granted for user: %s", current_user.get('id'))
     return current_user
 
 
@@ -179,13 +191,13 @@ async def require_user_or_admin(
     
     SECURITY: Implements user data isolation and admin override
     """
-    logger.info(f"🔥 require_user_or_admin ENTRY - requested_user: {user_id}, current_user: {current_user.get('id')}")
+    logger.info("🔥 require_user_or_admin ENTRY - requested_user: %s, current_user: %s", user_id, current_user.get('id'))
     
     current_user_id = current_user.get("id")
     
     # Check if user is accessing their own data
     if current_user_id == user_id:
-        logger.info(f"🔧 User access granted (own data): {current_user_id}")
+        logger.debug("🔧 User access granted (own data): %s", current_user_id)
         return current_user
     
     # Check if user has admin privileges
@@ -219,11 +231,11 @@ async def validate_workout_ownership(
     SECURITY: Uses parameterized query for ownership verification
     SCHEMA: Uses verified workouts table structure
     """
-    logger.info(f"🔥 validate_workout_ownership ENTRY - workout: {workout_id}, user: {current_user.get('id')}")
+    logger.info("🔥 validate_workout_ownership ENTRY - workout: %s, user: %s", workout_id, current_user.get('id'))
     
     try:
         # Parameterized query using verified workouts table columns
-        query = "SELECT id FROM workouts WHERE id = $1 AND user_id = $2"
+        query = WORKOUT_OWNER_QUERY
         params = [workout_id, current_user.get("id")]
         
         result = await db.execute_query(query, *params, fetch_one=True)
@@ -234,7 +246,7 @@ async def validate_workout_ownership(
             logger.warning(f"🚨 Workout ownership validation failed: {workout_id}")
             raise AuthorizationError("You don't have permission to access this workout")
         
-        logger.info(f"🔧 Workout ownership validated: {workout_id}")
+        logger.debug("🔧 Workout ownership validated: %s", workout_id)
         return True
         
     except HTTPException:
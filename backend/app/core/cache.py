@@ -0,0 +1,200 @@
+"""
+FitForge In-Process Caches
+Bounded TTL caches for verified tokens and user profiles used by auth dependencies,
+and for compressed response bodies
+
+Entries live in the worker's memory, so an invalidation only reaches the
+worker that made the write; other workers serve the old entry until its TTL
+runs out. TTLs are kept short for that reason (CACHE_AUTH_*_TTL).
+"""
+
+import hashlib
+import heapq
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Generic, Hashable, List, Optional, Tuple, TypeVar
+
+from .config import get_settings
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+V = TypeVar("V")
+
+
+class TTLCache(Generic[V]):
+    """
+    Least-recently-used cache whose entries also expire after a TTL
+
+    Not thread-safe; it is only touched from the event loop.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, Tuple[float, V]]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[V]:
+        """Value for key, or None if missing or expired"""
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def set(self, key: Hashable, value: V, ttl: Optional[float] = None) -> None:
+        """Store value for ttl seconds (default: the cache TTL), evicting the oldest entry when full"""
+        ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+        if ttl <= 0:
+            return
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, int]:
+        return {"size": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+class ExpiringSet:
+    """
+    Keys that are members until their own expiry, with no size bound
+
+    Unlike TTLCache nothing is evicted early, so a member can only disappear
+    by expiring. Expired keys are swept oldest-first on every add, which keeps
+    memory proportional to the keys still live.
+
+    Not thread-safe; it is only touched from the event loop.
+    """
+
+    def __init__(self):
+        self._expiry: Dict[Hashable, float] = {}
+        self._heap: List[Tuple[float, Hashable]] = []
+
+    def add(self, key: Hashable, ttl: float) -> None:
+        """Keep key for ttl seconds, or longer if it is already held longer"""
+        now = time.monotonic()
+        self._sweep(now)
+        if ttl <= 0:
+            return
+        expires = now + ttl
+        if expires > self._expiry.get(key, 0.0):
+            self._expiry[key] = expires
+            heapq.heappush(self._heap, (expires, key))
+
+    def __contains__(self, key: Hashable) -> bool:
+        expires = self._expiry.get(key)
+        return expires is not None and expires > time.monotonic()
+
+    def _sweep(self, now: float) -> None:
+        while self._heap and self._heap[0][0] <= now:
+            expires, key = heapq.heappop(self._heap)
+            # A re-added key has a later heap entry of its own
+            if self._expiry.get(key) == expires:
+                del self._expiry[key]
+
+    def clear(self) -> None:
+        self._expiry.clear()
+        self._heap.clear()
+
+    def __len__(self) -> int:
+        return len(self._expiry)
+
+    def stats(self) -> Dict[str, int]:
+        return {"size": len(self._expiry)}
+
+
+def token_key(token: str) -> str:
+    """Cache key for a bearer token; the raw token is never kept in memory"""
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+class AuthCache:
+    """
+    Verified JWT payloads keyed by token hash and user profile rows keyed by user ID
+
+    A payload is cached for at most the time left until its exp claim, so an
+    expired token is never accepted from the cache. Revoked tokens (logout)
+    are remembered until they would have expired, in a set that is not
+    bounded by max_entries: evicting a revocation would let a logged-out
+    token back in. Its size is the number of logouts within one token
+    lifetime.
+    """
+
+    def __init__(self, max_entries: int, token_ttl: float, profile_ttl: float):
+        self.tokens: TTLCache[Dict[str, Any]] = TTLCache(max_entries, token_ttl)
+        self.profiles: TTLCache[Dict[str, Any]] = TTLCache(max_entries, profile_ttl)
+        self.revoked = ExpiringSet()
+
+    def get_payload(self, token: str) -> Optional[Dict[str, Any]]:
+        return self.tokens.get(token_key(token))
+
+    def is_revoked(self, token: str) -> bool:
+        return token_key(token) in self.revoked
+
+    def set_payload(self, token: str, payload: Dict[str, Any]) -> None:
+        exp = payload.get("exp")
+        self.tokens.set(token_key(token), payload, exp - time.time() if exp else None)
+
+    def get_profile(self, user_id: Any) -> Optional[Dict[str, Any]]:
+        profile = self.profiles.get(str(user_id))
+        return dict(profile) if profile is not None else None
+
+    def set_profile(self, user_id: Any, profile: Dict[str, Any]) -> None:
+        self.profiles.set(str(user_id), dict(profile))
+
+    def invalidate_user(self, user_id: Any) -> None:
+        """Drop a user's cached profile after a write to their users row"""
+        self.profiles.pop(str(user_id))
+
+    def revoke_token(self, token: str, user_id: Optional[Any] = None) -> None:
+        """Forget a token's payload and refuse it until it expires (logout)"""
+        key = token_key(token)
+        payload = self.tokens.get(key)
+        self.tokens.pop(key)
+        exp = (payload or {}).get("exp")
+        remaining = exp - time.time() if exp else settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+        self.revoked.add(key, remaining)
+        if user_id is not None:
+            self.invalidate_user(user_id)
+
+    def clear(self) -> None:
+        self.tokens.clear()
+        self.profiles.clear()
+        self.revoked.clear()
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        return {"tokens": self.tokens.stats(), "profiles": self.profiles.stats(), "revoked": self.revoked.stats()}
+
+
+# Global auth cache instance
+auth_cache = AuthCache(
+    settings.cache.AUTH_CACHE_MAX_ENTRIES,
+    settings.cache.AUTH_TOKEN_TTL,
+    settings.cache.AUTH_PROFILE_TTL
+)
+
+# Compressed response bodies keyed by (encoding, body digest), see CompressionMiddleware
+compressed_bodies: TTLCache[bytes] = TTLCache(
+    settings.cache.COMPRESSED_BODY_ENTRIES,
+    settings.cache.COMPRESSED_BODY_TTL
+)
+
+
+__all__ = ["TTLCache", "ExpiringSet", "AuthCache", "auth_cache", "compressed_bodies", "token_key"]
@@ -71,6 +71,18 @@ class DatabaseSettings(BaseSettings):
     # Advanced settings
     ECHO_QUERIES: bool = Field(default=False, description="Echo SQL queries (debug only)")
     SLOW_QUERY_THRESHOLD: float = Field(default=1.0, ge=0.1, description="Slow query log threshold in seconds")
+    STREAM_CHUNK_SIZE: int = Field(default=1000, ge=10, le=50000, description="Rows fetched per server-side cursor round trip")
+    FAN_OUT_CONNECTIONS: int = Field(default=4, ge=1, le=20, description="Pooled connections one request may hold for concurrent reads")
+    PREPARED_STATEMENTS: bool = Field(default=True, description="Prepare registered queries and cache statements per connection (disable behind a transaction-mode pooler)")
+    STATEMENT_CACHE_SIZE: int = Field(default=256, ge=1, le=10000, description="Prepared statements kept per connection (asyncpg statement_cache_size)")
+    LAST_ACTIVE_PRECISION_SECONDS: int = Field(default=60, ge=1, le=86400, description="Granularity of users.last_active_at; newer activity inside it is not written")
+    LAST_ACTIVE_FLUSH_SECONDS: float = Field(default=15.0, gt=0, description="Interval of the batched last_active_at write")
+    LAST_ACTIVE_MAX_PENDING: int = Field(default=10000, ge=1, description="Buffered users that trigger an early flush")
+    
+    # Read replicas
+    REPLICA_URLS: str = Field(default="", description="Comma-separated read replica URLs; empty routes every query to the primary")
+    REPLICA_POOL_MAX_SIZE: int = Field(default=10, ge=1, le=100, description="Maximum pool size per replica")
+    READ_YOUR_WRITES_SECONDS: float = Field(default=5.0, ge=0, description="After a user writes, their read_only queries stay on the primary this long")
     
     @computed_field
     @property
@@ -83,6 +95,11 @@ class DatabaseSettings(BaseSettings):
     def async_connection_url(self) -> str:
         """Build async database connection URL"""
         return f"postgresql+asyncpg://{self.USER}:{self.PASSWORD.get_secret_value()}@{self.HOST}:{self.PORT}/{self.NAME}"
+    
+    @property
+    def replica_urls(self) -> List[str]:
+        """Configured replica URLs (not a computed field: they carry credentials)"""
+        return [url.strip() for url in self.REPLICA_URLS.split(",") if url.strip()]
 
 
 class CacheSettings(BaseSettings):
@@ -99,12 +116,20 @@ class CacheSettings(BaseSettings):
     # Cache settings
     DEFAULT_TTL: int = Field(default=3600, ge=1, description="Default cache TTL in seconds")
     MAX_CONNECTIONS: int = Field(default=50, ge=1, description="Maximum Redis connections")
+    REDIS_SOCKET_TIMEOUT: float = Field(default=0.5, gt=0, description="Redis connect/read timeout in seconds")
     
     # Cache keys
     USER_SESSION_TTL: int = Field(default=86400, description="User session TTL (24 hours)")
     WORKOUT_CACHE_TTL: int = Field(default=300, description="Workout cache TTL (5 minutes)")
     ANALYTICS_CACHE_TTL: int = Field(default=3600, description="Analytics cache TTL (1 hour)")
-    
+
+    # In-process auth caches (per worker, see app/core/cache.py)
+    AUTH_TOKEN_TTL: int = Field(default=300, ge=0, description="Verified token payload TTL, capped by token exp")
+    AUTH_PROFILE_TTL: int = Field(default=60, ge=0, description="User profile TTL; bounds staleness across workers")
+    AUTH_CACHE_MAX_ENTRIES: int = Field(default=10000, ge=1, description="Maximum entries per auth cache; revoked tokens are kept until expiry regardless")
+    COMPRESSED_BODY_ENTRIES: int = Field(default=256, ge=1, description="Compressed response bodies kept for reuse")
+    COMPRESSED_BODY_TTL: int = Field(default=300, ge=0, description="Compressed response body TTL")
+
     @computed_field
     @property
     def redis_url(self) -> str:
@@ -123,6 +148,9 @@ class MonitoringSettings(BaseSettings):
     ENABLE_METRICS: bool = Field(default=True, description="Enable metrics collection")
     METRICS_ENDPOINT: str = Field(default="/metrics", description="Metrics endpoint path")
     METRICS_TOKEN: Optional[SecretStr] = Field(default=None, description="Metrics endpoint auth token")
+    LOOP_LAG_INTERVAL_SECONDS: float = Field(default=0.5, gt=0, le=60, description="Event loop lag sampling interval")
+    HEALTH_PROBE_TIMEOUT_SECONDS: float = Field(default=0.75, gt=0, le=30, description="Timeout of each dependency probe behind /api/health")
+    HEALTH_CACHE_SECONDS: float = Field(default=3.0, ge=0, le=60, description="Probe results are reused this long; 0 probes on every request")
     
     # Tracing
     ENABLE_TRACING: bool = Field(default=False, description="Enable distributed tracing")
@@ -134,6 +162,22 @@ class MonitoringSettings(BaseSettings):
     SENTRY_TRACES_SAMPLE_RATE: float = Field(default=0.1, ge=0.0, le=1.0, description="Sentry traces sample rate")
 
 
+class JobSettings(BaseSettings):
+    """Background job queue settings"""
+    
+    model_config = SettingsConfigDict(env_prefix="JOBS_")
+    
+    ENABLED: bool = Field(default=True, description="Run background job workers in this process")
+    WORKERS: int = Field(default=2, ge=1, le=32, description="Concurrent job workers per process")
+    POLL_INTERVAL_SECONDS: float = Field(default=2.0, gt=0, description="Idle poll interval for jobs enqueued by other processes")
+    LEASE_SECONDS: int = Field(default=300, ge=10, description="Lease on a claimed job, renewed every third of it while the job runs; another worker may reclaim it once it lapses")
+    MAX_ATTEMPTS: int = Field(default=5, ge=1, le=50, description="Attempts before a job is marked failed")
+    RETRY_BASE_SECONDS: float = Field(default=5.0, gt=0, description="First retry delay, doubled on each further attempt")
+    RETRY_MAX_SECONDS: float = Field(default=900.0, gt=0, description="Upper bound on the retry delay")
+    RETENTION_HOURS: int = Field(default=72, ge=1, description="How long finished jobs are kept before pruning")
+    USER_STATS_RECONCILE_SECONDS: int = Field(default=21600, ge=60, description="Interval of the user_stats drift reconciliation job")
+
+
 class Settings(BaseSettings):
     """
     Application settings with environment variable support
@@ -169,6 +213,9 @@ class Settings(BaseSettings):
     SUPABASE_URL: Optional[str] = Field(default=None, description="Supabase project URL")
     SUPABASE_ANON_KEY: Optional[str] = Field(default=None, description="Supabase anon key")
     SUPABASE_SERVICE_KEY: Optional[str] = Field(default=None, description="Supabase service role key")
+    SUPABASE_MAX_WORKERS: int = Field(default=8, ge=1, le=64, description="Threads running blocking Supabase client calls")
+    SUPABASE_MAX_PENDING: int = Field(default=64, ge=1, le=1000, description="Supabase calls accepted (running or queued) before new ones are refused")
+    SUPABASE_TIMEOUT_SECONDS: float = Field(default=10.0, gt=0, le=120, description="Maximum wait for one Supabase call")
     
     # Database connection pool settings
     DB_POOL_MIN_SIZE: int = Field(default=5, ge=1, le=20, description="Minimum database pool size")
@@ -210,6 +257,21 @@ class Settings(BaseSettings):
     LOG_FILE: Optional[str] = Field(default="logs/fitforge.log", description="Log file path")
     LOG_MAX_BYTES: int = Field(default=10485760, description="Max log file size (10MB)")
     LOG_BACKUP_COUNT: int = Field(default=5, description="Number of log backup files")
+    LOG_QUEUE_ENABLED: bool = Field(default=True, description="Write log output from a background thread instead of the event loop")
+    LOG_SAMPLE_RATE: float = Field(default=1.0, ge=0.0, le=1.0, description="Fraction of hot-path ENTRY/QUERY_BUILD log lines kept")
+    LOG_SAMPLE_MAX_PER_SECOND: int = Field(default=20, ge=0, description="Hot-path log lines per call site per second, 0 for no cap")
+    LOG_SAMPLE_LOGGERS: Dict[str, float] = Field(
+        default_factory=dict,
+        description="Per-logger hot-path sample rates, e.g. {\"app.api.exercises\": 0.1}"
+    )
+    
+    # Startup
+    PRELOAD_ROUTERS: bool = Field(default=True, description="Import all API routers during startup instead of on their first request")
+    
+    # Response compression (app/middleware/compression.py)
+    COMPRESSION_MIN_SIZE: int = Field(default=1024, ge=0, description="Smallest response body compressed, in bytes")
+    COMPRESSION_GZIP_LEVEL: int = Field(default=6, ge=1, le=9, description="gzip compression level")
+    COMPRESSION_BROTLI_QUALITY: int = Field(default=4, ge=0, le=11, description="Brotli quality; above ~5 costs too much CPU for dynamic responses")
     
     # Redis settings (for caching, sessions)
     REDIS_URL: Optional[str] = Field(default=None, description="Redis connection URL")
@@ -217,6 +279,7 @@ class Settings(BaseSettings):
     
     # API rate limiting
     RATE_LIMIT_PER_MINUTE: int = Field(default=60, ge=1, description="API rate limit per minute per IP")
+    RATE_LIMIT_REDIS_RETRY_SECONDS: float = Field(default=5.0, gt=0, description="Time on in-process buckets after a Redis error before Redis is tried again")
     
     # File upload settings
     MAX_UPLOAD_SIZE: int = Field(default=10 * 1024 * 1024, ge=1, description="Max file upload size in bytes (10MB)")
@@ -239,6 +302,7 @@ class Settings(BaseSettings):
     _database: Optional[DatabaseSettings] = None
     _cache: Optional[CacheSettings] = None
     _monitoring: Optional[MonitoringSettings] = None
+    _jobs: Optional[JobSettings] = None
     
     @property
     def features(self) -> FeatureFlags:
@@ -268,6 +332,13 @@ class Settings(BaseSettings):
             self._monitoring = MonitoringSettings()
         return self._monitoring
     
+    @property
+    def jobs(self) -> JobSettings:
+        """Get background job queue configuration"""
+        if self._jobs is None:
+            self._jobs = JobSettings()
+        return self._jobs
+    
     @field_validator('ENVIRONMENT', mode='before')
     @classmethod
     def validate_environment(cls, v: Any) -> Environment:
@@ -8,30 +8,421 @@ All database operations must match the validated schema structure
 """
 
 import asyncio
+import hashlib
 import logging
-from typing import AsyncGenerator, Optional, Dict, Any
+import re
+import time
+from typing import TYPE_CHECKING, AsyncGenerator, AsyncIterator, Iterable, NamedTuple, Optional, Dict, Any, List, Sequence, Union
 from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from functools import lru_cache
 
 import asyncpg
-from supabase import create_client, Client
 from fastapi import HTTPException
 
+from .cache import TTLCache
 from .config import get_settings
+from .logging import get_logger, log_database_operation
+from .metrics import ROW_BUCKETS, registry
+
+if TYPE_CHECKING:
+    from .supabase_client import AsyncSupabase
 
 settings = get_settings()
 logger = logging.getLogger(__name__)
+slow_query_logger = get_logger("database.slow_query")
+
+
+# ============================================================================
+# PREPARED STATEMENTS
+# ============================================================================
+
+_LITERAL_COMMENT_OR_SPACE = re.compile(r"""('(?:[^']|'')*'|"(?:[^"]|"")*")|(?:\s|--[^\n]*)+""")
+
+
+def normalize_sql(query: str) -> str:
+    """
+    Collapse whitespace and drop line comments outside quoted text
+    
+    Query builders that assemble the same filter shape with different
+    indentation or line breaks then map to one prepared statement.
+    Dollar-quoted and E'' strings are left untouched.
+    """
+    query = str(query)
+    if "$$" in query or "E'" in query:
+        return query.strip()
+    return _LITERAL_COMMENT_OR_SPACE.sub(lambda m: m.group(1) or " ", query).strip()
+
+
+class NamedQuery(str):
+    """SQL text registered under a name; prepared on every pooled connection"""
+    
+    name: str
+    
+    def __new__(cls, name: str, query: str) -> "NamedQuery":
+        named = super().__new__(cls, normalize_sql(query))
+        named.name = name
+        return named
+
+
+_named_queries: Dict[str, NamedQuery] = {}
+_named_sql = set()
+
+
+def register_query(name: str, query: str) -> NamedQuery:
+    """
+    Declare a hot query once at import time
+    
+    Pass the returned NamedQuery to execute_query / fan_out like any SQL
+    string. Connections opened after registration prepare it up front;
+    older connections prepare it on first use.
+    """
+    named = NamedQuery(name, query)
+    existing = _named_queries.get(name)
+    if existing is not None and existing != named:
+        raise ValueError(f"Query '{name}' is already registered with different SQL")
+    _named_queries[name] = named
+    _named_sql.add(str(named))
+    return named
+
+
+class StatementStats:
+    """Process-wide statement cache counters, split by registered vs ad-hoc SQL"""
+    
+    def __init__(self):
+        self.named_hits = 0
+        self.named_misses = 0
+        self.hits = 0
+        self.misses = 0
+    
+    def record(self, query: str, hit: bool) -> None:
+        if query in _named_sql:
+            if hit:
+                self.named_hits += 1
+            else:
+                self.named_misses += 1
+        elif hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+    
+    def as_dict(self) -> Dict[str, Any]:
+        lookups = self.named_hits + self.named_misses + self.hits + self.misses
+        return {
+            "registered_queries": len(_named_queries),
+            "named_hits": self.named_hits,
+            "named_misses": self.named_misses,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round((self.named_hits + self.hits) / lookups, 4) if lookups else None
+        }
+
+
+statement_stats = StatementStats()
+
+
+class PreparedConnection(asyncpg.Connection):
+    """
+    asyncpg connection that prepares registered queries and counts cache hits
+    
+    asyncpg keeps prepared statements per connection in an LRU keyed by
+    query text (statement_cache_size), and that cache is what carries them
+    across pool acquires; a PreparedStatement object is only valid for the
+    acquire that created it. This subclass fills the cache at connect time
+    and observes lookups, relying on asyncpg 0.29 internals (_get_statement,
+    _stmt_cache).
+    """
+    
+    async def prepare_registered(self) -> None:
+        """Prepare every registered query into the statement cache"""
+        for named in list(_named_queries.values()):
+            try:
+                await self._get_statement(str(named), None)
+            except asyncpg.PostgresError as e:
+                # e.g. a table from a pending migration; prepared on first use instead
+                logger.warning(f"🚨 Could not prepare query '{named.name}': {e}")
+    
+    async def _get_statement(self, query, timeout, *, named=False, use_cache=True, **kwargs):
+        if use_cache and not named and self._stmt_cache_enabled:
+            key = (query, kwargs.get("record_class") or self._protocol.get_record_class(),
+                   kwargs.get("ignore_custom_codec", False))
+            statement_stats.record(query, self._stmt_cache.get(key) is not None)
+        return await super()._get_statement(query, timeout, named=named, use_cache=use_cache, **kwargs)
+
+
+# ============================================================================
+# READ REPLICAS
+# ============================================================================
+
+_WRITE_SQL = re.compile(
+    r"^\s*(?:insert|update|delete|merge|copy|create|alter|drop|truncate|grant|revoke"
+    r"|with\b.*\b(?:insert|update|delete)\b)",
+    re.IGNORECASE | re.DOTALL
+)
+
+# Authenticated user of the current request, for read-your-writes pinning
+_request_user: ContextVar[Optional[str]] = ContextVar("db_request_user", default=None)
+
+# Replica acquisition failures that fall back to the primary
+_REPLICA_ERRORS = (OSError, asyncio.TimeoutError, asyncpg.PostgresError, asyncpg.InterfaceError)
+
+
+def is_write_query(query: str) -> bool:
+    """True for statements that modify data or schema"""
+    return bool(_WRITE_SQL.match(query))
+
+
+def set_request_user(user_id: Optional[Any]) -> None:
+    """Bind the authenticated user to the current request (called by the auth dependencies)"""
+    _request_user.set(str(user_id) if user_id else None)
+
+
+# ============================================================================
+# QUERY INSTRUMENTATION
+# ============================================================================
+
+QUERY_DURATION = registry.histogram(
+    "fitforge_db_query_duration_seconds", "Query execution time, excluding pool wait", ["query"]
+)
+QUERY_ROWS = registry.histogram(
+    "fitforge_db_query_rows", "Rows returned or affected per query", ["query"], ROW_BUCKETS
+)
+QUERY_ERRORS = registry.counter(
+    "fitforge_db_query_errors_total", "Queries that raised", ["query"]
+)
+POOL_WAIT = registry.histogram(
+    "fitforge_db_pool_wait_seconds", "Time spent acquiring a pooled connection", ["pool"]
+)
+
+_FINGERPRINT_LITERAL = re.compile(r"'(?:[^']|'')*'|(?<![\w$])\d+(?:\.\d+)?")
+_FINGERPRINT_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_VERB_AND_TABLE = re.compile(
+    r"^\s*(?:(update)\s+(\w+)|(\w+).*?\b(?:from|into|update)\s+(\w+))", re.IGNORECASE | re.DOTALL
+)
+
+# Resolved once: Settings.database is a property and record_query runs per statement
+_db_settings = settings.database
+
+# HTTP scope of the current request, for attributing slow queries to endpoints
+_request_scope: ContextVar[Optional[Dict[str, Any]]] = ContextVar("db_request_scope", default=None)
+
+
+@lru_cache(maxsize=2048)
+def sql_fingerprint(query: str) -> str:
+    """Normalized SQL with literals and literal lists replaced by ?"""
+    return _FINGERPRINT_LIST.sub("(?)", _FINGERPRINT_LITERAL.sub("?", normalize_sql(query)))
+
+
+@lru_cache(maxsize=2048)
+def _fingerprint_name(query: str) -> str:
+    fingerprint = sql_fingerprint(query)
+    match = _VERB_AND_TABLE.match(fingerprint)
+    if match:
+        verb, table = (match.group(1), match.group(2)) if match.group(1) else (match.group(3), match.group(4))
+    else:
+        verb, table = fingerprint.split(" ", 1)[0] or "query", ""
+    digest = hashlib.sha1(fingerprint.encode()).hexdigest()[:8]
+    return "_".join(part.lower() for part in (verb, table, digest) if part)
+
+
+def query_name(query: str) -> str:
+    """
+    Stable metric label for a query
+    
+    Registered queries use their registry name; anything else is named
+    verb_table_hash from its fingerprint, so builders that only vary
+    literals or whitespace share one label.
+    """
+    if isinstance(query, NamedQuery):
+        return query.name
+    return _fingerprint_name(query)
+
+
+def set_request_scope(scope: Optional[Dict[str, Any]]) -> None:
+    """Bind the ASGI scope of the current request (called by RequestLoggingMiddleware)"""
+    _request_scope.set(scope)
+
+
+def calling_endpoint() -> Optional[str]:
+    """Method and route template of the current request, if any"""
+    scope = _request_scope.get()
+    if scope is None:
+        return None
+    path = getattr(scope.get("route"), "path", None) or scope.get("path")
+    return f"{scope.get('method', '')} {path}".strip()
+
+
+def _row_count(result: Any) -> int:
+    if isinstance(result, list):
+        return len(result)
+    if isinstance(result, dict):
+        return 1
+    if isinstance(result, str):
+        # Command tag, e.g. "UPDATE 3" or "INSERT 0 1"
+        count = result.rsplit(" ", 1)[-1]
+        return int(count) if count.isdigit() else 0
+    return 0
+
+
+def record_query(name: str, query: str, duration: float, rows: int, pool_wait: float = 0.0) -> None:
+    """Record one statement's metrics and log it if it crossed DB_SLOW_QUERY_THRESHOLD"""
+    QUERY_DURATION.observe(duration, (name,))
+    QUERY_ROWS.observe(rows, (name,))
+    if _db_settings.ECHO_QUERIES:
+        log_database_operation(query.lstrip().split(None, 1)[0].upper(), name, duration * 1000, rows)
+    if duration >= _db_settings.SLOW_QUERY_THRESHOLD:
+        slow_query_logger.warning("🚨 Slow query", extra={
+            "query_name": name,
+            "fingerprint": sql_fingerprint(query),
+            "duration_ms": round(duration * 1000, 2),
+            "pool_wait_ms": round(pool_wait * 1000, 2),
+            "rows": rows,
+            "endpoint": calling_endpoint() or "background"
+        })
+
+
+# ============================================================================
+# QUERY EXECUTION
+# ============================================================================
+
+def _query_error(e: Exception) -> HTTPException:
+    """Map a database error to the HTTPException the API returns for it"""
+    if isinstance(e, asyncpg.exceptions.UniqueViolationError):
+        logger.warning(f"Unique constraint violation: {e}")
+        return HTTPException(
+            status_code=409,
+            detail="Resource already exists"
+        )
+    if isinstance(e, asyncpg.exceptions.ForeignKeyViolationError):
+        logger.warning(f"Foreign key violation: {e}")
+        return HTTPException(
+            status_code=400,
+            detail="Invalid reference to related resource"
+        )
+    if isinstance(e, asyncpg.exceptions.CheckViolationError):
+        logger.warning(f"Check constraint violation: {e}")
+        return HTTPException(
+            status_code=400,
+            detail="Data validation failed"
+        )
+    logger.error(f"Database query failed: {e}")
+    return HTTPException(
+        status_code=500,
+        detail="Database operation failed"
+    )
+
+
+def _prepare_sql(query: str) -> str:
+    # str() unwraps NamedQuery; asyncpg only accepts exact str
+    return str(query) if isinstance(query, NamedQuery) else normalize_sql(query)
+
+
+async def _run_query(
+    conn: asyncpg.Connection,
+    query: str,
+    args: tuple,
+    fetch: bool,
+    fetch_one: bool,
+    name: str,
+    pool_wait: float = 0.0
+) -> Optional[Any]:
+    started = time.perf_counter()
+    try:
+        if fetch_one:
+            result = await conn.fetchrow(query, *args)
+            result = dict(result) if result else None
+        elif fetch:
+            results = await conn.fetch(query, *args)
+            result = [dict(row) for row in results]
+        else:
+            result = await conn.execute(query, *args)
+    except Exception as e:
+        QUERY_ERRORS.inc((name,))
+        raise _query_error(e) from e
+    record_query(name, query, time.perf_counter() - started, _row_count(result), pool_wait)
+    return result
+
+
+class Transaction:
+    """
+    Unit of work on one pooled connection, from DatabaseManager.transaction()
+    
+    execute_query has the DatabaseManager signature and error mapping, so
+    helpers that take a db can be handed a Transaction instead. Everything
+    commits when the block exits and rolls back if it raises.
+    """
+    
+    def __init__(self, connection: asyncpg.Connection):
+        self.connection = connection
+    
+    async def execute_query(
+        self,
+        query: str,
+        *args,
+        fetch: bool = False,
+        fetch_one: bool = False,
+        read_only: bool = False
+    ) -> Optional[Any]:
+        """Execute a query inside the transaction (read_only is accepted and ignored)"""
+        return await _run_query(self.connection, _prepare_sql(query), args, fetch, fetch_one, query_name(query))
+    
+    async def execute_many(self, query: str, args: Iterable[Sequence[Any]]) -> None:
+        """Execute one statement per argument tuple in a single pipelined round trip"""
+        name = query_name(query)
+        query = _prepare_sql(query)
+        args = list(args)
+        started = time.perf_counter()
+        try:
+            await self.connection.executemany(query, args)
+        except Exception as e:
+            QUERY_ERRORS.inc((name,))
+            raise _query_error(e) from e
+        record_query(name, query, time.perf_counter() - started, len(args))
+    
+    @asynccontextmanager
+    async def savepoint(self) -> AsyncGenerator["Transaction", None]:
+        """
+        Nested block that rolls back on its own when it raises
+        
+        The exception still propagates; catch it outside the block to keep
+        the surrounding transaction going.
+        """
+        async with self.connection.transaction():
+            yield self
+
+
+# DatabaseManager or an open Transaction; both provide execute_query
+QueryExecutor = Union["DatabaseManager", Transaction]
+
+
+class ReadQuery(NamedTuple):
+    """One independent read for DatabaseManager.fan_out"""
+    query: str
+    args: tuple = ()
+    fetch_one: bool = False
 
 
 class DatabaseManager:
     """
     Database connection manager for Supabase PostgreSQL
     Handles both direct asyncpg connections and Supabase client operations
+    
+    Queries run on the primary unless the caller passes read_only=True and
+    DB_REPLICA_URLS is set; those rotate over the replica pools. Once a
+    request's user writes, their read_only queries stay on the primary for
+    DB_READ_YOUR_WRITES_SECONDS so they never read behind their own write.
+    Pins are per process; with several workers a user's next request can
+    land elsewhere, so keep the window above typical replica lag only.
     """
     
     def __init__(self):
         self.pool: Optional[asyncpg.Pool] = None
-        self.supabase: Optional[Client] = None
+        self.replica_pools: List[asyncpg.Pool] = []
+        self._next_replica = 0
+        self._pinned: TTLCache[bool] = TTLCache(10000, settings.database.READ_YOUR_WRITES_SECONDS)
+        self.supabase: Optional["AsyncSupabase"] = None
         self._initialized = False
+        self.statement_stats = statement_stats
     
     async def initialize(self) -> None:
         """Initialize database connections"""
@@ -41,10 +432,13 @@ class DatabaseManager:
         try:
             # Initialize Supabase client
             if settings.SUPABASE_URL and settings.SUPABASE_ANON_KEY:
-                self.supabase = create_client(
+                # Imported here; the client library costs ~0.3s at import
+                from supabase import create_client
+                from .supabase_client import AsyncSupabase
+                self.supabase = AsyncSupabase(create_client(
                     settings.SUPABASE_URL,
                     settings.SUPABASE_ANON_KEY
-                )
+                ))
                 logger.info("✅ Supabase client initialized")
             
             # Initialize direct PostgreSQL connection pool
@@ -54,18 +448,19 @@ class DatabaseManager:
                 # Use component-based configuration
                 db_url = settings.database.connection_url
                 
-            self.pool = await asyncpg.create_pool(
-                db_url,
-                min_size=settings.database.POOL_MIN_SIZE,
-                max_size=settings.database.POOL_MAX_SIZE,
-                command_timeout=settings.database.COMMAND_TIMEOUT,
-                server_settings={
-                    'application_name': 'FitForge_Backend',
-                    'timezone': 'UTC'
-                }
-            )
+            self.pool = await self._create_pool(db_url, settings.database.POOL_MAX_SIZE)
             logger.info("✅ PostgreSQL connection pool initialized")
             
+            # A replica that is down at startup is skipped, not fatal
+            for index, replica_url in enumerate(settings.database.replica_urls):
+                try:
+                    self.replica_pools.append(
+                        await self._create_pool(replica_url, settings.database.REPLICA_POOL_MAX_SIZE)
+                    )
+                    logger.info(f"✅ Read replica {index} connection pool initialized")
+                except _REPLICA_ERRORS as e:
+                    logger.warning(f"🚨 Read replica {index} unavailable, skipping it: {e}")
+            
             self._initialized = True
             
         except Exception as e:
@@ -75,85 +470,250 @@ class DatabaseManager:
                 detail=f"Database connection failed: {str(e)}"
             )
     
+    async def _create_pool(self, dsn: str, max_size: int) -> asyncpg.Pool:
+        return await asyncpg.create_pool(
+            dsn,
+            min_size=min(settings.database.POOL_MIN_SIZE, max_size),
+            max_size=max_size,
+            command_timeout=settings.database.COMMAND_TIMEOUT,
+            statement_cache_size=(
+                settings.database.STATEMENT_CACHE_SIZE if settings.database.PREPARED_STATEMENTS else 0
+            ),
+            connection_class=PreparedConnection,
+            init=self._prepare_registered,
+            server_settings={
+                'application_name': 'FitForge_Backend',
+                'timezone': 'UTC'
+            }
+        )
+    
     async def close(self) -> None:
         """Close database connections"""
         if self.pool:
             await self.pool.close()
             logger.info("🔌 PostgreSQL connection pool closed")
         
+        for replica_pool in self.replica_pools:
+            await replica_pool.close()
+        if self.replica_pools:
+            logger.info(f"🔌 {len(self.replica_pools)} read replica pool(s) closed")
+        self.replica_pools = []
+        
+        if self.supabase:
+            self.supabase.close()
+            self.supabase = None
+        
         self._initialized = False
     
+    def pin_to_primary(self, user_id: Optional[Any] = None) -> None:
+        """Keep a user's read_only queries on the primary for the read-your-writes window"""
+        user_id = str(user_id) if user_id else _request_user.get()
+        if user_id:
+            self._pinned.set(user_id, True)
+    
+    def _route(self, read_only: bool) -> asyncpg.Pool:
+        """Pool for the next query: a replica in rotation, or the primary"""
+        if not read_only or not self.replica_pools:
+            return self.pool
+        user_id = _request_user.get()
+        if user_id and self._pinned.get(user_id):
+            return self.pool
+        self._next_replica = (self._next_replica + 1) % len(self.replica_pools)
+        return self.replica_pools[self._next_replica]
+    
     @asynccontextmanager
-    async def get_connection(self) -> AsyncGenerator[asyncpg.Connection, None]:
-        """Get a database connection from the pool"""
+    async def _acquire(self, read_only: bool) -> AsyncGenerator[asyncpg.Connection, None]:
         if not self.pool:
             raise HTTPException(
                 status_code=500,
                 detail="Database pool not initialized"
             )
         
-        async with self.pool.acquire() as connection:
-            try:
-                yield connection
-            except Exception as e:
-                # Log the error but let it propagate
-                logger.error(f"Database operation failed: {e}")
+        pool = self._route(read_only)
+        started = time.perf_counter()
+        try:
+            connection = await pool.acquire(timeout=settings.database.POOL_TIMEOUT)
+        except _REPLICA_ERRORS as e:
+            if pool is self.pool:
                 raise
+            logger.warning(f"🚨 Read replica unavailable, reading from primary: {e}")
+            pool = self.pool
+            connection = await pool.acquire(timeout=settings.database.POOL_TIMEOUT)
+        POOL_WAIT.observe(time.perf_counter() - started, ("primary" if pool is self.pool else "replica",))
+        
+        try:
+            yield connection
+        except Exception as e:
+            # Log the error but let it propagate
+            logger.error(f"Database operation failed: {e}")
+            raise
+        finally:
+            await pool.release(connection)
+    
+    @asynccontextmanager
+    async def get_connection(self, read_only: bool = False) -> AsyncGenerator[asyncpg.Connection, None]:
+        """
+        Get a database connection from the pool
+        
+        Connections taken without read_only are assumed to write, so the
+        request's user is pinned to the primary.
+        """
+        if not read_only:
+            self.pin_to_primary()
+        async with self._acquire(read_only) as connection:
+            yield connection
+    
+    async def _prepare_registered(self, conn: PreparedConnection) -> None:
+        """Pool init hook: prepare every registered query on a new connection"""
+        if settings.database.PREPARED_STATEMENTS:
+            await conn.prepare_registered()
     
     async def execute_query(
         self,
         query: str,
         *args,
         fetch: bool = False,
-        fetch_one: bool = False
+        fetch_one: bool = False,
+        read_only: bool = False
     ) -> Optional[Any]:
         """
         Execute a database query with error handling
         
+        Query text is normalized first, so builders that emit the same
+        filter shape share one entry in the connection's prepared statement
+        cache; registered NamedQuery objects are already in it. Latency,
+        rows and pool wait are recorded under query_name(query).
+        
         Args:
-            query: SQL query string
+            query: SQL query string or NamedQuery
             *args: Query parameters
             fetch: Return all results
             fetch_one: Return single result
+            read_only: Allow routing to a read replica
             
         Returns:
             Query results or None
         """
+        name = query_name(query)
+        query = _prepare_sql(query)
+        if not read_only and is_write_query(query):
+            self.pin_to_primary()
+        started = time.perf_counter()
+        async with self._acquire(read_only) as conn:
+            return await _run_query(conn, query, args, fetch, fetch_one, name, time.perf_counter() - started)
+    
+    @asynccontextmanager
+    async def transaction(self, isolation: Optional[str] = None) -> AsyncGenerator[Transaction, None]:
+        """
+        Run several statements on one connection, atomically
+        
+            async with db.transaction() as tx:
+                workout = await tx.execute_query(..., fetch_one=True)
+                async with tx.savepoint():
+                    await tx.execute_query(...)
+        
+        Statement errors map to the same HTTPExceptions as execute_query;
+        errors raised at commit (deferred constraints, serialization
+        failures) are mapped the same way. The user is pinned to the primary.
+        
+        Args:
+            isolation: asyncpg isolation level (default: server default)
+        """
         async with self.get_connection() as conn:
             try:
-                if fetch_one:
-                    result = await conn.fetchrow(query, *args)
-                    return dict(result) if result else None
-                elif fetch:
-                    results = await conn.fetch(query, *args)
-                    return [dict(row) for row in results]
-                else:
-                    return await conn.execute(query, *args)
-                    
-            except asyncpg.exceptions.UniqueViolationError as e:
-                logger.warning(f"Unique constraint violation: {e}")
-                raise HTTPException(
-                    status_code=409,
-                    detail="Resource already exists"
-                )
-            except asyncpg.exceptions.ForeignKeyViolationError as e:
-                logger.warning(f"Foreign key violation: {e}")
-                raise HTTPException(
-                    status_code=400,
-                    detail="Invalid reference to related resource"
-                )
-            except asyncpg.exceptions.CheckViolationError as e:
-                logger.warning(f"Check constraint violation: {e}")
-                raise HTTPException(
-                    status_code=400,
-                    detail="Data validation failed"
-                )
-            except Exception as e:
-                logger.error(f"Database query failed: {e}")
-                raise HTTPException(
-                    status_code=500,
-                    detail="Database operation failed"
+                async with conn.transaction(isolation=isolation):
+                    yield Transaction(conn)
+            except asyncpg.PostgresError as e:
+                raise _query_error(e) from e
+    
+    async def fan_out(
+        self,
+        queries: Sequence[ReadQuery],
+        max_connections: Optional[int] = None,
+        read_only: bool = False
+    ) -> List[Any]:
+        """
+        Run independent read queries concurrently on separate pooled connections
+        
+        Each query goes through execute_query, so errors map to the same
+        HTTPExceptions; the first failure cancels the rest. At most
+        max_connections (default DB_FAN_OUT_CONNECTIONS) are held at once, so
+        one request cannot drain the pool. Queries do not share a snapshot;
+        only use this for reads that need not be mutually consistent.
+        
+        Args:
+            queries: ReadQuery per query; fetch_one returns a dict, otherwise a list
+            max_connections: Per-call connection budget
+            read_only: Allow routing the queries to read replicas
+            
+        Returns:
+            Results in the order of queries
+        """
+        budget = asyncio.Semaphore(max_connections or settings.database.FAN_OUT_CONNECTIONS)
+        
+        async def run(read: ReadQuery) -> Any:
+            async with budget:
+                return await self.execute_query(
+                    read.query, *read.args,
+                    fetch=not read.fetch_one, fetch_one=read.fetch_one, read_only=read_only
                 )
+        
+        tasks = [asyncio.ensure_future(run(read)) for read in queries]
+        try:
+            return await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+    
+    async def stream_query(
+        self,
+        query: str,
+        *args,
+        chunk_size: Optional[int] = None,
+        read_only: bool = False
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Stream query results from a server-side cursor in fixed-size chunks
+        
+        Only one chunk is held in memory at a time, so exports over a user's
+        full history stay flat regardless of row count. The connection is held
+        in a read-only REPEATABLE READ transaction until the generator finishes
+        or is closed, giving every chunk the same snapshot.
+        
+        Args:
+            query: SQL query string
+            *args: Query parameters
+            chunk_size: Rows per fetch (defaults to DB_STREAM_CHUNK_SIZE)
+            read_only: Allow streaming from a read replica
+            
+        Yields:
+            Lists of row dicts, at most chunk_size long
+        """
+        chunk_size = chunk_size or settings.database.STREAM_CHUNK_SIZE
+        name = query_name(query)
+        query = str(query)
+        # Only time spent in the database counts, not the consumer between chunks
+        db_time, row_count = 0.0, 0
+        
+        async with self._acquire(read_only) as conn:
+            try:
+                async with conn.transaction(isolation="repeatable_read", readonly=True):
+                    started = time.perf_counter()
+                    cursor = await conn.cursor(query, *args)
+                    while True:
+                        rows = await cursor.fetch(chunk_size)
+                        db_time += time.perf_counter() - started
+                        row_count += len(rows)
+                        if not rows:
+                            break
+                        yield [dict(row) for row in rows]
+                        if len(rows) < chunk_size:
+                            break
+                        started = time.perf_counter()
+            finally:
+                record_query(name, query, db_time, row_count)
     
     async def health_check(self) -> Dict[str, Any]:
         """Check database connectivity and return status"""
@@ -161,13 +721,15 @@ class DatabaseManager:
             "database": "unknown",
             "supabase": "unknown",
             "pool_size": 0,
-            "timestamp": None
+            "replicas": len(self.replica_pools),
+            "timestamp": None,
+            "statement_cache": self.statement_stats.as_dict()
         }
         
         try:
             # Check PostgreSQL pool
             if self.pool:
-                async with self.get_connection() as conn:
+                async with self._acquire(read_only=False) as conn:
                     result = await conn.fetchrow("SELECT NOW() as timestamp, version() as version")
                     status["database"] = "connected"
                     status["pool_size"] = self.pool.get_size()
@@ -177,9 +739,8 @@ class DatabaseManager:
             # Check Supabase client
             if self.supabase:
                 try:
-                    # Simple health check query
-                    response = self.supabase.from_("exercises").select("id").limit(1).execute()
-                    status["supabase"] = "connected" if response.data is not None else "error"
+                    # Simple health check query, off the event loop
+                    status["supabase"] = "connected" if await self.supabase.health_check() else "error"
                 except Exception as e:
                     logger.warning(f"Supabase health check failed: {e}")
                     status["supabase"] = "error"
@@ -203,8 +764,8 @@ async def get_database() -> DatabaseManager:
     return db_manager
 
 
-async def get_supabase_client() -> Client:
-    """Dependency injection for Supabase client"""
+async def get_supabase_client() -> "AsyncSupabase":
+    """Dependency injection for the async Supabase client"""
     db = await get_database()
     if not db.supabase:
         raise HTTPException(
@@ -214,15 +775,35 @@ async def get_supabase_client() -> Client:
     return db.supabase
 
 
+# Hot lookups shared by the auth dependencies and DatabaseUtils
+USER_PROFILE_QUERY = register_query(
+    "users.profile",
+    """
+    SELECT id, email, display_name, height_inches, weight_lbs, age, sex,
+           experience_level, primary_goals, available_equipment,
+           workout_count, feature_level, created_at, updated_at, last_active_at
+    FROM users
+    WHERE id = $1
+    """
+)
+USER_EXISTS_QUERY = register_query("users.exists", "SELECT id FROM users WHERE id = $1")
+EXERCISE_EXISTS_QUERY = register_query(
+    "exercises.exists", "SELECT id FROM exercises WHERE id = $1 AND is_active = true"
+)
+WORKOUT_OWNER_QUERY = register_query(
+    "workouts.owned_by", "SELECT id FROM workouts WHERE id = $1 AND user_id = $2"
+)
+
+
 # Database utilities for common operations
 class DatabaseUtils:
     """Utility functions for database operations"""
     
     @staticmethod
-    async def verify_user_exists(user_id: str, db: DatabaseManager) -> bool:
+    async def verify_user_exists(user_id: str, db: QueryExecutor) -> bool:
         """Verify user exists in database"""
         result = await db.execute_query(
-            "SELECT id FROM users WHERE id = $1",
+            USER_EXISTS_QUERY,
             user_id,
             fetch_one=True
         )
@@ -232,7 +813,7 @@ class DatabaseUtils:
     async def verify_exercise_exists(exercise_id: str, db: DatabaseManager) -> bool:
         """Verify exercise exists in database"""
         result = await db.execute_query(
-            "SELECT id FROM exercises WHERE id = $1 AND is_active = true",
+            EXERCISE_EXISTS_QUERY,
             exercise_id,
             fetch_one=True
         )
@@ -246,7 +827,7 @@ class DatabaseUtils:
     ) -> bool:
         """Verify workout belongs to specified user"""
         result = await db.execute_query(
-            "SELECT id FROM workouts WHERE id = $1 AND user_id = $2",
+            WORKOUT_OWNER_QUERY,
             workout_id,
             user_id,
             fetch_one=True
@@ -289,6 +870,18 @@ class DatabaseUtils:
 __all__ = [
     'DatabaseManager',
     'DatabaseUtils',
+    'NamedQuery',
+    'QueryExecutor',
+    'USER_PROFILE_QUERY',
+    'ReadQuery',
+    'is_write_query',
+    'normalize_sql',
+    'query_name',
+    'register_query',
+    'set_request_scope',
+    'set_request_user',
+    'sql_fingerprint',
+    'Transaction',
     'db_manager',
     'get_database',
     'get_supabase_client'
@@ -4,7 +4,8 @@ Dependency injection for FastAPI endpoints
 """
 
 import logging
-from typing import AsyncGenerator, Optional, Dict, Any
+import math
+from typing import Optional, Dict, Any
 from datetime import datetime, timezone
 
 from fastapi import Depends, HTTPException, Request, status
@@ -12,8 +13,11 @@ from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 import redis.asyncio as aioredis
 from jose import JWTError, jwt
 
+from .cache import auth_cache
 from .config import get_settings, Settings
-from .database import get_database, DatabaseManager
+from .database import get_database, set_request_user, DatabaseManager, USER_PROFILE_QUERY
+from .rate_limit import rate_limiter
+from .redis_client import redis_manager
 from ..models.schemas import User
 
 logger = logging.getLogger(__name__)
@@ -27,28 +31,9 @@ async def get_config() -> Settings:
     return get_settings()
 
 
-async def get_redis_client(
-    settings: Settings = Depends(get_config)
-) -> AsyncGenerator[Optional[aioredis.Redis], None]:
-    """Get Redis client for caching"""
-    if not settings.cache.redis_url:
-        yield None
-        return
-    
-    redis_client = None
-    try:
-        redis_client = await aioredis.from_url(
-            settings.cache.redis_url,
-            max_connections=settings.cache.MAX_CONNECTIONS,
-            decode_responses=True
-        )
-        yield redis_client
-    except Exception as e:
-        logger.error(f"Failed to connect to Redis: {e}")
-        yield None
-    finally:
-        if redis_client:
-            await redis_client.close()
+async def get_redis_client() -> Optional[aioredis.Redis]:
+    """Get the shared Redis client (pool owned by the app lifespan)"""
+    return redis_manager.client
 
 
 async def verify_feature_flag(flag_name: str):
@@ -68,9 +53,43 @@ async def get_current_user(
     settings: Settings = Depends(get_config),
     db: DatabaseManager = Depends(get_database)
 ) -> User:
-    """Extract and validate current user from JWT token"""
+    """
+    Extract and validate current user from JWT token
+    
+    Verified payloads and user rows come from auth_cache when present, so a
+    repeat request with the same token needs neither a decode nor a query.
+    """
     token = credentials.credentials
+    if auth_cache.is_revoked(token):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid authentication credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    
+    payload = auth_cache.get_payload(token)
+    if payload is None:
+        payload = _verify_token(token, settings)
+        auth_cache.set_payload(token, payload)
+    user_id: str = payload["sub"]
+    set_request_user(user_id)
     
+    user_data = auth_cache.get_profile(user_id)
+    if user_data is None:
+        user_data = await db.execute_query(USER_PROFILE_QUERY, user_id, fetch_one=True)
+        
+        if not user_data:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="User not found"
+            )
+        auth_cache.set_profile(user_id, user_data)
+    
+    return User(**user_data)
+
+
+def _verify_token(token: str, settings: Settings) -> Dict[str, Any]:
+    """Decode a JWT and check its subject and expiry; raises 401 otherwise"""
     try:
         # Decode JWT token
         payload = jwt.decode(
@@ -103,26 +122,7 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    # Fetch user from database
-    user_data = await db.execute_query(
-        """
-        SELECT id, email, display_name, height_inches, weight_lbs, age, sex,
-               experience_level, primary_goals, available_equipment,
-               workout_count, feature_level, created_at, updated_at, last_active_at
-        FROM users
-        WHERE id = $1
-        """,
-        user_id,
-        fetch_one=True
-    )
-    
-    if not user_data:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User not found"
-        )
-    
-    return User(**user_data)
+    return payload
 
 
 async def get_optional_current_user(
@@ -146,10 +146,17 @@ async def get_optional_current_user(
 
 
 class RateLimiter:
-    """Rate limiting dependency"""
+    """
+    Rate limiting dependency
+    
+    Token bucket per client IP: requests_per_minute refill per minute with a
+    burst of the same size (default RATE_LIMIT_PER_MINUTE). Checked atomically
+    in Redis; falls back to in-process buckets when Redis is unavailable.
+    """
     
-    def __init__(self, requests_per_minute: int = 60):
+    def __init__(self, requests_per_minute: Optional[int] = None, scope: str = "api"):
         self.requests_per_minute = requests_per_minute
+        self.scope = scope
     
     async def __call__(
         self,
@@ -158,36 +165,18 @@ class RateLimiter:
         settings: Settings = Depends(get_config)
     ) -> bool:
         """Check rate limit for request"""
-        if not redis:
-            # If Redis is not available, allow the request
-            return True
+        limit = self.requests_per_minute or settings.RATE_LIMIT_PER_MINUTE
+        client_ip = request.client.host if request.client else "unknown"
+        decision = await rate_limiter.hit(f"rate_limit:{self.scope}:{client_ip}", limit, 60.0, redis)
         
-        # Get client IP
-        client_ip = request.client.host
-        key = f"rate_limit:{client_ip}"
+        if not decision.allowed:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail=f"Rate limit exceeded. Maximum {limit} requests per minute.",
+                headers={"Retry-After": str(max(1, math.ceil(decision.retry_after)))}
+            )
         
-        try:
-            # Increment counter
-            current = await redis.incr(key)
-            
-            # Set expiration on first request
-            if current == 1:
-                await redis.expire(key, 60)  # 1 minute
-            
-            # Check limit
-            limit = settings.RATE_LIMIT_PER_MINUTE or self.requests_per_minute
-            if current > limit:
-                raise HTTPException(
-                    status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                    detail=f"Rate limit exceeded. Maximum {limit} requests per minute."
-                )
-            
-            return True
-            
-        except aioredis.RedisError as e:
-            logger.error(f"Redis error during rate limiting: {e}")
-            # Allow request if Redis fails
-            return True
+        return True
 
 
 async def check_ab_test_group(
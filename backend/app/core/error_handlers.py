@@ -35,6 +35,7 @@ from .exceptions import (
     RateLimitError
 )
 from .config import get_settings
+from .logging import correlation_id_var
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
@@ -50,8 +51,8 @@ def get_correlation_id(request: Request) -> str:
     Returns:
         Correlation ID string
     """
-    # Try to get from request state (set by middleware)
-    correlation_id = getattr(request.state, "correlation_id", None)
+    # Try to get from request state or the request context (set by middleware)
+    correlation_id = getattr(request.state, "correlation_id", None) or correlation_id_var.get()
     
     # Try to get from headers (for distributed tracing)
     if not correlation_id:
@@ -233,7 +234,7 @@ async def http_exception_handler(request: Request, exc: HTTPException) -> JSONRe
     )
     
     # Extract headers if present (useful for rate limit errors)
-    headers = getattr(exc, "headers", {})
+    headers = getattr(exc, "headers", None) or {}
     details = {}
     if "Retry-After" in headers:
         details["retry_after_seconds"] = int(headers["Retry-After"])
@@ -0,0 +1,424 @@
+"""
+FitForge Background Job Queue
+Durable in-process job queue backed by the background_jobs table
+
+Jobs are inserted in the same transaction as the state change that needs
+them, so a committed change always has its follow-up work recorded. Workers
+claim rows with FOR UPDATE SKIP LOCKED, which lets any number of workers and
+API processes share one table without blocking each other. A claimed job
+holds a lease; if the process dies mid-job the lease expires and another
+worker picks it up. Failures are retried with exponential backoff until
+max_attempts, then left as 'failed' with the last error for inspection.
+
+Recurring jobs are declared with schedule(); an idle worker enqueues one
+when none of that type is queued, running or was created within the
+interval, so several API processes still produce one job per interval.
+
+While a handler runs, the worker extends its lease every third of
+JOBS_LEASE_SECONDS, so only a dead or stalled process loses a job to another
+worker. Handlers must still be safe to run more than once for the same
+payload. A handler whose writes are not idempotent (an increment, or a
+follow-up job) calls job.complete(conn) inside its own transaction: the job
+is marked done in the same commit as the writes, and if another worker has
+reclaimed it in the meantime complete() raises LeaseLostError and the whole
+transaction rolls back.
+"""
+
+import asyncio
+import json
+import logging
+import time
+from collections import defaultdict, deque
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Tuple
+from uuid import UUID
+
+import asyncpg
+
+from .config import get_settings
+from .database import DatabaseManager, db_manager
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+JobHandler = Callable[[Dict[str, Any], DatabaseManager, "Job"], Awaitable[None]]
+
+# Latency samples kept per process for the p50/p95 figures
+LATENCY_SAMPLE_SIZE = 1000
+# How often one idle worker prunes finished jobs
+PRUNE_INTERVAL_SECONDS = 3600
+
+CLAIM_QUERY = """
+    UPDATE background_jobs SET
+        status = 'running',
+        attempts = attempts + 1,
+        locked_until = NOW() + make_interval(secs => $1),
+        started_at = COALESCE(started_at, NOW())
+    WHERE id = (
+        SELECT id FROM background_jobs
+        WHERE (status = 'pending' AND run_after <= NOW())
+           OR (status = 'running' AND locked_until < NOW())
+        ORDER BY run_after
+        LIMIT 1
+        FOR UPDATE SKIP LOCKED
+    )
+    RETURNING id, job_type, payload, attempts, max_attempts,
+              EXTRACT(EPOCH FROM NOW() - run_after) AS wait_seconds
+"""
+
+
+# The attempts check keeps a worker whose lease expired from closing a job
+# another worker has since reclaimed
+COMPLETE_QUERY = """
+    UPDATE background_jobs SET
+        status = 'done', locked_until = NULL, last_error = NULL, finished_at = NOW()
+    WHERE id = $1 AND attempts = $2 AND status = 'running'
+    RETURNING true
+"""
+
+HEARTBEAT_QUERY = """
+    UPDATE background_jobs SET locked_until = NOW() + make_interval(secs => $3)
+    WHERE id = $1 AND attempts = $2 AND status = 'running'
+    RETURNING true
+"""
+
+
+def enqueue_query(job_types: str, payload: str, source: Optional[str] = None) -> str:
+    """
+    INSERT queueing one job per element of job_types (a text[] expression)
+    with the jsonb payload expression, returning the job ids
+
+    The one place background_jobs rows are created. Callers that queue work
+    in the same statement as the change that needs it embed the result as a
+    data-modifying CTE; payload may then refer to columns of source.
+    """
+    source_sql = f"{source} CROSS JOIN " if source else ""
+    return f"""
+        INSERT INTO background_jobs (job_type, payload, max_attempts)
+        SELECT job_type, {payload}, {int(settings.jobs.MAX_ATTEMPTS)}
+        FROM {source_sql}unnest({job_types}::text[]) AS job_type
+        RETURNING id
+    """
+
+
+class LeaseLostError(Exception):
+    """The job was reclaimed by another worker; this attempt's writes must roll back"""
+
+
+class Job:
+    """A claimed job, as handed to its handler"""
+
+    def __init__(self, record: asyncpg.Record):
+        self.id: UUID = record["id"]
+        self.job_type: str = record["job_type"]
+        self.attempts: int = record["attempts"]
+        self.max_attempts: int = record["max_attempts"]
+        self.completed = False
+
+    async def complete(self, conn: asyncpg.Connection) -> None:
+        """
+        Mark the job done on conn, inside the handler's open transaction
+
+        The handler's writes and the status change then commit together, so
+        a retry after a crash never sees the writes without the status.
+
+        Raises:
+            LeaseLostError: another worker holds the job now
+        """
+        if not await conn.fetchval(COMPLETE_QUERY, self.id, self.attempts):
+            raise LeaseLostError(f"Job {self.id} attempt {self.attempts} was reclaimed by another worker")
+        self.completed = True
+
+
+class JobQueue:
+    """
+    Postgres-backed job queue with in-process workers
+    Register handlers, call start() at startup and stop() at shutdown
+    """
+
+    def __init__(self, db: DatabaseManager):
+        self.db = db
+        self.handlers: Dict[str, JobHandler] = {}
+        self._wakeup = asyncio.Event()
+        self._workers: List[asyncio.Task] = []
+        self._stopping = False
+        self._next_prune = 0.0
+        self._schedules: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._next_scheduled: Dict[str, float] = {}
+
+        # In-process metrics, reset on restart
+        self._wait_samples: Deque[float] = deque(maxlen=LATENCY_SAMPLE_SIZE)
+        self._run_samples: Deque[float] = deque(maxlen=LATENCY_SAMPLE_SIZE)
+        self._counters: Dict[str, Dict[str, int]] = defaultdict(lambda: {"succeeded": 0, "retried": 0, "failed": 0})
+
+    def register(self, job_type: str, handler: JobHandler) -> None:
+        """Register the coroutine that processes jobs of job_type"""
+        self.handlers[job_type] = handler
+
+    async def enqueue(
+        self,
+        job_type: str,
+        payload: Dict[str, Any],
+        conn: Optional[asyncpg.Connection] = None
+    ) -> UUID:
+        """
+        Insert a job, on the caller's connection when given
+
+        Pass the connection of an open transaction to make the job commit
+        (or roll back) together with the change that produced it.
+        """
+        query = enqueue_query("ARRAY[$1]", "$2::jsonb")
+        args = (job_type, json.dumps(payload, default=str))
+        if conn is not None:
+            job_id = await conn.fetchval(query, *args)
+        else:
+            job_id = (await self.db.execute_query(query, *args, fetch_one=True))["id"]
+        return job_id
+
+    def schedule(self, job_type: str, every_seconds: float, payload: Optional[Dict[str, Any]] = None) -> None:
+        """Enqueue job_type about every every_seconds across all processes"""
+        self._schedules[job_type] = (every_seconds, payload or {})
+
+    async def enqueue_due(self) -> List[str]:
+        """Enqueue scheduled jobs whose interval has passed; returns the job types enqueued"""
+        enqueued = []
+        now = time.monotonic()
+        for job_type, (every_seconds, payload) in self._schedules.items():
+            if now < self._next_scheduled.get(job_type, 0.0):
+                continue
+            self._next_scheduled[job_type] = now + min(every_seconds, PRUNE_INTERVAL_SECONDS)
+            job = await self.db.execute_query(
+                """
+                INSERT INTO background_jobs (job_type, payload, max_attempts)
+                SELECT $1, $2::jsonb, $3
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM background_jobs
+                    WHERE job_type = $1
+                      AND (status IN ('pending', 'running') OR created_at > NOW() - make_interval(secs => $4))
+                )
+                RETURNING id
+                """,
+                job_type,
+                json.dumps(payload, default=str),
+                settings.jobs.MAX_ATTEMPTS,
+                float(every_seconds),
+                fetch_one=True
+            )
+            if job:
+                enqueued.append(job_type)
+                logger.info(f"🔧 Scheduled job {job_type} enqueued", extra={"job_id": str(job["id"])})
+        return enqueued
+
+    def notify(self) -> None:
+        """Wake idle workers after a commit that enqueued jobs"""
+        self._wakeup.set()
+
+    # ========================================================================
+    # WORKERS
+    # ========================================================================
+
+    async def start(self, workers: Optional[int] = None) -> None:
+        """Start worker tasks on the running event loop"""
+        if self._workers:
+            return
+        self._stopping = False
+        count = workers or settings.jobs.WORKERS
+        self._workers = [
+            asyncio.create_task(self._worker(n), name=f"fitforge-job-worker-{n}")
+            for n in range(count)
+        ]
+        logger.info(f"✅ Job queue started with {count} workers", extra={"job_types": sorted(self.handlers)})
+
+    async def stop(self) -> None:
+        """Stop workers; an interrupted job is retried once its lease expires"""
+        self._stopping = True
+        self._wakeup.set()
+        for task in self._workers:
+            task.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        logger.info("🛑 Job queue stopped")
+
+    async def _worker(self, worker_id: int) -> None:
+        """Claim and run jobs until stopped, sleeping when the queue is empty"""
+        while not self._stopping:
+            try:
+                if await self.run_next():
+                    continue
+                if worker_id == 0:
+                    if await self.enqueue_due():
+                        continue
+                    if time.monotonic() >= self._next_prune:
+                        await self.prune()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Database unavailable or similar; back off a full poll interval
+                logger.error(f"🚨 Job worker {worker_id} FAILURE - {str(e)}")
+
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=settings.jobs.POLL_INTERVAL_SECONDS)
+            except asyncio.TimeoutError:
+                pass
+
+    async def run_next(self) -> bool:
+        """
+        Claim and run a single job
+
+        Returns:
+            True when a job was claimed, False when none was ready
+        """
+        async with self.db.get_connection() as conn:
+            job = await conn.fetchrow(CLAIM_QUERY, settings.jobs.LEASE_SECONDS)
+        if job is None:
+            return False
+
+        self._wait_samples.append(float(job["wait_seconds"]))
+        job_type = job["job_type"]
+        handler = self.handlers.get(job_type)
+        claimed = Job(job)
+        heartbeat = asyncio.create_task(self._heartbeat(claimed))
+        started = time.perf_counter()
+
+        try:
+            if handler is None:
+                raise LookupError(f"No handler registered for job type '{job_type}'")
+            await handler(json.loads(job["payload"]), self.db, claimed)
+        except LeaseLostError as e:
+            logger.warning(f"🚨 Job {job_type} lease lost - {e}", extra={"job_id": str(claimed.id)})
+            return True
+        except Exception as e:
+            await self._record_failure(job, e)
+            return True
+        finally:
+            heartbeat.cancel()
+            self._run_samples.append(time.perf_counter() - started)
+
+        if not claimed.completed:
+            closed = await self.db.execute_query(COMPLETE_QUERY, claimed.id, claimed.attempts, fetch_one=True)
+            if not closed:
+                logger.warning(f"🚨 Job {job_type} lease lost before it was closed", extra={"job_id": str(claimed.id)})
+                return True
+        self._counters[job_type]["succeeded"] += 1
+        return True
+
+    async def _heartbeat(self, job: Job) -> None:
+        """Extend the lease of a running job until cancelled"""
+        lease = settings.jobs.LEASE_SECONDS
+        while True:
+            await asyncio.sleep(lease / 3)
+            try:
+                extended = await self.db.execute_query(HEARTBEAT_QUERY, job.id, job.attempts, float(lease), fetch_one=True)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Keep trying; the lease still has two thirds left
+                logger.warning(f"🚨 Job {job.job_type} heartbeat FAILURE - {getattr(e, 'detail', None) or e}")
+                continue
+            if not extended:
+                if not job.completed:
+                    logger.warning(f"🚨 Job {job.job_type} lease lost while running", extra={"job_id": str(job.id)})
+                return
+
+    async def _record_failure(self, job: asyncpg.Record, error: Exception) -> None:
+        """Schedule a retry with exponential backoff, or give up after max_attempts"""
+        job_type = job["job_type"]
+        exhausted = job["attempts"] >= job["max_attempts"]
+        delay = min(
+            settings.jobs.RETRY_BASE_SECONDS * 2 ** (job["attempts"] - 1),
+            settings.jobs.RETRY_MAX_SECONDS
+        )
+
+        logger.warning(f"🚨 Job {job_type} attempt {job['attempts']} FAILURE - {getattr(error, 'detail', None) or error}", extra={
+            "job_id": str(job["id"]), "retry_in_seconds": None if exhausted else delay
+        })
+
+        await self.db.execute_query(
+            """
+            UPDATE background_jobs SET
+                status = CASE WHEN $3 THEN 'failed' ELSE 'pending' END,
+                run_after = NOW() + make_interval(secs => $4),
+                finished_at = CASE WHEN $3 THEN NOW() END,
+                locked_until = NULL,
+                last_error = $5
+            WHERE id = $1 AND attempts = $2
+            """,
+            job["id"],
+            job["attempts"],
+            exhausted,
+            0.0 if exhausted else delay,
+            f"{type(error).__name__}: {getattr(error, 'detail', None) or error}"[:2000]
+        )
+        self._counters[job_type]["failed" if exhausted else "retried"] += 1
+
+    async def prune(self) -> int:
+        """Delete finished jobs older than the retention window; failed jobs are kept"""
+        self._next_prune = time.monotonic() + PRUNE_INTERVAL_SECONDS
+        result = await self.db.execute_query(
+            "DELETE FROM background_jobs WHERE status = 'done' AND finished_at < NOW() - make_interval(hours => $1)",
+            settings.jobs.RETENTION_HOURS
+        )
+        pruned = int(result.split()[-1])
+        if pruned:
+            logger.info(f"🔧 Pruned {pruned} finished jobs")
+        return pruned
+
+    # ========================================================================
+    # METRICS
+    # ========================================================================
+
+    async def backlog(self) -> Dict[str, Any]:
+        """Count queued, running and failed jobs and the age of the oldest ready job"""
+        rows = await self.db.execute_query(
+            """
+            SELECT status,
+                   COUNT(*) AS jobs,
+                   EXTRACT(EPOCH FROM NOW() - MIN(run_after) FILTER (WHERE run_after <= NOW())) AS oldest_ready_seconds
+            FROM background_jobs
+            WHERE status <> 'done'
+            GROUP BY status
+            """,
+            fetch=True
+        )
+        by_status = {row["status"]: row for row in rows or []}
+        pending = by_status.get("pending", {})
+        return {
+            "pending": int(pending.get("jobs", 0)),
+            "running": int(by_status.get("running", {}).get("jobs", 0)),
+            "failed": int(by_status.get("failed", {}).get("jobs", 0)),
+            "oldest_pending_seconds": round(float(pending.get("oldest_ready_seconds") or 0), 3)
+        }
+
+    def latency(self) -> Dict[str, Any]:
+        """Queue wait and run time percentiles over the recent jobs in this process"""
+        return {
+            "samples": len(self._run_samples),
+            "wait_seconds": _percentiles(self._wait_samples),
+            "run_seconds": _percentiles(self._run_samples),
+            "by_type": {job_type: dict(counts) for job_type, counts in self._counters.items()}
+        }
+
+    @property
+    def running(self) -> bool:
+        """Whether worker tasks are active in this process"""
+        return any(not task.done() for task in self._workers)
+
+
+def _percentiles(samples: Deque[float]) -> Dict[str, Optional[float]]:
+    """Nearest-rank p50/p95/max of a sample window"""
+    if not samples:
+        return {"p50": None, "p95": None, "max": None}
+    ordered = sorted(samples)
+    last = len(ordered) - 1
+    return {
+        "p50": round(ordered[round(last * 0.50)], 4),
+        "p95": round(ordered[round(last * 0.95)], 4),
+        "max": round(ordered[last], 4)
+    }
+
+
+# Global job queue instance
+job_queue = JobQueue(db_manager)
+
+
+__all__ = ["Job", "JobQueue", "JobHandler", "LeaseLostError", "enqueue_query", "job_queue"]
@@ -1,21 +1,222 @@
 """
 FitForge Backend Logging Configuration
 Production-ready logging setup with structured output
+
+Console and file output is written by one background thread: each configured
+logger's handlers are replaced by a LogForwarder that queues the record with
+only its message rendered, so formatting and I/O stay off the event loop. Per-request trace
+lines (🔥 ENTRY, 🔧 QUERY_BUILD) pass through hot_path_sampler first; log them
+with %-style arguments so a suppressed record is never formatted.
 """
 
+import atexit
 import logging
 import logging.config
+import os
+import queue
+import random
 import sys
-from typing import Dict, Any
+from contextvars import ContextVar
+from logging.handlers import QueueListener
+from typing import Dict, Any, List, Mapping, Optional, Sequence, Tuple
+
+# Correlation ID of the request being handled, set by ErrorHandlingMiddleware
+correlation_id_var: ContextVar[Optional[str]] = ContextVar("correlation_id", default=None)
+
+HOT_PATH_MARKERS: Tuple[str, ...] = ("ENTRY", "QUERY_BUILD")
 
 
-def setup_logging(log_level: str = "INFO") -> None:
+# ============================================================================
+# HOT-PATH SAMPLING
+# ============================================================================
+
+class HotPathSampler(logging.Filter):
+    """
+    Thins out per-request trace lines under load
+    Only INFO-and-below records containing a hot-path marker are considered;
+    everything else always passes.
+    """
+
+    def __init__(self, markers: Sequence[str] = HOT_PATH_MARKERS):
+        super().__init__()
+        self.markers = tuple(markers)
+        self.configure()
+
+    def configure(self, sample_rate: float = 1.0, max_per_second: int = 0,
+                  logger_rates: Optional[Mapping[str, float]] = None) -> None:
+        """
+        Args:
+            sample_rate: Fraction of hot-path records kept
+            max_per_second: Cap per call site after sampling, 0 for no cap
+            logger_rates: Sample rate per logger name, overriding sample_rate for that logger and its children
+        """
+        self.sample_rate = sample_rate
+        self.max_per_second = max_per_second
+        self.logger_rates = dict(logger_rates or {})
+        self.suppressed = 0
+        self._rates: Dict[str, float] = {}
+        # (pathname, lineno) -> [second, records passed in that second]
+        self._windows: Dict[Tuple[str, int], List[int]] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING or not isinstance(record.msg, str):
+            return True
+        if not any(marker in record.msg for marker in self.markers):
+            return True
+
+        rate = self._rates.get(record.name)
+        if rate is None:
+            rate = self._rates[record.name] = self._rate_for(record.name)
+        if rate < 1.0 and random.random() >= rate:
+            self.suppressed += 1
+            return False
+
+        if self.max_per_second:
+            # Keyed by call site: bounded, unlike f-string message text
+            key = (record.pathname, record.lineno)
+            second = int(record.created)
+            window = self._windows.get(key)
+            if window is None or window[0] != second:
+                self._windows[key] = [second, 1]
+            elif window[1] >= self.max_per_second:
+                self.suppressed += 1
+                return False
+            else:
+                window[1] += 1
+        return True
+
+    def _rate_for(self, name: str) -> float:
+        """Rate of the longest configured logger name that is name or a parent of it"""
+        best, rate = -1, self.sample_rate
+        for prefix, prefix_rate in self.logger_rates.items():
+            if (name == prefix or name.startswith(prefix + ".")) and len(prefix) > best:
+                best, rate = len(prefix), prefix_rate
+        return rate
+
+
+# Global hot-path sampler, attached to every logger by setup_logging
+hot_path_sampler = HotPathSampler()
+
+
+# ============================================================================
+# QUEUED OUTPUT
+# ============================================================================
+
+_log_queue: "queue.SimpleQueue[Any]" = queue.SimpleQueue()
+_listener: Optional[QueueListener] = None
+
+
+def _dispatch(handlers: Tuple[logging.Handler, ...], record: logging.LogRecord) -> None:
+    for handler in handlers:
+        if record.levelno >= handler.level:
+            handler.handle(record)
+
+
+class _LogDispatcher(QueueListener):
+    """Logging thread; each item carries the handlers of the logger that produced it"""
+
+    def handle(self, item: Tuple[Tuple[logging.Handler, ...], logging.LogRecord]) -> None:
+        _dispatch(*item)
+
+
+class LogForwarder(logging.Handler):
+    """
+    Stands in for a logger's configured handlers
+    Queues records for the logging thread, or writes inline while it is not
+    running. A queued record's message is rendered first, as
+    QueueHandler.prepare does, so arguments the caller mutates after logging
+    cannot change it; records the sampler drops never get this far.
+    """
+
+    def __init__(self, handlers: Sequence[logging.Handler]):
+        super().__init__(min(handler.level for handler in handlers))
+        self.handlers = tuple(handlers)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if _listener is None:
+            _dispatch(self.handlers, record)
+            return
+        try:
+            if record.args:
+                record.msg = record.getMessage()
+                record.args = None
+        except Exception:
+            self.handleError(record)
+            return
+        _log_queue.put_nowait((self.handlers, record))
+
+
+def start_log_listener() -> None:
+    """Start the logging thread if it is not running"""
+    global _listener
+    if _listener is None:
+        listener = _LogDispatcher(_log_queue)
+        listener.start()
+        _listener = listener
+
+
+def stop_logging() -> None:
+    """Drain queued records and write inline from then on"""
+    global _listener
+    listener, _listener = _listener, None
+    if listener is not None:
+        listener.stop()
+
+
+def _restart_after_fork() -> None:
+    # The logging thread does not survive fork (gunicorn --preload); records
+    # queued in the parent before the fork belong to the parent
+    global _listener, _log_queue
+    if _listener is not None:
+        _listener = None
+        _log_queue = queue.SimpleQueue()
+        start_log_listener()
+
+
+atexit.register(stop_logging)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_restart_after_fork)
+
+
+def log_queue_depth() -> int:
+    """Records waiting for the logging thread"""
+    return _log_queue.qsize()
+
+
+def _install_forwarders(logger_names: Sequence[str]) -> None:
+    """Replace each logger's handlers with one LogForwarder carrying the sampler"""
+    for name in logger_names:
+        logger = logging.getLogger(name or None)
+        if not logger.handlers:
+            continue
+        forwarder = LogForwarder(logger.handlers)
+        forwarder.addFilter(hot_path_sampler)
+        logger.handlers = [forwarder]
+
+
+def setup_logging(
+    log_level: str = "INFO",
+    queued: bool = True,
+    sample_rate: float = 1.0,
+    max_per_second: int = 0,
+    logger_rates: Optional[Mapping[str, float]] = None
+) -> None:
     """
     Set up application logging with structured configuration
     
     Args:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+        queued: Write output from the logging thread instead of the caller
+        sample_rate: Fraction of hot-path (ENTRY, QUERY_BUILD) records kept
+        max_per_second: Hot-path records per call site per second, 0 for no cap
+        logger_rates: Per-logger sample rates overriding sample_rate
     """
+    # Settings pass a LogLevel enum, which dictConfig rejects
+    log_level = getattr(log_level, "value", log_level)
+    
+    # Flush records queued for the handlers about to be replaced
+    stop_logging()
+    hot_path_sampler.configure(sample_rate, max_per_second, logger_rates)
     
     # Logging configuration dictionary
     logging_config: Dict[str, Any] = {
@@ -117,10 +318,13 @@ def setup_logging(log_level: str = "INFO") -> None:
     
     # Apply logging configuration
     logging.config.dictConfig(logging_config)
+    _install_forwarders(list(logging_config["loggers"]))
+    if queued:
+        start_log_listener()
     
     # Log the setup completion
     logger = logging.getLogger("fitforge")
-    logger.info(f"Logging initialized with level: {log_level}")
+    logger.info("Logging initialized with level: %s (queued=%s)", log_level, queued)
 
 
 def get_logger(name: str) -> logging.Logger:
@@ -149,11 +353,12 @@ def log_request(method: str, url: str, status_code: int, duration_ms: float) ->
     logger = get_logger("requests")
     
     if status_code >= 500:
-        logger.error(f"{method} {url} - {status_code} - {duration_ms:.2f}ms")
+        level = logging.ERROR
     elif status_code >= 400:
-        logger.warning(f"{method} {url} - {status_code} - {duration_ms:.2f}ms")
+        level = logging.WARNING
     else:
-        logger.info(f"{method} {url} - {status_code} - {duration_ms:.2f}ms")
+        level = logging.INFO
+    logger.log(level, "%s %s - %s - %.2fms", method, url, status_code, duration_ms)
 
 
 def log_database_operation(operation: str, table: str, duration_ms: float, affected_rows: int = 0) -> None:
@@ -0,0 +1,192 @@
+"""
+FitForge Metrics
+In-process registry of labeled counters and fixed-bucket histograms
+
+Histograms use cumulative Prometheus-style buckets, so an observation is a
+bisect and three additions with no sample retention; series are keyed by
+their label values and created on first use. Label values must come from a
+bounded set (query names, route templates), never from request data.
+Values that already live elsewhere (pool sizes, cache counters, process
+stats) are read by collectors at scrape time, so the hot path never sees
+them. render() produces Prometheus text exposition format 0.0.4.
+"""
+
+import logging
+import threading
+from bisect import bisect_left
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if value == float("-inf"):
+        return "-Inf"
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values)) + "}"
+
+
+def _header(name: str, documentation: str, kind: str) -> List[str]:
+    # HELP text escapes backslash and newline only; quotes are literal
+    help_text = documentation.replace("\\", "\\\\").replace("\n", "\\n")
+    return [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+
+
+class MetricFamily(NamedTuple):
+    """Samples produced by a collector at scrape time"""
+    name: str
+    documentation: str
+    kind: str  # "gauge" or "counter"
+    samples: List[Tuple[Dict[str, str], float]]
+
+    def expose(self) -> List[str]:
+        lines = _header(self.name, self.documentation, self.kind)
+        for labels, value in self.samples:
+            lines.append(f"{self.name}{_format_labels(list(labels), list(labels.values()))} {_format_value(value)}")
+        return lines
+
+
+# Seconds; covers sub-millisecond primary-key reads up to statement timeouts
+LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0
+)
+ROW_BUCKETS: Tuple[float, ...] = (0, 1, 5, 10, 50, 100, 500, 1000, 5000, 10000, 100000)
+
+
+class Histogram:
+    """
+    Distribution of observations per label set
+    Each series holds one count per bucket plus +Inf, the sum and the total count
+    """
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._series: Dict[Tuple[str, ...], List[float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, labels: Tuple[str, ...] = ()) -> None:
+        """Record one observation; labels are values in labelnames order"""
+        series = self._series.get(labels)
+        if series is None:
+            with self._lock:
+                series = self._series.setdefault(labels, [0.0] * (len(self.buckets) + 3))
+        # [bucket counts..., +Inf count, sum, count]; non-cumulative until snapshot
+        series[bisect_left(self.buckets, value)] += 1
+        series[-2] += value
+        series[-1] += 1
+
+    def snapshot(self) -> Dict[Tuple[str, ...], Dict[str, Any]]:
+        """Cumulative buckets, sum and count per label set"""
+        result = {}
+        for labels, series in list(self._series.items()):
+            cumulative, running = [], 0.0
+            for bound, count in zip(self.buckets + (float("inf"),), series[:-2]):
+                running += count
+                cumulative.append((bound, int(running)))
+            result[labels] = {"buckets": cumulative, "sum": series[-2], "count": int(series[-1])}
+        return result
+
+    def expose(self) -> List[str]:
+        lines = _header(self.name, self.documentation, "histogram")
+        bucket_names = self.labelnames + ("le",)
+        for labels, data in self.snapshot().items():
+            for bound, count in data["buckets"]:
+                lines.append(f"{self.name}_bucket{_format_labels(bucket_names, labels + (_format_value(bound),))} {count}")
+            label_text = _format_labels(self.labelnames, labels)
+            lines.append(f"{self.name}_sum{label_text} {_format_value(data['sum'])}")
+            lines.append(f"{self.name}_count{label_text} {data['count']}")
+        return lines
+
+
+class Counter:
+    """Monotonic total per label set"""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, labels: Tuple[str, ...] = (), amount: float = 1.0) -> None:
+        self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def snapshot(self) -> Dict[Tuple[str, ...], float]:
+        return dict(self._values)
+
+    def expose(self) -> List[str]:
+        lines = _header(self.name, self.documentation, "counter")
+        for labels, value in self.snapshot().items():
+            lines.append(f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}")
+        return lines
+
+
+class MetricsRegistry:
+    """Named metrics of this process, in registration order"""
+
+    def __init__(self):
+        self.metrics: Dict[str, Any] = {}
+        self.collectors: List[Callable[[], Iterable[MetricFamily]]] = []
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = LATENCY_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def collector(self, collect: Callable[[], Iterable[MetricFamily]]) -> Callable[[], Iterable[MetricFamily]]:
+        """Register a scrape-time collector (usable as a decorator)"""
+        self.collectors.append(collect)
+        return collect
+
+    def render(self) -> str:
+        """Every metric and collector in Prometheus text format; a failing collector is skipped"""
+        lines: List[str] = []
+        for metric in list(self.metrics.values()):
+            lines.extend(metric.expose())
+        for collect in self.collectors:
+            try:
+                families = list(collect())
+            except Exception as e:
+                logger.warning(f"🚨 Metrics collector {getattr(collect, '__name__', collect)} FAILURE: {e}")
+                continue
+            for family in families:
+                lines.extend(family.expose())
+        return "\n".join(lines) + "\n"
+
+    def _register(self, metric):
+        if metric.name in self.metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self.metrics[metric.name] = metric
+        return metric
+
+
+# Global metrics registry
+registry = MetricsRegistry()
+
+
+__all__ = [
+    "CONTENT_TYPE",
+    "Counter",
+    "Histogram",
+    "LATENCY_BUCKETS",
+    "MetricFamily",
+    "MetricsRegistry",
+    "ROW_BUCKETS",
+    "registry"
+]
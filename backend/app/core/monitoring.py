@@ -0,0 +1,173 @@
+"""
+FitForge Runtime Monitoring
+HTTP latency and event-loop lag, plus scrape-time gauges for pools, caches and the process
+
+Request latency is the only series written per request (one histogram
+observe in RequestLoggingMiddleware). Pool sizes, Redis connections, cache
+counters, the log queue and process stats are read by collectors when
+/metrics is scraped. Event-loop lag is sampled by a background task.
+"""
+
+import asyncio
+import logging
+import os
+from typing import Any, Dict, List, Optional
+
+import psutil
+
+from .cache import auth_cache, compressed_bodies
+from .config import get_settings
+from .database import db_manager, statement_stats
+from .logging import hot_path_sampler, log_queue_depth
+from .metrics import MetricFamily, registry
+from .redis_client import redis_manager
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+REQUEST_DURATION = registry.histogram(
+    "fitforge_http_request_duration_seconds",
+    "HTTP request latency by route template and status",
+    ["method", "route", "status"]
+)
+LOOP_LAG = registry.histogram(
+    "fitforge_event_loop_lag_seconds",
+    "Delay of a scheduled wakeup beyond its deadline",
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+)
+
+_process: Optional[psutil.Process] = None
+
+
+def observe_request(scope: Dict[str, Any], status_code: int, duration: float) -> None:
+    """Record one request; unrouted paths share a label so 404 scans cannot add series"""
+    route = getattr(scope.get("route"), "path", None) or "unmatched"
+    REQUEST_DURATION.observe(duration, (scope.get("method", ""), route, str(status_code)))
+
+
+class LoopLagMonitor:
+    """
+    Sleeps for a fixed interval and records how late it wakes up
+    Lag means something blocked the loop: sync I/O, CPU-bound work, a long GC
+    """
+
+    def __init__(self):
+        self._task: Optional[asyncio.Task] = None
+        self.last_lag = 0.0
+
+    async def start(self) -> None:
+        """Start sampling on the running event loop"""
+        if self._task:
+            return
+        self._task = asyncio.create_task(self._run(), name="fitforge-loop-lag-monitor")
+        logger.info("✅ Event loop lag monitor started")
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+            logger.info("🛑 Event loop lag monitor stopped")
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        interval = settings.monitoring.LOOP_LAG_INTERVAL_SECONDS
+        while True:
+            deadline = loop.time() + interval
+            await asyncio.sleep(interval)
+            self.last_lag = max(0.0, loop.time() - deadline)
+            LOOP_LAG.observe(self.last_lag)
+
+
+# Global event loop lag monitor instance
+loop_lag_monitor = LoopLagMonitor()
+
+
+# ============================================================================
+# SCRAPE-TIME COLLECTORS
+# ============================================================================
+
+@registry.collector
+def collect_db_pools() -> List[MetricFamily]:
+    """asyncpg pool sizes; wait time is fitforge_db_pool_wait_seconds"""
+    pools = [("primary", db_manager.pool)] if db_manager.pool else []
+    pools += [(f"replica{index}", pool) for index, pool in enumerate(db_manager.replica_pools)]
+    return [
+        MetricFamily("fitforge_db_pool_connections", "Open connections per pool", "gauge",
+                     [({"pool": name}, pool.get_size()) for name, pool in pools]),
+        MetricFamily("fitforge_db_pool_idle_connections", "Idle connections per pool", "gauge",
+                     [({"pool": name}, pool.get_idle_size()) for name, pool in pools]),
+        MetricFamily("fitforge_db_pool_max_connections", "Configured maximum per pool", "gauge",
+                     [({"pool": name}, pool.get_max_size()) for name, pool in pools])
+    ]
+
+
+@registry.collector
+def collect_redis_pool() -> List[MetricFamily]:
+    """Connections of the shared Redis pool"""
+    if redis_manager.client is None:
+        return []
+    pool = redis_manager.client.connection_pool
+    return [
+        MetricFamily("fitforge_redis_pool_connections", "Redis connections by state", "gauge", [
+            ({"state": "idle"}, len(getattr(pool, "_available_connections", ()))),
+            ({"state": "in_use"}, len(getattr(pool, "_in_use_connections", ())))
+        ]),
+        MetricFamily("fitforge_redis_pool_max_connections", "Configured Redis pool maximum", "gauge",
+                     [({}, pool.max_connections)])
+    ]
+
+
+@registry.collector
+def collect_caches() -> List[MetricFamily]:
+    """Hit and miss totals and hit ratio of the in-process caches"""
+    counts = {name: (stats["hits"], stats["misses"]) for name, stats in auth_cache.stats().items()}
+    counts["compressed_bodies"] = (compressed_bodies.hits, compressed_bodies.misses)
+    counts["statements"] = (
+        statement_stats.named_hits + statement_stats.hits,
+        statement_stats.named_misses + statement_stats.misses
+    )
+    return [
+        MetricFamily("fitforge_cache_hits_total", "Cache hits", "counter",
+                     [({"cache": name}, hits) for name, (hits, _) in counts.items()]),
+        MetricFamily("fitforge_cache_misses_total", "Cache misses", "counter",
+                     [({"cache": name}, misses) for name, (_, misses) in counts.items()]),
+        MetricFamily("fitforge_cache_hit_ratio", "Hits over lookups since start", "gauge",
+                     [({"cache": name}, hits / (hits + misses)) for name, (hits, misses) in counts.items() if hits + misses])
+    ]
+
+
+@registry.collector
+def collect_logging() -> List[MetricFamily]:
+    """Backlog of the logging thread and hot-path lines dropped by sampling"""
+    return [
+        MetricFamily("fitforge_log_queue_depth", "Log records waiting for the logging thread", "gauge",
+                     [({}, log_queue_depth())]),
+        MetricFamily("fitforge_log_records_suppressed_total", "Hot-path log records dropped by sampling", "counter",
+                     [({}, hot_path_sampler.suppressed)])
+    ]
+
+
+@registry.collector
+def collect_process() -> List[MetricFamily]:
+    """Resident memory, CPU time and file descriptors of this worker"""
+    global _process
+    # Re-resolved after a fork so preloaded workers report themselves
+    if _process is None or _process.pid != os.getpid():
+        _process = psutil.Process(os.getpid())
+    with _process.oneshot():
+        memory = _process.memory_info()
+        cpu = _process.cpu_times()
+        families = [
+            MetricFamily("process_resident_memory_bytes", "Resident memory size in bytes", "gauge", [({}, memory.rss)]),
+            MetricFamily("process_cpu_seconds_total", "User and system CPU time in seconds", "counter",
+                         [({}, cpu.user + cpu.system)]),
+            MetricFamily("process_start_time_seconds", "Start time since the Unix epoch in seconds", "gauge",
+                         [({}, _process.create_time())])
+        ]
+        if hasattr(_process, "num_fds"):
+            families.append(MetricFamily("process_open_fds", "Open file descriptors", "gauge", [({}, _process.num_fds())]))
+    return families
+
+
+__all__ = ["LOOP_LAG", "LoopLagMonitor", "REQUEST_DURATION", "loop_lag_monitor", "observe_request"]
@@ -0,0 +1,87 @@
+"""
+FitForge OpenAPI Document
+Serves the OpenAPI schema as pre-encoded bytes, from the build-time artifact when available
+
+scripts/generate_openapi.py writes openapi.json during the image build (and
+the checked-in copy is kept current by tests/test_openapi_artifact.py).
+Workers read that file instead of walking every route to build the schema,
+gzip it once, and answer each request with the same bytes. In DEBUG, or
+without an artifact, the schema is built from the live routes on first
+request and then served the same way.
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+from fastapi import FastAPI, Request
+from fastapi.responses import Response
+
+from ..middleware.compression import negotiate, no_compression
+from .config import get_settings
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+ARTIFACT_PATH = Path(__file__).resolve().parents[2] / "openapi.json"
+
+
+def encode_schema(schema: Dict[str, Any]) -> bytes:
+    """Artifact encoding: indented for readable diffs; gzip removes most of the whitespace cost"""
+    return (json.dumps(schema, indent=2, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+class OpenAPIDocument:
+    """Encoded schema with its gzip form and ETag, built once per worker"""
+
+    def __init__(self, body: bytes):
+        self.body = body
+        self.gzipped = gzip.compress(body, compresslevel=9, mtime=0)
+        self.etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+    def respond(self, request: Request) -> Response:
+        headers = {"ETag": self.etag, "Cache-Control": "public, max-age=300", "Vary": "Accept-Encoding"}
+        if request.headers.get("if-none-match") == self.etag:
+            return Response(status_code=304, headers=headers)
+        if negotiate(request.headers.get("accept-encoding", ""), ("gzip",)) == "gzip":
+            headers["Content-Encoding"] = "gzip"
+            return Response(self.gzipped, media_type="application/json", headers=headers)
+        return Response(self.body, media_type="application/json", headers=headers)
+
+
+def load_artifact(path: Optional[Path] = None) -> Optional[OpenAPIDocument]:
+    """The build-time document, or None when it has not been generated"""
+    try:
+        return OpenAPIDocument((path or ARTIFACT_PATH).read_bytes())
+    except FileNotFoundError:
+        return None
+
+
+def serve_openapi(app: FastAPI, build_schema: Callable[[], Dict[str, Any]]) -> None:
+    """
+    Replace FastAPI's openapi_url route, which re-encodes the schema on every request
+
+    Args:
+        app: Application whose openapi_url is served
+        build_schema: Live schema builder, used in DEBUG or without an artifact
+    """
+    document = None if settings.DEBUG else load_artifact()
+    if document:
+        logger.info(f"✅ OpenAPI served from {ARTIFACT_PATH.name} ({len(document.body)} bytes, {len(document.gzipped)} gzipped)")
+
+    # The document negotiates and pre-encodes its own body; the middleware leaves it alone
+    @no_compression
+    async def openapi(request: Request) -> Response:
+        nonlocal document
+        if document is None:
+            document = OpenAPIDocument(encode_schema(build_schema()))
+        return document.respond(request)
+
+    app.router.routes = [route for route in app.router.routes if getattr(route, "path", None) != app.openapi_url]
+    app.add_route(app.openapi_url, openapi, include_in_schema=False)
+
+
+__all__ = ["ARTIFACT_PATH", "OpenAPIDocument", "encode_schema", "load_artifact", "serve_openapi"]
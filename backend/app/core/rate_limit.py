@@ -0,0 +1,116 @@
+"""
+FitForge Rate Limiting
+Token-bucket limiter evaluated atomically in Redis, with an in-process fallback
+
+Each check is one EVALSHA: the script refills the bucket from Redis server
+time, takes a token if one is available and refreshes the key expiry, so
+concurrent requests across workers cannot race between read and write.
+When Redis errors, checks use a per-process bucket with the same rate and
+burst (the effective limit is then per worker) and Redis is retried after
+RATE_LIMIT_REDIS_RETRY_SECONDS.
+"""
+
+import logging
+import time
+from typing import NamedTuple, Optional
+
+import redis.asyncio as aioredis
+
+from .cache import TTLCache
+from .config import get_settings
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+# Buckets kept in memory while Redis is unavailable
+FALLBACK_MAX_BUCKETS = 10000
+
+# KEYS[1] bucket; ARGV[1] tokens per second, ARGV[2] capacity.
+# Returns {allowed, tokens left, seconds until a token is available};
+# floats are returned as strings because Redis truncates Lua numbers.
+TOKEN_BUCKET_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+local allowed = 0
+local retry_after = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+else
+    retry_after = (1 - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('PEXPIRE', KEYS[1], math.ceil(capacity / rate * 1000))
+return {allowed, tostring(tokens), tostring(retry_after)}
+"""
+
+
+class RateLimitDecision(NamedTuple):
+    """Outcome of one rate limit check"""
+    allowed: bool
+    remaining: int
+    retry_after: float
+    backend: str
+
+
+class TokenBucketLimiter:
+    """
+    Token buckets of `capacity` tokens refilled at `limit` per `period` seconds
+    Shared by every RateLimiter dependency in the process
+    """
+
+    def __init__(self):
+        self._script = None
+        self._script_client: Optional[aioredis.Redis] = None
+        self._redis_retry_at = 0.0
+        self._fallback: TTLCache[list] = TTLCache(FALLBACK_MAX_BUCKETS, float("inf"))
+
+    async def hit(
+        self,
+        key: str,
+        limit: int,
+        period: float = 60.0,
+        redis: Optional[aioredis.Redis] = None
+    ) -> RateLimitDecision:
+        """Take one token from the bucket at key"""
+        rate = limit / period
+        if redis is not None and time.monotonic() >= self._redis_retry_at:
+            try:
+                return await self._hit_redis(redis, key, rate, limit)
+            except aioredis.RedisError as e:
+                self._redis_retry_at = time.monotonic() + settings.RATE_LIMIT_REDIS_RETRY_SECONDS
+                logger.error(f"🚨 Redis rate limiting FAILURE, using in-process buckets: {e}")
+        return self._hit_local(key, rate, limit)
+
+    async def _hit_redis(self, redis: aioredis.Redis, key: str, rate: float, capacity: int) -> RateLimitDecision:
+        if self._script is None or self._script_client is not redis:
+            self._script = redis.register_script(TOKEN_BUCKET_SCRIPT)
+            self._script_client = redis
+        allowed, tokens, retry_after = await self._script(keys=[key], args=[rate, capacity])
+        return RateLimitDecision(bool(int(allowed)), int(float(tokens)), float(retry_after), "redis")
+
+    def _hit_local(self, key: str, rate: float, capacity: int) -> RateLimitDecision:
+        now = time.monotonic()
+        bucket = self._fallback.get(key)
+        if bucket is None:
+            bucket = [float(capacity), now]
+        tokens = min(capacity, bucket[0] + (now - bucket[1]) * rate)
+        allowed = tokens >= 1
+        if allowed:
+            tokens -= 1
+        bucket[0], bucket[1] = tokens, now
+        self._fallback.set(key, bucket, capacity / rate)
+        return RateLimitDecision(allowed, int(tokens), 0.0 if allowed else (1 - tokens) / rate, "local")
+
+
+# Global limiter instance
+rate_limiter = TokenBucketLimiter()
+
+
+__all__ = ["RateLimitDecision", "TokenBucketLimiter", "rate_limiter", "TOKEN_BUCKET_SCRIPT"]
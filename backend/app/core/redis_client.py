@@ -0,0 +1,62 @@
+"""
+FitForge Redis Connection
+Single Redis connection pool shared by the whole process
+
+The pool is created in the app lifespan and handed out by
+get_redis_client; redis-py connects lazily and reconnects on its own, so a
+Redis that is down at startup is picked up once it comes back.
+"""
+
+import logging
+from typing import Optional
+
+import redis.asyncio as aioredis
+
+from .config import get_settings
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+
+class RedisManager:
+    """
+    Owner of the process-wide Redis client
+    Call initialize() at startup and close() at shutdown
+    """
+
+    def __init__(self):
+        self.client: Optional[aioredis.Redis] = None
+
+    async def initialize(self) -> None:
+        """Create the shared pool; a failed ping is logged, not raised"""
+        if self.client or not settings.cache.redis_url:
+            return
+
+        self.client = aioredis.Redis(
+            connection_pool=aioredis.ConnectionPool.from_url(
+                settings.cache.redis_url,
+                max_connections=settings.cache.MAX_CONNECTIONS,
+                socket_connect_timeout=settings.cache.REDIS_SOCKET_TIMEOUT,
+                socket_timeout=settings.cache.REDIS_SOCKET_TIMEOUT,
+                decode_responses=True
+            )
+        )
+        try:
+            await self.client.ping()
+            logger.info("✅ Redis connection pool initialized")
+        except aioredis.RedisError as e:
+            logger.warning(f"🚨 Redis unavailable at startup, continuing without it: {e}")
+
+    async def close(self) -> None:
+        """Close the shared pool"""
+        if self.client:
+            await self.client.aclose()
+            self.client = None
+            logger.info("🔌 Redis connection pool closed")
+
+
+# Global Redis manager instance
+redis_manager = RedisManager()
+
+
+__all__ = ["RedisManager", "redis_manager"]
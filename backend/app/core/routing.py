@@ -0,0 +1,84 @@
+"""
+FitForge Lazy Routers
+API routers imported on first use instead of when main is imported
+
+Each router is registered as a LazyRouter placeholder covering its prefix.
+The first request under that prefix, or load_routers(), imports the module
+and swaps the placeholder for the router's real routes at the same position,
+so route order is the same as with eager include_router calls. Startup
+preloads every router unless PRELOAD_ROUTERS is off.
+"""
+
+import importlib
+import logging
+import time
+from typing import Any, List, Sequence, Tuple
+
+from fastapi import FastAPI
+from starlette.routing import BaseRoute, Match, NoMatchFound
+from starlette.types import Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+
+class LazyRouter(BaseRoute):
+    """
+    Placeholder route for every path under a router's prefix
+    Loading is synchronous, so concurrent first requests cannot load twice.
+    """
+
+    def __init__(self, app: FastAPI, module: str, prefix: str, tags: Sequence[str]):
+        self.app = app
+        self.module = module
+        self.prefix = prefix
+        self.tags = list(tags)
+        self.loaded = False
+
+    def matches(self, scope: Scope) -> Tuple[Match, Scope]:
+        if scope["type"] in ("http", "websocket"):
+            path = scope["path"]
+            if path == self.prefix or path.startswith(self.prefix + "/"):
+                return Match.FULL, {}
+        return Match.NONE, {}
+
+    def url_path_for(self, name: str, /, **path_params: Any):
+        # Route names are only known once loaded; load_routers() first if needed
+        raise NoMatchFound(name, path_params)
+
+    async def handle(self, scope: Scope, receive: Receive, send: Send) -> None:
+        self.load()
+        # Dispatch again, now against the real routes
+        await self.app.router(scope, receive, send)
+
+    def load(self) -> None:
+        """Import the router module and replace this placeholder with its routes"""
+        if self.loaded:
+            return
+        started = time.perf_counter()
+        router = importlib.import_module(self.module).router
+        routes = self.app.router.routes
+        position = routes.index(self)
+        before = len(routes)
+        self.app.include_router(router, prefix=self.prefix, tags=self.tags)
+        added = routes[before:]
+        del routes[before:]
+        routes[position:position + 1] = added
+        self.loaded = True
+        logger.info(f"🔧 Router {self.module} loaded in {(time.perf_counter() - started) * 1000:.1f}ms")
+
+
+def include_lazy_router(app: FastAPI, module: str, prefix: str, tags: Sequence[str]) -> LazyRouter:
+    """Register the `router` of module under prefix without importing it"""
+    placeholder = LazyRouter(app, module, prefix, tags)
+    app.router.routes.append(placeholder)
+    return placeholder
+
+
+def load_routers(app: FastAPI) -> None:
+    """Import every router still pending, e.g. before serving or building the OpenAPI schema"""
+    pending: List[LazyRouter] = [route for route in app.router.routes if isinstance(route, LazyRouter)]
+    for placeholder in pending:
+        placeholder.load()
+
+
+__all__ = ["LazyRouter", "include_lazy_router", "load_routers"]
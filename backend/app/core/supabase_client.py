@@ -0,0 +1,162 @@
+"""
+FitForge Async Supabase Client
+Awaitable facade over the synchronous supabase client
+
+supabase-py's Client does blocking HTTP. Called directly from a request
+handler, every sign-in, refresh or health query held the event loop for a
+full round trip to Supabase. AsyncSupabase runs each call on its own
+bounded thread pool, so the loop keeps serving while it waits and a slow
+auth service cannot take the default executor from other work.
+
+Concurrency is limited twice: SUPABASE_MAX_WORKERS calls run at once and
+at most SUPABASE_MAX_PENDING are accepted (running or queued); beyond that
+calls fail fast rather than queue. A call not finished within
+SUPABASE_TIMEOUT_SECONDS raises ExternalServiceError. Its thread cannot be
+interrupted, so it still counts as pending until it returns.
+
+supabase-py's auth client keeps the session of its last sign-in, sign-up or
+refresh and acts on it in sign_out. Shared between concurrent requests, one
+user's logout could revoke another's session, so those calls go through a
+separate auth client per pool thread, and sign_out revokes the caller's own
+access token through the admin endpoint without reading any stored session.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, TypeVar
+
+from .config import get_settings
+from .exceptions import ExternalServiceError
+from .metrics import registry
+
+if TYPE_CHECKING:
+    from supabase import Client
+    from supabase.lib.auth_client import SupabaseAuthClient
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+SUPABASE_CALL_DURATION = registry.histogram(
+    "fitforge_supabase_call_duration_seconds",
+    "Supabase client calls by operation and outcome, including time queued for a thread",
+    ["operation", "outcome"]
+)
+
+
+class AsyncSupabase:
+    """
+    Supabase operations as coroutines, run on a dedicated thread pool
+    `client` is the wrapped synchronous client; do not call it from the loop.
+    """
+
+    def __init__(
+        self,
+        client: "Client",
+        max_workers: Optional[int] = None,
+        max_pending: Optional[int] = None,
+        timeout: Optional[float] = None
+    ):
+        self.client = client
+        self.max_workers = max_workers or settings.SUPABASE_MAX_WORKERS
+        self.max_pending = max_pending or settings.SUPABASE_MAX_PENDING
+        self.timeout = timeout or settings.SUPABASE_TIMEOUT_SECONDS
+        self.pending = 0
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="supabase")
+        self._pending_lock = threading.Lock()
+        self._thread_auth = threading.local()
+
+    async def run(self, operation: str, func: Callable[..., T], *args: Any, timeout: Optional[float] = None) -> T:
+        """
+        Call func(*args) on the Supabase thread pool
+
+        Raises:
+            ExternalServiceError: Too many calls pending, or no result within timeout
+        """
+        with self._pending_lock:
+            if self.pending >= self.max_pending:
+                SUPABASE_CALL_DURATION.observe(0.0, (operation, "rejected"))
+                raise ExternalServiceError("supabase", f"Too many pending Supabase calls ({self.pending})")
+            self.pending += 1
+
+        started = time.perf_counter()
+        try:
+            future = self._executor.submit(func, *args)
+        except RuntimeError:
+            self._release(None)
+            raise ExternalServiceError("supabase", "Supabase client is shut down")
+        # Released when the thread finishes, not when the caller stops waiting
+        future.add_done_callback(self._release)
+
+        try:
+            result = await asyncio.wait_for(asyncio.wrap_future(future), timeout or self.timeout)
+        except asyncio.TimeoutError:
+            SUPABASE_CALL_DURATION.observe(time.perf_counter() - started, (operation, "timeout"))
+            logger.warning(f"🚨 Supabase {operation} timed out after {timeout or self.timeout:g}s")
+            raise ExternalServiceError("supabase", f"Supabase {operation} timed out")
+        except Exception:
+            SUPABASE_CALL_DURATION.observe(time.perf_counter() - started, (operation, "error"))
+            raise
+        SUPABASE_CALL_DURATION.observe(time.perf_counter() - started, (operation, "ok"))
+        return result
+
+    def _release(self, _future) -> None:
+        with self._pending_lock:
+            self.pending -= 1
+
+    # ------------------------------------------------------------------
+    # Operations used by DatabaseManager and AuthService
+    # ------------------------------------------------------------------
+
+    def _auth(self) -> "SupabaseAuthClient":
+        """
+        This pool thread's own auth client, created on first use
+
+        A thread runs one call at a time, so the session a call leaves behind
+        is never seen by a concurrent call; the shared client's is never set.
+        """
+        auth = getattr(self._thread_auth, "client", None)
+        if auth is None:
+            from gotrue import SyncMemoryStorage
+            from supabase.lib.auth_client import SupabaseAuthClient
+
+            key = self.client.supabase_key
+            auth = SupabaseAuthClient(
+                url=self.client.auth_url,
+                headers={"apiKey": key, "Authorization": f"Bearer {key}"},
+                auto_refresh_token=False,
+                persist_session=False,
+                storage=SyncMemoryStorage()
+            )
+            self._thread_auth.client = auth
+        return auth
+
+    async def sign_in_with_password(self, credentials: Dict[str, str]):
+        return await self.run("sign_in", lambda: self._auth().sign_in_with_password(credentials))
+
+    async def sign_up(self, credentials: Dict[str, str]):
+        return await self.run("sign_up", lambda: self._auth().sign_up(credentials))
+
+    async def refresh_session(self, refresh_token: str):
+        return await self.run("refresh_session", lambda: self._auth().refresh_session(refresh_token))
+
+    async def sign_out(self, access_token: str) -> None:
+        """End the session of access_token; no stored session is read or changed"""
+        await self.run("sign_out", self.client.auth.admin.sign_out, access_token)
+
+    async def health_check(self) -> bool:
+        """Whether a one-row query against the REST API returns data"""
+        def query() -> bool:
+            return self.client.from_("exercises").select("id").limit(1).execute().data is not None
+        return await self.run("health_check", query)
+
+    def close(self) -> None:
+        """Stop accepting calls; calls already running finish in their threads"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+__all__ = ["AsyncSupabase", "SUPABASE_CALL_DURATION"]
@@ -0,0 +1,211 @@
+"""
+Response Compression Middleware
+Negotiated brotli/gzip compression of JSON and text responses
+
+Raw ASGI middleware. A complete body (a single http.response.body message)
+is compressed once it reaches COMPRESSION_MIN_SIZE, through the
+compressed_bodies cache: an identical body served again (a repeated
+analytics payload, a cached response) costs a hash instead of another
+compression. A streaming body is compressed chunk by chunk with a flush
+after each, so it is never buffered. Routes opt out with @no_compression.
+brotli is optional; without it only gzip is offered.
+"""
+
+import hashlib
+import zlib
+from functools import lru_cache
+from typing import Callable, Optional, Tuple
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.cache import compressed_bodies
+from app.core.config import get_settings
+from app.core.metrics import registry
+
+try:
+    import brotli
+except ImportError:  # optional dependency, see requirements.txt
+    brotli = None
+
+settings = get_settings()
+
+COMPRESSION_BYTES = registry.counter(
+    "fitforge_http_compression_bytes_total",
+    "Response body bytes before (in) and after (out) compression",
+    ["encoding", "stage"]
+)
+
+SUPPORTED_ENCODINGS: Tuple[str, ...] = ("br", "gzip") if brotli else ("gzip",)
+COMPRESSIBLE_TYPES = ("application/json", "application/x-ndjson", "application/javascript", "application/xml")
+# Larger bodies are compressed on every request rather than cached
+CACHE_MAX_BODY_BYTES = 256 * 1024
+GZIP_WBITS = 31  # zlib with a gzip header and trailer
+
+
+def no_compression(endpoint: Callable) -> Callable:
+    """
+    Route decorator (below @router.get): responses are sent as the endpoint built them
+
+    For endpoints that negotiate and pre-encode their own body, such as the
+    OpenAPI document, so the middleware never encodes it a second time.
+    """
+    endpoint.__compress__ = False
+    return endpoint
+
+
+@lru_cache(maxsize=128)
+def negotiate(accept_encoding: str, offered: Optional[Tuple[str, ...]] = None) -> Optional[str]:
+    """
+    Offered coding with the highest q-value in Accept-Encoding, earlier offers winning ties
+
+    offered defaults to SUPPORTED_ENCODINGS (brotli first when installed).
+    None means the client gets the identity body.
+    """
+    weights = {}
+    for part in accept_encoding.lower().split(","):
+        coding, _, params = part.partition(";")
+        weight = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                weight = float(params[2:])
+            except ValueError:
+                weight = 0.0
+        weights[coding.strip()] = weight
+    best, best_weight = None, 0.0
+    for coding in offered or SUPPORTED_ENCODINGS:
+        weight = weights.get(coding, weights.get("*", 0.0))
+        if weight > best_weight:
+            best, best_weight = coding, weight
+    return best
+
+
+def compress_body(body: bytes, encoding: str) -> bytes:
+    """One-shot compression, cached by content for bodies up to CACHE_MAX_BODY_BYTES"""
+    key = None
+    if len(body) <= CACHE_MAX_BODY_BYTES:
+        key = (encoding, hashlib.blake2b(body, digest_size=16).digest())
+        cached = compressed_bodies.get(key)
+        if cached is not None:
+            return cached
+    if encoding == "br":
+        compressed = brotli.compress(body, quality=settings.COMPRESSION_BROTLI_QUALITY, mode=brotli.MODE_TEXT)
+    else:
+        compressor = zlib.compressobj(settings.COMPRESSION_GZIP_LEVEL, zlib.DEFLATED, GZIP_WBITS)
+        compressed = compressor.compress(body) + compressor.flush()
+    if key is not None:
+        compressed_bodies.set(key, compressed)
+    return compressed
+
+
+class StreamEncoder:
+    """Incremental encoder; each chunk is flushed so the client can decode it on arrival"""
+
+    def __init__(self, encoding: str):
+        self.encoding = encoding
+        if encoding == "br":
+            self._compressor = brotli.Compressor(quality=settings.COMPRESSION_BROTLI_QUALITY, mode=brotli.MODE_TEXT)
+        else:
+            self._compressor = zlib.compressobj(settings.COMPRESSION_GZIP_LEVEL, zlib.DEFLATED, GZIP_WBITS)
+
+    def chunk(self, data: bytes) -> bytes:
+        if self.encoding == "br":
+            return self._compressor.process(data) + self._compressor.flush()
+        return self._compressor.compress(data) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        if self.encoding == "br":
+            return self._compressor.finish()
+        return self._compressor.flush()
+
+
+def is_compressible(scope: Scope, message: Message) -> bool:
+    """Whether a response, from its start message and routed scope, should be compressed"""
+    if message["status"] < 200 or message["status"] in (204, 304):
+        return False
+    if getattr(scope.get("endpoint"), "__compress__", True) is False:
+        return False
+    headers = Headers(raw=message["headers"])
+    if "content-encoding" in headers:
+        return False
+    content_type = headers.get("content-type", "").split(";")[0].strip().lower()
+    return content_type.startswith("text/") or content_type.endswith("+json") or content_type in COMPRESSIBLE_TYPES
+
+
+class CompressionMiddleware:
+    """
+    Compresses responses for clients that accept brotli or gzip
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: Optional[int] = None):
+        self.app = app
+        self.minimum_size = settings.COMPRESSION_MIN_SIZE if minimum_size is None else minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] == "HEAD":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = None
+        for name, value in scope["headers"]:
+            if name == b"accept-encoding":
+                encoding = negotiate(value.decode("latin-1"))
+                break
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message: Optional[Message] = None
+        encoder: Optional[StreamEncoder] = None
+        passthrough = False
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal start_message, encoder, passthrough
+            if message["type"] == "http.response.start":
+                if is_compressible(scope, message):
+                    # Held until the first body message shows whether the body is complete
+                    start_message = message
+                else:
+                    passthrough = True
+                    await send(message)
+                return
+            if passthrough or message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+            if encoder is None:
+                headers = MutableHeaders(scope=start_message)
+                if not more_body:
+                    passthrough = True
+                    if len(body) < self.minimum_size:
+                        await send(start_message)
+                        await send(message)
+                        return
+                    compressed = compress_body(body, encoding)
+                    COMPRESSION_BYTES.inc((encoding, "in"), len(body))
+                    COMPRESSION_BYTES.inc((encoding, "out"), len(compressed))
+                    headers["Content-Encoding"] = encoding
+                    headers["Content-Length"] = str(len(compressed))
+                    headers.add_vary_header("Accept-Encoding")
+                    await send(start_message)
+                    await send({"type": "http.response.body", "body": compressed})
+                    return
+                encoder = StreamEncoder(encoding)
+                headers["Content-Encoding"] = encoding
+                if "content-length" in headers:
+                    del headers["Content-Length"]
+                headers.add_vary_header("Accept-Encoding")
+                await send(start_message)
+
+            data = encoder.chunk(body) if body else b""
+            if not more_body:
+                data += encoder.finish()
+            COMPRESSION_BYTES.inc((encoding, "in"), len(body))
+            COMPRESSION_BYTES.inc((encoding, "out"), len(data))
+            await send({"type": "http.response.body", "body": data, "more_body": more_body})
+
+        await self.app(scope, receive, send_compressed)
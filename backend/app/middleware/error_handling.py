@@ -2,56 +2,69 @@
 Error Handling Middleware
 Centralized error handling and logging for the application
 Now integrated with the new error handling system - primarily handles correlation IDs
+
+Raw ASGI middleware: the correlation ID is bound to correlation_id_var for
+the request and added to the http.response.start message, so streaming
+responses pass through untouched and no extra task is spawned.
 """
 
 import logging
-import traceback
-from typing import Callable
 from uuid import uuid4
 
-from fastapi import Request, Response, status
-from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.logging import correlation_id_var
 
 logger = logging.getLogger("fitforge.middleware.error_handling")
 
+# Longer client-supplied IDs are replaced rather than echoed back
+MAX_CORRELATION_ID_LENGTH = 128
+
 
-class ErrorHandlingMiddleware(BaseHTTPMiddleware):
+class ErrorHandlingMiddleware:
     """
     Middleware to handle correlation IDs and integrate with global error handlers
     Most error handling is now done by the global exception handlers
     """
     
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         Process request with correlation ID tracking
         
-        Args:
-            request: FastAPI request object
-            call_next: Next middleware or endpoint
-            
-        Returns:
-            Response object
+        The ID comes from the X-Correlation-ID request header or is
+        generated, and is exposed as request.state.correlation_id and
+        correlation_id_var for the duration of the request.
         """
-        # Generate or extract correlation ID
-        correlation_id = request.headers.get("X-Correlation-ID", str(uuid4()))
-        request.state.correlation_id = correlation_id
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        correlation_id = None
+        for name, value in scope["headers"]:
+            if name == b"x-correlation-id":
+                correlation_id = value.decode("latin-1")
+                break
+        if not correlation_id or len(correlation_id) > MAX_CORRELATION_ID_LENGTH:
+            correlation_id = str(uuid4())
+        scope.setdefault("state", {})["correlation_id"] = correlation_id
+        token = correlation_id_var.set(correlation_id)
         
-        # Add correlation ID to all log records for this request
-        import contextvars
-        correlation_context = contextvars.ContextVar('correlation_id', default=None)
-        correlation_context.set(correlation_id)
+        async def send_with_correlation_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message).append("X-Correlation-ID", correlation_id)
+            await send(message)
         
         try:
-            response = await call_next(request)
-            # Add correlation ID to response headers
-            response.headers["X-Correlation-ID"] = correlation_id
-            return response
-            
-        except Exception as exc:
+            await self.app(scope, receive, send_with_correlation_id)
+        except Exception:
             # Let the global exception handlers deal with it
             # Just log that we're passing it through
-            logger.debug(f"Exception caught in middleware, passing to global handlers", 
-                        extra={"correlation_id": correlation_id})
+            logger.debug("Exception caught in middleware, passing to global handlers",
+                         extra={"correlation_id": correlation_id})
             raise
-    
+        finally:
+            correlation_id_var.reset(token)
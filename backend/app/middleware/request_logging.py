@@ -1,68 +1,76 @@
 """
 Request Logging Middleware
 Logs all HTTP requests with timing and response information
+
+Raw ASGI middleware: X-Process-Time is added to the http.response.start
+message (time until the response starts, which for streaming responses is
+time to first byte), and the log line and latency histogram use the time
+until the response body has been sent.
 """
 
 import time
 import logging
-from typing import Callable
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+from app.core.database import set_request_scope
 from app.core.logging import log_request
+from app.core.monitoring import observe_request
 
 logger = logging.getLogger("fitforge.middleware.request_logging")
 
 
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
+class RequestLoggingMiddleware:
     """
     Middleware to log all HTTP requests with timing information
     """
     
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        """
-        Process request and log information
+    def __init__(self, app: ASGIApp):
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Process request and log information"""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
         
-        Args:
-            request: FastAPI request object
-            call_next: Next middleware or endpoint
-            
-        Returns:
-            Response object
-        """
-        start_time = time.time()
+        start_time = time.perf_counter()
+        method = scope["method"]
+        url = scope["path"]
+        if scope.get("query_string"):
+            url = f"{url}?{scope['query_string'].decode('latin-1')}"
         
-        # Extract request information
-        method = request.method
-        url = str(request.url)
-        client_ip = request.client.host if request.client else "unknown"
-        user_agent = request.headers.get("user-agent", "unknown")
+        if logger.isEnabledFor(logging.DEBUG):
+            client_ip = scope["client"][0] if scope.get("client") else "unknown"
+            logger.debug(f"[{client_ip}] {method} {url} - Started")
         
-        # Log request start (debug level)
-        logger.debug(f"[{client_ip}] {method} {url} - Started")
+        # Slow-query log entries name the endpoint from the routed scope
+        set_request_scope(scope)
+        status_code = 500
+        
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                duration_ms = (time.perf_counter() - start_time) * 1000
+                MutableHeaders(scope=message).append("X-Process-Time", f"{duration_ms:.2f}")
+            await send(message)
         
         try:
-            # Process request
-            response = await call_next(request)
-            
-            # Calculate duration
-            duration_ms = (time.time() - start_time) * 1000
-            
-            # Log request completion
-            log_request(method, url, response.status_code, duration_ms)
-            
-            # Add custom headers
-            response.headers["X-Process-Time"] = str(duration_ms)
-            
-            return response
-            
+            await self.app(scope, receive, send_with_timing)
         except Exception as exc:
             # Calculate duration for failed requests
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.perf_counter() - start_time) * 1000
             
             # Log request failure
+            client_ip = scope["client"][0] if scope.get("client") else "unknown"
             logger.error(f"[{client_ip}] {method} {url} - FAILED - {duration_ms:.2f}ms - {exc}")
+            observe_request(scope, 500, duration_ms / 1000)
             
             # Re-raise the exception
-            raise exc
\ No newline at end of file
+            raise
+        
+        duration_ms = (time.perf_counter() - start_time) * 1000
+        log_request(method, url, status_code, duration_ms)
+        observe_request(scope, status_code, duration_ms / 1000)
@@ -13,7 +13,7 @@ Schema verification: All validation rules mirror database CHECK constraints
 from datetime import datetime, date
 from decimal import Decimal
 from enum import Enum
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional
 from uuid import UUID
 
 from pydantic import BaseModel, Field, field_validator, ConfigDict
@@ -8,15 +8,19 @@ All database operations use parameterized queries for security
 """
 
 import logging
-from typing import Optional, Dict, Any, Tuple
+from typing import TYPE_CHECKING, Optional, Dict, Any, Tuple
 from datetime import datetime, timedelta
 from jose import JWTError, jwt
 from passlib.context import CryptContext
-from supabase import Client
-import asyncpg
+from fastapi import HTTPException
 
+from ..core.cache import auth_cache
 from ..core.config import get_settings
-from ..core.database import DatabaseManager
+from ..core.database import DatabaseManager, USER_PROFILE_QUERY
+from ..core.exceptions import ExternalServiceError
+
+if TYPE_CHECKING:
+    from ..core.supabase_client import AsyncSupabase
 
 settings = get_settings()
 logger = logging.getLogger(__name__)
@@ -31,7 +35,7 @@ class AuthService:
     Handles user authentication, JWT tokens, and session management
     """
     
-    def __init__(self, supabase_client: Client, db: DatabaseManager):
+    def __init__(self, supabase_client: "AsyncSupabase", db: DatabaseManager):
         self.supabase = supabase_client
         self.db = db
         self.secret_key = settings.SECRET_KEY
@@ -44,12 +48,14 @@ class AuthService:
         
         SECURITY: Uses Supabase's built-in authentication
         SCHEMA: Returns user data matching verified users table structure
+        ERRORS: Supabase timeouts and overload raise ExternalServiceError
+        rather than reading as bad credentials
         """
-        logger.info(f"🔥 authenticate_user ENTRY - email: {email}")
+        logger.info("🔥 authenticate_user ENTRY - email: %s", email)
         
         try:
             # Authenticate with Supabase
-            auth_response = self.supabase.auth.sign_in_with_password({
+            auth_response = await self.supabase.sign_in_with_password({
                 "email": email,
                 "password": password
             })
@@ -65,7 +71,7 @@ class AuthService:
                 logger.warning(f"🚨 User profile not found for authenticated user: {auth_response.user.id}")
                 return None
             
-            logger.info(f"🔧 Authentication successful for user: {auth_response.user.id}")
+            logger.info("🔧 Authentication successful for user: %s", auth_response.user.id)
             
             return {
                 "supabase_user": auth_response.user,
@@ -73,6 +79,8 @@ class AuthService:
                 "session": auth_response.session
             }
             
+        except ExternalServiceError:
+            raise
         except Exception as e:
             logger.error(f"🚨 authenticate_user ERROR: {str(e)}")
             return None
@@ -83,28 +91,26 @@ class AuthService:
         
         SECURITY: Uses parameterized query for SQL injection prevention
         SCHEMA: Uses only verified columns from users table
+        CACHE: Served from auth_cache for AUTH_PROFILE_TTL; writes to the
+        users row must call auth_cache.invalidate_user
         """
-        logger.info(f"🔥 get_user_profile ENTRY - user_id: {user_id}")
+        logger.info("🔥 get_user_profile ENTRY - user_id: %s", user_id)
+        
+        cached = auth_cache.get_profile(user_id)
+        if cached is not None:
+            return cached
         
         try:
             # Parameterized query using verified users table columns
-            query = """
-            SELECT 
-                id, email, display_name, height_inches, weight_lbs, age, sex,
-                experience_level, primary_goals, available_equipment,
-                workout_count, feature_level, created_at, updated_at, last_active_at
-            FROM users 
-            WHERE id = $1
-            """
+            query = USER_PROFILE_QUERY
             
             params = [user_id]
             
-            logger.info(f"🔧 USER_PROFILE_QUERY: {query[:50]}... with params: {params}")
-            
             result = await self.db.execute_query(query, *params, fetch_one=True)
             
             if result:
-                logger.info(f"🔧 User profile retrieved successfully for: {user_id}")
+                logger.debug("🔧 User profile retrieved successfully for: %s", user_id)
+                auth_cache.set_profile(user_id, result)
                 return result
             else:
                 logger.warning(f"🚨 User profile not found for: {user_id}")
@@ -126,7 +132,7 @@ class AuthService:
         SECURITY: Uses parameterized INSERT with verified schema columns
         SCHEMA: Uses only verified columns from users table
         """
-        logger.info(f"🔥 create_user_profile ENTRY - user_id: {user_id}, email: {email}")
+        logger.info("🔥 create_user_profile ENTRY - user_id: %s, email: %s", user_id, email)
         
         try:
             # Parameterized INSERT using verified users table columns
@@ -140,21 +146,24 @@ class AuthService:
             
             params = [user_id, email, display_name]
             
-            logger.info(f"🔧 CREATE_PROFILE_QUERY: {insert_query[:50]}... with {len(params)} params")
-            
-            result = await self.db.execute_query(insert_query, *params, fetch_one=True)
+            async with self.db.transaction() as tx:
+                try:
+                    async with tx.savepoint():
+                        result = await tx.execute_query(insert_query, *params, fetch_one=True)
+                except HTTPException as e:
+                    if e.status_code != 409:
+                        raise
+                    # Retried signup: return the existing profile from the same connection
+                    logger.warning(f"🚨 User profile already exists for: {user_id}")
+                    result = await tx.execute_query(USER_PROFILE_QUERY, user_id, fetch_one=True)
             
             if result:
-                logger.info(f"🔧 User profile created successfully for: {user_id}")
+                logger.info("🔧 User profile created successfully for: %s", user_id)
                 return result
             else:
                 logger.error(f"🚨 Failed to create user profile for: {user_id}")
                 return None
                 
-        except asyncpg.exceptions.UniqueViolationError:
-            logger.warning(f"🚨 User profile already exists for: {user_id}")
-            # Return existing profile
-            return await self.get_user_profile(user_id)
         except Exception as e:
             logger.error(f"🚨 create_user_profile ERROR: {str(e)}")
             return None
@@ -210,7 +219,7 @@ class AuthService:
                 logger.warning("🚨 Token verification failed: no user ID in payload")
                 return None
             
-            logger.info(f"🔧 Token verified successfully for user: {user_id}")
+            logger.debug("🔧 Token verified successfully for user: %s", user_id)
             return payload
             
         except JWTError as e:
@@ -226,7 +235,7 @@ class AuthService:
         logger.info("🔥 refresh_supabase_session ENTRY")
         
         try:
-            auth_response = self.supabase.auth.refresh_session(refresh_token)
+            auth_response = await self.supabase.refresh_session(refresh_token)
             
             if not auth_response.session:
                 logger.warning("🚨 Session refresh failed")
@@ -238,6 +247,8 @@ class AuthService:
                 "user": auth_response.user
             }
             
+        except ExternalServiceError:
+            raise
         except Exception as e:
             logger.error(f"🚨 refresh_supabase_session ERROR: {str(e)}")
             return None
@@ -251,11 +262,8 @@ class AuthService:
         logger.info("🔥 sign_out_user ENTRY")
         
         try:
-            # Set the session for the logout request
-            self.supabase.auth.set_session(access_token, "")
-            
-            # Sign out from Supabase
-            self.supabase.auth.sign_out()
+            # Set the session for the logout request and sign out from Supabase
+            await self.supabase.sign_out(access_token)
             
             logger.info("🔧 User signed out successfully")
             return True
@@ -0,0 +1,101 @@
+"""
+FitForge Muscle States
+Per-muscle fatigue of a workout and its fold into the user's muscle_states
+
+Used by the workout.muscle_states job after completion and by the bulk
+importer for imported workouts inside the recovery window.
+"""
+
+import json
+import logging
+from datetime import datetime
+from typing import Dict
+
+from ..core.database import QueryExecutor, Transaction
+
+logger = logging.getLogger(__name__)
+
+
+async def calculate_muscle_fatigue(workout_id: str, db: QueryExecutor) -> Dict[str, float]:
+    """Calculate per-muscle fatigue contribution of a workout's sets"""
+    # Get workout sets for muscle fatigue calculation (volume calculated by DB trigger)
+    workout_sets = await db.execute_query(
+        """
+        SELECT ws.*, e.muscle_engagement AS muscle_engagement_data
+        FROM workout_sets ws
+        JOIN exercises e ON ws.exercise_id = e.id
+        WHERE ws.workout_id = $1
+        """,
+        workout_id,
+        fetch=True
+    )
+    
+    logger.info("🔧 Processing workout completion", extra={
+        "workout_id": workout_id, "sets_count": len(workout_sets) if workout_sets else 0
+    })
+    
+    muscle_fatigue_data = {}
+    
+    if workout_sets:
+        for set_data in workout_sets:
+            # Use the pre-calculated volume_lbs from the set (calculated by trigger)
+            set_volume = float(set_data.get("volume_lbs", 0))
+            
+            # Process muscle engagement for fatigue calculation
+            muscle_engagement = set_data.get("muscle_engagement_data", {})
+            if isinstance(muscle_engagement, str):
+                muscle_engagement = json.loads(muscle_engagement)  # asyncpg returns JSONB as text
+            if isinstance(muscle_engagement, dict):
+                for muscle, percentage in muscle_engagement.items():
+                    if muscle not in muscle_fatigue_data:
+                        muscle_fatigue_data[muscle] = 0.0
+                    # Weight fatigue contribution by muscle engagement percentage
+                    muscle_fatigue_data[muscle] += set_volume * (float(percentage) / 100.0)
+    
+    logger.info("🔧 Calculated muscle fatigue data", extra={
+        "muscles_engaged": len(muscle_fatigue_data)
+    })
+    
+    return muscle_fatigue_data
+
+
+async def update_muscle_states(
+    user_id: str, 
+    muscle_fatigue_data: Dict[str, float], 
+    workout_time: datetime,
+    tx: Transaction
+):
+    """Update user muscle states based on workout fatigue, one pipelined upsert per muscle"""
+    logger.info("🔧 Updating muscle states", extra={
+        "user_id": user_id, "muscles_count": len(muscle_fatigue_data)
+    })
+    
+    # Upsert muscle state records
+    upsert_query = """
+        INSERT INTO muscle_states (
+            id, user_id, muscle_name, current_fatigue_percentage,
+            last_workout_date, total_volume_lifetime, updated_at
+        ) VALUES (
+            gen_random_uuid(), $1, $2, $3, $4, $5, $4
+        )
+        ON CONFLICT (user_id, muscle_name) 
+        DO UPDATE SET
+            current_fatigue_percentage = LEAST(100.0, muscle_states.current_fatigue_percentage + $3),
+            last_workout_date = $4,
+            total_volume_lifetime = muscle_states.total_volume_lifetime + $5,
+            updated_at = $4
+    """
+    
+    await tx.execute_many(upsert_query, [
+        (
+            user_id,
+            muscle_name,
+            min(20.0, fatigue_amount / 100.0),  # Cap fatigue increase per workout
+            workout_time,
+            fatigue_amount
+        )
+        for muscle_name, fatigue_amount in muscle_fatigue_data.items()
+    ])
+
+
+__all__ = ["calculate_muscle_fatigue", "update_muscle_states"]
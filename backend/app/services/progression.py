@@ -0,0 +1,352 @@
+"""
+FitForge Progression Engine
+Personal best maintenance and vectorized strength trend analysis
+
+recompute_personal_bests is shared by the bulk importer and the
+post-completion job handlers so every path that writes sets out of order
+repairs personal bests the same way.
+
+analyze_progression takes a user's set history as flat numpy arrays and, in
+one pass with no per-row Python, reduces it to per-session best e1RM, a
+rolling least-squares slope per exercise, and progressing / plateau /
+regression flags. It backs GET /api/analytics/plateaus, which runs it on a
+worker thread: for a long history the numpy work takes tens of milliseconds
+that would otherwise hold the event loop.
+"""
+
+import asyncio
+import logging
+from typing import Dict, List, Optional
+from uuid import UUID
+
+import asyncpg
+import numpy as np
+
+from ..core.database import DatabaseManager
+
+logger = logging.getLogger(__name__)
+
+E1RM_FORMULAS = ("epley", "brzycki")
+
+# Trend defaults: slope over the last 6 sessions, flagged once 4 sessions exist
+TREND_WINDOW_SESSIONS = 6
+MIN_TREND_SESSIONS = 4
+# Weekly e1RM change (% of the window's mean) separating the three states
+PLATEAU_SLOPE_PCT_PER_WEEK = 0.5
+REGRESSION_SLOPE_PCT_PER_WEEK = -1.0
+
+STATUS_INSUFFICIENT_DATA = 0
+STATUS_PROGRESSING = 1
+STATUS_PLATEAU = 2
+STATUS_REGRESSION = 3
+STATUS_LABELS = ("insufficient_data", "progressing", "plateau", "regression")
+
+
+async def recompute_personal_bests(
+    conn: asyncpg.Connection,
+    user_id: UUID,
+    workout_ids: List[UUID]
+) -> int:
+    """
+    Recompute is_personal_best for the exercises in the given workouts
+
+    A set is a PB when no earlier set of the exercise had at least as many
+    reps at the same or higher weight (the rule check_personal_best applies
+    at insert time). Expanding each set into one row per rep threshold turns
+    that into a running MAX window instead of a correlated subquery per set.
+    Only sets from the earliest touched set onward enter the window; older
+    history is folded into one best weight per rep count first. Rows are
+    only rewritten where the flag actually changes.
+
+    Returns:
+        Number of sets whose flag changed
+    """
+    result = await conn.execute(
+        """
+        WITH touched AS (
+            SELECT exercise_id, MIN(created_at) AS since
+            FROM workout_sets
+            WHERE workout_id = ANY($2::uuid[])
+            GROUP BY exercise_id
+        ),
+        history AS (
+            -- Best earlier weight per rep count; few rows, so cheap to expand below
+            SELECT ws.exercise_id, ws.reps, MAX(ws.weight_lbs) AS weight_lbs
+            FROM workout_sets ws
+            JOIN touched t USING (exercise_id)
+            WHERE ws.user_id = $1 AND ws.created_at < t.since
+            GROUP BY ws.exercise_id, ws.reps
+        ),
+        thresholds AS (
+            SELECT NULL::uuid AS id, h.exercise_id, h.reps, h.weight_lbs,
+                   '-infinity'::timestamptz AS created_at, r.min_reps
+            FROM history h
+            CROSS JOIN LATERAL generate_series(1, h.reps) AS r(min_reps)
+            UNION ALL
+            SELECT ws.id, ws.exercise_id, ws.reps, ws.weight_lbs, ws.created_at, r.min_reps
+            FROM workout_sets ws
+            JOIN touched t USING (exercise_id)
+            CROSS JOIN LATERAL generate_series(1, ws.reps) AS r(min_reps)
+            WHERE ws.user_id = $1 AND ws.created_at >= t.since
+        ),
+        running AS (
+            SELECT id, reps, weight_lbs, min_reps,
+                   MAX(weight_lbs) OVER (
+                       PARTITION BY exercise_id, min_reps
+                       ORDER BY created_at, id
+                       ROWS BETWEEN UNBOUNDED PRECEDING AND 1 PRECEDING
+                   ) AS prior_best
+            FROM thresholds
+        )
+        UPDATE workout_sets ws SET
+            is_personal_best = (running.prior_best IS NULL OR running.weight_lbs > running.prior_best),
+            updated_at = NOW()
+        FROM running
+        WHERE running.id = ws.id
+          AND running.min_reps = running.reps
+          AND ws.is_personal_best IS DISTINCT FROM (running.prior_best IS NULL OR running.weight_lbs > running.prior_best)
+        """,
+        user_id,
+        workout_ids
+    )
+    return int(result.split()[-1])
+
+
+# ============================================================================
+# VECTORIZED TREND ANALYSIS
+# ============================================================================
+
+def estimate_one_rep_max(weight: np.ndarray, reps: np.ndarray, formula: str = "epley") -> np.ndarray:
+    """
+    Estimated one-rep max for every set
+
+    Epley (weight * (1 + reps / 30)) matches the estimated_one_rep_max column.
+    Brzycki (weight * 36 / (37 - reps)) diverges above ~12 reps and is undefined
+    from 37 reps; those sets get 0 so they never win a session.
+    """
+    weight = np.asarray(weight, dtype=np.float64)
+    reps = np.asarray(reps, dtype=np.float64)
+
+    if formula == "epley":
+        return weight * (1.0 + reps / 30.0)
+    if formula == "brzycki":
+        valid = reps < 37
+        return np.where(valid, weight * 36.0 / np.where(valid, 37.0 - reps, 1.0), 0.0)
+    raise ValueError(f"Unknown e1RM formula '{formula}', expected one of {E1RM_FORMULAS}")
+
+
+class ProgressionAnalysis:
+    """
+    Result of analyze_progression
+
+    Session arrays are ordered by exercise then session time; exercise arrays
+    are indexed by exercise index (the dense rank the caller supplied).
+    """
+
+    def __init__(self, **arrays: np.ndarray):
+        # Per session
+        self.session_exercise: np.ndarray = arrays["session_exercise"]
+        self.session_day: np.ndarray = arrays["session_day"]
+        self.session_best_e1rm: np.ndarray = arrays["session_best_e1rm"]
+        self.slope_pct_per_week: np.ndarray = arrays["slope_pct_per_week"]
+        self.status: np.ndarray = arrays["status"]
+
+        # Per exercise (state at its latest session)
+        self.exercise_index: np.ndarray = arrays["exercise_index"]
+        self.session_count: np.ndarray = arrays["session_count"]
+        self.current_e1rm: np.ndarray = arrays["current_e1rm"]
+        self.best_e1rm: np.ndarray = arrays["best_e1rm"]
+        self.current_slope_pct_per_week: np.ndarray = arrays["current_slope_pct_per_week"]
+        self.current_status: np.ndarray = arrays["current_status"]
+        self.sessions_since_best: np.ndarray = arrays["sessions_since_best"]
+        self.last_session_day: np.ndarray = arrays["last_session_day"]
+
+
+def analyze_progression(
+    exercise_idx: np.ndarray,
+    session_day: np.ndarray,
+    weight: np.ndarray,
+    reps: np.ndarray,
+    formula: str = "epley",
+    window: int = TREND_WINDOW_SESSIONS,
+    min_sessions: int = MIN_TREND_SESSIONS,
+    plateau_pct: float = PLATEAU_SLOPE_PCT_PER_WEEK,
+    regression_pct: float = REGRESSION_SLOPE_PCT_PER_WEEK
+) -> ProgressionAnalysis:
+    """
+    Reduce a set history to session bests, rolling slopes and trend flags
+
+    A session is every set of one exercise sharing a workout start time.
+    Sets may arrive in any order; input already sorted by (exercise, start)
+    skips the sort.
+
+    Args:
+        exercise_idx: Small non-negative exercise index per set
+        session_day: Workout start in days (any epoch) per set
+        weight: Set weight in lbs
+        reps: Set reps
+        formula: "epley" or "brzycki"
+        window: Sessions in each rolling least-squares fit
+        min_sessions: Sessions needed before a trend is flagged
+        plateau_pct: Weekly slope (% of mean e1RM) below which a trend is a plateau
+        regression_pct: Weekly slope at or below which a trend is a regression
+
+    Returns:
+        ProgressionAnalysis with per-session and per-exercise arrays
+    """
+    exercise_idx = np.asarray(exercise_idx, dtype=np.int64)
+    if exercise_idx.size == 0:
+        empty_f, empty_i = np.empty(0, dtype=np.float64), np.empty(0, dtype=np.int64)
+        return ProgressionAnalysis(
+            session_exercise=empty_i, session_day=empty_f, session_best_e1rm=empty_f,
+            slope_pct_per_week=empty_f, status=np.empty(0, dtype=np.int8),
+            exercise_index=empty_i, session_count=empty_i, current_e1rm=empty_f, best_e1rm=empty_f,
+            current_slope_pct_per_week=empty_f, current_status=np.empty(0, dtype=np.int8),
+            sessions_since_best=empty_i, last_session_day=empty_f
+        )
+
+    session_day = np.asarray(session_day, dtype=np.float64)
+    weight, reps = np.asarray(weight), np.asarray(reps)
+
+    # Order by exercise, then time. Histories come back roughly chronological, so a
+    # timsort on time followed by a stable radix sort on the exercise index is near linear
+    exercise_step, day_step = np.diff(exercise_idx), np.diff(session_day)
+    if np.any((exercise_step < 0) | ((exercise_step == 0) & (day_step < 0))):
+        order = np.argsort(session_day, kind="stable")
+        radix_key = exercise_idx[order].astype(np.int16 if exercise_idx.max() < 2 ** 15 else np.int64)
+        order = order[np.argsort(radix_key, kind="stable")]
+        exercise_idx, session_day = exercise_idx[order], session_day[order]
+        weight, reps = weight[order], reps[order]
+        exercise_step, day_step = np.diff(exercise_idx), np.diff(session_day)
+    e1rm = estimate_one_rep_max(weight, reps, formula)
+
+    # Session reduction: best e1RM of each session
+    set_starts = np.flatnonzero(np.concatenate(([True], (exercise_step != 0) | (day_step != 0))))
+    best = np.maximum.reduceat(e1rm, set_starts)
+    exercise = exercise_idx[set_starts]
+    day = session_day[set_starts]
+    n = best.size
+    position = np.arange(n)
+
+    # Exercise groups over the session series
+    new_group = np.diff(exercise, prepend=exercise[0] - 1) != 0
+    group_starts = np.flatnonzero(new_group)
+    group_id = np.cumsum(new_group) - 1
+    first = group_starts[group_id]
+    group_ends = np.append(group_starts[1:] - 1, n - 1)
+
+    # Rolling least-squares slope over the last `window` sessions of the same exercise,
+    # from windowed sums of prefix sums (x is days since the exercise's first session)
+    low = np.maximum(position - window + 1, first)
+    count = (position - low + 1).astype(np.float64)
+    x = day - day[first]
+
+    def window_sum(values: np.ndarray) -> np.ndarray:
+        prefix = np.concatenate(([0.0], np.cumsum(values)))
+        return prefix[position + 1] - prefix[low]
+
+    sum_x, sum_y = window_sum(x), window_sum(best)
+    sum_xx, sum_xy = window_sum(x * x), window_sum(x * best)
+    denominator = count * sum_xx - sum_x * sum_x
+    with np.errstate(divide="ignore", invalid="ignore"):
+        slope_per_day = np.where(denominator > 1e-9, (count * sum_xy - sum_x * sum_y) / denominator, np.nan)
+        mean = sum_y / count
+        slope_pct = np.where(mean > 0, slope_per_day * 7.0 / mean * 100.0, np.nan)
+
+    status = np.full(n, STATUS_INSUFFICIENT_DATA, dtype=np.int8)
+    flagged = (count >= min_sessions) & ~np.isnan(slope_pct)
+    status[flagged & (slope_pct >= plateau_pct)] = STATUS_PROGRESSING
+    status[flagged & (slope_pct < plateau_pct)] = STATUS_PLATEAU
+    status[flagged & (slope_pct <= regression_pct)] = STATUS_REGRESSION
+
+    # Running best per exercise: offsetting each group above the previous one lets a
+    # single maximum.accumulate restart at every group boundary
+    offset = float(best.max()) + 1.0
+    running_best = np.maximum.accumulate(best + group_id * offset) - group_id * offset
+    is_best = best >= running_best - 1e-6
+    last_best = np.maximum.accumulate(np.where(is_best, position, first))
+
+    return ProgressionAnalysis(
+        session_exercise=exercise,
+        session_day=day,
+        session_best_e1rm=best,
+        slope_pct_per_week=slope_pct,
+        status=status,
+        exercise_index=exercise[group_starts],
+        session_count=group_ends - group_starts + 1,
+        current_e1rm=best[group_ends],
+        best_e1rm=running_best[group_ends],
+        current_slope_pct_per_week=slope_pct[group_ends],
+        current_status=status[group_ends],
+        sessions_since_best=group_ends - last_best[group_ends],
+        last_session_day=day[group_ends]
+    )
+
+
+async def load_set_history(
+    db: DatabaseManager,
+    user_id: UUID,
+    exercise_id: Optional[str] = None
+) -> Dict[str, np.ndarray]:
+    """
+    Fetch a user's completed-workout set history as column arrays
+
+    One row comes back holding an array per column, which asyncpg decodes in C.
+    Exercises are ranked up front from index probes so each set carries a
+    small integer instead of its text id, and the rows are left in heap
+    (roughly chronological) order: sorting in numpy is cheaper than
+    PostgreSQL's sort of the same rows.
+    exercise_ids and exercise_names are aligned with exercise_idx.
+    """
+    row = await db.execute_query(
+        """
+        WITH seen AS (
+            SELECT e.id, e.name, (ROW_NUMBER() OVER (ORDER BY e.id) - 1)::int AS exercise_idx
+            FROM exercises e
+            WHERE ($2::text IS NULL OR e.id = $2)
+              AND EXISTS (SELECT 1 FROM workout_sets ws WHERE ws.user_id = $1 AND ws.exercise_id = e.id)
+        )
+        SELECT array_agg(seen.exercise_idx) AS exercise_idx,
+               array_agg(EXTRACT(EPOCH FROM w.started_at)::float8) AS started_epoch,
+               array_agg(ws.weight_lbs::float8) AS weight,
+               array_agg(ws.reps) AS reps,
+               (SELECT array_agg(id ORDER BY exercise_idx) FROM seen) AS exercise_ids,
+               (SELECT array_agg(name ORDER BY exercise_idx) FROM seen) AS exercise_names
+        FROM workout_sets ws
+        JOIN seen ON seen.id = ws.exercise_id
+        JOIN workouts w ON w.id = ws.workout_id
+        WHERE ws.user_id = $1
+          AND w.is_completed = true
+          AND ws.weight_lbs > 0
+        """,
+        user_id,
+        exercise_id,
+        fetch_one=True,
+        read_only=True
+    )
+
+    # Converting a few hundred thousand decoded values runs off the event loop
+    return await asyncio.to_thread(_history_arrays, row)
+
+
+def _history_arrays(row: asyncpg.Record) -> Dict[str, np.ndarray]:
+    return {
+        "exercise_idx": np.asarray(row["exercise_idx"] or [], dtype=np.int64),
+        "session_day": np.asarray(row["started_epoch"] or [], dtype=np.float64) / 86400.0,
+        "weight": np.asarray(row["weight"] or [], dtype=np.float64),
+        "reps": np.asarray(row["reps"] or [], dtype=np.float64),
+        "exercise_ids": row["exercise_ids"] or [],
+        "exercise_names": row["exercise_names"] or []
+    }
+
+
+__all__ = [
+    "E1RM_FORMULAS",
+    "STATUS_LABELS",
+    "TREND_WINDOW_SESSIONS",
+    "ProgressionAnalysis",
+    "analyze_progression",
+    "estimate_one_rep_max",
+    "load_set_history",
+    "recompute_personal_bests"
+]
@@ -0,0 +1,263 @@
+"""
+FitForge Set Metrics Backfill
+Recompute estimated_one_rep_max and improvement_vs_last for existing sets
+
+Both columns are written once at insert time. Imported history, edited sets
+and sets logged before a formula change are never revisited, so this
+rebuilds them in set-based SQL for a user and/or created_at range.
+
+improvement_vs_last compares a set's volume with the most recent earlier set
+of the same exercise within ±2 reps (the rule calculate_improvement applies
+at insert time). Each set is expanded into one row per rep bucket it can be
+compared under (reps - 2 .. reps + 2); in the partition for bucket r a LAG
+over created_at then lands on exactly the latest earlier set within ±2 of r.
+
+Work is split into batches of whole (user, exercise) histories, since that
+is the window partition, each in its own short transaction. Rows are only
+rewritten where a value changes, and rows locked by a live write are skipped
+(SKIP LOCKED) and counted instead of waited on; a later run picks them up.
+"""
+
+import asyncio
+import logging
+import time
+from datetime import datetime
+from decimal import Decimal
+from typing import Awaitable, Callable, List, Optional, Tuple
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from ..core.database import DatabaseManager
+
+logger = logging.getLogger(__name__)
+
+# Sets per transaction; a single longer exercise history still gets one batch
+BACKFILL_BATCH_SETS = 5000
+# improvement_vs_last is DECIMAL(5,2)
+MAX_IMPROVEMENT_PCT = 999.99
+
+
+def epley_one_rep_max(weight_lbs: Decimal, reps: int) -> Optional[float]:
+    """Epley estimate; None for bodyweight sets and singles"""
+    if weight_lbs > 0 and reps > 1:
+        return round(float(weight_lbs) * (1 + float(reps) / 30), 2)
+    return None
+
+
+def is_personal_best(weight_lbs: Decimal, max_weight: Optional[Decimal]) -> bool:
+    """Heavier than every earlier set at the same or higher reps (max_weight is None without one)"""
+    return max_weight is None or weight_lbs > max_weight
+
+
+def improvement_pct(weight_lbs: Decimal, reps: int, previous_volume: Optional[Decimal]) -> Optional[Decimal]:
+    """
+    Volume change vs the previous comparable set, in percent
+
+    Clamped to ±MAX_IMPROVEMENT_PCT like the backfill, so a jump such as
+    10 -> 200 lbs·reps stores 999.99 instead of overflowing the column.
+    """
+    if not previous_volume:
+        return None
+    current_volume = float(weight_lbs) * float(reps)
+    improvement = (current_volume - float(previous_volume)) / float(previous_volume) * 100
+    improvement = max(-MAX_IMPROVEMENT_PCT, min(MAX_IMPROVEMENT_PCT, improvement))
+    return round(Decimal(str(improvement)), 2)
+
+BACKFILL_QUERY = f"""
+    WITH groups AS (
+        SELECT * FROM unnest($1::uuid[], $2::text[]) AS g(user_id, exercise_id)
+    ),
+    history AS (
+        SELECT ws.id, ws.user_id, ws.exercise_id, ws.set_number, ws.reps,
+               ws.weight_lbs, ws.volume_lbs, ws.created_at
+        FROM workout_sets ws
+        JOIN groups g USING (user_id, exercise_id)
+    ),
+    buckets AS (
+        SELECT h.*, h.reps + d.offset_reps AS bucket, d.offset_reps
+        FROM history h
+        CROSS JOIN generate_series(-2, 2) AS d(offset_reps)
+    ),
+    previous AS (
+        SELECT id, offset_reps,
+               LAG(volume_lbs) OVER (
+                   PARTITION BY user_id, exercise_id, bucket
+                   ORDER BY created_at, set_number, id
+               ) AS previous_volume
+        FROM buckets
+    ),
+    computed AS (
+        SELECT h.id,
+               -- Epley, same as epley_one_rep_max
+               CASE WHEN h.weight_lbs > 0 AND h.reps > 1
+                    THEN ROUND(h.weight_lbs * (1 + h.reps / 30.0), 2) END AS estimated_one_rep_max,
+               CASE WHEN p.previous_volume > 0
+                    THEN LEAST(GREATEST(
+                        ROUND((h.volume_lbs - p.previous_volume) / p.previous_volume * 100, 2),
+                        -{MAX_IMPROVEMENT_PCT}), {MAX_IMPROVEMENT_PCT}) END AS improvement_vs_last
+        FROM history h
+        JOIN previous p ON p.id = h.id AND p.offset_reps = 0
+        WHERE ($3::timestamptz IS NULL OR h.created_at >= $3)
+          AND ($4::timestamptz IS NULL OR h.created_at < $4)
+    ),
+    changed AS (
+        SELECT c.*
+        FROM computed c
+        JOIN workout_sets ws ON ws.id = c.id
+        WHERE ws.estimated_one_rep_max IS DISTINCT FROM c.estimated_one_rep_max
+           OR ws.improvement_vs_last IS DISTINCT FROM c.improvement_vs_last
+    ),
+    locked AS (
+        SELECT ws.id
+        FROM workout_sets ws
+        WHERE ws.id IN (SELECT id FROM changed)
+        FOR UPDATE SKIP LOCKED
+    ),
+    updated AS (
+        UPDATE workout_sets ws SET
+            estimated_one_rep_max = c.estimated_one_rep_max,
+            improvement_vs_last = c.improvement_vs_last,
+            updated_at = NOW()
+        FROM changed c
+        JOIN locked l USING (id)
+        WHERE ws.id = c.id
+        RETURNING 1
+    )
+    SELECT (SELECT COUNT(*) FROM computed) AS scanned,
+           (SELECT COUNT(*) FROM changed) AS changed,
+           (SELECT COUNT(*) FROM updated) AS updated
+"""
+
+
+class BackfillProgress(BaseModel):
+    """Running totals of a backfill, reported after every batch"""
+    exercise_histories: int = 0
+    exercise_histories_done: int = 0
+    batches_done: int = 0
+    sets_scanned: int = 0
+    sets_updated: int = 0
+    sets_skipped_locked: int = 0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def percent_complete(self) -> float:
+        if not self.exercise_histories:
+            return 100.0
+        return round(self.exercise_histories_done / self.exercise_histories * 100, 1)
+
+
+ProgressCallback = Callable[[BackfillProgress], Awaitable[None]]
+
+
+class SetMetricsBackfill:
+    """
+    Batched recompute of per-set derived metrics
+    Safe to run repeatedly and alongside live traffic
+    """
+
+    def __init__(
+        self,
+        db: DatabaseManager,
+        batch_sets: int = BACKFILL_BATCH_SETS,
+        pause_seconds: float = 0.0
+    ):
+        self.db = db
+        self.batch_sets = batch_sets
+        self.pause_seconds = pause_seconds
+
+    async def run(
+        self,
+        user_id: Optional[UUID] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        on_progress: Optional[ProgressCallback] = None
+    ) -> BackfillProgress:
+        """
+        Recompute sets created in [since, until) for one user or everyone
+
+        Earlier sets are always read so improvement_vs_last at the start of
+        the range still finds its predecessor.
+        """
+        logger.info("🔥 set metrics backfill ENTRY", extra={
+            "user_id": str(user_id) if user_id else None,
+            "since": since.isoformat() if since else None,
+            "until": until.isoformat() if until else None
+        })
+        started = time.perf_counter()
+        progress = BackfillProgress()
+
+        batches = await self._plan(user_id, since, until)
+        progress.exercise_histories = sum(len(batch) for batch in batches)
+
+        for batch in batches:
+            async with self.db.get_connection() as conn:
+                async with conn.transaction():
+                    counts = await conn.fetchrow(
+                        BACKFILL_QUERY,
+                        [group[0] for group in batch],
+                        [group[1] for group in batch],
+                        since,
+                        until
+                    )
+
+            progress.batches_done += 1
+            progress.exercise_histories_done += len(batch)
+            progress.sets_scanned += counts["scanned"]
+            progress.sets_updated += counts["updated"]
+            progress.sets_skipped_locked += counts["changed"] - counts["updated"]
+            progress.elapsed_seconds = round(time.perf_counter() - started, 3)
+
+            logger.info(f"🔧 Set metrics backfill {progress.percent_complete}%", extra=progress.model_dump())
+            if on_progress is not None:
+                await on_progress(progress)
+            if self.pause_seconds:
+                await asyncio.sleep(self.pause_seconds)
+
+        progress.elapsed_seconds = round(time.perf_counter() - started, 3)
+        logger.info("✅ Set metrics backfill complete", extra=progress.model_dump())
+        return progress
+
+    async def _plan(
+        self,
+        user_id: Optional[UUID],
+        since: Optional[datetime],
+        until: Optional[datetime]
+    ) -> List[List[Tuple[UUID, str]]]:
+        """Group (user, exercise) histories with sets in range into batches of ~batch_sets"""
+        rows = await self.db.execute_query(
+            """
+            SELECT user_id, exercise_id, COUNT(*) AS set_count
+            FROM workout_sets
+            WHERE ($1::uuid IS NULL OR user_id = $1)
+            GROUP BY user_id, exercise_id
+            HAVING COUNT(*) FILTER (
+                WHERE ($2::timestamptz IS NULL OR created_at >= $2)
+                  AND ($3::timestamptz IS NULL OR created_at < $3)
+            ) > 0
+            ORDER BY user_id, exercise_id
+            """,
+            user_id,
+            since,
+            until,
+            fetch=True
+        )
+
+        batches: List[List[Tuple[UUID, str]]] = []
+        batch: List[Tuple[UUID, str]] = []
+        batch_size = 0
+        for row in rows or []:
+            if batch and batch_size + row["set_count"] > self.batch_sets:
+                batches.append(batch)
+                batch, batch_size = [], 0
+            batch.append((row["user_id"], row["exercise_id"]))
+            batch_size += row["set_count"]
+        if batch:
+            batches.append(batch)
+        return batches
+
+
+__all__ = [
+    "BACKFILL_BATCH_SETS", "BackfillProgress", "MAX_IMPROVEMENT_PCT", "SetMetricsBackfill",
+    "epley_one_rep_max", "improvement_pct", "is_personal_best"
+]
@@ -0,0 +1,262 @@
+"""
+FitForge User Stats
+Reads and reconciliation of the trigger-maintained user_stats summaries
+
+user_stats and user_exercise_stats are kept current by statement-level
+triggers on workouts and workout_sets (schemas/migrations/005_user_stats.sql).
+Deltas can still drift: rows written with triggers disabled, a manual fix in
+SQL, or a bug in a trigger. The user_stats.reconcile job recomputes both from
+source rows in batches of users and rewrites only the rows that differ. Each
+job checks at most RECONCILE_JOB_USERS users, then queues a follow-up job for
+the next user range in the same commit that marks it done.
+"""
+
+import logging
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from ..core.config import get_settings
+from ..core.database import DatabaseManager, ReadQuery, register_query
+from ..core.jobs import Job, JobQueue, job_queue
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+RECONCILE_BATCH_USERS = 500
+# Users checked by one reconcile job; the rest of the table continues in a follow-up job
+RECONCILE_JOB_USERS = 5000
+
+SUMMARY_COLUMNS = (
+    "total_workouts", "total_volume_lbs", "total_sets", "total_reps",
+    "total_duration_seconds", "timed_workouts", "first_workout_at", "last_workout_at"
+)
+EXERCISE_COLUMNS = (
+    "set_count", "total_volume_lbs", "best_set_id", "best_volume_lbs",
+    "best_weight_lbs", "best_reps", "best_set_at"
+)
+
+
+def _row(alias: str, columns: tuple) -> str:
+    return ", ".join(f"{alias}.{column}" for column in columns)
+
+
+def _assign(columns: tuple) -> str:
+    return ",\n                ".join(f"{column} = EXCLUDED.{column}" for column in columns)
+
+
+# Both statements run after the batch's summary rows are locked, so a
+# concurrent trigger delta either committed before the recompute (and is in
+# it) or waits for the lock and is applied on top of the corrected row.
+RECONCILE_SUMMARY_QUERY = f"""
+    WITH expected AS (
+        SELECT b.user_id,
+               COUNT(w.id) AS total_workouts,
+               COALESCE(SUM(w.total_volume_lbs), 0) AS total_volume_lbs,
+               COALESCE(SUM(w.total_sets), 0) AS total_sets,
+               COALESCE(SUM(w.total_reps), 0) AS total_reps,
+               COALESCE(SUM(w.duration_seconds), 0) AS total_duration_seconds,
+               COUNT(w.duration_seconds) AS timed_workouts,
+               MIN(w.started_at) AS first_workout_at,
+               MAX(w.started_at) AS last_workout_at
+        FROM unnest($1::uuid[]) AS b(user_id)
+        LEFT JOIN workouts w ON w.user_id = b.user_id AND w.is_completed
+        GROUP BY b.user_id
+    ),
+    fixed AS (
+        INSERT INTO user_stats AS s (user_id, {", ".join(SUMMARY_COLUMNS)}, updated_at)
+        SELECT e.user_id, {_row("e", SUMMARY_COLUMNS)}, NOW()
+        FROM expected e
+        LEFT JOIN user_stats cur ON cur.user_id = e.user_id
+        WHERE (cur.user_id IS NULL AND e.total_workouts > 0)
+           OR (cur.user_id IS NOT NULL AND ({_row("cur", SUMMARY_COLUMNS)}) IS DISTINCT FROM ({_row("e", SUMMARY_COLUMNS)}))
+        ON CONFLICT (user_id) DO UPDATE SET
+                {_assign(SUMMARY_COLUMNS)},
+                updated_at = NOW()
+        RETURNING 1
+    )
+    SELECT COUNT(*) FROM fixed
+"""
+
+RECONCILE_EXERCISE_QUERY = f"""
+    WITH totals AS (
+        SELECT user_id, exercise_id, COUNT(*) AS set_count, COALESCE(SUM(volume_lbs), 0) AS total_volume_lbs
+        FROM workout_sets
+        WHERE user_id = ANY($1::uuid[])
+        GROUP BY user_id, exercise_id
+    ),
+    best AS (
+        SELECT DISTINCT ON (user_id, exercise_id)
+               user_id, exercise_id, id AS best_set_id, volume_lbs AS best_volume_lbs,
+               weight_lbs AS best_weight_lbs, reps AS best_reps, created_at AS best_set_at
+        FROM workout_sets
+        WHERE user_id = ANY($1::uuid[])
+        ORDER BY user_id, exercise_id, volume_lbs DESC, created_at DESC, id DESC
+    ),
+    expected AS (
+        SELECT * FROM totals JOIN best USING (user_id, exercise_id)
+    ),
+    removed AS (
+        DELETE FROM user_exercise_stats s
+        WHERE s.user_id = ANY($1::uuid[])
+          AND NOT EXISTS (
+              SELECT 1 FROM expected e WHERE e.user_id = s.user_id AND e.exercise_id = s.exercise_id
+          )
+        RETURNING 1
+    ),
+    fixed AS (
+        INSERT INTO user_exercise_stats AS s (user_id, exercise_id, {", ".join(EXERCISE_COLUMNS)})
+        SELECT e.user_id, e.exercise_id, {_row("e", EXERCISE_COLUMNS)}
+        FROM expected e
+        LEFT JOIN user_exercise_stats cur ON cur.user_id = e.user_id AND cur.exercise_id = e.exercise_id
+        WHERE cur.user_id IS NULL
+           OR ({_row("cur", EXERCISE_COLUMNS)}) IS DISTINCT FROM ({_row("e", EXERCISE_COLUMNS)})
+        ON CONFLICT (user_id, exercise_id) DO UPDATE SET
+                {_assign(EXERCISE_COLUMNS)}
+        RETURNING 1
+    )
+    SELECT (SELECT COUNT(*) FROM removed) + (SELECT COUNT(*) FROM fixed)
+"""
+
+
+SUMMARY_QUERY = register_query("user_stats.summary", "SELECT * FROM user_stats WHERE user_id = $1")
+EXERCISES_QUERY = register_query(
+    "user_stats.exercises",
+    """
+    SELECT s.exercise_id, e.name, e.category, s.set_count, s.total_volume_lbs,
+           s.best_volume_lbs, s.best_weight_lbs, s.best_reps, s.best_set_at
+    FROM user_exercise_stats s
+    JOIN exercises e ON e.id = s.exercise_id
+    WHERE s.user_id = $1
+    ORDER BY s.exercise_id
+    """
+)
+FREQUENCY_QUERY = register_query(
+    "user_stats.frequency",
+    """
+    SELECT DATE_TRUNC('week', started_at) as week, COUNT(*) as workout_count
+    FROM workouts
+    WHERE user_id = $1 AND is_completed = true AND started_at >= NOW() - INTERVAL '12 weeks'
+    GROUP BY week
+    ORDER BY week DESC
+    """
+)
+
+
+async def load_user_stats(db: DatabaseManager, user_id: UUID) -> Dict[str, Any]:
+    """
+    Summary row, per-exercise rows and 12-week frequency for one user
+
+    The summary is a primary-key read and the exercise rows a primary-key
+    prefix scan; only the 12-week frequency still reads workouts, bounded by
+    idx_workouts_user_started.
+    """
+    summary, exercises, frequency = await db.fan_out([
+        ReadQuery(SUMMARY_QUERY, (user_id,), fetch_one=True),
+        ReadQuery(EXERCISES_QUERY, (user_id,)),
+        ReadQuery(FREQUENCY_QUERY, (user_id,))
+    ], read_only=True)
+    return {"summary": summary, "exercises": exercises, "frequency": frequency}
+
+
+async def reconcile_user_stats(
+    db: DatabaseManager,
+    user_ids: Optional[List[UUID]] = None,
+    batch_users: int = RECONCILE_BATCH_USERS,
+    after: Optional[UUID] = None,
+    max_users: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Recompute user_stats / user_exercise_stats and fix rows that drifted
+
+    Args:
+        user_ids: Only these users (default: every user, in batches)
+        batch_users: Users per transaction
+        after: Start after this user ID when walking every user
+        max_users: Stop walking every user once this many were checked
+
+    Returns:
+        Users checked, summary rows fixed, exercise rows fixed or removed, and
+        resume_after: the last user checked when max_users stopped the walk
+        early, otherwise None
+    """
+    result: Dict[str, Any] = {
+        "users_checked": 0, "summary_rows_fixed": 0, "exercise_rows_fixed": 0, "resume_after": None
+    }
+    last_id = after
+
+    while True:
+        if user_ids is not None:
+            batch = sorted(user_ids)
+            limit = len(batch)
+        else:
+            limit = batch_users if max_users is None else min(batch_users, max_users - result["users_checked"])
+            rows = await db.execute_query(
+                "SELECT id FROM users WHERE ($1::uuid IS NULL OR id > $1) ORDER BY id LIMIT $2",
+                last_id,
+                limit,
+                fetch=True
+            )
+            batch = [row["id"] for row in rows or []]
+        if not batch:
+            break
+
+        async with db.get_connection() as conn:
+            async with conn.transaction():
+                await conn.execute(
+                    "SELECT 1 FROM user_stats WHERE user_id = ANY($1::uuid[]) ORDER BY user_id FOR UPDATE",
+                    batch
+                )
+                await conn.execute(
+                    "SELECT 1 FROM user_exercise_stats WHERE user_id = ANY($1::uuid[]) ORDER BY user_id, exercise_id FOR UPDATE",
+                    batch
+                )
+                result["summary_rows_fixed"] += await conn.fetchval(RECONCILE_SUMMARY_QUERY, batch)
+                result["exercise_rows_fixed"] += await conn.fetchval(RECONCILE_EXERCISE_QUERY, batch)
+
+        result["users_checked"] += len(batch)
+        if user_ids is not None or len(batch) < limit:
+            break
+        last_id = batch[-1]
+        if max_users is not None and result["users_checked"] >= max_users:
+            result["resume_after"] = last_id
+            break
+
+    if result["summary_rows_fixed"] or result["exercise_rows_fixed"]:
+        logger.warning("🚨 User stats drift corrected", extra=result)
+    else:
+        logger.info("✅ User stats consistent", extra=result)
+    return result
+
+
+async def reconcile_user_stats_job(payload: Dict[str, Any], db: DatabaseManager, job: Job) -> None:
+    """
+    Job handler; payload may list user_ids, otherwise one range of users is checked
+
+    A walk over every user is split into jobs of RECONCILE_JOB_USERS, each
+    starting after payload["after"], so no single job runs long enough to
+    lose its lease. The follow-up job is inserted in the same transaction
+    that marks this one done, so a retried job never queues it twice.
+    """
+    if payload.get("user_ids"):
+        await reconcile_user_stats(db, [UUID(user_id) for user_id in payload["user_ids"]])
+        return
+
+    result = await reconcile_user_stats(
+        db,
+        after=UUID(payload["after"]) if payload.get("after") else None,
+        max_users=RECONCILE_JOB_USERS
+    )
+    if result["resume_after"] is None:
+        return
+    async with db.transaction() as tx:
+        await job_queue.enqueue("user_stats.reconcile", {"after": str(result["resume_after"])}, conn=tx.connection)
+        await job.complete(tx.connection)
+
+
+def register_user_stats_jobs(queue: JobQueue) -> None:
+    """Register the reconcile handler and run it every JOBS_USER_STATS_RECONCILE_SECONDS"""
+    queue.register("user_stats.reconcile", reconcile_user_stats_job)
+    queue.schedule("user_stats.reconcile", settings.jobs.USER_STATS_RECONCILE_SECONDS)
+
+
+__all__ = ["load_user_stats", "reconcile_user_stats", "register_user_stats_jobs"]
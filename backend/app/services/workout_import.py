@@ -0,0 +1,533 @@
+"""
+FitForge Workout Import Service
+Streaming bulk import of workout logs exported from other trackers
+Created: October 19, 2026
+
+Rows are parsed incrementally from CSV or JSON (array or NDJSON), staged with
+COPY into a temporary table and merged into workouts/workout_sets with
+set-based SQL. Reading and normalizing run on a worker thread one batch at a
+time, so a large upload never holds the event loop. Per-row trigger work is deferred and applied once at the end.
+improvement_vs_last depends on neighbouring sets, so it is left to a queued
+workout_sets.backfill_metrics job over the imported range.
+"""
+
+import asyncio
+import csv
+import itertools
+import json
+import logging
+import re
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal, ROUND_HALF_UP, InvalidOperation
+from typing import Any, Dict, Iterator, List, Optional, TextIO, Tuple
+from uuid import UUID
+
+import asyncpg
+from pydantic import BaseModel, Field
+
+from ..core.cache import auth_cache
+from ..core.database import DatabaseManager
+from ..core.jobs import job_queue
+from .muscle_states import calculate_muscle_fatigue, update_muscle_states
+from .progression import recompute_personal_bests
+
+logger = logging.getLogger(__name__)
+
+IMPORT_BATCH_SIZE = 5000
+JSON_READ_SIZE = 64 * 1024
+MAX_REPORTED_ERRORS = 50
+KG_TO_LBS = Decimal("2.20462")
+
+# Fatigue from workouts older than the 5-day recovery model has fully recovered
+RECOVERY_WINDOW_DAYS = 5
+
+# Header aliases used by FitForge exports, Fitbod and Strong style CSVs
+COLUMN_ALIASES: Dict[str, Tuple[str, ...]] = {
+    "workout_date": ("workout_date", "started_at", "date", "start_time"),
+    "workout_name": ("workout_name", "workout name", "workout"),
+    "exercise_name": ("exercise_name", "exercise name", "exercise", "exercise_id"),
+    "set_number": ("set_number", "set order", "set"),
+    "reps": ("reps",),
+    "weight_lbs": ("weight_lbs", "weight (lbs)", "weight(lbs)"),
+    "weight_kg": ("weight_kg", "weight (kg)", "weight(kg)"),
+    "weight": ("weight",),
+    "perceived_exertion": ("perceived_exertion", "rpe"),
+    "is_warmup": ("is_warmup", "iswarmup", "warmup"),
+}
+
+DATE_FORMATS = ("%Y-%m-%d %H:%M:%S %z", "%Y-%m-%d %H:%M:%S", "%m/%d/%Y %H:%M", "%m/%d/%Y", "%Y-%m-%d")
+
+STAGING_COLUMNS = [
+    "line_no", "workout_date", "workout_name", "exercise_name",
+    "set_number", "reps", "weight_lbs", "perceived_exertion"
+]
+
+
+class ImportFormatError(ValueError):
+    """Upload cannot be parsed at all (as opposed to individual bad rows)"""
+
+
+class ImportSummary(BaseModel):
+    """Outcome of a bulk import"""
+    rows_read: int = 0
+    rows_rejected: int = 0
+    warmup_sets_skipped: int = 0
+    workouts_created: int = 0
+    workouts_already_imported: int = 0
+    sets_imported: int = 0
+    personal_bests_updated: int = 0
+    unmapped_exercises: Dict[str, int] = Field(default_factory=dict, description="Source exercise names with no catalog match, by row count")
+    errors: List[str] = Field(default_factory=list, description=f"First {MAX_REPORTED_ERRORS} row errors")
+
+
+# ============================================================================
+# PARSING
+# ============================================================================
+
+def iter_csv_records(stream: TextIO) -> Iterator[Dict[str, Any]]:
+    """Yield CSV rows as dicts keyed by the header"""
+    yield from csv.DictReader(stream)
+
+
+def iter_json_records(stream: TextIO) -> Iterator[Dict[str, Any]]:
+    """
+    Yield objects from a JSON array or NDJSON without loading the document
+    Only the current read buffer and one decoded object are held in memory
+    """
+    decoder = json.JSONDecoder()
+    separators = re.compile(r"[\s,\[\]]*")
+    buffer = ""
+    position = 0
+    eof = False
+
+    while True:
+        position = separators.match(buffer, position).end()
+        if position < len(buffer):
+            try:
+                record, position = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                if eof:
+                    raise ImportFormatError(f"Malformed JSON near: {buffer[position:position + 80]!r}")
+            else:
+                if not isinstance(record, dict):
+                    raise ImportFormatError("JSON import must contain objects, one per set")
+                yield record
+                continue
+        elif eof:
+            return
+
+        # Need more input: keep only the unparsed tail
+        chunk = stream.read(JSON_READ_SIZE)
+        eof = not chunk
+        buffer = buffer[position:] + chunk
+        position = 0
+
+
+def _lookup(record: Dict[str, Any], field: str) -> Any:
+    """Find a field by any of its aliases in a header-normalized record"""
+    for alias in COLUMN_ALIASES[field]:
+        value = record.get(alias)
+        if value not in (None, ""):
+            return value
+    return None
+
+
+def _parse_date(value: Any) -> datetime:
+    """Parse ISO and common tracker date formats; naive values are UTC"""
+    text = str(value).strip()
+    try:
+        parsed = datetime.fromisoformat(text)
+    except ValueError:
+        for date_format in DATE_FORMATS:
+            try:
+                parsed = datetime.strptime(text, date_format)
+                break
+            except ValueError:
+                continue
+        else:
+            raise ValueError(f"unrecognized date {text!r}")
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def _to_int(value: Any, field: str) -> int:
+    """Whole number from a numeric cell ('8' or '8.0'); inf and 1e400 are invalid, not an OverflowError"""
+    try:
+        return int(float(value))
+    except OverflowError:
+        raise ValueError(f"{field} {value!r} out of range")
+
+
+def _to_weight_lbs(record: Dict[str, Any], default_unit: str) -> Decimal:
+    """Weight in lbs rounded to the schema's 0.25 lb increment"""
+    lbs, kg, plain = _lookup(record, "weight_lbs"), _lookup(record, "weight_kg"), _lookup(record, "weight")
+    if lbs is None and kg is None and plain is not None:
+        lbs, kg = (plain, None) if default_unit == "lbs" else (None, plain)
+
+    try:
+        weight = Decimal(str(lbs)) if lbs is not None else Decimal(str(kg or 0)) * KG_TO_LBS
+        # Infinity cannot be quantized and NaN passes through it, so both end up here
+        weight = (weight * 4).quantize(Decimal("1"), rounding=ROUND_HALF_UP) / 4
+        if weight.is_nan():
+            raise InvalidOperation
+    except InvalidOperation:
+        raise ValueError(f"invalid weight {lbs if lbs is not None else kg!r}")
+
+    if weight < 0 or weight > 500:
+        raise ValueError(f"weight {weight} lbs outside 0-500")
+    return weight
+
+
+def normalize_record(
+    raw: Dict[str, Any],
+    line_no: int,
+    default_unit: str = "lbs"
+) -> Optional[Tuple[Any, ...]]:
+    """
+    Convert one source row to a staging tuple (STAGING_COLUMNS order)
+    Returns None for warm-up sets; raises ValueError for invalid rows
+    """
+    record = {str(key).strip().lower(): value for key, value in raw.items() if key is not None}
+
+    warmup = _lookup(record, "is_warmup")
+    if warmup is not None and str(warmup).strip().lower() in ("1", "true", "yes", "y"):
+        return None
+
+    workout_date = _lookup(record, "workout_date")
+    exercise_name = _lookup(record, "exercise_name")
+    reps = _lookup(record, "reps")
+    if workout_date is None or exercise_name is None or reps is None:
+        raise ValueError("date, exercise and reps are required")
+
+    reps = _to_int(reps, "reps")
+    if not 1 <= reps <= 50:
+        raise ValueError(f"reps {reps} outside 1-50")
+
+    set_number = _lookup(record, "set_number")
+    rpe = _lookup(record, "perceived_exertion")
+    rpe = _to_int(rpe, "rpe") if rpe is not None else None
+    if rpe is not None and not 1 <= rpe <= 10:
+        rpe = None
+
+    workout_name = _lookup(record, "workout_name")
+    return (
+        line_no,
+        _parse_date(workout_date),
+        str(workout_name).strip()[:255] if workout_name is not None else None,
+        str(exercise_name).strip(),
+        _to_int(set_number, "set_number") if set_number is not None else None,
+        reps,
+        _to_weight_lbs(record, default_unit),
+        rpe,
+    )
+
+
+def normalize_batch(
+    numbered_records: Iterator[Tuple[int, Dict[str, Any]]],
+    default_unit: str,
+    summary: ImportSummary,
+    size: int
+) -> Tuple[List[Tuple[Any, ...]], bool]:
+    """
+    Normalize up to size (line_no, row) pairs, counting rejects and warm-ups in summary
+
+    Returns:
+        Staging tuples, and whether the source is exhausted
+    """
+    batch: List[Tuple[Any, ...]] = []
+    read = 0
+    for line_no, raw in itertools.islice(numbered_records, size):
+        read += 1
+        summary.rows_read += 1
+        try:
+            row = normalize_record(raw, line_no, default_unit)
+        except (ValueError, TypeError, ArithmeticError) as e:
+            # A bad cell rejects its row; it never fails the upload
+            summary.rows_rejected += 1
+            if len(summary.errors) < MAX_REPORTED_ERRORS:
+                summary.errors.append(f"row {line_no}: {e}")
+            continue
+        if row is None:
+            summary.warmup_sets_skipped += 1
+            continue
+        batch.append(row)
+    return batch, read < size
+
+
+# ============================================================================
+# EXERCISE NAME MAPPING
+# ============================================================================
+
+def _tokens(name: str) -> Tuple[str, ...]:
+    """Lowercase alphanumeric tokens ('Bench Press (Barbell)' -> bench, press, barbell)"""
+    return tuple(re.findall(r"[a-z0-9]+", name.lower()))
+
+
+class ExerciseNameIndex:
+    """
+    In-memory token index over the active exercise catalog
+    Exact name/ID matches win; otherwise the catalog entry sharing the most
+    tokens with the source name (shortest name on ties) is used.
+    """
+
+    def __init__(self, catalog: List[Dict[str, Any]]):
+        self.exact: Dict[Tuple[str, ...], str] = {}
+        self.entries: List[Tuple[frozenset, int, str]] = []
+        for exercise in catalog:
+            name_tokens = _tokens(exercise["name"])
+            self.exact[name_tokens] = exercise["id"]
+            self.exact.setdefault(_tokens(exercise["id"]), exercise["id"])
+            self.entries.append((frozenset(name_tokens), len(exercise["name"]), exercise["id"]))
+
+    def match(self, source_name: str) -> Optional[str]:
+        source_tokens = _tokens(source_name)
+        if source_tokens in self.exact:
+            return self.exact[source_tokens]
+
+        wanted = frozenset(source_tokens)
+        best: Optional[Tuple[int, int, str]] = None
+        for name_tokens, name_length, exercise_id in self.entries:
+            # Catalog name fully contained in the source name, or vice versa
+            if not (name_tokens <= wanted or wanted <= name_tokens):
+                continue
+            candidate = (len(name_tokens & wanted), -name_length, exercise_id)
+            if best is None or candidate > best:
+                best = candidate
+        return best[2] if best else None
+
+
+# ============================================================================
+# IMPORT
+# ============================================================================
+
+class WorkoutImportService:
+    """
+    Bulk importer for historical workout logs
+    One transaction per import: staging, merge and recompute either all land or none do
+    """
+
+    def __init__(self, db: DatabaseManager):
+        self.db = db
+
+    async def import_records(
+        self,
+        user_id: UUID,
+        records: Iterator[Dict[str, Any]],
+        default_unit: str = "lbs"
+    ) -> ImportSummary:
+        """Stage, merge and post-process an iterator of source rows"""
+        logger.info("🔥 import_records ENTRY", extra={"user_id": str(user_id)})
+        summary = ImportSummary()
+
+        async with self.db.get_connection() as conn:
+            async with conn.transaction():
+                await conn.execute(
+                    """
+                    CREATE TEMP TABLE import_staging (
+                        line_no INTEGER NOT NULL,
+                        workout_date TIMESTAMPTZ NOT NULL,
+                        workout_name TEXT,
+                        exercise_name TEXT NOT NULL,
+                        set_number INTEGER,
+                        reps INTEGER NOT NULL,
+                        weight_lbs NUMERIC(6,2) NOT NULL,
+                        perceived_exertion INTEGER
+                    ) ON COMMIT DROP;
+                    CREATE TEMP TABLE import_exercise_map (
+                        exercise_name TEXT PRIMARY KEY,
+                        exercise_id TEXT NOT NULL
+                    ) ON COMMIT DROP;
+                    """
+                )
+
+                await self._stage(conn, records, default_unit, summary)
+                await self._map_exercises(conn, summary)
+                new_workout_ids = await self._merge(conn, user_id, summary)
+                if new_workout_ids:
+                    summary.personal_bests_updated = await recompute_personal_bests(
+                        conn, user_id, new_workout_ids
+                    )
+                    # Later sets compare against the imported ones too, so only the start is bounded
+                    imported_since = await conn.fetchval(
+                        "SELECT MIN(workout_date) FROM import_workouts WHERE NOT already_imported"
+                    )
+                    await job_queue.enqueue(
+                        "workout_sets.backfill_metrics",
+                        {"user_id": str(user_id), "since": imported_since.isoformat()},
+                        conn=conn
+                    )
+                recent_workouts = await conn.fetch(
+                    "SELECT id, started_at FROM workouts WHERE id = ANY($1::uuid[]) AND started_at >= $2",
+                    new_workout_ids,
+                    datetime.now(timezone.utc) - timedelta(days=RECOVERY_WINDOW_DAYS)
+                )
+
+        if new_workout_ids:
+            job_queue.notify()
+            auth_cache.invalidate_user(user_id)
+        await self._update_muscle_rollups(user_id, recent_workouts)
+
+        logger.info("🔧 Import complete", extra={"user_id": str(user_id), **summary.model_dump(exclude={"errors", "unmapped_exercises"})})
+        return summary
+
+    async def _stage(
+        self,
+        conn: asyncpg.Connection,
+        records: Iterator[Dict[str, Any]],
+        default_unit: str,
+        summary: ImportSummary
+    ) -> None:
+        """COPY normalized rows into the staging table in fixed-size batches"""
+        numbered = enumerate(records, start=1)
+        exhausted = False
+        while not exhausted:
+            # Decoding the upload and normalizing rows is CPU work; only the COPY runs on the loop
+            batch, exhausted = await asyncio.to_thread(
+                normalize_batch, numbered, default_unit, summary, IMPORT_BATCH_SIZE
+            )
+            if batch:
+                await conn.copy_records_to_table("import_staging", records=batch, columns=STAGING_COLUMNS)
+
+    async def _map_exercises(self, conn: asyncpg.Connection, summary: ImportSummary) -> None:
+        """Resolve each distinct source exercise name once"""
+        catalog = await conn.fetch("SELECT id, name FROM exercises WHERE is_active = true")
+        index = ExerciseNameIndex([dict(row) for row in catalog])
+
+        mapping = []
+        for row in await conn.fetch("SELECT exercise_name, COUNT(*) AS row_count FROM import_staging GROUP BY exercise_name"):
+            exercise_id = index.match(row["exercise_name"])
+            if exercise_id:
+                mapping.append((row["exercise_name"], exercise_id))
+            else:
+                summary.unmapped_exercises[row["exercise_name"]] = row["row_count"]
+                summary.rows_rejected += row["row_count"]
+
+        if mapping:
+            await conn.copy_records_to_table("import_exercise_map", records=mapping)
+
+    async def _merge(self, conn: asyncpg.Connection, user_id: UUID, summary: ImportSummary) -> List[UUID]:
+        """Create workouts and sets for rows not imported before; returns new workout IDs"""
+        # The user row is updated once below instead of once per workout
+        await conn.execute("SET LOCAL fitforge.defer_workout_count = 'on'")
+
+        # One workout per (date, name); workouts already present at that start time are skipped
+        await conn.execute(
+            """
+            CREATE TEMP TABLE import_workouts ON COMMIT DROP AS
+            SELECT s.workout_date, s.workout_name,
+                   COALESCE(existing.id, gen_random_uuid()) AS workout_id,
+                   existing.id IS NOT NULL AS already_imported
+            FROM (
+                SELECT DISTINCT workout_date, workout_name
+                FROM import_staging JOIN import_exercise_map USING (exercise_name)
+            ) s
+            LEFT JOIN LATERAL (
+                SELECT id FROM workouts
+                WHERE user_id = $1 AND started_at = s.workout_date
+                LIMIT 1
+            ) existing ON true
+            """,
+            user_id
+        )
+
+        new_workouts = await conn.fetch(
+            """
+            INSERT INTO workouts (id, user_id, name, started_at, is_completed, notes)
+            SELECT workout_id, $1, COALESCE(workout_name, 'Imported workout'), workout_date, true, 'Imported'
+            FROM import_workouts
+            WHERE NOT already_imported
+            RETURNING id
+            """,
+            user_id
+        )
+        new_workout_ids = [row["id"] for row in new_workouts]
+        summary.workouts_created = len(new_workout_ids)
+        summary.workouts_already_imported = await conn.fetchval(
+            "SELECT COUNT(*) FROM import_workouts WHERE already_imported"
+        )
+
+        # Sets are renumbered per workout/exercise in source order; the schema allows 20
+        counts = await conn.fetchrow(
+            """
+            WITH ranked AS (
+                SELECT s.*, m.exercise_id,
+                       ROW_NUMBER() OVER (
+                           PARTITION BY s.workout_date, s.workout_name, m.exercise_id
+                           ORDER BY s.set_number NULLS LAST, s.line_no
+                       ) AS sequence
+                FROM import_staging s
+                JOIN import_exercise_map m USING (exercise_name)
+            ),
+            inserted AS (
+                INSERT INTO workout_sets (
+                    workout_id, exercise_id, user_id, set_number, reps, weight_lbs,
+                    perceived_exertion, estimated_one_rep_max, created_at, updated_at
+                )
+                SELECT
+                    w.workout_id, r.exercise_id, $1, r.sequence, r.reps, r.weight_lbs,
+                    r.perceived_exertion,
+                    -- Epley, same as create_workout_set
+                    CASE WHEN r.weight_lbs > 0 AND r.reps > 1
+                         THEN ROUND(r.weight_lbs * (1 + r.reps / 30.0), 2) END,
+                    r.workout_date + r.line_no * INTERVAL '1 millisecond',
+                    NOW()
+                FROM ranked r
+                JOIN import_workouts w
+                    ON w.workout_date = r.workout_date
+                   AND w.workout_name IS NOT DISTINCT FROM r.workout_name
+                WHERE NOT w.already_imported AND r.sequence <= 20
+                RETURNING 1
+            )
+            SELECT
+                (SELECT COUNT(*) FROM inserted) AS inserted,
+                (SELECT COUNT(*) FROM ranked r
+                 JOIN import_workouts w
+                     ON w.workout_date = r.workout_date
+                    AND w.workout_name IS NOT DISTINCT FROM r.workout_name
+                 WHERE NOT w.already_imported AND r.sequence > 20) AS over_limit
+            """,
+            user_id
+        )
+        summary.sets_imported = counts["inserted"]
+        if counts["over_limit"]:
+            summary.rows_rejected += counts["over_limit"]
+            if len(summary.errors) < MAX_REPORTED_ERRORS:
+                summary.errors.append(f"{counts['over_limit']} sets beyond 20 per exercise in a workout were skipped")
+
+        # Deferred update_user_workout_count(): one increment, same thresholds
+        if new_workout_ids:
+            await conn.execute(
+                """
+                UPDATE users SET
+                    workout_count = workout_count + $2,
+                    feature_level = CASE
+                        WHEN workout_count + $2 >= 20 THEN 4
+                        WHEN workout_count + $2 >= 10 THEN 3
+                        WHEN workout_count + $2 >= 3 THEN 2
+                        ELSE 1
+                    END,
+                    last_active_at = NOW()
+                WHERE id = $1
+                """,
+                user_id,
+                len(new_workout_ids)
+            )
+        await conn.execute("SET LOCAL fitforge.defer_workout_count = 'off'")
+
+        return new_workout_ids
+
+    async def _update_muscle_rollups(self, user_id: UUID, recent_workouts: List[asyncpg.Record]) -> None:
+        """Apply muscle fatigue for imported workouts still inside the recovery window"""
+        if not recent_workouts:
+            return
+        async with self.db.transaction() as tx:
+            for workout in recent_workouts:
+                # A failing workout rolls back to its savepoint; the rest still apply
+                try:
+                    async with tx.savepoint():
+                        muscle_fatigue_data = await calculate_muscle_fatigue(str(workout["id"]), tx)
+                        if muscle_fatigue_data:
+                            await update_muscle_states(user_id, muscle_fatigue_data, workout["started_at"], tx)
+                except Exception as e:
+                    logger.warning(f"🚨 Muscle state update failed after import - {str(e)}", extra={
+                        "workout_id": str(workout["id"])
+                    })
@@ -0,0 +1,90 @@
+"""
+FitForge Workout Job Handlers
+Post-completion work run by the background job queue
+
+complete_workout and sync's workout.complete commit the workout and queue
+POST_COMPLETION_JOBS in the same statement, then respond. Personal bests are recomputed from the sets
+themselves, so repeating that job is harmless. Muscle states are
+increments, so that handler marks its job done in the same transaction as
+the upserts: either both commit or neither does, and a retry or a reclaimed
+lease can never add the same workout twice.
+
+workout_sets.backfill_metrics is queued by the bulk importer and can be
+queued by hand to rebuild per-set metrics for a user or date range.
+"""
+
+import logging
+from datetime import datetime
+from typing import Any, Dict
+from uuid import UUID
+
+from ..core.database import DatabaseManager
+from ..core.jobs import Job, JobQueue, enqueue_query
+from .muscle_states import calculate_muscle_fatigue, update_muscle_states
+from .progression import recompute_personal_bests
+from .set_metrics import SetMetricsBackfill
+
+logger = logging.getLogger(__name__)
+
+# Queued for every completed workout, whichever router completed it
+POST_COMPLETION_JOBS = ["workout.personal_bests", "workout.muscle_states"]
+
+
+def queue_post_completion_jobs(completed: str) -> str:
+    """
+    INSERT queueing POST_COMPLETION_JOBS for each row of completed, a CTE of
+    just-completed workouts with id, user_id and ended_at; embed it as a
+    data-modifying CTE next to the UPDATE that completes them
+    """
+    job_types = ", ".join(f"'{job_type}'" for job_type in POST_COMPLETION_JOBS)
+    return enqueue_query(
+        f"ARRAY[{job_types}]",
+        "jsonb_build_object('workout_id', c.id, 'user_id', c.user_id, 'completed_at', c.ended_at)",
+        source=f"{completed} c"
+    )
+
+
+async def repair_personal_bests(payload: Dict[str, Any], db: DatabaseManager, job: Job) -> None:
+    """Recompute PB flags for the completed workout's exercises"""
+    async with db.get_connection() as conn:
+        async with conn.transaction():
+            changed = await recompute_personal_bests(
+                conn, UUID(payload["user_id"]), [UUID(payload["workout_id"])]
+            )
+
+    logger.info("🔧 Personal bests repaired", extra={
+        "workout_id": payload["workout_id"], "sets_changed": changed
+    })
+
+
+async def update_muscle_rollups(payload: Dict[str, Any], db: DatabaseManager, job: Job) -> None:
+    """Fold the completed workout's muscle fatigue into the user's muscle states"""
+    async with db.transaction() as tx:
+        muscle_fatigue_data = await calculate_muscle_fatigue(payload["workout_id"], tx)
+        if muscle_fatigue_data:
+            completed_at = datetime.fromisoformat(payload["completed_at"])
+            await update_muscle_states(payload["user_id"], muscle_fatigue_data, completed_at, tx)
+        # The upserts add to the stored totals, so they commit only together with the done status
+        await job.complete(tx.connection)
+
+
+async def backfill_set_metrics(payload: Dict[str, Any], db: DatabaseManager, job: Job) -> None:
+    """Recompute estimated_one_rep_max / improvement_vs_last; payload keys are all optional"""
+    await SetMetricsBackfill(db).run(
+        user_id=UUID(payload["user_id"]) if payload.get("user_id") else None,
+        since=datetime.fromisoformat(payload["since"]) if payload.get("since") else None,
+        until=datetime.fromisoformat(payload["until"]) if payload.get("until") else None
+    )
+
+
+def register_workout_jobs(queue: JobQueue) -> None:
+    """Register the handlers for POST_COMPLETION_JOBS and set maintenance"""
+    queue.register("workout.personal_bests", repair_personal_bests)
+    queue.register("workout.muscle_states", update_muscle_rollups)
+    queue.register("workout_sets.backfill_metrics", backfill_set_metrics)
+
+
+__all__ = [
+    "POST_COMPLETION_JOBS", "backfill_set_metrics", "queue_post_completion_jobs",
+    "register_workout_jobs", "repair_personal_bests", "update_muscle_rollups"
+]
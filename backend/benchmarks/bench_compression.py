@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Response Compression Benchmark
+Wire size and CPU cost of compressing real analytics payloads
+
+Renders the muscle heatmap, progress analytics and user stats responses of
+one user against a real database, encodes them exactly as FastAPI would,
+then compresses each with gzip at several levels (and brotli when it is
+installed). The cached row is what CompressionMiddleware pays when the same
+body was compressed before: one blake2b hash and a cache lookup.
+
+Run with: python benchmarks/bench_compression.py --dsn postgresql://... --user-id <uuid>
+"""
+
+import argparse
+import asyncio
+import hashlib
+import os
+import statistics
+import sys
+import time
+import zlib
+from types import SimpleNamespace
+from typing import Callable, List, Tuple
+from uuid import UUID
+
+import asyncpg
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+# Allow running from the backend directory without installing the package
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.api.analytics import get_muscle_heatmap_data, get_progress_analytics
+from app.api.users import get_current_user_stats
+from app.core.cache import compressed_bodies
+from app.core.database import DatabaseManager
+from app.middleware.compression import GZIP_WBITS, compress_body
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+def gzip_at(level: int) -> Callable[[bytes], bytes]:
+    def compress(body: bytes) -> bytes:
+        compressor = zlib.compressobj(level, zlib.DEFLATED, GZIP_WBITS)
+        return compressor.compress(body) + compressor.flush()
+    return compress
+
+
+def brotli_at(quality: int) -> Callable[[bytes], bytes]:
+    return lambda body: brotli.compress(body, quality=quality, mode=brotli.MODE_TEXT)
+
+
+def time_us(func: Callable[[], object], runs: int) -> float:
+    """Median microseconds per call"""
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - started) * 1_000_000)
+    return statistics.median(timings)
+
+
+async def render_payloads(db: DatabaseManager, user_id: UUID) -> List[Tuple[str, bytes]]:
+    """Response bodies as the JSONResponse of each endpoint would send them"""
+    user = SimpleNamespace(id=user_id)
+    results = [
+        ("muscle-heatmap", await get_muscle_heatmap_data(user_id=str(user_id), current_user=user, db=db)),
+        ("progress (12 weeks)", await get_progress_analytics(
+            user_id=str(user_id), weeks=12, muscle_group=None, current_user=user, db=db
+        )),
+        ("users/me/stats", await get_current_user_stats(current_user=user, db=db)),
+    ]
+    return [(name, JSONResponse(jsonable_encoder(result)).body) for name, result in results]
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dsn", required=True, help="Database to query")
+    parser.add_argument("--user-id", required=True, type=UUID, help="User whose analytics are rendered")
+    parser.add_argument("--runs", type=int, default=200, help="Timed compressions per variant")
+    args = parser.parse_args()
+
+    pool = await asyncpg.create_pool(args.dsn, min_size=2, max_size=5)
+    try:
+        db = DatabaseManager()
+        db.pool = pool
+        payloads = await render_payloads(db, args.user_id)
+    finally:
+        await pool.close()
+
+    variants = [(f"gzip -{level}", gzip_at(level)) for level in (1, 6, 9)]
+    if brotli:
+        variants += [(f"br q{quality}", brotli_at(quality)) for quality in (4, 11)]
+
+    print(f"📊 Compression benchmark - user {args.user_id}{'' if brotli else ' (brotli not installed)'}")
+    for name, body in payloads:
+        print("=" * 60)
+        print(f"{name}: {len(body):,} bytes raw")
+        print(f"{'variant':<14}{'bytes':>12}{'ratio':>10}{'µs':>12}{'MB/s':>12}")
+        for label, compress in variants:
+            size = len(compress(body))
+            us = time_us(lambda: compress(body), args.runs)
+            print(f"{label:<14}{size:>12,}{len(body) / size:>9.1f}x{us:>12.1f}{len(body) / us:>12.1f}")
+
+        # Middleware path: first call compresses, the rest hit the content-addressed cache
+        compressed_bodies.clear()
+        compress_body(body, "gzip")
+        cached_us = time_us(lambda: compress_body(body, "gzip"), args.runs)
+        hash_us = time_us(lambda: hashlib.blake2b(body, digest_size=16).digest(), args.runs)
+        print(f"{'cached':<14}{'':>12}{'':>10}{cached_us:>12.1f}{'':>12}  (blake2b alone {hash_us:.1f} µs)")
+    print("-" * 60)
+    print("✅ bytes on the wire per response, and the CPU each encoding costs per request")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
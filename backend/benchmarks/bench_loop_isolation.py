@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Event Loop Isolation Load Test
+Tail latency of light requests while heavy analytics requests run
+
+Drives the real application in process, through its full middleware stack,
+against a real database. Light requests (GET /api/health/live, which does
+no I/O, and a 10-row workout list) arrive at a fixed rate, and each
+latency is measured from the request's scheduled start. A stalled loop
+therefore shows up in the tail instead of just delaying the next send.
+The same light load runs twice: alone, then while --analytics-workers
+clients loop over the plateau, progress and muscle-heatmap analytics of
+--user-id.
+
+If the analytics endpoints blocked the loop (synchronous DB drivers, long
+CPU-bound loops), /live p99 would climb toward the analytics request time.
+With asyncpg it stays near the baseline. The workout list also shares the
+database with the analytics queries, so its tail measures database
+contention as well.
+
+Wall-clock latency cannot tell a blocked loop from a starved process: when
+PostgreSQL runs on the same cores it takes CPU from the app. Each phase
+therefore also reports the CPU time of the longest single event-loop step
+(what one callback held the loop for) and the app's share of one core.
+
+Run with: python benchmarks/bench_loop_isolation.py --dsn postgresql://... --user-id <uuid>
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import statistics
+import sys
+import time
+from collections import defaultdict
+from types import SimpleNamespace
+from typing import Dict, List
+from uuid import UUID
+
+import httpx
+
+# Allow running from the backend directory without installing the package
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from main import app
+from app.core.database import db_manager
+from app.core.dependencies import get_current_user
+from app.core.routing import load_routers
+
+LIGHT_PATHS = ("/api/health/live", "/api/workouts/?limit=10")
+
+
+class LoopStepMonitor:
+    """CPU time of every event-loop callback, so blocking is measured apart from preemption"""
+
+    def __init__(self):
+        self.steps: List[float] = []
+        self._run = asyncio.events.Handle._run
+
+    def __enter__(self) -> "LoopStepMonitor":
+        steps, run = self.steps, self._run
+
+        def timed_run(handle):
+            started = time.thread_time()
+            run(handle)
+            steps.append((time.thread_time() - started) * 1000)
+
+        asyncio.events.Handle._run = timed_run
+        self.wall, self.cpu = time.perf_counter(), time.process_time()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        asyncio.events.Handle._run = self._run
+        self.cpu_share = (time.process_time() - self.cpu) / (time.perf_counter() - self.wall)
+
+
+def percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+async def light_load(client: httpx.AsyncClient, rate: float, duration: float) -> Dict[str, List[float]]:
+    """Milliseconds per light request by path, from scheduled start, at a fixed arrival rate"""
+    latencies: Dict[str, List[float]] = defaultdict(list)
+    interval = 1.0 / rate
+
+    async def one(path: str, scheduled: float) -> None:
+        response = await client.get(path)
+        response.raise_for_status()
+        latencies[path].append((time.perf_counter() - scheduled) * 1000)
+
+    tasks = []
+    started = time.perf_counter()
+    for n in range(int(rate * duration)):
+        scheduled = started + n * interval
+        delay = scheduled - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        tasks.append(asyncio.create_task(one(LIGHT_PATHS[n % len(LIGHT_PATHS)], scheduled)))
+    await asyncio.gather(*tasks)
+    return latencies
+
+
+async def analytics_load(client: httpx.AsyncClient, user_id: UUID, stop: asyncio.Event,
+                         timings: Dict[str, List[float]]) -> None:
+    """Heavy analytics requests back to back until stop is set"""
+    paths = {
+        "plateaus": "/api/analytics/plateaus",
+        "progress": f"/api/analytics/progress/{user_id}?weeks=52",
+        "muscle-heatmap": f"/api/analytics/muscle-heatmap/{user_id}"
+    }
+    while not stop.is_set():
+        for name, path in paths.items():
+            started = time.perf_counter()
+            response = await client.get(path)
+            response.raise_for_status()
+            timings[name].append((time.perf_counter() - started) * 1000)
+
+
+def report(label: str, latencies: List[float]) -> float:
+    p99 = percentile(latencies, 0.99)
+    print(f"{label:<26}{len(latencies):>7}{statistics.median(latencies):>10.2f}"
+          f"{percentile(latencies, 0.95):>10.2f}{p99:>10.2f}{max(latencies):>10.2f}")
+    return p99
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dsn", required=True, help="Database to query")
+    parser.add_argument("--user-id", required=True, type=UUID, help="User whose analytics are requested")
+    parser.add_argument("--rate", type=float, default=100, help="Light requests per second")
+    parser.add_argument("--duration", type=float, default=10, help="Seconds per phase")
+    parser.add_argument("--analytics-workers", type=int, default=4, help="Concurrent analytics clients")
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    db_manager.pool = await db_manager._create_pool(args.dsn, 20)
+    db_manager._initialized = True
+    load_routers(app)
+    app.dependency_overrides[get_current_user] = lambda: SimpleNamespace(id=args.user_id)
+
+    print(f"📊 Loop isolation - {args.rate:g} light req/s for {args.duration:g}s per phase, "
+          f"{args.analytics_workers} analytics clients, user {args.user_id}")
+    print("=" * 73)
+    print(f"{'light requests':<26}{'count':>7}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+    try:
+        async with httpx.AsyncClient(app=app, base_url="http://bench", timeout=60) as client:
+            for path in LIGHT_PATHS:
+                (await client.get(path)).raise_for_status()  # warm up routes and plans
+            with LoopStepMonitor() as alone:
+                latencies = await light_load(client, args.rate, args.duration)
+            baseline = {path: report(f"{path[:18]} alone", values) for path, values in latencies.items()}
+
+            stop = asyncio.Event()
+            timings: Dict[str, List[float]] = defaultdict(list)
+            workers = [
+                asyncio.create_task(analytics_load(client, args.user_id, stop, timings))
+                for _ in range(args.analytics_workers)
+            ]
+            try:
+                with LoopStepMonitor() as under_load:
+                    latencies = await light_load(client, args.rate, args.duration)
+            finally:
+                stop.set()
+                await asyncio.gather(*workers)
+            loaded = {path: report(f"{path[:18]} loaded", values) for path, values in latencies.items()}
+    finally:
+        await db_manager.close()
+
+    print("-" * 73)
+    print(f"{'analytics requests':<26}{'count':>7}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+    for name, values in timings.items():
+        report(name, values)
+    print("-" * 73)
+    print(f"{'loop steps (CPU)':<26}{'count':>7}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+    report("alone", alone.steps)
+    report("loaded", under_load.steps)
+    print(f"app CPU share: {alone.cpu_share:.0%} alone, {under_load.cpu_share:.0%} loaded ({os.cpu_count()} CPUs)")
+    print("-" * 73)
+    for path in LIGHT_PATHS:
+        print(f"{path} p99 {baseline[path]:.2f} ms alone -> {loaded[path]:.2f} ms under analytics load "
+              f"({loaded[path] / baseline[path]:.1f}x)")
+    step_alone, step_loaded = percentile(alone.steps, 0.99), percentile(under_load.steps, 0.99)
+    blocked = step_loaded > max(2 * step_alone, 5.0)
+    print(f"{'⚠️ event loop blocked' if blocked else '✅ event loop not blocked'}: p99 step "
+          f"{step_alone:.2f} ms alone, {step_loaded:.2f} ms loaded; any remaining light-request tail "
+          f"is the app waiting for CPU, not for the loop")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
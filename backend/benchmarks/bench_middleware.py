@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Middleware Overhead Benchmark
+Per-request cost of RequestLoggingMiddleware + ErrorHandlingMiddleware, old vs new
+
+Variants:
+  bare     - the app with no custom middleware
+  legacy   - the previous BaseHTTPMiddleware implementations
+  asgi     - the raw ASGI implementations in app/middleware
+
+Requests are driven straight through the ASGI interface (no HTTP client or
+server), so the difference to bare is the middleware cost alone.
+
+Run with: python benchmarks/bench_middleware.py [--requests 5000]
+"""
+
+import argparse
+import asyncio
+import contextvars
+import logging
+import os
+import statistics
+import sys
+import time
+from typing import Callable, List
+from uuid import uuid4
+
+from fastapi import FastAPI, Request
+from starlette.middleware.base import BaseHTTPMiddleware
+
+# Allow running from the backend directory without installing the package
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.core.logging import log_request
+from app.middleware.error_handling import ErrorHandlingMiddleware
+from app.middleware.request_logging import RequestLoggingMiddleware
+
+
+class LegacyRequestLoggingMiddleware(BaseHTTPMiddleware):
+    """The previous RequestLoggingMiddleware.dispatch"""
+
+    async def dispatch(self, request: Request, call_next: Callable):
+        start_time = time.time()
+        method = request.method
+        url = str(request.url)
+        response = await call_next(request)
+        duration_ms = (time.time() - start_time) * 1000
+        log_request(method, url, response.status_code, duration_ms)
+        response.headers["X-Process-Time"] = str(duration_ms)
+        return response
+
+
+class LegacyErrorHandlingMiddleware(BaseHTTPMiddleware):
+    """The previous ErrorHandlingMiddleware.dispatch, including its per-request ContextVar"""
+
+    async def dispatch(self, request: Request, call_next: Callable):
+        correlation_id = request.headers.get("X-Correlation-ID", str(uuid4()))
+        request.state.correlation_id = correlation_id
+        correlation_context = contextvars.ContextVar('correlation_id', default=None)
+        correlation_context.set(correlation_id)
+        response = await call_next(request)
+        response.headers["X-Correlation-ID"] = correlation_id
+        return response
+
+
+def build_app(variant: str) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/api/ping/{item_id}")
+    async def ping(item_id: str):
+        return {"item_id": item_id}
+
+    if variant == "legacy":
+        app.add_middleware(LegacyErrorHandlingMiddleware)
+        app.add_middleware(LegacyRequestLoggingMiddleware)
+    elif variant == "asgi":
+        app.add_middleware(ErrorHandlingMiddleware)
+        app.add_middleware(RequestLoggingMiddleware)
+    return app
+
+
+async def call(app: FastAPI, n: int) -> None:
+    """One GET through the ASGI interface, discarding the response"""
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+        "scheme": "http", "path": f"/api/ping/{n}", "raw_path": f"/api/ping/{n}".encode(),
+        "query_string": b"", "root_path": "", "headers": [(b"host", b"bench")],
+        "client": ("127.0.0.1", 5000), "server": ("bench", 80)
+    }
+
+    body_sent = False
+
+    async def receive():
+        # Like a server: the body once, then block until disconnect (never here)
+        nonlocal body_sent
+        if body_sent:
+            await asyncio.Event().wait()
+        body_sent = True
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    await app(scope, receive, send)
+
+
+async def time_requests(app: FastAPI, requests: int) -> List[float]:
+    """Microseconds per request"""
+    for n in range(min(200, requests)):
+        await call(app, n)
+    timings = []
+    for n in range(requests):
+        started = time.perf_counter()
+        await call(app, n)
+        timings.append((time.perf_counter() - started) * 1_000_000)
+    return sorted(timings)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=5000, help="Timed requests per variant")
+    args = parser.parse_args()
+
+    # Per-request log lines would dominate the measurement
+    logging.disable(logging.INFO)
+
+    print(f"📊 Middleware overhead - {args.requests} requests per variant")
+    print("=" * 40)
+    print(f"{'variant':<12}{'median µs':>14}{'p99 µs':>14}")
+    medians = {}
+    for variant in ("bare", "legacy", "asgi"):
+        timings = await time_requests(build_app(variant), args.requests)
+        medians[variant] = statistics.median(timings)
+        print(f"{variant:<12}{medians[variant]:>14.1f}{timings[int(len(timings) * 0.99) - 1]:>14.1f}")
+
+    print("-" * 40)
+    legacy_cost = medians["legacy"] - medians["bare"]
+    asgi_cost = medians["asgi"] - medians["bare"]
+    print(f"✅ middleware cost per request: legacy {legacy_cost:.1f} µs, asgi {asgi_cost:.1f} µs "
+          f"({legacy_cost - asgi_cost:.1f} µs saved)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
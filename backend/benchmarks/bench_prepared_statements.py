@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Prepared Statement Benchmark
+Latency of hot and query-builder queries with and without the statement cache
+
+Runs the same mix through DatabaseManager.execute_query against a pool with
+statement_cache_size=0 (every call parses and plans) and against the
+registry-backed pool (registered queries prepared at connect, builder output
+normalized into the per-connection cache).
+
+Run with: python benchmarks/bench_prepared_statements.py --dsn postgresql://... --user-id <uuid>
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from uuid import UUID
+
+import asyncpg
+
+# Allow running from the backend directory without installing the package
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.core.database import USER_PROFILE_QUERY, DatabaseManager, PreparedConnection, statement_stats
+from app.services.user_stats import EXERCISES_QUERY, SUMMARY_QUERY
+
+CATEGORIES = ["Push", "Pull", "Legs", "Abs"]
+
+
+def exercise_filter_query(n: int) -> str:
+    """get_exercises-style builder output; indentation varies by call site"""
+    indent = " " * (4 + n % 3 * 4)
+    return f"""
+{indent}SELECT id, name, category, equipment, difficulty
+{indent}FROM exercises
+{indent}WHERE is_active = $1 AND category = $2
+{indent}ORDER BY name
+{indent}LIMIT $3 OFFSET $4
+"""
+
+
+async def run_mix(db: DatabaseManager, user_id: UUID, n: int) -> None:
+    await db.execute_query(USER_PROFILE_QUERY, user_id, fetch_one=True)
+    await db.execute_query(SUMMARY_QUERY, user_id, fetch_one=True)
+    await db.execute_query(EXERCISES_QUERY, user_id, fetch=True)
+    await db.execute_query(exercise_filter_query(n), True, CATEGORIES[n % len(CATEGORIES)], 50, 0, fetch=True)
+
+
+async def time_variant(dsn: str, user_id: UUID, runs: int, cached: bool) -> list:
+    db = DatabaseManager()
+    db.pool = await asyncpg.create_pool(
+        dsn, min_size=2, max_size=2,
+        statement_cache_size=256 if cached else 0,
+        connection_class=PreparedConnection,
+        init=db._prepare_registered if cached else None
+    )
+    try:
+        await run_mix(db, user_id, 0)
+        timings = []
+        for n in range(runs):
+            started = time.perf_counter()
+            await run_mix(db, user_id, n)
+            timings.append((time.perf_counter() - started) * 1000)
+        return sorted(timings)
+    finally:
+        await db.pool.close()
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dsn", required=True, help="Database to query")
+    parser.add_argument("--user-id", required=True, type=UUID, help="User for the profile/stats queries")
+    parser.add_argument("--runs", type=int, default=500, help="Timed request mixes per variant")
+    args = parser.parse_args()
+
+    print(f"📊 Prepared statements - {args.runs} mixes of 4 queries")
+    print("=" * 48)
+    print(f"{'variant':<20}{'median ms':>14}{'p95 ms':>14}")
+    medians = {}
+    for label, cached in (("no statement cache", False), ("registry + cache", True)):
+        timings = await time_variant(args.dsn, args.user_id, args.runs, cached)
+        medians[label] = statistics.median(timings)
+        print(f"{label:<20}{medians[label]:>14.3f}{timings[int(len(timings) * 0.95) - 1]:>14.3f}")
+
+    print("-" * 48)
+    print(f"statement cache: {statement_stats.as_dict()}")
+    speedup = medians["no statement cache"] / medians["registry + cache"]
+    print(f"{'✅' if speedup > 1 else '⚠️'} registry + cache: {speedup:.2f}x vs no cache")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Progression Engine Benchmark
+Times analyze_progression (GET /api/analytics/plateaus) on a synthetic set history
+
+The history mimics a long-term lifter: several years of sessions over 25
+exercises, 3-8 sets per exercise per session, with progressing, stalled and
+regressing exercises mixed in. The target is under 20 ms for 50k sets.
+
+Pass --dsn and --user-id to also time load_set_history against a real database.
+
+Run with: python benchmarks/bench_progression_engine.py --sets 50000
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from typing import Dict
+from uuid import UUID
+
+import asyncpg
+import numpy as np
+
+# Allow running from the backend directory without installing the package
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.core.database import DatabaseManager
+from app.services.progression import STATUS_LABELS, analyze_progression, load_set_history
+
+EXERCISES = 25
+TARGET_MS = 20.0
+
+
+def synthetic_history(total_sets: int, shuffled: bool = False, seed: int = 7) -> Dict[str, np.ndarray]:
+    """Column arrays shaped like load_set_history output, chronological or shuffled"""
+    rng = np.random.default_rng(seed)
+    sets_per_session = rng.integers(3, 9, size=total_sets)
+    session_lengths = sets_per_session[np.cumsum(sets_per_session) <= total_sets]
+    sessions = session_lengths.size
+
+    # Five exercises per workout, a workout every 1-3 days, so exercises interleave in time
+    exercise = rng.integers(0, EXERCISES, size=sessions)
+    workout_gaps = rng.integers(1, 4, size=sessions // 5 + 1).astype(np.float64)
+    day = (19000.0 + np.cumsum(workout_gaps))[np.arange(sessions) // 5] + rng.uniform(0.3, 0.4)
+    weekly_trend = rng.choice([0.02, 0.0, -0.015], size=EXERCISES)[exercise]
+    base = rng.uniform(60, 300, size=EXERCISES)[exercise]
+    session_weight = base * (1 + weekly_trend * (day - day.min()) / 7.0 / 10.0)
+
+    session_of_set = np.repeat(np.arange(sessions), session_lengths)
+    weight = np.round(session_weight[session_of_set] * rng.uniform(0.85, 1.0, size=session_of_set.size) * 4) / 4
+    reps = rng.integers(3, 13, size=session_of_set.size).astype(np.float64)
+
+    # Unshuffled is chronological, like a heap scan of an append-mostly table
+    shuffle = rng.permutation(session_of_set.size) if shuffled else np.arange(session_of_set.size)
+    return {
+        "exercise_idx": exercise[session_of_set][shuffle],
+        "session_day": day[session_of_set][shuffle],
+        "weight": np.maximum(weight, 2.5)[shuffle],
+        "reps": reps[shuffle]
+    }
+
+
+def time_engine(history: Dict[str, np.ndarray], formula: str, runs: int) -> list:
+    """Milliseconds per analyze_progression call"""
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        analyze_progression(
+            history["exercise_idx"], history["session_day"], history["weight"], history["reps"],
+            formula=formula
+        )
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+async def time_loader(dsn: str, user_id: UUID, runs: int) -> None:
+    """Time load_set_history plus the engine for a real user"""
+    db_manager = DatabaseManager()
+    db_manager.pool = await asyncpg.create_pool(dsn, min_size=1, max_size=2)
+    try:
+        load_ms, engine_ms = [], []
+        for _ in range(runs):
+            started = time.perf_counter()
+            history = await load_set_history(db_manager, user_id)
+            loaded = time.perf_counter()
+            analyze_progression(history["exercise_idx"], history["session_day"], history["weight"], history["reps"])
+            load_ms.append((loaded - started) * 1000)
+            engine_ms.append((time.perf_counter() - loaded) * 1000)
+        print(f"{'db load':<22}{history['weight'].size:>10}{statistics.median(load_ms):>12.2f}{max(load_ms):>12.2f}")
+        print(f"{'engine (db history)':<22}{history['weight'].size:>10}{statistics.median(engine_ms):>12.2f}{max(engine_ms):>12.2f}")
+    finally:
+        await db_manager.pool.close()
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sets", type=int, default=50000, help="Synthetic sets to analyze")
+    parser.add_argument("--runs", type=int, default=50, help="Timed runs per variant")
+    parser.add_argument("--dsn", default=None, help="Also time load_set_history against this database")
+    parser.add_argument("--user-id", type=UUID, default=None, help="User whose history is loaded with --dsn")
+    args = parser.parse_args()
+
+    history = synthetic_history(args.sets)
+    print(f"🏋️ Progression engine benchmark - {history['weight'].size} sets, {EXERCISES} exercises")
+    print("=" * 68)
+    print(f"{'variant':<22}{'sets':>10}{'median ms':>12}{'max ms':>12}")
+
+    time_engine(history, "epley", 3)  # warm up numpy
+    for formula in ("epley", "brzycki"):
+        timings = time_engine(history, formula, args.runs)
+        print(f"{'engine ' + formula:<22}{history['weight'].size:>10}{statistics.median(timings):>12.2f}{max(timings):>12.2f}")
+    median = statistics.median(time_engine(history, "epley", args.runs))
+
+    # Unordered input (what load_set_history returns) pays for one argsort
+    timings = time_engine(synthetic_history(args.sets, shuffled=True), "epley", args.runs)
+    print(f"{'engine unordered':<22}{history['weight'].size:>10}{statistics.median(timings):>12.2f}{max(timings):>12.2f}")
+
+    if args.dsn and args.user_id:
+        await time_loader(args.dsn, args.user_id, min(args.runs, 10))
+
+    analysis = analyze_progression(history["exercise_idx"], history["session_day"], history["weight"], history["reps"])
+    counts = {label: int((analysis.current_status == code).sum()) for code, label in enumerate(STATUS_LABELS)}
+    print("-" * 68)
+    print(f"📈 Exercise status: {counts}")
+    verdict = "✅" if median < TARGET_MS else "❌"
+    print(f"{verdict} median {median:.2f} ms vs {TARGET_MS:.0f} ms target")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Rate Limiter Overhead Benchmark
+Per-request cost of the RateLimiter dependency, old vs new
+
+Variants:
+  legacy   - new Redis pool per request, INCR then EXPIRE, pool closed
+  script   - one EVALSHA of the token-bucket script on the shared pool
+  local    - in-process token bucket used when Redis is unavailable
+
+Without --redis-url only the in-process bucket is measured.
+
+Run with: python benchmarks/bench_rate_limiter.py [--redis-url redis://localhost:6379/0] [--requests 5000]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from typing import Awaitable, Callable, List
+
+import redis.asyncio as aioredis
+
+# Allow running from the backend directory without installing the package
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.core.rate_limit import TokenBucketLimiter
+
+LIMIT = 1_000_000  # never reject, so every variant does the same work per call
+
+
+async def legacy_check(redis_url: str, key: str) -> None:
+    """The previous get_redis_client + RateLimiter path"""
+    client = await aioredis.from_url(redis_url, decode_responses=True)
+    try:
+        current = await client.incr(key)
+        if current == 1:
+            await client.expire(key, 60)
+    finally:
+        await client.close()
+
+
+async def time_calls(call: Callable[[int], Awaitable[None]], requests: int) -> List[float]:
+    """Microseconds per call"""
+    for n in range(min(100, requests)):  # warm up connections and script cache
+        await call(n)
+    timings = []
+    for n in range(requests):
+        started = time.perf_counter()
+        await call(n)
+        timings.append((time.perf_counter() - started) * 1_000_000)
+    return sorted(timings)
+
+
+def report(label: str, timings: List[float]) -> float:
+    median = statistics.median(timings)
+    p99 = timings[int(len(timings) * 0.99) - 1]
+    print(f"{label:<12}{median:>14.1f}{p99:>14.1f}")
+    return median
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--redis-url", default=None, help="Redis to benchmark against")
+    parser.add_argument("--requests", type=int, default=5000, help="Timed calls per variant")
+    args = parser.parse_args()
+
+    limiter = TokenBucketLimiter()
+    print(f"📊 RateLimiter overhead - {args.requests} calls per variant")
+    print("=" * 40)
+    print(f"{'variant':<12}{'median µs':>14}{'p99 µs':>14}")
+
+    medians = {}
+    medians["local"] = report("local", await time_calls(
+        lambda n: limiter.hit(f"bench:local:{n % 1000}", LIMIT), args.requests
+    ))
+
+    if args.redis_url:
+        client = aioredis.Redis.from_url(args.redis_url, decode_responses=True)
+        try:
+            await client.ping()
+            medians["script"] = report("script", await time_calls(
+                lambda n: limiter.hit(f"bench:script:{n % 1000}", LIMIT, redis=client), args.requests
+            ))
+            medians["legacy"] = report("legacy", await time_calls(
+                lambda n: legacy_check(args.redis_url, f"bench:legacy:{n % 1000}"), args.requests
+            ))
+        finally:
+            await client.aclose()
+
+    print("-" * 40)
+    if "legacy" in medians:
+        print(f"✅ script: {medians['legacy'] / medians['script']:.1f}x faster than legacy per request")
+    else:
+        print("⚠️ pass --redis-url to measure the Redis variants")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
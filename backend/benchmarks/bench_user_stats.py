@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+User Stats Fan-out Benchmark
+Wall-clock time of GET /api/users/me/stats with sequential vs concurrent reads
+
+Calls get_current_user_stats directly against a real database. The
+sequential variant gives fan_out a budget of one connection, which is the
+old one-query-after-another behaviour on the same code path.
+
+Against a local database the queries are CPU bound, so overlap only helps
+with spare cores. --rtt-ms adds a simulated network round trip per query
+to model a remote (e.g. Supabase) database, where the sequential version
+pays every round trip in turn.
+
+Run with: python benchmarks/bench_user_stats.py --dsn postgresql://... --user-id <uuid>
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from types import SimpleNamespace
+from uuid import UUID
+
+import asyncpg
+
+# Allow running from the backend directory without installing the package
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.api.users import get_current_user_stats
+from app.core.database import DatabaseManager
+
+
+class BudgetedDatabaseManager(DatabaseManager):
+    """DatabaseManager whose fan_out always uses a fixed connection budget"""
+
+    def __init__(self, budget: int, rtt_seconds: float = 0.0):
+        super().__init__()
+        self.budget = budget
+        self.rtt_seconds = rtt_seconds
+
+    async def fan_out(self, queries, max_connections=None):
+        return await super().fan_out(queries, self.budget)
+
+    async def execute_query(self, query, *args, **kwargs):
+        if self.rtt_seconds:
+            await asyncio.sleep(self.rtt_seconds)
+        return await super().execute_query(query, *args, **kwargs)
+
+
+async def time_stats(db: DatabaseManager, user_id: UUID, runs: int) -> list:
+    """Milliseconds per stats call"""
+    user = SimpleNamespace(id=user_id)
+    await get_current_user_stats(current_user=user, db=db)  # warm up plans and connections
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        await get_current_user_stats(current_user=user, db=db)
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dsn", required=True, help="Database to query")
+    parser.add_argument("--user-id", required=True, type=UUID, help="User whose stats are computed")
+    parser.add_argument("--runs", type=int, default=20, help="Timed runs per variant")
+    parser.add_argument("--rtt-ms", type=float, default=0.0, help="Simulated network round trip per query")
+    args = parser.parse_args()
+
+    pool = await asyncpg.create_pool(args.dsn, min_size=5, max_size=5)
+    print(f"📊 /users/me/stats benchmark - user {args.user_id}, {args.rtt_ms:g} ms simulated RTT, {os.cpu_count()} CPUs")
+    print("=" * 56)
+    print(f"{'variant':<22}{'median ms':>12}{'p95 ms':>12}")
+    try:
+        medians = {}
+        for label, budget in (("sequential (1 conn)", 1), ("fan-out (2 conns)", 2), ("fan-out (5 conns)", 5)):
+            db = BudgetedDatabaseManager(budget, args.rtt_ms / 1000)
+            db.pool = pool
+            timings = sorted(await time_stats(db, args.user_id, args.runs))
+            medians[label] = statistics.median(timings)
+            print(f"{label:<22}{medians[label]:>12.2f}{timings[int(len(timings) * 0.95) - 1]:>12.2f}")
+    finally:
+        await pool.close()
+
+    speedup = medians["sequential (1 conn)"] / medians["fan-out (5 conns)"]
+    print("-" * 56)
+    print(f"{'✅' if speedup > 1 else '⚠️'} fan-out: {speedup:.2f}x vs sequential")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
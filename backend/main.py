@@ -5,8 +5,6 @@ Production-ready FastAPI server with CORS, middleware, and error handling
 Run with: uvicorn main:app --reload
 """
 
-import os
-import sys
 import logging
 from contextlib import asynccontextmanager
 from typing import Dict, Any
@@ -19,28 +17,27 @@ from fastapi.exceptions import RequestValidationError
 from fastapi.openapi.utils import get_openapi
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
-# Add the schemas directory to the Python path for imports
-sys.path.append(os.path.join(os.path.dirname(__file__), "..", "schemas"))
-
 from app.core.config import get_settings
 from app.core.logging import setup_logging
 from app.core.error_handlers import setup_exception_handlers
 from app.middleware.request_logging import RequestLoggingMiddleware
+from app.middleware.compression import CompressionMiddleware
 from app.middleware.error_handling import ErrorHandlingMiddleware
-from app.api.health import router as health_router
-from app.api.auth import router as auth_router
-from app.api.users import router as users_router
-from app.api.exercises import router as exercises_router
-from app.api.workouts import router as workouts_router
-from app.api.workout_sets import router as workout_sets_router
-from app.api.analytics import router as analytics_router
+from app.core.openapi import serve_openapi
+from app.core.routing import include_lazy_router, load_routers
 
 
 # Initialize settings
 settings = get_settings()
 
 # Set up logging
-setup_logging(settings.LOG_LEVEL)
+setup_logging(
+    settings.LOG_LEVEL,
+    queued=settings.LOG_QUEUE_ENABLED,
+    sample_rate=settings.LOG_SAMPLE_RATE,
+    max_per_second=settings.LOG_SAMPLE_MAX_PER_SECOND,
+    logger_rates=settings.LOG_SAMPLE_LOGGERS
+)
 logger = logging.getLogger(__name__)
 
 
@@ -52,6 +49,8 @@ async def lifespan(app: FastAPI):
     """
     # Startup
     logger.info("🚀 FitForge Backend starting up...")
+    if settings.PRELOAD_ROUTERS:
+        load_routers(app)
     logger.info(f"Environment: {settings.ENVIRONMENT}")
     logger.info(f"Debug mode: {settings.DEBUG}")
     logger.info(f"Database URL: {settings.DATABASE_URL[:50]}...")  # Truncate for security
@@ -61,10 +60,35 @@ async def lifespan(app: FastAPI):
     await db_manager.initialize()
     logger.info("✅ Database connections initialized")
     
+    # Shared Redis pool (rate limiting, caching); optional
+    from app.core.redis_client import redis_manager
+    await redis_manager.initialize()
+    
+    # Start background job workers (post-completion work, user stats reconciliation)
+    from app.core.jobs import job_queue
+    from app.services.user_stats import register_user_stats_jobs
+    from app.services.workout_jobs import register_workout_jobs
+    register_workout_jobs(job_queue)
+    register_user_stats_jobs(job_queue)
+    if settings.jobs.ENABLED:
+        await job_queue.start()
+    
+    # Start batched users.last_active_at writes
+    from app.core.activity import last_active
+    await last_active.start()
+    
+    # Sample event loop lag for /api/health/metrics
+    from app.core.monitoring import loop_lag_monitor
+    await loop_lag_monitor.start()
+    
     yield
     
     # Shutdown
     logger.info("🛑 FitForge Backend shutting down...")
+    await job_queue.stop()
+    await loop_lag_monitor.stop()
+    await last_active.stop()
+    await redis_manager.close()
     # Clean up database connections
     await db_manager.close()
     logger.info("🔌 Database connections closed")
@@ -112,6 +136,10 @@ tags_metadata = [
         "name": "muscle-states",
         "description": "Real-time muscle fatigue tracking. Monitor recovery status and fatigue levels using our **5-day recovery model**.",
     },
+    {
+        "name": "sync",
+        "description": "Offline sync. Replay queued workout, set and completion writes in one **idempotent** batch.",
+    },
     {
         "name": "system",
         "description": "System endpoints for API information, health checks, and operational status.",
@@ -196,6 +224,9 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+# Response compression (innermost, so the logged timing includes it)
+app.add_middleware(CompressionMiddleware)
+
 # Trust host middleware (security)
 app.add_middleware(
     TrustedHostMiddleware,
@@ -269,19 +300,19 @@ async def root():
     }
 
 
-# Include routers
-app.include_router(health_router, prefix="/api/health", tags=["health"])
-app.include_router(auth_router, prefix="/api/auth", tags=["authentication"])
-app.include_router(users_router, prefix="/api/users", tags=["users"])
-app.include_router(exercises_router, prefix="/api/exercises", tags=["exercises"])
-app.include_router(workouts_router, prefix="/api/workouts", tags=["workouts"])
-app.include_router(workout_sets_router, prefix="/api/workout-sets", tags=["workout-sets"])
-app.include_router(analytics_router, prefix="/api/analytics", tags=["analytics"])
+# Include routers (imported on startup or first request, see app.core.routing)
+include_lazy_router(app, "app.api.health", prefix="/api/health", tags=["health"])
+include_lazy_router(app, "app.api.auth", prefix="/api/auth", tags=["authentication"])
+include_lazy_router(app, "app.api.users", prefix="/api/users", tags=["users"])
+include_lazy_router(app, "app.api.exercises", prefix="/api/exercises", tags=["exercises"])
+include_lazy_router(app, "app.api.workouts", prefix="/api/workouts", tags=["workouts"])
+include_lazy_router(app, "app.api.workout_sets", prefix="/api/workout-sets", tags=["workout-sets"])
+include_lazy_router(app, "app.api.analytics", prefix="/api/analytics", tags=["analytics"])
+include_lazy_router(app, "app.api.sync", prefix="/api/sync", tags=["sync"])
 
 # Include test error endpoints in debug mode
 if settings.DEBUG:
-    from app.api.test_errors import router as test_errors_router
-    app.include_router(test_errors_router, prefix="/api/test-errors", tags=["test-errors"])
+    include_lazy_router(app, "app.api.test_errors", prefix="/api/test-errors", tags=["test-errors"])
 
 
 # Custom OpenAPI schema
@@ -289,6 +320,7 @@ def custom_openapi():
     """Generate custom OpenAPI schema with enhancements"""
     if app.openapi_schema:
         return app.openapi_schema
+    load_routers(app)
         
     openapi_schema = get_openapi(
         title=app.title,
@@ -345,6 +377,9 @@ def custom_openapi():
 # Override the default OpenAPI function
 app.openapi = custom_openapi
 
+# Serve the build-time document (scripts/generate_openapi.py) as pre-encoded bytes
+serve_openapi(app, custom_openapi)
+
 
 if __name__ == "__main__":
     import uvicorn
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+FitForge Set Metrics Backfill CLI
+Recompute estimated_one_rep_max and improvement_vs_last for existing sets
+
+Runs in short batched transactions and can be left running against a live
+database. Omit --user-id to backfill every user.
+
+Run with: python scripts/backfill_set_metrics.py [--user-id <uuid>] [--since 2024-01-01] [--until 2025-01-01]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+from datetime import datetime, timezone
+from uuid import UUID
+
+# Allow running from the backend directory without installing the package
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.core.database import db_manager
+from app.services.set_metrics import BACKFILL_BATCH_SETS, BackfillProgress, SetMetricsBackfill
+
+
+def parse_date(value: str) -> datetime:
+    """ISO date or datetime; naive values are taken as UTC"""
+    parsed = datetime.fromisoformat(value)
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+async def print_progress(progress: BackfillProgress) -> None:
+    print(f"  {progress.percent_complete:5.1f}%  {progress.exercise_histories_done}/{progress.exercise_histories} "
+          f"histories, {progress.sets_updated} of {progress.sets_scanned} sets updated "
+          f"({progress.sets_skipped_locked} locked) in {progress.elapsed_seconds:.1f}s")
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--user-id", type=UUID, default=None, help="Only this user's sets")
+    parser.add_argument("--since", type=parse_date, default=None, help="Only sets created at or after this date")
+    parser.add_argument("--until", type=parse_date, default=None, help="Only sets created before this date")
+    parser.add_argument("--batch-sets", type=int, default=BACKFILL_BATCH_SETS, help="Sets per transaction")
+    parser.add_argument("--pause", type=float, default=0.0, help="Seconds to sleep between batches")
+    args = parser.parse_args()
+
+    await db_manager.initialize()
+    try:
+        print(f"🔧 Backfilling set metrics for {args.user_id or 'all users'}...")
+        progress = await SetMetricsBackfill(db_manager, args.batch_sets, args.pause).run(
+            args.user_id, args.since, args.until, on_progress=print_progress
+        )
+    finally:
+        await db_manager.close()
+
+    print(json.dumps(progress.model_dump(), indent=2))
+    print(f"✅ {progress.sets_updated} sets updated")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
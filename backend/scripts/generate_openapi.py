@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+FitForge OpenAPI Generator
+Write the OpenAPI document served by the API to openapi.json
+
+Run during the image build so workers never build the schema themselves.
+The document is generated with DEBUG off, matching production routes.
+--check exits non-zero when the existing file differs from the live routes.
+
+Run with: python scripts/generate_openapi.py [--check] [--output openapi.json]
+"""
+
+import argparse
+import json
+import os
+import sys
+from pathlib import Path
+
+# Allow running from the backend directory without installing the package
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+# Debug-only routers must not end up in the artifact
+os.environ["DEBUG"] = "false"
+
+from app.core.openapi import ARTIFACT_PATH, encode_schema
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--output", type=Path, default=ARTIFACT_PATH, help="Artifact path")
+    parser.add_argument("--check", action="store_true", help="Verify the artifact instead of writing it")
+    args = parser.parse_args()
+
+    from main import app
+    body = encode_schema(app.openapi())
+
+    if args.check:
+        try:
+            current = json.loads(args.output.read_bytes())
+        except FileNotFoundError:
+            print(f"🚨 {args.output} does not exist; run python scripts/generate_openapi.py")
+            return 1
+        if current != json.loads(body):
+            print(f"🚨 {args.output} is out of date with the route table; run python scripts/generate_openapi.py")
+            return 1
+        print(f"✅ {args.output} matches the route table")
+        return 0
+
+    args.output.write_bytes(body)
+    print(f"✅ Wrote {args.output} ({len(body)} bytes, {len(app.openapi()['paths'])} paths)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+FitForge Workout Import CLI
+Bulk import a CSV, JSON or NDJSON workout log for one user
+
+Same pipeline as POST /api/users/me/import, reading straight from disk.
+
+Run with: python scripts/import_workouts.py history.csv --user-id <uuid> [--weight-unit kg]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+from uuid import UUID
+
+# Allow running from the backend directory without installing the package
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.core.database import db_manager
+from app.services.workout_import import (
+    ImportFormatError,
+    WorkoutImportService,
+    iter_csv_records,
+    iter_json_records
+)
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("path", help="Export file to import")
+    parser.add_argument("--user-id", required=True, type=UUID, help="User to import into")
+    parser.add_argument("--format", choices=["csv", "json"], help="Input format (inferred from the extension if omitted)")
+    parser.add_argument("--weight-unit", choices=["lbs", "kg"], default="lbs", help="Unit of a plain 'weight' column")
+    args = parser.parse_args()
+
+    import_format = args.format or ("csv" if args.path.lower().endswith(".csv") else "json")
+
+    await db_manager.initialize()
+    try:
+        with open(args.path, encoding="utf-8-sig", newline="") as stream:
+            records = iter_csv_records(stream) if import_format == "csv" else iter_json_records(stream)
+            print(f"📥 Importing {args.path} ({import_format}) for user {args.user_id}...")
+            summary = await WorkoutImportService(db_manager).import_records(args.user_id, records, args.weight_unit)
+    except ImportFormatError as e:
+        print(f"❌ Could not parse {args.path}: {e}")
+        return 1
+    finally:
+        await db_manager.close()
+
+    print(json.dumps(summary.model_dump(), indent=2))
+    print(f"✅ {summary.sets_imported} sets in {summary.workouts_created} new workouts "
+          f"({summary.rows_rejected} rows rejected)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
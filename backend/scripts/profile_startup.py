@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+FitForge Startup Profile
+Per-module import cost of a cold `import main`, from python -X importtime
+
+Each run starts a fresh interpreter, so nothing is cached in sys.modules.
+Bytecode caches are used as usual; run twice after a code change to leave
+compilation out of the numbers.
+
+Run with: python scripts/profile_startup.py [--module main] [--top 25] [--sort self|cumulative]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from typing import Dict, List, NamedTuple, Tuple
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+
+class ImportCost(NamedTuple):
+    module: str
+    self_us: int
+    cumulative_us: int
+
+
+def profile_import(module: str) -> Tuple[float, List[ImportCost]]:
+    """Wall-clock seconds of a fresh interpreter importing module, and every import it made"""
+    started = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=BACKEND_DIR, capture_output=True, text=True
+    )
+    wall = time.perf_counter() - started
+    if result.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{result.stderr[-2000:]}")
+
+    costs = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        costs.append(ImportCost(name.strip(), int(self_us), int(cumulative_us)))
+    return wall, costs
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--module", default="main", help="Module to import")
+    parser.add_argument("--top", type=int, default=25, help="Modules to list")
+    parser.add_argument("--sort", choices=("self", "cumulative"), default="cumulative", help="Ranking of the module list")
+    args = parser.parse_args()
+
+    wall, costs = profile_import(args.module)
+    key = (lambda cost: cost.self_us) if args.sort == "self" else (lambda cost: cost.cumulative_us)
+
+    print(f"📊 Cold import of {args.module}: {wall * 1000:.0f} ms wall, {len(costs)} modules")
+    print("=" * 72)
+    print(f"{'self ms':>9}{'cumul. ms':>11}  module")
+    for cost in sorted(costs, key=key, reverse=True)[:args.top]:
+        print(f"{cost.self_us / 1000:>9.1f}{cost.cumulative_us / 1000:>11.1f}  {cost.module}")
+
+    # Self time summed per top-level package: which dependency the time goes to
+    packages: Dict[str, int] = defaultdict(int)
+    for cost in costs:
+        packages[cost.module.split(".")[0]] += cost.self_us
+    print("-" * 72)
+    print(f"{'self ms':>9}  package")
+    for package, self_us in sorted(packages.items(), key=lambda item: item[1], reverse=True)[:args.top]:
+        print(f"{self_us / 1000:>9.1f}  {package}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
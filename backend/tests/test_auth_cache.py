@@ -0,0 +1,161 @@
+"""
+FitForge Auth Cache Tests
+Token payload and user profile caching in the auth dependencies
+"""
+
+import os
+import sys
+import time
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+from jose import jwt
+
+# Add project root to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from backend.app.core.cache import AuthCache, ExpiringSet, TTLCache, auth_cache
+from backend.app.core.config import get_settings
+from backend.app.core.dependencies import get_current_user
+
+USER_ID = "11111111-1111-1111-1111-111111111111"
+USER_ROW = {
+    "id": USER_ID, "email": "lifter@example.com", "display_name": "Lifter",
+    "height_inches": None, "weight_lbs": None, "age": None, "sex": None,
+    "experience_level": "Beginner", "primary_goals": [], "available_equipment": [],
+    "workout_count": 0, "feature_level": 1,
+    "created_at": datetime(2025, 1, 1, tzinfo=timezone.utc),
+    "updated_at": datetime(2025, 1, 1, tzinfo=timezone.utc),
+    "last_active_at": datetime(2025, 1, 1, tzinfo=timezone.utc)
+}
+
+
+def make_token(seconds: int = 600) -> HTTPAuthorizationCredentials:
+    token = jwt.encode({"sub": USER_ID, "exp": int(time.time()) + seconds}, get_settings().SECRET_KEY, algorithm="HS256")
+    return HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+
+@pytest.fixture(autouse=True)
+def clear_auth_cache():
+    auth_cache.clear()
+    yield
+    auth_cache.clear()
+
+
+class TestTTLCache:
+    """
+    Bounded LRU with per-entry expiry
+    """
+
+    def test_evicts_least_recently_used(self):
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1 and cache.get("c") == 3
+
+    def test_entries_expire(self):
+        cache = TTLCache(maxsize=2, ttl=60)
+        with patch("backend.app.core.cache.time.monotonic", return_value=1000.0):
+            cache.set("a", 1, ttl=5)
+        with patch("backend.app.core.cache.time.monotonic", return_value=1004.0):
+            assert cache.get("a") == 1
+        with patch("backend.app.core.cache.time.monotonic", return_value=1006.0):
+            assert cache.get("a") is None
+        assert len(cache) == 0
+
+
+class TestRevocations:
+    """
+    Revoked tokens stay revoked until they expire, however many there are
+    """
+
+    def test_revocations_are_not_evicted_by_max_entries(self):
+        cache = AuthCache(max_entries=2, token_ttl=60, profile_ttl=60)
+        tokens = [f"token-{n}" for n in range(10)]
+        for token in tokens:
+            cache.set_payload(token, {"sub": USER_ID, "exp": time.time() + 600})
+            cache.revoke_token(token)
+
+        assert all(cache.is_revoked(token) for token in tokens)
+        assert len(cache.tokens) == 0
+
+    def test_expired_revocations_are_swept(self):
+        revoked = ExpiringSet()
+        with patch("backend.app.core.cache.time.monotonic", return_value=1000.0):
+            revoked.add("a", 5)
+            revoked.add("b", 60)
+            revoked.add("b", 1)
+        with patch("backend.app.core.cache.time.monotonic", return_value=1006.0):
+            assert "a" not in revoked and "b" in revoked
+            revoked.add("c", 5)
+        assert len(revoked) == 2
+        with patch("backend.app.core.cache.time.monotonic", return_value=1070.0):
+            revoked.add("d", 5)
+        assert len(revoked) == 1
+
+
+class TestCachedCurrentUser:
+    """
+    get_current_user skips decode and query on repeat calls
+    """
+
+    @pytest.mark.asyncio
+    async def test_repeat_requests_hit_cache(self):
+        """Only the first call with a token reads the users row"""
+        db = AsyncMock()
+        db.execute_query.return_value = dict(USER_ROW)
+        credentials = make_token()
+
+        for _ in range(3):
+            user = await get_current_user(credentials, get_settings(), db)
+
+        assert str(user.id) == USER_ID
+        assert db.execute_query.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_invalidate_user_refetches_profile(self):
+        """A profile write drops the cached row"""
+        db = AsyncMock()
+        db.execute_query.return_value = dict(USER_ROW)
+        credentials = make_token()
+
+        await get_current_user(credentials, get_settings(), db)
+        db.execute_query.return_value = {**USER_ROW, "display_name": "Renamed"}
+        auth_cache.invalidate_user(USER_ID)
+        user = await get_current_user(credentials, get_settings(), db)
+
+        assert user.display_name == "Renamed"
+        assert db.execute_query.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_revoked_token_rejected(self):
+        """After logout the token is refused even though it has not expired"""
+        db = AsyncMock()
+        db.execute_query.return_value = dict(USER_ROW)
+        credentials = make_token()
+
+        await get_current_user(credentials, get_settings(), db)
+        auth_cache.revoke_token(credentials.credentials, USER_ID)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await get_current_user(credentials, get_settings(), db)
+        assert exc_info.value.status_code == 401
+        assert auth_cache.get_profile(USER_ID) is None
+
+    @pytest.mark.asyncio
+    async def test_expired_token_not_cached(self):
+        """An expired token is rejected and never enters the cache"""
+        db = AsyncMock()
+        db.execute_query.return_value = dict(USER_ROW)
+        credentials = make_token(seconds=-5)
+
+        with pytest.raises(HTTPException):
+            await get_current_user(credentials, get_settings(), db)
+        assert auth_cache.get_payload(credentials.credentials) is None
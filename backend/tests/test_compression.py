@@ -0,0 +1,142 @@
+"""
+FitForge Response Compression Tests
+Negotiation, size threshold, streaming without buffering, opt-out and body reuse
+"""
+
+import asyncio
+import gzip
+import os
+import sys
+import zlib
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+
+# Add project root to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from backend.app.middleware import compression
+from backend.app.middleware.compression import CompressionMiddleware, negotiate, no_compression
+
+PAYLOAD = {"Push": [{"muscle_name": f"muscle_{n}", "fatigue_percentage": 42.5, "color": "#FFFF00"} for n in range(100)]}
+
+
+def make_app(events=None) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=500)
+
+    @app.get("/heatmap")
+    async def heatmap():
+        return PAYLOAD
+
+    @app.get("/small")
+    async def small():
+        return {"ok": True}
+
+    @app.get("/export")
+    async def export():
+        async def rows():
+            for n in range(3):
+                events.append(f"chunk {n}")
+                yield f'{{"row": {n}}}\n'.encode() * 50
+        return StreamingResponse(rows(), media_type="application/x-ndjson")
+
+    @app.get("/raw")
+    @no_compression
+    async def raw():
+        return PAYLOAD
+
+    return app
+
+
+async def call(app: FastAPI, path: str, accept_encoding: str = "gzip", events=None):
+    """Start message and body messages of one GET, sent straight through the ASGI interface"""
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET", "scheme": "http",
+        "path": path, "raw_path": path.encode(), "query_string": b"", "root_path": "",
+        "headers": [(b"host", b"test"), (b"accept-encoding", accept_encoding.encode())],
+        "client": ("127.0.0.1", 5000), "server": ("test", 80)
+    }
+    messages = []
+    requested = False
+
+    async def receive():
+        # The request once, then wait for a disconnect that never comes
+        nonlocal requested
+        if requested:
+            await asyncio.Event().wait()
+        requested = True
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+        if events is not None and message["type"] == "http.response.body":
+            events.append("sent")
+
+    await app(scope, receive, send)
+    headers = {name.decode(): value.decode() for name, value in messages[0]["headers"]}
+    return headers, [message for message in messages[1:] if message["type"] == "http.response.body"]
+
+
+class TestNegotiation:
+    """
+    q-values decide; unsupported or refused codings fall back to identity
+    """
+
+    def test_negotiate(self):
+        assert negotiate("gzip, deflate") == "gzip"
+        assert negotiate("gzip;q=0, deflate") is None
+        assert negotiate("identity") is None
+        assert negotiate("*") in ("br", "gzip")
+        assert negotiate("br, gzip;q=0.5", ("gzip",)) == "gzip"
+        assert negotiate("br, gzip;q=0", ("gzip",)) is None
+
+
+class TestCompressionMiddleware:
+    """
+    Large JSON is compressed, small bodies and opted-out routes are not
+    """
+
+    @pytest.mark.asyncio
+    async def test_large_json_is_gzipped_and_reused(self):
+        app = make_app()
+        # The middleware's cache (app.core.cache, not backend.app.core.cache)
+        compressed_bodies = compression.compressed_bodies
+        compressed_bodies.clear()
+        hits = compressed_bodies.hits
+
+        headers, bodies = await call(app, "/heatmap")
+        assert headers["content-encoding"] == "gzip"
+        assert "accept-encoding" in headers["vary"].lower()
+        assert int(headers["content-length"]) == len(bodies[0]["body"])
+        assert gzip.decompress(bodies[0]["body"]).startswith(b'{"Push":')
+
+        # Identical body: compressed bytes come from the cache
+        _, again = await call(app, "/heatmap")
+        assert again[0]["body"] == bodies[0]["body"]
+        assert compressed_bodies.hits == hits + 1
+
+    @pytest.mark.asyncio
+    async def test_small_opted_out_and_unaccepted_responses_untouched(self):
+        app = make_app()
+        for path, accept_encoding in (("/small", "gzip"), ("/raw", "gzip"), ("/heatmap", "identity")):
+            headers, bodies = await call(app, path, accept_encoding)
+            assert "content-encoding" not in headers, path
+            assert bodies[0]["body"].startswith(b"{"), path
+
+    @pytest.mark.asyncio
+    async def test_streaming_body_compressed_per_chunk(self):
+        events = []
+        headers, bodies = await call(make_app(events), "/export", events=events)
+
+        assert headers["content-encoding"] == "gzip"
+        assert "content-length" not in headers
+        # One compressed message per chunk, each decodable on arrival
+        decoder = zlib.decompressobj(31)
+        decoded = [decoder.decompress(message["body"]) for message in bodies]
+        assert decoded[0] == b'{"row": 0}\n' * 50
+        assert b"".join(decoded) == b"".join(f'{{"row": {n}}}\n'.encode() * 50 for n in range(3))
+        assert bodies[-1]["more_body"] is False
+        # Each chunk is sent before the next one is produced
+        assert events[:4] == ["chunk 0", "sent", "chunk 1", "sent"]
@@ -0,0 +1,160 @@
+"""
+FitForge History Export Tests
+CSV / NDJSON framing of streamed chunks and server-side cursor chunking
+"""
+
+import csv
+import gzip
+import io
+import json
+import os
+import sys
+from datetime import datetime, timezone
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+from uuid import UUID
+
+import pytest
+
+# Add project root to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from backend.app.api.users import EXPORT_COLUMNS, _encode_csv, _encode_ndjson, _gzip_stream
+from backend.app.core.database import DatabaseManager
+
+WORKOUT_ID = UUID("550e8400-e29b-41d4-a716-446655440000")
+STARTED_AT = datetime(2024, 12, 21, 18, 30, tzinfo=timezone.utc)
+
+
+def export_row(set_number: int, **overrides):
+    row = dict.fromkeys(EXPORT_COLUMNS)
+    row.update(
+        workout_id=WORKOUT_ID, workout_name="Push, heavy", started_at=STARTED_AT,
+        set_id=UUID(int=set_number), exercise_id="bench_press", set_number=set_number,
+        reps=8, weight_lbs=Decimal("135.25"), volume_lbs=Decimal("1082.00"), is_personal_best=False
+    )
+    row.update(overrides)
+    return row
+
+
+async def chunked(*chunks):
+    for rows in chunks:
+        yield rows
+
+
+async def collect(body):
+    return [piece async for piece in body]
+
+
+class TestExportEncoders:
+    """
+    One write per database chunk, with DB types encoded as plain scalars
+    """
+
+    @pytest.mark.asyncio
+    async def test_ndjson_writes_one_line_per_row_and_one_piece_per_chunk(self):
+        pieces = await collect(_encode_ndjson(chunked(
+            [export_row(1), export_row(2)], [export_row(3, ended_at=None)]
+        )))
+
+        assert len(pieces) == 2
+        lines = b"".join(pieces).decode().splitlines()
+        assert len(lines) == 3
+        first = json.loads(lines[0])
+        assert list(first) == EXPORT_COLUMNS
+        assert first["workout_id"] == str(WORKOUT_ID)
+        assert first["started_at"] == "2024-12-21T18:30:00+00:00"
+        assert first["weight_lbs"] == "135.25"
+        assert first["reps"] == 8
+        assert json.loads(lines[2])["ended_at"] is None
+
+    @pytest.mark.asyncio
+    async def test_csv_writes_the_header_once_and_quotes_values(self):
+        pieces = await collect(_encode_csv(chunked([export_row(1)], [export_row(2), export_row(3)])))
+
+        assert len(pieces) == 2
+        assert pieces[0].startswith(",".join(EXPORT_COLUMNS).encode())
+        rows = list(csv.DictReader(io.StringIO(b"".join(pieces).decode())))
+        assert [row["set_number"] for row in rows] == ["1", "2", "3"]
+        assert rows[0]["workout_name"] == "Push, heavy"
+        assert rows[0]["volume_lbs"] == "1082.00"
+        assert rows[0]["ended_at"] == ""
+
+    @pytest.mark.asyncio
+    async def test_empty_history_is_a_header_only_csv(self):
+        pieces = await collect(_encode_csv(chunked()))
+        assert b"".join(pieces).decode().splitlines() == [",".join(EXPORT_COLUMNS)]
+
+    @pytest.mark.asyncio
+    async def test_gzip_stream_round_trips(self):
+        rows = [export_row(n) for n in range(1, 200)]
+        plain = b"".join(await collect(_encode_ndjson(chunked(rows))))
+        compressed = b"".join(await collect(_gzip_stream(_encode_ndjson(chunked(rows)))))
+        assert gzip.decompress(compressed) == plain
+
+
+class FakeCursor:
+    def __init__(self, rows):
+        self.rows = rows
+        self.fetch_sizes = []
+
+    async def fetch(self, size):
+        self.fetch_sizes.append(size)
+        batch, self.rows = self.rows[:size], self.rows[size:]
+        return batch
+
+
+def cursor_db(rows):
+    """DatabaseManager over a fake pool whose connection serves rows from one cursor"""
+    cursor = FakeCursor(rows)
+    tx_context = MagicMock()
+    tx_context.__aenter__ = AsyncMock()
+    tx_context.__aexit__ = AsyncMock(return_value=False)
+    conn = MagicMock()
+    conn.transaction.return_value = tx_context
+    conn.cursor = AsyncMock(return_value=cursor)
+    pool = MagicMock()
+    pool.acquire = AsyncMock(return_value=conn)
+    pool.release = AsyncMock()
+    db = DatabaseManager()
+    db.pool = pool
+    return db, pool, conn, cursor
+
+
+class TestStreamQuery:
+    """
+    stream_query reads fixed-size chunks in one read-only snapshot
+    """
+
+    @pytest.mark.asyncio
+    async def test_chunks_stop_at_the_first_short_fetch(self):
+        db, pool, conn, cursor = cursor_db([{"id": n} for n in range(5)])
+
+        chunks = [chunk async for chunk in db.stream_query("SELECT id FROM workout_sets WHERE user_id = $1", 7, chunk_size=2)]
+
+        assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+        assert chunks[2] == [{"id": 4}]
+        assert cursor.fetch_sizes == [2, 2, 2]
+        conn.cursor.assert_awaited_once_with("SELECT id FROM workout_sets WHERE user_id = $1", 7)
+        conn.transaction.assert_called_once_with(isolation="repeatable_read", readonly=True)
+        pool.release.assert_awaited_once_with(conn)
+
+    @pytest.mark.asyncio
+    async def test_exact_multiple_ends_on_an_empty_fetch(self):
+        db, pool, conn, cursor = cursor_db([{"id": n} for n in range(4)])
+
+        chunks = [chunk async for chunk in db.stream_query("SELECT id FROM workout_sets", chunk_size=2)]
+
+        assert [len(chunk) for chunk in chunks] == [2, 2]
+        assert cursor.fetch_sizes == [2, 2, 2]
+
+    @pytest.mark.asyncio
+    async def test_closing_early_releases_the_connection(self):
+        db, pool, conn, cursor = cursor_db([{"id": n} for n in range(10)])
+
+        stream = db.stream_query("SELECT id FROM workout_sets", chunk_size=2)
+        assert await stream.__anext__() == [{"id": 0}, {"id": 1}]
+        await stream.aclose()
+
+        assert cursor.fetch_sizes == [2]
+        pool.release.assert_awaited_once_with(conn)
@@ -0,0 +1,163 @@
+"""
+FitForge Health Check Tests
+Concurrent probes with per-probe timeouts, shared cached results and readiness
+"""
+
+import asyncio
+import os
+import sys
+import time
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+# Add project root to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from backend.app.api import health
+
+PRIMARY_URL = os.getenv("DB_TEST_PRIMARY_URL")
+
+
+class SlowPool:
+    """asyncpg pool stand-in whose round trip takes delay seconds"""
+
+    def __init__(self, delay: float):
+        self.delay = delay
+        self.queries = 0
+
+    @asynccontextmanager
+    async def acquire(self):
+        yield self
+
+    async def fetchval(self, query):
+        self.queries += 1
+        await asyncio.sleep(self.delay)
+        return 1
+
+    def get_size(self):
+        return 2
+
+    def get_idle_size(self):
+        return 1
+
+
+class SlowRedis:
+    def __init__(self, delay: float):
+        self.delay = delay
+
+    async def ping(self):
+        await asyncio.sleep(self.delay)
+        return True
+
+
+@pytest.fixture
+def probes(monkeypatch):
+    """Probe settings with a 100ms timeout, no Supabase, and an empty cache"""
+    fake_settings = SimpleNamespace(
+        OPENAI_API_KEY=None,
+        monitoring=SimpleNamespace(HEALTH_PROBE_TIMEOUT_SECONDS=0.1, HEALTH_CACHE_SECONDS=3.0)
+    )
+    monkeypatch.setattr(health, "get_settings", lambda: fake_settings)
+    monkeypatch.setattr(health.db_manager, "supabase", None)
+    health.probe_cache.clear()
+    yield
+    health.probe_cache.clear()
+
+
+class TestProbes:
+    """
+    Probes run together and each is bounded by its own timeout
+    """
+
+    @pytest.mark.asyncio
+    async def test_probes_run_concurrently(self, probes, monkeypatch):
+        monkeypatch.setattr(health.db_manager, "pool", SlowPool(0.05))
+        monkeypatch.setattr(health.redis_manager, "client", SlowRedis(0.05))
+
+        started = time.perf_counter()
+        checks = await health.run_checks(list(health.PROBES))
+        elapsed = time.perf_counter() - started
+
+        assert checks["database"]["status"] == "healthy"
+        assert checks["redis"]["status"] == "healthy"
+        assert checks["external_apis"]["services"] == {"openai": "not_configured", "supabase": "not_configured"}
+        assert checks["database"]["response_time_ms"] >= 50
+        assert elapsed < 0.09
+
+    @pytest.mark.asyncio
+    async def test_hung_dependency_times_out_and_fails_readiness(self, probes, monkeypatch):
+        monkeypatch.setattr(health.db_manager, "pool", SlowPool(5))
+        monkeypatch.setattr(health.redis_manager, "client", None)
+
+        started = time.perf_counter()
+        with pytest.raises(HTTPException) as exc_info:
+            await health.readiness_check()
+        assert exc_info.value.status_code == 503
+        assert time.perf_counter() - started < 0.5
+
+        checks = await health.run_checks(["database", "redis"])
+        assert checks["database"]["error"] == "Timed out after 0.1s"
+        assert checks["redis"]["status"] == "not_configured"
+
+    @pytest.mark.asyncio
+    async def test_unreachable_redis_does_not_fail_readiness(self, probes, monkeypatch):
+        class DownRedis:
+            async def ping(self):
+                raise ConnectionError("Connection refused")
+
+        monkeypatch.setattr(health.db_manager, "pool", SlowPool(0))
+        monkeypatch.setattr(health.redis_manager, "client", DownRedis())
+
+        response = await health.readiness_check()
+        assert response.ready is True
+        assert response.checks["redis"]["status"] == "unhealthy"
+        assert response.checks["redis"]["error"] == "Connection refused"
+
+
+class TestProbeCache:
+    """
+    A burst of polls costs one probe; results are reused for HEALTH_CACHE_SECONDS
+    """
+
+    @pytest.mark.asyncio
+    async def test_concurrent_and_repeated_polls_share_one_probe(self, probes, monkeypatch):
+        pool = SlowPool(0.02)
+        monkeypatch.setattr(health.db_manager, "pool", pool)
+        monkeypatch.setattr(health.redis_manager, "client", None)
+        observed = health.HEALTH_PROBE_DURATION.snapshot().get(("database", "healthy"), {"count": 0})["count"]
+
+        results = await asyncio.gather(*(health.run_checks(["database"]) for _ in range(20)))
+        again = await health.run_checks(["database"])
+
+        assert pool.queries == 1
+        assert all(result["database"] is results[0]["database"] for result in results)
+        assert again["database"]["checked_at"] == results[0]["database"]["checked_at"]
+        assert health.HEALTH_PROBE_DURATION.snapshot()[("database", "healthy")]["count"] == observed + 1
+
+        health.probe_cache.clear()
+        await health.run_checks(["database"])
+        assert pool.queries == 2
+
+
+@pytest.mark.skipif(not PRIMARY_URL, reason="set DB_TEST_PRIMARY_URL to probe a real database")
+class TestDatabaseProbeIntegration:
+    """
+    Against a real PostgreSQL pool
+    """
+
+    @pytest.mark.asyncio
+    async def test_database_probe(self, probes, monkeypatch):
+        from backend.app.core.database import DatabaseManager
+
+        db = DatabaseManager()
+        pool = await db._create_pool(PRIMARY_URL, 2)
+        monkeypatch.setattr(health.db_manager, "pool", pool)
+        try:
+            result = await health.check_database()
+            assert result["status"] == "healthy"
+            assert result["pool_size"] >= 1
+        finally:
+            await pool.close()
@@ -0,0 +1,269 @@
+"""
+FitForge Background Job Queue Tests
+Claim, retry, completion and lease handling against a real PostgreSQL database
+
+Each test gets a scratch schema holding its own background_jobs (and
+muscle_states) table, put first on the pool's search_path, so jobs queued by
+other tests or by a running backend are never claimed.
+"""
+
+import asyncio
+import os
+import sys
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from uuid import UUID, uuid4
+
+import asyncpg
+import pytest
+
+# Add project root to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from backend.app.core import jobs
+from backend.app.core.jobs import Job, JobQueue, LeaseLostError
+
+PRIMARY_URL = os.getenv("DB_TEST_PRIMARY_URL")
+
+pytestmark = pytest.mark.skipif(not PRIMARY_URL, reason="set DB_TEST_PRIMARY_URL to run the job queue against a real database")
+
+
+@asynccontextmanager
+async def job_database():
+    """DatabaseManager whose background_jobs is a fresh table in a scratch schema"""
+    from backend.app.core.database import DatabaseManager
+
+    schema = f"jobs_test_{uuid4().hex[:12]}"
+    admin = await asyncpg.connect(PRIMARY_URL)
+    await admin.execute(f"""
+        CREATE SCHEMA {schema};
+        CREATE TABLE {schema}.background_jobs (LIKE public.background_jobs INCLUDING ALL);
+        CREATE TABLE {schema}.job_effects (job_id UUID NOT NULL, attempt INTEGER NOT NULL);
+        CREATE TABLE {schema}.muscle_states (
+            id UUID PRIMARY KEY,
+            user_id UUID NOT NULL,
+            muscle_name TEXT NOT NULL,
+            current_fatigue_percentage NUMERIC NOT NULL,
+            last_workout_date TIMESTAMPTZ,
+            total_volume_lifetime NUMERIC NOT NULL,
+            updated_at TIMESTAMPTZ,
+            UNIQUE (user_id, muscle_name)
+        );
+    """)
+    db = DatabaseManager()
+    separator = "&" if "?" in PRIMARY_URL else "?"
+    db.pool = await db._create_pool(f"{PRIMARY_URL}{separator}search_path={schema},public", 4)
+    try:
+        yield db
+    finally:
+        await db.pool.close()
+        await admin.execute(f"DROP SCHEMA {schema} CASCADE")
+        await admin.close()
+
+
+async def job_row(db, job_id: UUID):
+    return await db.pool.fetchrow("SELECT * FROM background_jobs WHERE id = $1", job_id)
+
+
+class TestClaimAndComplete:
+    """
+    Workers claim ready jobs once and close them when the handler returns
+    """
+
+    @pytest.mark.asyncio
+    async def test_jobs_run_once_and_are_marked_done(self):
+        async with job_database() as db:
+            queue = JobQueue(db)
+            seen = []
+
+            async def handler(payload, db, job):
+                seen.append((payload["n"], job.attempts))
+
+            queue.register("test.noop", handler)
+            job_ids = [await queue.enqueue("test.noop", {"n": n}) for n in range(2)]
+
+            assert await queue.run_next() is True
+            assert await queue.run_next() is True
+            assert await queue.run_next() is False
+
+            assert sorted(seen) == [(0, 1), (1, 1)]
+            for job_id in job_ids:
+                row = await job_row(db, job_id)
+                assert (row["status"], row["attempts"], row["locked_until"]) == ("done", 1, None)
+                assert row["finished_at"] is not None
+            assert queue.latency()["by_type"]["test.noop"]["succeeded"] == 2
+
+    @pytest.mark.asyncio
+    async def test_jobs_enqueued_in_a_rolled_back_transaction_never_run(self):
+        async with job_database() as db:
+            queue = JobQueue(db)
+            with pytest.raises(RuntimeError):
+                async with db.get_connection() as conn:
+                    async with conn.transaction():
+                        await queue.enqueue("test.noop", {}, conn=conn)
+                        raise RuntimeError("completion failed")
+
+            assert await queue.run_next() is False
+
+
+class TestRetries:
+    """
+    Failures back off exponentially and give up after max_attempts
+    """
+
+    @pytest.mark.asyncio
+    async def test_failed_job_is_retried_then_marked_failed(self, monkeypatch):
+        monkeypatch.setattr(jobs.settings.jobs, "MAX_ATTEMPTS", 2)
+        async with job_database() as db:
+            queue = JobQueue(db)
+
+            async def handler(payload, db, job):
+                raise ValueError(f"boom {job.attempts}")
+
+            queue.register("test.flaky", handler)
+            job_id = await queue.enqueue("test.flaky", {})
+
+            assert await queue.run_next() is True
+            row = await job_row(db, job_id)
+            assert (row["status"], row["attempts"], row["last_error"]) == ("pending", 1, "ValueError: boom 1")
+            delay = (row["run_after"] - datetime.now(timezone.utc)).total_seconds()
+            assert 0 < delay <= jobs.settings.jobs.RETRY_BASE_SECONDS
+            # Backing off: not claimable yet
+            assert await queue.run_next() is False
+
+            await db.pool.execute("UPDATE background_jobs SET run_after = NOW() WHERE id = $1", job_id)
+            assert await queue.run_next() is True
+            row = await job_row(db, job_id)
+            assert (row["status"], row["attempts"], row["last_error"]) == ("failed", 2, "ValueError: boom 2")
+            assert queue.latency()["by_type"]["test.flaky"] == {"succeeded": 0, "retried": 1, "failed": 1}
+
+    @pytest.mark.asyncio
+    async def test_unknown_job_type_is_recorded_as_a_failure(self):
+        async with job_database() as db:
+            queue = JobQueue(db)
+            job_id = await queue.enqueue("test.unregistered", {})
+
+            assert await queue.run_next() is True
+            row = await job_row(db, job_id)
+            assert row["last_error"] == "LookupError: No handler registered for job type 'test.unregistered'"
+
+
+class TestLeases:
+    """
+    A running job keeps its lease; a reclaimed job's stale attempt rolls back
+    """
+
+    @pytest.mark.asyncio
+    async def test_heartbeat_keeps_a_long_job_from_being_reclaimed(self, monkeypatch):
+        monkeypatch.setattr(jobs.settings.jobs, "LEASE_SECONDS", 0.6)
+        async with job_database() as db:
+            queue, other_worker = JobQueue(db), JobQueue(db)
+            finished = asyncio.Event()
+
+            async def slow(payload, db, job):
+                await asyncio.sleep(1.5)
+                finished.set()
+
+            queue.register("test.slow", slow)
+            job_id = await queue.enqueue("test.slow", {})
+            running = asyncio.create_task(queue.run_next())
+
+            # Well past the original lease, the job is still held
+            while not finished.is_set():
+                await asyncio.sleep(0.25)
+                assert await other_worker.run_next() is False
+            assert await running is True
+
+            row = await job_row(db, job_id)
+            assert (row["status"], row["attempts"]) == ("done", 1)
+
+    @pytest.mark.asyncio
+    async def test_reclaimed_job_applies_its_writes_once(self):
+        async with job_database() as db:
+            stale_worker, other_worker = JobQueue(db), JobQueue(db)
+            resume = asyncio.Event()
+            started = asyncio.Event()
+
+            async def record_effect(payload, db, job):
+                async with db.transaction() as tx:
+                    await tx.execute_query("INSERT INTO job_effects (job_id, attempt) VALUES ($1, $2)", job.id, job.attempts)
+                    if job.attempts == 1:
+                        # The first worker stalls past its lease before committing
+                        started.set()
+                        await resume.wait()
+                    await job.complete(tx.connection)
+
+            for queue in (stale_worker, other_worker):
+                queue.register("test.effect", record_effect)
+            job_id = await stale_worker.enqueue("test.effect", {})
+
+            stalled = asyncio.create_task(stale_worker.run_next())
+            await started.wait()
+            await db.pool.execute("UPDATE background_jobs SET locked_until = NOW() - INTERVAL '1 second' WHERE id = $1", job_id)
+            assert await other_worker.run_next() is True
+            resume.set()
+            assert await stalled is True
+
+            effects = await db.pool.fetch("SELECT attempt FROM job_effects WHERE job_id = $1", job_id)
+            assert [effect["attempt"] for effect in effects] == [2]
+            row = await job_row(db, job_id)
+            assert (row["status"], row["attempts"]) == ("done", 2)
+            assert stale_worker.latency()["by_type"] == {}
+
+
+class TestMuscleRollups:
+    """
+    workout.muscle_states adds a workout's fatigue exactly once
+    """
+
+    @pytest.mark.asyncio
+    async def test_muscle_states_and_done_status_commit_together(self):
+        from backend.app.services.workout_jobs import register_workout_jobs
+
+        async with job_database() as db:
+            user_id, workout_id = uuid4(), uuid4()
+            await db.pool.execute("INSERT INTO users (id, email) VALUES ($1, $2)", user_id, f"jobs-{user_id}@example.com")
+            try:
+                await db.pool.execute("INSERT INTO workouts (id, user_id) VALUES ($1, $2)", workout_id, user_id)
+                await db.pool.execute(
+                    """
+                    INSERT INTO workout_sets (workout_id, exercise_id, user_id, set_number, reps, weight_lbs)
+                    VALUES ($1, 'bench_press', $2, 1, 10, 100), ($1, 'bench_press', $2, 2, 10, 100)
+                    """,
+                    workout_id,
+                    user_id
+                )
+                engagement = await db.pool.fetchval(
+                    "SELECT (muscle_engagement->>'Pectoralis_Major')::numeric FROM exercises WHERE id = 'bench_press'"
+                )
+                queue = JobQueue(db)
+                register_workout_jobs(queue)
+                job_id = await queue.enqueue("workout.muscle_states", {
+                    "workout_id": str(workout_id), "user_id": str(user_id),
+                    "completed_at": datetime.now(timezone.utc).isoformat()
+                })
+
+                assert await queue.run_next() is True
+                volume = await db.pool.fetchval(
+                    "SELECT total_volume_lifetime FROM muscle_states WHERE user_id = $1 AND muscle_name = 'Pectoralis_Major'",
+                    user_id
+                )
+                assert volume == 2000 * engagement / 100
+                assert (await job_row(db, job_id))["status"] == "done"
+
+                # A duplicate delivery of the same attempt cannot close the job again, so its upserts roll back
+                duplicate = Job(await db.pool.fetchrow(
+                    "SELECT id, job_type, attempts, max_attempts FROM background_jobs WHERE id = $1", job_id
+                ))
+                with pytest.raises(LeaseLostError):
+                    await queue.handlers["workout.muscle_states"](
+                        {"workout_id": str(workout_id), "user_id": str(user_id),
+                         "completed_at": datetime.now(timezone.utc).isoformat()},
+                        db,
+                        duplicate
+                    )
+                assert await db.pool.fetchval(
+                    "SELECT total_volume_lifetime FROM muscle_states WHERE user_id = $1", user_id
+                ) == volume
+            finally:
+                await db.pool.execute("DELETE FROM users WHERE id = $1", user_id)
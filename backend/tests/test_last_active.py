@@ -0,0 +1,62 @@
+"""
+FitForge Last-Active Tracking Tests
+Buffered, deduplicated users.last_active_at writes
+"""
+
+import os
+import sys
+from unittest.mock import AsyncMock
+
+import pytest
+from fastapi import HTTPException
+
+# Add project root to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from backend.app.core.activity import LastActiveTracker
+
+USER_A = "11111111-1111-1111-1111-111111111111"
+USER_B = "22222222-2222-2222-2222-222222222222"
+
+
+class TestLastActiveTracker:
+    """
+    touch() buffers, flush() writes one bulk UPDATE
+    """
+
+    @pytest.mark.asyncio
+    async def test_repeat_touches_flush_as_one_update(self):
+        """Many requests from two users become one UPDATE with two rows"""
+        db = AsyncMock()
+        db.execute_query.return_value = "UPDATE 2"
+        tracker = LastActiveTracker(db)
+
+        for _ in range(50):
+            tracker.touch(USER_A)
+            tracker.touch(USER_B)
+
+        assert await tracker.flush() == 2
+        assert db.execute_query.await_count == 1
+        _, user_ids, seen_at, _ = db.execute_query.await_args.args
+        assert user_ids == [USER_A, USER_B] and len(seen_at) == 2
+
+        # Still inside the precision window: nothing new to write
+        tracker.touch(USER_A)
+        assert await tracker.flush() == 0
+        assert db.execute_query.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_keeps_batch(self):
+        """A database error leaves the users buffered for the next flush"""
+        db = AsyncMock()
+        db.execute_query.side_effect = HTTPException(status_code=500, detail="Database operation failed")
+        tracker = LastActiveTracker(db)
+        tracker.touch(USER_A)
+
+        assert await tracker.flush() == 0
+        assert tracker.pending == 1
+
+        db.execute_query.side_effect = None
+        db.execute_query.return_value = "UPDATE 1"
+        assert await tracker.flush() == 1
+        assert tracker.pending == 0
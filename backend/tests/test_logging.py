@@ -0,0 +1,119 @@
+"""
+FitForge Logging Tests
+Hot-path sampling and queued output on the logging thread
+"""
+
+import logging
+import os
+import sys
+import threading
+
+# Add project root to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from backend.app.core.logging import HotPathSampler, LogForwarder, start_log_listener, stop_logging
+
+
+class CapturingHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.lines = []
+        self.threads = set()
+
+    def emit(self, record):
+        self.lines.append(self.format(record))
+        self.threads.add(threading.get_ident())
+
+
+class CountingArg:
+    """Counts how often the record message is rendered"""
+
+    def __init__(self):
+        self.renders = 0
+
+    def __str__(self):
+        self.renders += 1
+        return "arg"
+
+
+def make_logger(name, sampler=None):
+    handler = CapturingHandler()
+    forwarder = LogForwarder([handler])
+    if sampler:
+        forwarder.addFilter(sampler)
+    logger = logging.getLogger(name)
+    logger.handlers = [forwarder]
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    return logger, handler
+
+
+class TestHotPathSampler:
+    """
+    ENTRY/QUERY_BUILD lines are capped per call site; everything else passes
+    """
+
+    def test_caps_each_call_site_and_keeps_other_records(self):
+        sampler = HotPathSampler()
+        sampler.configure(max_per_second=2)
+        logger, handler = make_logger("fitforge.test.sampling.cap", sampler)
+
+        arg = CountingArg()
+        for _ in range(10):
+            logger.info("🔥 hot ENTRY - %s", arg)
+            logger.info("✅ hot SUCCESS")
+        logger.warning("🔥 hot ENTRY - failing input")
+
+        assert handler.lines.count("🔥 hot ENTRY - arg") == 2
+        assert handler.lines.count("✅ hot SUCCESS") == 10
+        assert "🔥 hot ENTRY - failing input" in handler.lines
+        assert sampler.suppressed == 8
+        # Suppressed records are never formatted
+        assert arg.renders == 2
+
+    def test_logger_rate_overrides_default(self):
+        sampler = HotPathSampler()
+        sampler.configure(sample_rate=1.0, logger_rates={"fitforge.test.sampling.quiet": 0.0})
+        quiet, quiet_handler = make_logger("fitforge.test.sampling.quiet.child", sampler)
+        loud, loud_handler = make_logger("fitforge.test.sampling.loud", sampler)
+
+        for _ in range(5):
+            quiet.info("🔧 QUERY_BUILD RESULT: %.200s", "SELECT 1")
+            loud.info("🔧 QUERY_BUILD RESULT: %.200s", "SELECT 1")
+
+        assert quiet_handler.lines == []
+        assert len(loud_handler.lines) == 5
+
+
+class TestQueuedOutput:
+    """
+    Records are written by the logging thread, and flushed on stop
+    """
+
+    def test_records_written_off_the_calling_thread(self):
+        logger, handler = make_logger("fitforge.test.queued")
+        start_log_listener()
+        try:
+            for n in range(50):
+                logger.info("line %d", n)
+        finally:
+            stop_logging()
+
+        assert handler.lines == [f"line {n}" for n in range(50)]
+        assert threading.get_ident() not in handler.threads
+
+        # With the thread stopped, output is written inline
+        logger.info("after stop")
+        assert handler.lines[-1] == "after stop"
+
+    def test_queued_message_is_rendered_before_arguments_change(self):
+        logger, handler = make_logger("fitforge.test.queued.mutable")
+        start_log_listener()
+        try:
+            payload = {"reps": 5}
+            logger.info("payload %s", payload)
+            payload["reps"] = 8
+        finally:
+            stop_logging()
+
+        assert handler.lines == ["payload {'reps': 5}"]
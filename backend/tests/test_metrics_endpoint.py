@@ -0,0 +1,72 @@
+"""
+FitForge Metrics Endpoint Tests
+Prometheus exposition and METRICS_TOKEN gating
+"""
+
+import os
+import sys
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+from pydantic import SecretStr
+
+# Add project root to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from backend.app.api import health
+from backend.app.core.metrics import MetricFamily, MetricsRegistry
+
+
+def monitoring_settings(token=None, enabled=True):
+    return SimpleNamespace(monitoring=SimpleNamespace(ENABLE_METRICS=enabled, METRICS_TOKEN=token))
+
+
+class TestExposition:
+    """
+    Histograms, counters and collector families in text format 0.0.4
+    """
+
+    def test_render_histogram_and_collector(self):
+        registry = MetricsRegistry()
+        latency = registry.histogram("req_seconds", "Request latency", ["route"], buckets=(0.1, 1.0))
+        latency.observe(0.05, ("/api/workouts/{workout_id}",))
+        latency.observe(3.0, ("/api/workouts/{workout_id}",))
+        registry.collector(lambda: [MetricFamily("pool_idle", "Idle", "gauge", [({"pool": "primary"}, 4)])])
+        registry.collector(lambda: 1 / 0)  # a broken collector does not break the scrape
+
+        text = registry.render()
+
+        assert '# TYPE req_seconds histogram' in text
+        assert 'req_seconds_bucket{route="/api/workouts/{workout_id}",le="0.1"} 1' in text
+        assert 'req_seconds_bucket{route="/api/workouts/{workout_id}",le="+Inf"} 2' in text
+        assert 'req_seconds_count{route="/api/workouts/{workout_id}"} 2' in text
+        assert 'pool_idle{pool="primary"} 4.0' in text
+
+
+class TestMetricsEndpoint:
+    """
+    Bearer token required when MONITORING_METRICS_TOKEN is set
+    """
+
+    @pytest.mark.asyncio
+    async def test_token_gates_scrape(self, monkeypatch):
+        monkeypatch.setattr(health, "get_settings", lambda: monitoring_settings(SecretStr("s3cret")))
+
+        with pytest.raises(HTTPException) as exc_info:
+            await health.metrics(authorization="Bearer wrong")
+        assert exc_info.value.status_code == 401
+
+        response = await health.metrics(authorization="Bearer s3cret")
+        body = response.body.decode()
+        assert response.media_type.startswith("text/plain; version=0.0.4")
+        assert "# TYPE fitforge_db_query_duration_seconds histogram" in body
+        assert "process_resident_memory_bytes" in body
+
+    @pytest.mark.asyncio
+    async def test_disabled_metrics_are_not_found(self, monkeypatch):
+        monkeypatch.setattr(health, "get_settings", lambda: monitoring_settings(enabled=False))
+
+        with pytest.raises(HTTPException) as exc_info:
+            await health.metrics(authorization=None)
+        assert exc_info.value.status_code == 404
@@ -0,0 +1,63 @@
+"""
+FitForge Middleware Tests
+Raw ASGI request logging and correlation ID middleware
+"""
+
+import os
+import sys
+
+from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+# Add project root to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from backend.app.middleware import error_handling
+from backend.app.middleware.error_handling import ErrorHandlingMiddleware
+from backend.app.middleware.request_logging import RequestLoggingMiddleware
+
+
+def build_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/context")
+    async def context(request: Request):
+        return {"state": request.state.correlation_id, "context": error_handling.correlation_id_var.get()}
+
+    @app.get("/stream")
+    async def stream():
+        async def chunks():
+            for n in range(3):
+                yield f"chunk{n}\n".encode()
+        return StreamingResponse(chunks(), media_type="text/plain")
+
+    app.add_middleware(ErrorHandlingMiddleware)
+    app.add_middleware(RequestLoggingMiddleware)
+    return app
+
+
+class TestAsgiMiddleware:
+    """
+    Headers are added on http.response.start; bodies pass through untouched
+    """
+
+    def test_correlation_id_reaches_handler_and_response(self):
+        client = TestClient(build_app())
+
+        response = client.get("/context", headers={"X-Correlation-ID": "req-42"})
+
+        assert response.json() == {"state": "req-42", "context": "req-42"}
+        assert response.headers["X-Correlation-ID"] == "req-42"
+        assert float(response.headers["X-Process-Time"]) >= 0
+        # The ID does not leak into the next request's context
+        assert error_handling.correlation_id_var.get() is None
+
+    def test_streaming_response_and_generated_id(self):
+        client = TestClient(build_app())
+
+        response = client.get("/stream", headers={"X-Correlation-ID": "x" * 500})
+
+        assert response.text == "chunk0\nchunk1\nchunk2\n"
+        assert len(response.headers["X-Correlation-ID"]) == 36  # oversized ID replaced by a UUID
+        assert "X-Process-Time" in response.headers
@@ -0,0 +1,83 @@
+"""
+FitForge OpenAPI Artifact Tests
+The checked-in openapi.json matches the routes, and is served pre-encoded
+"""
+
+import gzip
+import os
+import subprocess
+import sys
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+# Add project root to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from backend.app.core import openapi
+from backend.app.core.openapi import OpenAPIDocument, serve_openapi
+from backend.app.middleware.compression import CompressionMiddleware
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+
+class TestArtifactConsistency:
+    """
+    Route or schema changes must come with a regenerated openapi.json
+    """
+
+    def test_artifact_matches_live_route_table(self):
+        result = subprocess.run(
+            [sys.executable, "scripts/generate_openapi.py", "--check"],
+            cwd=BACKEND_DIR, capture_output=True, text=True, timeout=120
+        )
+        assert result.returncode == 0, result.stdout + result.stderr[-2000:]
+
+
+class TestServedDocument:
+    """
+    Same bytes on every request: gzip when accepted, 304 on a matching ETag
+    """
+
+    def make_client(self, monkeypatch, tmp_path) -> TestClient:
+        artifact = tmp_path / "openapi.json"
+        artifact.write_bytes(b'{"openapi": "3.1.0", "paths": {}}\n')
+        monkeypatch.setattr(openapi, "ARTIFACT_PATH", artifact)
+
+        def build_schema():
+            raise AssertionError("the artifact is served without building the schema")
+
+        app = FastAPI(openapi_url="/api/v1/openapi.json")
+        serve_openapi(app, build_schema)
+        return TestClient(app)
+
+    def test_serves_artifact_gzipped_with_etag(self, monkeypatch, tmp_path):
+        client = self.make_client(monkeypatch, tmp_path)
+
+        response = client.get("/api/v1/openapi.json", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.json() == {"openapi": "3.1.0", "paths": {}}
+
+        plain = client.get("/api/v1/openapi.json", headers={"Accept-Encoding": "identity"})
+        assert "content-encoding" not in plain.headers
+        assert plain.content == b'{"openapi": "3.1.0", "paths": {}}\n'
+
+        cached = client.get("/api/v1/openapi.json", headers={"If-None-Match": response.headers["etag"]})
+        assert cached.status_code == 304
+
+    def test_refused_gzip_gets_the_plain_body(self, monkeypatch, tmp_path):
+        client = self.make_client(monkeypatch, tmp_path)
+        client.app.add_middleware(CompressionMiddleware, minimum_size=0)
+
+        for accept_encoding in ("gzip;q=0", "identity", "br;q=1, gzip;q=0"):
+            response = client.get("/api/v1/openapi.json", headers={"Accept-Encoding": accept_encoding})
+            assert "content-encoding" not in response.headers
+            assert response.content == b'{"openapi": "3.1.0", "paths": {}}\n'
+
+        preferred = client.get("/api/v1/openapi.json", headers={"Accept-Encoding": "br, gzip;q=0.5"})
+        assert preferred.headers["content-encoding"] == "gzip"
+
+    def test_gzip_is_deterministic(self):
+        body = b'{"openapi": "3.1.0"}'
+        assert OpenAPIDocument(body).gzipped == OpenAPIDocument(body).gzipped
+        assert gzip.decompress(OpenAPIDocument(body).gzipped) == body
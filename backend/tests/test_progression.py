@@ -0,0 +1,131 @@
+"""
+FitForge Progression Engine Tests
+Validates the vectorized e1RM / plateau analysis against a plain Python reference
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# Add project root to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from backend.app.services.progression import (
+    STATUS_LABELS,
+    analyze_progression,
+    estimate_one_rep_max
+)
+
+
+def reference_analysis(exercise_idx, session_day, weight, reps, window=6, min_sessions=4):
+    """Row-by-row version of analyze_progression used as the oracle"""
+    sessions = {}
+    for ex, day, w, r in zip(exercise_idx, session_day, weight, reps):
+        key = (int(ex), float(day))
+        sessions[key] = max(sessions.get(key, 0.0), w * (1 + r / 30.0))
+
+    results = {}
+    for ex in sorted({key[0] for key in sessions}):
+        series = sorted((day, best) for (e, day), best in sessions.items() if e == ex)
+        days = np.array([day for day, _ in series])
+        bests = np.array([best for _, best in series])
+        recent_days, recent_bests = days[-window:], bests[-window:]
+
+        slope_pct = None
+        status = "insufficient_data"
+        if len(recent_days) >= min_sessions:
+            slope = np.polyfit(recent_days - days[0], recent_bests, 1)[0]
+            slope_pct = slope * 7 / recent_bests.mean() * 100
+            if slope_pct <= -1.0:
+                status = "regression"
+            elif slope_pct < 0.5:
+                status = "plateau"
+            else:
+                status = "progressing"
+
+        best_position = max(i for i, value in enumerate(bests) if value >= bests[:i + 1].max())
+        results[ex] = {
+            "sessions": len(bests),
+            "current_e1rm": bests[-1],
+            "best_e1rm": bests.max(),
+            "slope_pct": slope_pct,
+            "status": status,
+            "sessions_since_best": len(bests) - 1 - best_position
+        }
+    return results
+
+
+class TestOneRepMaxFormulas:
+    """e1RM formulas match the stored estimated_one_rep_max convention"""
+
+    def test_epley_matches_database_formula(self):
+        e1rm = estimate_one_rep_max(np.array([200.0, 135.0]), np.array([5, 10]), "epley")
+        assert e1rm == pytest.approx([200 * (1 + 5 / 30), 135 * (1 + 10 / 30)])
+
+    def test_brzycki_excludes_invalid_rep_counts(self):
+        e1rm = estimate_one_rep_max(np.array([100.0, 100.0]), np.array([10, 40]), "brzycki")
+        assert e1rm[0] == pytest.approx(100 * 36 / 27)
+        assert e1rm[1] == 0.0, "Brzycki is undefined from 37 reps and must never win a session"
+
+    def test_unknown_formula_rejected(self):
+        with pytest.raises(ValueError):
+            estimate_one_rep_max(np.array([100.0]), np.array([5]), "lombardi")
+
+
+class TestProgressionAnalysis:
+    """Vectorized analysis agrees with the row-by-row reference"""
+
+    @pytest.fixture
+    def history(self):
+        """Three exercises trending up, flat and down, interleaved and shuffled"""
+        rng = np.random.default_rng(11)
+        rows = []
+        for session in range(12):
+            day = 20000.0 + session * 3
+            for ex, weekly_change in ((0, 0.03), (1, 0.0), (2, -0.03)):
+                top = 200.0 * (1 + weekly_change * session * 3 / 7)
+                # One top set of 5 plus lighter back-off sets that never beat it
+                rows.append((ex, day, top, 5))
+                for _ in range(3):
+                    rows.append((ex, day, round(top * rng.uniform(0.8, 0.9) * 4) / 4, int(rng.integers(3, 9))))
+        rows = [rows[i] for i in rng.permutation(len(rows))]
+        return tuple(np.array(column) for column in zip(*rows))
+
+    def test_matches_reference(self, history):
+        analysis = analyze_progression(*history)
+        expected = reference_analysis(*history)
+
+        assert list(analysis.exercise_index) == sorted(expected)
+        for i, ex in enumerate(analysis.exercise_index):
+            reference = expected[int(ex)]
+            assert analysis.session_count[i] == reference["sessions"]
+            assert analysis.current_e1rm[i] == pytest.approx(reference["current_e1rm"])
+            assert analysis.best_e1rm[i] == pytest.approx(reference["best_e1rm"])
+            assert analysis.current_slope_pct_per_week[i] == pytest.approx(reference["slope_pct"])
+            assert STATUS_LABELS[analysis.current_status[i]] == reference["status"]
+            assert analysis.sessions_since_best[i] == reference["sessions_since_best"]
+
+    def test_flags_trends(self, history):
+        analysis = analyze_progression(*history)
+        statuses = [STATUS_LABELS[code] for code in analysis.current_status]
+        assert statuses == ["progressing", "plateau", "regression"]
+
+    def test_order_does_not_matter(self, history):
+        shuffled = analyze_progression(*history)
+        order = np.lexsort((history[1], history[0]))
+        ordered = analyze_progression(*(column[order] for column in history))
+        np.testing.assert_allclose(shuffled.session_best_e1rm, ordered.session_best_e1rm)
+        np.testing.assert_array_equal(shuffled.status, ordered.status)
+
+    def test_short_history_is_insufficient(self):
+        analysis = analyze_progression(
+            np.array([0, 0, 0]), np.array([1.0, 2.0, 3.0]), np.array([100.0, 105.0, 110.0]), np.array([5, 5, 5])
+        )
+        assert STATUS_LABELS[analysis.current_status[0]] == "insufficient_data"
+        assert analysis.sessions_since_best[0] == 0
+
+    def test_empty_history(self):
+        analysis = analyze_progression(np.array([]), np.array([]), np.array([]), np.array([]))
+        assert analysis.exercise_index.size == 0
@@ -0,0 +1,69 @@
+"""
+FitForge Query Instrumentation Tests
+Per-query histograms, stable query names and the slow-query log
+"""
+
+import logging
+import os
+import sys
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+# Add project root to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from backend.app.core import database
+from backend.app.core.database import DatabaseManager, query_name, set_request_scope, sql_fingerprint
+
+
+class TestQueryNames:
+    """
+    Labels stay stable across literals and layout
+    """
+
+    def test_builder_variants_share_a_name(self):
+        first = "SELECT * FROM exercises WHERE category IN ('push', 'pull') LIMIT 20 OFFSET 0"
+        second = """
+            SELECT *   FROM exercises  -- page 3
+            WHERE category IN ('legs') LIMIT 20 OFFSET 40
+        """
+
+        assert query_name(first) == query_name(second)
+        assert query_name(first).startswith("select_exercises_")
+        assert sql_fingerprint(first) == "SELECT * FROM exercises WHERE category IN (?) LIMIT ? OFFSET ?"
+        assert query_name(database.USER_PROFILE_QUERY) == "users.profile"
+
+
+class TestQueryInstrumentation:
+    """
+    execute_query records latency and rows, and logs slow statements
+    """
+
+    @pytest.mark.asyncio
+    async def test_slow_query_is_recorded_and_logged(self, monkeypatch, caplog):
+        conn = MagicMock()
+        conn.fetch = AsyncMock(return_value=[{"id": 1}, {"id": 2}])
+        db = DatabaseManager()
+        db.pool = MagicMock()
+        db.pool.acquire = AsyncMock(return_value=conn)
+        db.pool.release = AsyncMock()
+        monkeypatch.setattr(database.settings.database, "SLOW_QUERY_THRESHOLD", 0.0)
+
+        route = MagicMock()
+        route.path = "/api/workouts/{workout_id}"
+        set_request_scope({"method": "GET", "path": "/api/workouts/abc", "route": route})
+
+        query = "SELECT id FROM workouts WHERE user_id = $1"
+        name = query_name(query)
+        before = database.QUERY_DURATION.snapshot().get((name,), {"count": 0})["count"]
+        with caplog.at_level(logging.WARNING, logger="fitforge.database.slow_query"):
+            await db.execute_query(query, "user-1", fetch=True)
+
+        assert database.QUERY_DURATION.snapshot()[(name,)]["count"] == before + 1
+        assert database.QUERY_ROWS.snapshot()[(name,)]["sum"] >= 2
+        record = next(r for r in caplog.records if r.name == "fitforge.database.slow_query")
+        assert record.query_name == name
+        assert record.fingerprint == query
+        assert record.endpoint == "GET /api/workouts/{workout_id}"
+        assert record.rows == 2
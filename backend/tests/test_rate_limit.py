@@ -0,0 +1,67 @@
+"""
+FitForge Rate Limiter Tests
+Token-bucket limiting and the in-process fallback when Redis fails
+"""
+
+import os
+import sys
+from unittest.mock import MagicMock
+
+import pytest
+import redis.asyncio as aioredis
+from fastapi import HTTPException
+
+# Add project root to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from backend.app.core.config import get_settings
+from backend.app.core.dependencies import RateLimiter
+from backend.app.core.rate_limit import TokenBucketLimiter
+
+
+class TestTokenBucketLimiter:
+    """
+    Burst up to the limit, then reject until tokens refill
+    """
+
+    @pytest.mark.asyncio
+    async def test_local_bucket_allows_burst_then_rejects(self):
+        limiter = TokenBucketLimiter()
+        decisions = [await limiter.hit("client", 3, 60.0) for _ in range(4)]
+
+        assert [d.allowed for d in decisions] == [True, True, True, False]
+        assert decisions[-1].retry_after == pytest.approx(20.0, rel=0.01)
+        assert {d.backend for d in decisions} == {"local"}
+
+    @pytest.mark.asyncio
+    async def test_redis_error_falls_back_to_local_bucket(self):
+        """A failing Redis still limits, from in-process buckets"""
+        script = MagicMock(side_effect=aioredis.ConnectionError("Connection refused"))
+        redis = MagicMock()
+        redis.register_script.return_value = script
+        limiter = TokenBucketLimiter()
+
+        decisions = [await limiter.hit("client", 2, 60.0, redis) for _ in range(3)]
+
+        assert [d.allowed for d in decisions] == [True, True, False]
+        assert {d.backend for d in decisions} == {"local"}
+        # Redis is not retried on every request while it is down
+        assert script.call_count == 1
+
+
+class TestRateLimiterDependency:
+    """
+    429 with Retry-After once the bucket is empty
+    """
+
+    @pytest.mark.asyncio
+    async def test_rejects_with_retry_after(self):
+        limiter = RateLimiter(requests_per_minute=1, scope="test")
+        request = MagicMock()
+        request.client.host = "203.0.113.7"
+
+        assert await limiter(request, None, get_settings()) is True
+        with pytest.raises(HTTPException) as exc_info:
+            await limiter(request, None, get_settings())
+        assert exc_info.value.status_code == 429
+        assert exc_info.value.headers["Retry-After"] == "60"
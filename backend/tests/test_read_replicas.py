@@ -0,0 +1,105 @@
+"""
+FitForge Read Replica Routing Tests
+read_only queries on replicas, read-your-writes pinning and primary fallback
+"""
+
+import os
+import sys
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+# Add project root to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from backend.app.core.database import DatabaseManager, is_write_query, set_request_user
+
+USER_A = "11111111-1111-1111-1111-111111111111"
+USER_B = "22222222-2222-2222-2222-222222222222"
+
+PRIMARY_URL = os.getenv("DB_TEST_PRIMARY_URL")
+REPLICA_URL = os.getenv("DB_TEST_REPLICA_URL")
+
+
+def fake_pool(name: str) -> MagicMock:
+    """Pool whose connections answer fetchrow with the pool's name"""
+    conn = MagicMock()
+    conn.fetchrow = AsyncMock(return_value={"pool": name})
+    conn.execute = AsyncMock(return_value="UPDATE 1")
+    pool = MagicMock()
+    pool.acquire = AsyncMock(return_value=conn)
+    pool.release = AsyncMock()
+    return pool
+
+
+def routed_db() -> DatabaseManager:
+    db = DatabaseManager()
+    db.pool = fake_pool("primary")
+    db.replica_pools = [fake_pool("replica")]
+    return db
+
+
+class TestReplicaRouting:
+    """
+    Only read_only queries leave the primary
+    """
+
+    @pytest.mark.asyncio
+    async def test_read_only_uses_replica(self):
+        set_request_user(USER_A)
+        db = routed_db()
+
+        assert await db.execute_query("SELECT 1", fetch_one=True, read_only=True) == {"pool": "replica"}
+        assert await db.execute_query("SELECT 1", fetch_one=True) == {"pool": "primary"}
+
+    @pytest.mark.asyncio
+    async def test_write_pins_user_to_primary(self):
+        """After a write, that user's reads see it; other users still use replicas"""
+        set_request_user(USER_A)
+        db = routed_db()
+
+        await db.execute_query("UPDATE users SET display_name = $1 WHERE id = $2", "A", USER_A)
+        assert await db.execute_query("SELECT 1", fetch_one=True, read_only=True) == {"pool": "primary"}
+
+        set_request_user(USER_B)
+        assert await db.execute_query("SELECT 1", fetch_one=True, read_only=True) == {"pool": "replica"}
+
+    @pytest.mark.asyncio
+    async def test_unreachable_replica_falls_back_to_primary(self):
+        set_request_user(None)
+        db = routed_db()
+        db.replica_pools[0].acquire.side_effect = ConnectionRefusedError("replica down")
+
+        assert await db.execute_query("SELECT 1", fetch_one=True, read_only=True) == {"pool": "primary"}
+        db.pool.release.assert_awaited_once()
+
+    def test_write_detection(self):
+        assert is_write_query("INSERT INTO workouts (id) VALUES ($1)")
+        assert is_write_query("WITH moved AS (DELETE FROM sets RETURNING *) SELECT count(*) FROM moved")
+        assert not is_write_query("SELECT updated_at FROM users WHERE id = $1")
+
+
+@pytest.mark.skipif(
+    not (PRIMARY_URL and REPLICA_URL),
+    reason="set DB_TEST_PRIMARY_URL and DB_TEST_REPLICA_URL (see docker-compose.replica.yml)"
+)
+class TestReplicaIntegration:
+    """
+    Against a real primary and streaming replica
+    """
+
+    @pytest.mark.asyncio
+    async def test_routes_to_hot_standby_until_write(self):
+        set_request_user(USER_A)
+        db = DatabaseManager()
+        db.pool = await db._create_pool(PRIMARY_URL, 2)
+        db.replica_pools = [await db._create_pool(REPLICA_URL, 2)]
+        probe = "SELECT pg_is_in_recovery() AS standby"
+        try:
+            assert (await db.execute_query(probe, fetch_one=True, read_only=True))["standby"] is True
+            assert (await db.execute_query(probe, fetch_one=True))["standby"] is False
+
+            await db.execute_query("CREATE TEMP TABLE read_your_writes_probe (id int)")
+            assert (await db.execute_query(probe, fetch_one=True, read_only=True))["standby"] is False
+        finally:
+            await db.close()
@@ -0,0 +1,125 @@
+"""
+FitForge Set Metrics Backfill Tests
+Rep-bucket predecessor lookup, e1RM recompute and the improvement clamp
+"""
+
+import os
+import sys
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+
+# Add project root to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from backend.app.services.set_metrics import SetMetricsBackfill
+
+PRIMARY_URL = os.getenv("DB_TEST_PRIMARY_URL")
+T0 = datetime(2024, 12, 1, 18, 0, tzinfo=timezone.utc)
+
+# (reps, weight_lbs) logged one minute apart, with the metrics the backfill should store
+HISTORY = [
+    ((10, 100), (Decimal("133.33"), None)),               # first set: nothing to compare with
+    ((5, 100), (Decimal("116.67"), None)),                # 10 reps is outside the ±2 bucket
+    ((9, 110), (Decimal("143.00"), Decimal("-1.00"))),    # vs set 1: 990 / 1000
+    ((1, 200), (None, None)),                             # singles have no e1RM
+    ((3, 10), (Decimal("11.00"), Decimal("-85.00"))),     # latest of sets 2 and 4 in 1-5 reps: 30 / 200
+    ((1, 1), (None, Decimal("-96.67"))),                  # vs set 5: 1 / 30
+    ((2, 500), (Decimal("533.33"), Decimal("999.99"))),   # vs set 6: +99900% clamps to DECIMAL(5,2)
+]
+
+
+class FakePlanDatabase:
+    def __init__(self, rows):
+        self.rows = rows
+
+    async def execute_query(self, query, *args, fetch=False, **kwargs):
+        return self.rows
+
+
+class TestPlan:
+    """
+    Whole (user, exercise) histories are packed into batches of ~batch_sets
+    """
+
+    @pytest.mark.asyncio
+    async def test_histories_are_never_split_across_batches(self):
+        user = uuid4()
+        rows = [
+            {"user_id": user, "exercise_id": exercise, "set_count": count}
+            for exercise, count in [("a", 3), ("b", 3), ("c", 9), ("d", 1)]
+        ]
+
+        batches = await SetMetricsBackfill(FakePlanDatabase(rows), batch_sets=6)._plan(None, None, None)
+
+        assert batches == [[(user, "a"), (user, "b")], [(user, "c")], [(user, "d")]]
+
+
+@asynccontextmanager
+async def backfill_database():
+    """DatabaseManager on a real pool, plus a throwaway user with HISTORY logged and metrics scrambled"""
+    from backend.app.core.database import DatabaseManager
+
+    db = DatabaseManager()
+    db.pool = await db._create_pool(PRIMARY_URL, 2)
+    user_id, workout_id = uuid4(), uuid4()
+    await db.pool.execute("INSERT INTO users (id, email) VALUES ($1, $2)", user_id, f"backfill-{user_id}@example.com")
+    try:
+        await db.pool.execute("INSERT INTO workouts (id, user_id) VALUES ($1, $2)", workout_id, user_id)
+        await db.pool.executemany(
+            """
+            INSERT INTO workout_sets (workout_id, exercise_id, user_id, set_number, reps, weight_lbs,
+                                      estimated_one_rep_max, improvement_vs_last, created_at)
+            VALUES ($1, 'bench_press', $2, $3, $4, $5, 1, 1, $6)
+            """,
+            [
+                (workout_id, user_id, n + 1, reps, weight, T0 + timedelta(minutes=n))
+                for n, ((reps, weight), _) in enumerate(HISTORY)
+            ]
+        )
+        yield db, user_id
+    finally:
+        await db.pool.execute("DELETE FROM users WHERE id = $1", user_id)
+        await db.pool.close()
+
+
+async def stored_metrics(db, user_id):
+    rows = await db.pool.fetch(
+        "SELECT estimated_one_rep_max, improvement_vs_last FROM workout_sets WHERE user_id = $1 ORDER BY set_number",
+        user_id
+    )
+    return [(row["estimated_one_rep_max"], row["improvement_vs_last"]) for row in rows]
+
+
+@pytest.mark.skipif(not PRIMARY_URL, reason="set DB_TEST_PRIMARY_URL to backfill against a real database")
+class TestBackfillIntegration:
+    """
+    SetMetricsBackfill.run against a real PostgreSQL database
+    """
+
+    @pytest.mark.asyncio
+    async def test_recompute_matches_the_write_path_rules(self):
+        async with backfill_database() as (db, user_id):
+            progress = await SetMetricsBackfill(db).run(user_id=user_id)
+
+            assert await stored_metrics(db, user_id) == [metrics for _, metrics in HISTORY]
+            assert (progress.sets_scanned, progress.sets_updated, progress.sets_skipped_locked) == (7, 7, 0)
+            assert progress.percent_complete == 100.0
+
+            # Already correct: a second pass scans everything and writes nothing
+            again = await SetMetricsBackfill(db).run(user_id=user_id)
+            assert (again.sets_scanned, again.sets_updated) == (7, 0)
+
+    @pytest.mark.asyncio
+    async def test_range_reads_earlier_sets_but_only_writes_inside_it(self):
+        async with backfill_database() as (db, user_id):
+            progress = await SetMetricsBackfill(db).run(
+                user_id=user_id, since=T0 + timedelta(minutes=5), until=T0 + timedelta(minutes=7)
+            )
+
+            expected = [(Decimal("1"), Decimal("1"))] * 5 + [metrics for _, metrics in HISTORY[5:]]
+            assert await stored_metrics(db, user_id) == expected
+            assert progress.sets_updated == 2
@@ -0,0 +1,92 @@
+"""
+FitForge Startup Tests
+Cold-boot budget for `import main` and lazily loaded routers
+"""
+
+import os
+import subprocess
+import sys
+import time
+
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+
+# Add project root to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from backend.app.core.routing import LazyRouter, include_lazy_router, load_routers
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+# Seconds for a fresh interpreter to import main; override on slow CI runners
+STARTUP_BUDGET_SECONDS = float(os.environ.get("STARTUP_BUDGET_SECONDS", "2.5"))
+
+# Imported on first use only (routers, Supabase client, numpy via analytics)
+LAZY_MODULES = ("supabase", "numpy", "pandas", "scipy", "app.api.auth", "app.api.analytics", "app.models.pydantic_models")
+
+
+def cold_import(code: str) -> subprocess.CompletedProcess:
+    return subprocess.run([sys.executable, "-c", code], cwd=BACKEND_DIR, capture_output=True, text=True, timeout=60)
+
+
+class TestColdBoot:
+    """
+    Importing main stays cheap; python scripts/profile_startup.py shows where time goes
+    """
+
+    def test_import_main_within_budget(self):
+        cold_import("import main")  # compile bytecode outside the measurement
+        timings = []
+        for _ in range(2):
+            started = time.perf_counter()
+            result = cold_import("import main")
+            timings.append(time.perf_counter() - started)
+            assert result.returncode == 0, result.stderr[-2000:]
+
+        assert min(timings) < STARTUP_BUDGET_SECONDS, (
+            f"import main took {min(timings):.2f}s (budget {STARTUP_BUDGET_SECONDS}s); "
+            "see python scripts/profile_startup.py"
+        )
+
+    def test_heavy_modules_not_imported(self):
+        result = cold_import("import main, sys; print('\\n'.join(sys.modules))")
+        assert result.returncode == 0, result.stderr[-2000:]
+
+        loaded = set(result.stdout.split())
+        assert [module for module in LAZY_MODULES if module in loaded] == []
+
+
+def make_router_module(name: str) -> None:
+    """Register an importable module exposing `router`"""
+    module = type(sys)(name)
+    module.router = APIRouter()
+
+    @module.router.get("/items")
+    async def items():
+        return {"module": name}
+
+    sys.modules[name] = module
+
+
+class TestLazyRouter:
+    """
+    Routers load on first request or load_routers(), keeping registration order
+    """
+
+    def test_first_request_loads_router_in_place(self):
+        make_router_module("lazy_router_test_first")
+        make_router_module("lazy_router_test_second")
+        app = FastAPI()
+        include_lazy_router(app, "lazy_router_test_first", prefix="/api/first", tags=["first"])
+        include_lazy_router(app, "lazy_router_test_second", prefix="/api/second", tags=["second"])
+
+        response = TestClient(app).get("/api/second/items")
+
+        assert response.json() == {"module": "lazy_router_test_second"}
+        paths = [getattr(route, "path", None) for route in app.router.routes if not isinstance(route, LazyRouter)]
+        assert "/api/second/items" in paths and "/api/first/items" not in paths
+
+        load_routers(app)
+        paths = [route.path for route in app.router.routes][-2:]
+        assert paths == ["/api/first/items", "/api/second/items"]
+        assert TestClient(app).get("/api/firstitems").status_code == 404
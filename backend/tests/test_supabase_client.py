@@ -0,0 +1,193 @@
+"""
+FitForge Async Supabase Client Tests
+Real supabase-py client against a local HTTP stand-in for the auth service
+
+The stand-in answers each sign-in and logout after a fixed delay, the way a
+remote auth round trip would. The tests check that concurrent logins overlap,
+that the event loop keeps running while they wait, and that a logout only
+revokes the token it was given.
+"""
+
+import asyncio
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from jose import jwt
+from supabase import create_client
+from supabase.lib.client_options import ClientOptions
+
+# Add project root to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from backend.app.core.exceptions import ExternalServiceError
+from backend.app.core.supabase_client import AsyncSupabase
+from backend.app.services.auth import AuthService
+
+ROUND_TRIP = 0.2
+USER_ID = "6a1f7c1e-2b8e-4a47-9d55-0c5f3c7f8a11"
+# supabase-py only accepts JWT-shaped keys
+ANON_KEY = jwt.encode({"role": "anon"}, "stand-in-secret")
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Password grant and logout of the Supabase auth API, and one REST table"""
+
+    # Bearer tokens of every logout request received
+    logouts = []
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        body = json.loads(self.rfile.read(length) or b"{}")
+        time.sleep(ROUND_TRIP)
+        if self.path.startswith("/auth/v1/logout"):
+            self.logouts.append(self.headers["Authorization"].removeprefix("Bearer "))
+            self.send_response(204)
+            self.end_headers()
+            return
+        self._json({
+            "access_token": f"access-{body.get('email')}", "refresh_token": "stand-in-refresh",
+            "token_type": "bearer", "expires_in": 3600,
+            "user": {
+                "id": USER_ID, "aud": "authenticated", "email": body.get("email"),
+                "app_metadata": {}, "user_metadata": {}, "created_at": "2024-12-21T00:00:00Z"
+            }
+        })
+
+    def do_GET(self):
+        self._json([{"id": 1}])
+
+    def _json(self, payload):
+        data = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def supabase_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def client(supabase_url):
+    # No background refresh timer: it would keep the test process alive
+    return create_client(supabase_url, ANON_KEY, options=ClientOptions(auto_refresh_token=False, persist_session=False))
+
+
+async def max_loop_gap(work) -> float:
+    """Longest stretch the event loop went without running a 5ms ticker while work ran"""
+    gaps = []
+    last = time.perf_counter()
+
+    async def ticker():
+        nonlocal last
+        while True:
+            await asyncio.sleep(0.005)
+            now = time.perf_counter()
+            gaps.append(now - last)
+            last = now
+
+    task = asyncio.create_task(ticker())
+    try:
+        await work
+    finally:
+        task.cancel()
+    # Including the stretch since the last tick, for work that never yielded
+    return max(gaps + [time.perf_counter() - last])
+
+
+class FakeProfiles:
+    """DatabaseManager stand-in: the users row of every authenticated id"""
+
+    async def execute_query(self, query, *args, fetch_one=False, **kwargs):
+        return {"id": args[0], "email": "lifter@example.com"}
+
+
+class TestAsyncSupabase:
+    """
+    Blocking client calls run on the dedicated pool, bounded and timed out
+    """
+
+    @pytest.mark.asyncio
+    async def test_concurrent_logins_do_not_block_the_loop(self, client):
+        # Control: the synchronous client called on the loop stalls it for the round trip
+        async def direct():
+            client.auth.sign_in_with_password({"email": "lifter@example.com", "password": "pw"})
+        assert await max_loop_gap(direct()) >= ROUND_TRIP * 0.9
+
+        supabase = AsyncSupabase(client, max_workers=8, max_pending=16, timeout=5)
+        auth_service = AuthService(supabase, FakeProfiles())
+        logins = asyncio.gather(*(
+            auth_service.authenticate_user(f"lifter{n}@example.com", "pw") for n in range(8)
+        ))
+        started = time.perf_counter()
+        gap = await max_loop_gap(logins)
+        elapsed = time.perf_counter() - started
+
+        results = logins.result()
+        assert all(result["supabase_user"].id == USER_ID for result in results)
+        assert results[0]["session"].access_token == "access-lifter0@example.com"
+        assert gap < ROUND_TRIP / 2
+        # Eight round trips overlapped instead of running back to back
+        assert elapsed < ROUND_TRIP * 4
+        assert supabase.pending == 0
+        supabase.close()
+
+    @pytest.mark.asyncio
+    async def test_timeout_raises_and_holds_the_slot_until_the_thread_returns(self, client):
+        supabase = AsyncSupabase(client, max_workers=1, max_pending=4, timeout=ROUND_TRIP / 4)
+        with pytest.raises(ExternalServiceError) as exc_info:
+            await supabase.sign_in_with_password({"email": "lifter@example.com", "password": "pw"})
+        assert exc_info.value.status_code == 502
+        assert supabase.pending == 1
+
+        await asyncio.sleep(ROUND_TRIP * 1.5)
+        assert supabase.pending == 0
+        supabase.close()
+
+    @pytest.mark.asyncio
+    async def test_calls_beyond_max_pending_are_refused(self, client):
+        supabase = AsyncSupabase(client, max_workers=1, max_pending=2, timeout=5)
+        credentials = {"email": "lifter@example.com", "password": "pw"}
+        accepted = [asyncio.create_task(supabase.sign_in_with_password(credentials)) for _ in range(2)]
+        await asyncio.sleep(0)
+
+        with pytest.raises(ExternalServiceError):
+            await supabase.sign_in_with_password(credentials)
+        assert all(response.user.id == USER_ID for response in await asyncio.gather(*accepted))
+        assert await supabase.health_check() is True
+        supabase.close()
+
+    @pytest.mark.asyncio
+    async def test_logout_during_concurrent_logins_revokes_only_its_token(self, client):
+        supabase = AsyncSupabase(client, max_workers=8, max_pending=16, timeout=5)
+        StandInHandler.logouts.clear()
+        leaving = await supabase.sign_in_with_password({"email": "leaving@example.com", "password": "pw"})
+
+        results = await asyncio.gather(
+            *(supabase.sign_in_with_password({"email": f"lifter{n}@example.com", "password": "pw"}) for n in range(4)),
+            supabase.sign_out(leaving.session.access_token),
+            *(supabase.sign_in_with_password({"email": f"lifter{n}@example.com", "password": "pw"}) for n in range(4, 8))
+        )
+
+        logins = results[:4] + results[5:]
+        assert [login.session.access_token for login in logins] == [f"access-lifter{n}@example.com" for n in range(8)]
+        assert StandInHandler.logouts == ["access-leaving@example.com"]
+        # Sessions stay on the per-thread auth clients; the shared client never holds one
+        assert client.auth.get_session() is None
+        supabase.close()
@@ -0,0 +1,139 @@
+"""
+FitForge Sync Tests
+Idempotent replay of offline batches and per-operation rejection
+"""
+
+import os
+import sys
+from contextlib import asynccontextmanager
+from decimal import Decimal
+from types import SimpleNamespace
+from uuid import UUID, uuid4
+
+import asyncpg
+import pytest
+
+# Add project root to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from backend.app.api.sync import SyncRequest, describe_failure, sync_operations
+from backend.app.services.set_metrics import MAX_IMPROVEMENT_PCT, epley_one_rep_max, improvement_pct
+
+PRIMARY_URL = os.getenv("DB_TEST_PRIMARY_URL")
+
+
+class TestSetMetricRules:
+    """
+    Shared e1RM / improvement rules used by POST /api/sync and /api/workout-sets
+    """
+
+    def test_epley_skips_bodyweight_sets_and_singles(self):
+        assert epley_one_rep_max(Decimal("135"), 10) == 180.0
+        assert epley_one_rep_max(Decimal("0"), 10) is None
+        assert epley_one_rep_max(Decimal("135"), 1) is None
+
+    def test_improvement_is_clamped_to_the_column_range(self):
+        assert improvement_pct(Decimal("20"), 5, Decimal("90")) == Decimal("11.11")
+        # 10 -> 200 lbs·reps is +1900%, beyond DECIMAL(5,2)
+        assert improvement_pct(Decimal("20"), 10, Decimal("10")) == Decimal(str(MAX_IMPROVEMENT_PCT))
+        assert improvement_pct(Decimal("20"), 10, None) is None
+        assert improvement_pct(Decimal("20"), 10, Decimal("0")) is None
+
+    def test_data_errors_are_reported_without_driver_detail(self):
+        error = asyncpg.exceptions.NumericValueOutOfRangeError("numeric field overflow")
+        assert describe_failure(error) == "Data validation failed"
+
+
+@asynccontextmanager
+async def sync_database():
+    """DatabaseManager on a real pool, plus a throwaway user deleted (with cascades) afterwards"""
+    from backend.app.core.database import DatabaseManager
+
+    db = DatabaseManager()
+    db.pool = await db._create_pool(PRIMARY_URL, 2)
+    user_id = uuid4()
+    await db.pool.execute("INSERT INTO users (id, email) VALUES ($1, $2)", user_id, f"sync-{user_id}@example.com")
+    try:
+        yield db, SimpleNamespace(id=user_id)
+    finally:
+        await db.pool.execute("DELETE FROM background_jobs WHERE payload->>'user_id' = $1", str(user_id))
+        await db.pool.execute("DELETE FROM users WHERE id = $1", user_id)
+        await db.pool.close()
+
+
+def batch(*operations):
+    return SyncRequest(operations=[
+        {"idempotency_key": key, "type": op_type, "payload": payload}
+        for key, op_type, payload in operations
+    ])
+
+
+@pytest.mark.skipif(not PRIMARY_URL, reason="set DB_TEST_PRIMARY_URL to sync against a real database")
+class TestSyncIntegration:
+    """
+    POST /api/sync against a real PostgreSQL database
+    """
+
+    @pytest.mark.asyncio
+    async def test_replayed_batch_returns_stored_results(self):
+        async with sync_database() as (db, user):
+            workout_id, set_id = str(uuid4()), str(uuid4())
+            request = batch(
+                ("w-1", "workout.create", {"id": workout_id, "workout_type": "Push"}),
+                ("s-1", "set.create", {
+                    "id": set_id, "workout_id": workout_id, "exercise_id": "bench_press",
+                    "set_number": 1, "reps": 10, "weight_lbs": 135
+                }),
+                ("c-1", "workout.complete", {"workout_id": workout_id})
+            )
+
+            first = await sync_operations(request, current_user=user, db=db)
+            assert (first.applied, first.duplicates, first.failed) == (3, 0, 0)
+            assert first.results[1].result["id"] == set_id
+            assert first.results[1].result["estimated_one_rep_max"] == 180.0
+
+            replay = await sync_operations(request, current_user=user, db=db)
+            assert (replay.applied, replay.duplicates, replay.failed) == (0, 3, 0)
+            assert [result.result for result in replay.results] == [result.result for result in first.results]
+            assert await db.pool.fetchval("SELECT COUNT(*) FROM workout_sets WHERE workout_id = $1", UUID(workout_id)) == 1
+            assert await db.pool.fetchval(
+                "SELECT COUNT(*) FROM background_jobs WHERE payload->>'workout_id' = $1", workout_id
+            ) == 2
+
+    @pytest.mark.asyncio
+    async def test_rejected_operations_leave_the_rest_of_the_batch_applied(self):
+        async with sync_database() as (db, user):
+            workout_id = str(uuid4())
+            set_fields = {"workout_id": workout_id, "exercise_id": "bench_press", "reps": 10}
+
+            response = await sync_operations(batch(
+                ("w-1", "workout.create", {"id": workout_id}),
+                ("s-1", "set.create", {**set_fields, "set_number": 1, "weight_lbs": 1}),
+                # 10 -> 200 lbs·reps: improvement clamps instead of overflowing DECIMAL(5,2)
+                ("s-2", "set.create", {**set_fields, "set_number": 2, "weight_lbs": 20}),
+                # Out of int4 range: asyncpg raises DataError for this op alone
+                ("s-3", "set.create", {**set_fields, "set_number": 3, "weight_lbs": 20, "time_under_tension_seconds": 2 ** 40}),
+                ("s-4", "set.create", {**set_fields, "set_number": 2, "weight_lbs": 20}),
+                ("s-5", "set.create", {**set_fields, "workout_id": str(uuid4()), "set_number": 1, "weight_lbs": 20}),
+                ("s-6", "set.create", {**set_fields, "set_number": 4, "weight_lbs": 20.1})
+            ), current_user=user, db=db)
+
+            assert [result.status for result in response.results] == [
+                "applied", "applied", "applied", "failed", "failed", "failed", "failed"
+            ]
+            assert (response.applied, response.duplicates, response.failed) == (3, 0, 4)
+            errors = [result.error for result in response.results[3:]]
+            assert errors[0] == "Data validation failed"
+            assert errors[1] == "Resource already exists"
+            assert errors[2].endswith("not found")
+            assert errors[3].startswith("Invalid payload: weight_lbs")
+
+            stored = await db.pool.fetchval(
+                "SELECT improvement_vs_last FROM workout_sets WHERE workout_id = $1 AND set_number = 2",
+                UUID(workout_id)
+            )
+            assert stored == Decimal("999.99")
+            # Rejected keys were never claimed, so a corrected retry can still apply them
+            assert await db.pool.fetchval(
+                "SELECT COUNT(*) FROM sync_operations WHERE user_id = $1", user.id
+            ) == 3
@@ -0,0 +1,65 @@
+"""
+FitForge Transaction Tests
+Unit of work on one connection with execute_query's error mapping
+"""
+
+import os
+import sys
+from unittest.mock import AsyncMock, MagicMock
+
+import asyncpg
+import pytest
+from fastapi import HTTPException
+
+# Add project root to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from backend.app.core.database import DatabaseManager
+
+
+def transactional_db():
+    """DatabaseManager over a fake pool; returns (db, pool, connection, transaction context)"""
+    tx_context = MagicMock()
+    tx_context.__aenter__ = AsyncMock()
+    tx_context.__aexit__ = AsyncMock(return_value=False)
+    conn = MagicMock()
+    conn.transaction.return_value = tx_context
+    conn.fetchrow = AsyncMock(return_value={"id": 1})
+    conn.execute = AsyncMock(return_value="INSERT 0 1")
+    pool = MagicMock()
+    pool.acquire = AsyncMock(return_value=conn)
+    pool.release = AsyncMock()
+    db = DatabaseManager()
+    db.pool = pool
+    return db, pool, conn, tx_context
+
+
+class TestTransaction:
+    """
+    db.transaction() holds one connection until the block exits
+    """
+
+    @pytest.mark.asyncio
+    async def test_statements_share_one_connection(self):
+        db, pool, conn, tx_context = transactional_db()
+
+        async with db.transaction() as tx:
+            assert await tx.execute_query("SELECT id FROM workouts WHERE id = $1", 1, fetch_one=True) == {"id": 1}
+            await tx.execute_query("INSERT INTO workout_sets (id) VALUES ($1)", 2)
+
+        assert pool.acquire.await_count == 1
+        pool.release.assert_awaited_once_with(conn)
+        assert tx_context.__aexit__.await_args.args[0] is None  # committed
+
+    @pytest.mark.asyncio
+    async def test_errors_map_to_http_and_roll_back(self):
+        db, pool, conn, tx_context = transactional_db()
+        conn.fetchrow.side_effect = asyncpg.exceptions.UniqueViolationError("duplicate key")
+
+        with pytest.raises(HTTPException) as exc_info:
+            async with db.transaction() as tx:
+                await tx.execute_query("INSERT INTO users (id) VALUES ($1) RETURNING *", 1, fetch_one=True)
+
+        assert exc_info.value.status_code == 409
+        assert tx_context.__aexit__.await_args.args[0] is HTTPException  # rolled back
+        pool.release.assert_awaited_once_with(conn)
@@ -0,0 +1,208 @@
+"""
+FitForge User Stats Tests
+Trigger-maintained user_stats / user_exercise_stats and the reconcile job
+"""
+
+import os
+import sys
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from uuid import UUID, uuid4
+
+import asyncpg
+import pytest
+
+# Add project root to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from backend.app.core.jobs import JobQueue
+from backend.app.services import user_stats
+from backend.app.services.user_stats import reconcile_user_stats, register_user_stats_jobs
+
+PRIMARY_URL = os.getenv("DB_TEST_PRIMARY_URL")
+STARTED_AT = datetime(2024, 12, 21, 18, 30, tzinfo=timezone.utc)
+# Sorts after every uuid4, so walks starting here only see this file's users
+RANGE_START = UUID("ffffffff-ffff-ffff-ffff-ff0000000000")
+
+pytestmark = pytest.mark.skipif(not PRIMARY_URL, reason="set DB_TEST_PRIMARY_URL to run user stats against a real database")
+
+
+@asynccontextmanager
+async def stats_database(*user_ids: UUID):
+    """
+    DatabaseManager with the given throwaway users, and background_jobs in a
+    scratch schema so queued reconcile jobs are isolated from real ones
+    """
+    from backend.app.core.database import DatabaseManager
+
+    schema = f"stats_test_{uuid4().hex[:12]}"
+    admin = await asyncpg.connect(PRIMARY_URL)
+    await admin.execute(f"""
+        CREATE SCHEMA {schema};
+        CREATE TABLE {schema}.background_jobs (LIKE public.background_jobs INCLUDING ALL);
+    """)
+    await admin.executemany(
+        "INSERT INTO users (id, email) VALUES ($1, $2)",
+        [(user_id, f"stats-{user_id}@example.com") for user_id in user_ids]
+    )
+    db = DatabaseManager()
+    separator = "&" if "?" in PRIMARY_URL else "?"
+    db.pool = await db._create_pool(f"{PRIMARY_URL}{separator}search_path={schema},public", 2)
+    try:
+        yield db
+    finally:
+        await db.pool.close()
+        await admin.execute("DELETE FROM users WHERE id = ANY($1::uuid[])", list(user_ids))
+        await admin.execute(f"DROP SCHEMA {schema} CASCADE")
+        await admin.close()
+
+
+async def summary(db, user_id):
+    return await db.pool.fetchrow(
+        """
+        SELECT total_workouts, total_volume_lbs, total_sets, total_reps, total_duration_seconds,
+               timed_workouts, first_workout_at, last_workout_at
+        FROM user_stats WHERE user_id = $1
+        """,
+        user_id
+    )
+
+
+async def exercise_stats(db, user_id):
+    return await db.pool.fetchrow(
+        "SELECT set_count, total_volume_lbs, best_set_id, best_volume_lbs FROM user_exercise_stats WHERE user_id = $1",
+        user_id
+    )
+
+
+async def assert_consistent(db, user_id):
+    """The trigger-maintained rows equal a recompute from source rows"""
+    result = await reconcile_user_stats(db, [user_id])
+    assert (result["summary_rows_fixed"], result["exercise_rows_fixed"]) == (0, 0)
+
+
+class TestTriggerMaintainedStats:
+    """
+    Set and workout writes move the summary rows by delta
+    """
+
+    @pytest.mark.asyncio
+    async def test_sets_and_completion_keep_stats_current(self):
+        user_id, workout_id = uuid4(), uuid4()
+        async with stats_database(user_id) as db:
+            await db.pool.execute(
+                "INSERT INTO workouts (id, user_id, started_at) VALUES ($1, $2, $3)", workout_id, user_id, STARTED_AT
+            )
+            best_id, other_id = await db.pool.fetchval(
+                """
+                WITH inserted AS (
+                    INSERT INTO workout_sets (workout_id, exercise_id, user_id, set_number, reps, weight_lbs)
+                    VALUES ($1, 'bench_press', $2, 1, 10, 100), ($1, 'bench_press', $2, 2, 5, 150)
+                    RETURNING id, set_number
+                )
+                SELECT array_agg(id ORDER BY set_number) FROM inserted
+                """,
+                workout_id,
+                user_id
+            )
+
+            # Sets count per exercise right away; the workout only once completed
+            assert tuple(await exercise_stats(db, user_id)) == (2, 1750, best_id, 1000)
+            assert await summary(db, user_id) is None
+            await assert_consistent(db, user_id)
+
+            await db.pool.execute(
+                "UPDATE workouts SET is_completed = true, ended_at = $2 WHERE id = $1",
+                workout_id,
+                STARTED_AT + timedelta(hours=1)
+            )
+            assert tuple(await summary(db, user_id)) == (1, 1750, 2, 15, 3600, 1, STARTED_AT, STARTED_AT)
+            await assert_consistent(db, user_id)
+
+            # Deleting the best set re-reads it from the remaining sets
+            await db.pool.execute("DELETE FROM workout_sets WHERE id = $1", best_id)
+            assert tuple(await exercise_stats(db, user_id)) == (1, 750, other_id, 750)
+            assert tuple(await summary(db, user_id))[:4] == (1, 750, 1, 5)
+            await assert_consistent(db, user_id)
+
+            await db.pool.execute("UPDATE workouts SET is_completed = false WHERE id = $1", workout_id)
+            assert tuple(await summary(db, user_id)) == (0, 0, 0, 0, 0, 0, None, None)
+            await assert_consistent(db, user_id)
+
+
+class TestReconcile:
+    """
+    Drifted rows are rewritten from source rows; correct rows are left alone
+    """
+
+    @pytest.mark.asyncio
+    async def test_drift_is_corrected_once(self):
+        user_id, workout_id = uuid4(), uuid4()
+        async with stats_database(user_id) as db:
+            await db.pool.execute(
+                "INSERT INTO workouts (id, user_id, is_completed) VALUES ($1, $2, true)", workout_id, user_id
+            )
+            await db.pool.execute(
+                """
+                INSERT INTO workout_sets (workout_id, exercise_id, user_id, set_number, reps, weight_lbs)
+                VALUES ($1, 'bench_press', $2, 1, 10, 100)
+                """,
+                workout_id,
+                user_id
+            )
+            expected_summary, expected_exercise = await summary(db, user_id), await exercise_stats(db, user_id)
+            other_exercise = await db.pool.fetchval("SELECT id FROM exercises WHERE id <> 'bench_press' LIMIT 1")
+
+            # A lost delta, a lost row and a row with no sets behind it
+            await db.pool.execute("UPDATE user_stats SET total_workouts = 99 WHERE user_id = $1", user_id)
+            await db.pool.execute("DELETE FROM user_exercise_stats WHERE user_id = $1", user_id)
+            await db.pool.execute(
+                "INSERT INTO user_exercise_stats (user_id, exercise_id, set_count) VALUES ($1, $2, 4)",
+                user_id,
+                other_exercise
+            )
+
+            result = await reconcile_user_stats(db, [user_id])
+            assert (result["users_checked"], result["summary_rows_fixed"], result["exercise_rows_fixed"]) == (1, 1, 2)
+            assert await summary(db, user_id) == expected_summary
+            assert await exercise_stats(db, user_id) == expected_exercise
+            await assert_consistent(db, user_id)
+
+    @pytest.mark.asyncio
+    async def test_walk_stops_at_max_users_and_resumes_after_the_last_one(self):
+        user_ids = sorted(UUID(f"ffffffff-ffff-ffff-ffff-ff{uuid4().hex[:10]}") for _ in range(3))
+        async with stats_database(*user_ids) as db:
+            first = await reconcile_user_stats(db, batch_users=1, after=RANGE_START, max_users=2)
+            assert (first["users_checked"], first["resume_after"]) == (2, user_ids[1])
+
+            rest = await reconcile_user_stats(db, batch_users=1, after=first["resume_after"], max_users=2)
+            assert (rest["users_checked"], rest["resume_after"]) == (1, None)
+
+    @pytest.mark.asyncio
+    async def test_job_queues_the_next_user_range_when_it_completes(self, monkeypatch):
+        monkeypatch.setattr(user_stats, "RECONCILE_JOB_USERS", 2)
+        user_ids = sorted(UUID(f"ffffffff-ffff-ffff-ffff-ff{uuid4().hex[:10]}") for _ in range(3))
+        async with stats_database(*user_ids) as db:
+            # Summary rows for users without a completed workout are all drift
+            await db.pool.executemany(
+                "INSERT INTO user_stats (user_id, total_workouts) VALUES ($1, 5)", [(user_id,) for user_id in user_ids]
+            )
+            queue = JobQueue(db)
+            register_user_stats_jobs(queue)
+            await queue.enqueue("user_stats.reconcile", {"after": str(RANGE_START)})
+
+            assert await queue.run_next() is True
+            jobs = await db.pool.fetch("SELECT status, payload->>'after' AS after FROM background_jobs ORDER BY created_at")
+            assert [(job["status"], job["after"]) for job in jobs] == [
+                ("done", str(RANGE_START)), ("pending", str(user_ids[1]))
+            ]
+            assert await db.pool.fetchval(
+                "SELECT COUNT(*) FROM user_stats WHERE user_id = ANY($1::uuid[]) AND total_workouts = 0", user_ids
+            ) == 2
+
+            assert await queue.run_next() is True
+            assert await queue.run_next() is False
+            assert await db.pool.fetchval("SELECT COUNT(*) FROM background_jobs WHERE status = 'done'") == 2
+            assert await db.pool.fetchval(
+                "SELECT COUNT(*) FROM user_stats WHERE user_id = ANY($1::uuid[]) AND total_workouts = 0", user_ids
+            ) == 3
@@ -0,0 +1,181 @@
+"""
+FitForge Workout Import Tests
+Row normalization, streaming JSON parsing, exercise name matching and staging
+"""
+
+import asyncio
+import io
+import os
+import sys
+import threading
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+
+# Add project root to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from backend.app.services import workout_import
+from backend.app.services.workout_import import (
+    ExerciseNameIndex,
+    ImportFormatError,
+    ImportSummary,
+    WorkoutImportService,
+    iter_csv_records,
+    iter_json_records,
+    normalize_record
+)
+
+
+class TestNormalizeRecord:
+    """
+    One source row to one staging tuple, or a ValueError naming the bad cell
+    """
+
+    def test_strong_style_row(self):
+        row = normalize_record({
+            "Date": "2024-12-21 18:30:00", "Workout Name": " Push ", "Exercise Name": "Bench Press (Barbell)",
+            "Set Order": "2", "Weight": "60", "Reps": "8.0", "RPE": "8"
+        }, 7, default_unit="kg")
+
+        assert row == (
+            7, datetime(2024, 12, 21, 18, 30, tzinfo=timezone.utc), "Push", "Bench Press (Barbell)",
+            2, 8, Decimal("132.25"), 8
+        )
+
+    def test_warmups_are_skipped_and_rpe_outside_range_dropped(self):
+        base = {"date": "2024-12-21", "exercise": "Squat", "reps": "5", "weight_lbs": "225"}
+        assert normalize_record({**base, "warmup": "true"}, 1) is None
+        assert normalize_record({**base, "rpe": "11"}, 1)[-1] is None
+
+    @pytest.mark.parametrize("cells, message", [
+        ({"reps": "inf"}, "reps 'inf' out of range"),
+        ({"reps": "5", "set_number": "1e400"}, "set_number '1e400' out of range"),
+        ({"reps": "nan"}, "cannot convert float NaN"),
+        ({"reps": "5", "weight": "1e400"}, "invalid weight '1e400'"),
+        ({"reps": "5", "weight": "nan"}, "invalid weight 'nan'"),
+        ({"reps": "5", "weight": "-inf"}, "invalid weight '-inf'"),
+        ({"reps": "5", "weight": "501"}, "outside 0-500"),
+        ({"reps": "51"}, "reps 51 outside 1-50"),
+        ({}, "date, exercise and reps are required"),
+        ({"reps": "5", "date": "yesterday"}, "unrecognized date"),
+    ])
+    def test_bad_cells_raise_value_error(self, cells, message):
+        row = {"date": "2024-12-21", "exercise": "Squat", **cells}
+        with pytest.raises(ValueError, match=message):
+            normalize_record(row, 1)
+
+
+class TestIterJsonRecords:
+    """
+    JSON arrays and NDJSON are read incrementally, one object at a time
+    """
+
+    def test_array_and_ndjson_yield_the_same_records(self):
+        records = [{"exercise": "Squat", "reps": n} for n in range(3)]
+        array = '[{"exercise": "Squat", "reps": 0},\n {"exercise": "Squat", "reps": 1}, {"exercise": "Squat", "reps": 2}]'
+        ndjson = "\n".join(f'{{"exercise": "Squat", "reps": {n}}}' for n in range(3)) + "\n"
+
+        assert list(iter_json_records(io.StringIO(array))) == records
+        assert list(iter_json_records(io.StringIO(ndjson))) == records
+
+    def test_objects_split_across_reads(self, monkeypatch):
+        monkeypatch.setattr(workout_import, "JSON_READ_SIZE", 7)
+        records = [{"exercise": "Bench Press", "notes": "x" * 20, "reps": n} for n in range(50)]
+        text = "[" + ",".join(f'{{"exercise": "Bench Press", "notes": "{"x" * 20}", "reps": {n}}}' for n in range(50)) + "]"
+
+        assert list(iter_json_records(io.StringIO(text))) == records
+
+    def test_malformed_and_non_object_documents_are_format_errors(self):
+        with pytest.raises(ImportFormatError, match="Malformed JSON"):
+            list(iter_json_records(io.StringIO('[{"reps": 5}, {"reps": ')))
+        with pytest.raises(ImportFormatError, match="must contain objects"):
+            list(iter_json_records(io.StringIO("[1, 2]")))
+
+
+class TestExerciseNameIndex:
+    """
+    Exact names and IDs win; otherwise the closest token match
+    """
+
+    CATALOG = [
+        {"id": "bench_press", "name": "Bench Press"},
+        {"id": "incline_bench_press", "name": "Incline Bench Press"},
+        {"id": "squat", "name": "Barbell Back Squat"},
+        {"id": "pullup", "name": "Pull-up"},
+    ]
+
+    def test_exact_name_and_id(self):
+        index = ExerciseNameIndex(self.CATALOG)
+        assert index.match("bench press") == "bench_press"
+        assert index.match("Incline_Bench_Press") == "incline_bench_press"
+        assert index.match("Pull Up") == "pullup"
+
+    def test_token_subset_prefers_the_most_shared_tokens(self):
+        index = ExerciseNameIndex(self.CATALOG)
+        assert index.match("Bench Press (Barbell)") == "bench_press"
+        assert index.match("Incline Bench Press (Dumbbell)") == "incline_bench_press"
+        assert index.match("Squat") == "squat"
+
+    def test_no_match(self):
+        assert ExerciseNameIndex(self.CATALOG).match("Deadlift (Barbell)") is None
+
+
+class FakeStagingConnection:
+    """Collects the COPY batches instead of writing them"""
+
+    def __init__(self):
+        self.batches = []
+
+    async def copy_records_to_table(self, table, records, columns):
+        self.batches.append(list(records))
+
+
+class TestStaging:
+    """
+    Parsing runs on a worker thread in batches; bad cells reject rows, not the upload
+    """
+
+    @pytest.mark.asyncio
+    async def test_rows_are_normalized_off_the_loop_and_copied_in_batches(self, monkeypatch):
+        monkeypatch.setattr(workout_import, "IMPORT_BATCH_SIZE", 4)
+        loop_thread = threading.get_ident()
+        parse_threads = set()
+        lines = ["date,exercise,reps,weight,warmup"]
+        lines += [f"2024-12-21,Squat,5,{100 + n},no" for n in range(9)]
+        lines += ["2024-12-21,Squat,inf,100,no", "2024-12-21,Squat,5,1e400,no", "2024-12-21,Squat,5,45,yes"]
+
+        def records():
+            for record in iter_csv_records(io.StringIO("\n".join(lines))):
+                parse_threads.add(threading.get_ident())
+                yield record
+
+        conn = FakeStagingConnection()
+        summary = ImportSummary()
+        await WorkoutImportService(db=None)._stage(conn, records(), "lbs", summary)
+
+        assert parse_threads and loop_thread not in parse_threads
+        assert [len(batch) for batch in conn.batches] == [4, 4, 1]
+        assert (summary.rows_read, summary.rows_rejected, summary.warmup_sets_skipped) == (12, 2, 1)
+        assert summary.errors == ["row 10: reps 'inf' out of range", "row 11: invalid weight '1e400'"]
+
+    @pytest.mark.asyncio
+    async def test_loop_keeps_running_while_a_batch_is_parsed(self):
+        started, release = threading.Event(), threading.Event()
+
+        def records():
+            started.set()
+            release.wait(5)
+            yield {"date": "2024-12-21", "exercise": "Squat", "reps": "5"}
+
+        conn = FakeStagingConnection()
+        stage = asyncio.create_task(WorkoutImportService(db=None)._stage(conn, records(), "lbs", ImportSummary()))
+        while not started.is_set():
+            await asyncio.sleep(0.001)
+        # The parser is blocked mid-batch, yet this coroutine still gets scheduled
+        await asyncio.sleep(0.01)
+        assert not stage.done()
+        release.set()
+        await stage
+        assert len(conn.batches) == 1
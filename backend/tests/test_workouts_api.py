@@ -12,11 +12,12 @@ CRITICAL: These tests validate the recent fixes for:
 import pytest
 import asyncio
 from datetime import datetime, date
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock
 from fastapi.testclient import TestClient
 from fastapi import HTTPException
 import sys
 import os
+from contextlib import asynccontextmanager
 
 # Add project root to path for imports
 sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
@@ -25,10 +26,18 @@ from backend.app.api.workouts import (
     get_workouts, 
     get_workout, 
     create_workout, 
-    complete_workout,
-    update_muscle_states
+    complete_workout
 )
-from backend.app.core.database import DatabaseManager, DatabaseUtils
+from backend.app.core.database import DatabaseManager, DatabaseUtils, NamedQuery, ReadQuery, normalize_sql, register_query
+
+
+def run_transactions_inline(db):
+    """Make db.transaction() yield the mock itself, so execute_query assertions still see every call"""
+    @asynccontextmanager
+    async def transaction(isolation=None):
+        yield db
+    db.transaction = transaction
+    return db
 
 
 class TestSQLSecurityFixes:
@@ -218,7 +227,7 @@ class TestVolumeCalculationFixes:
     def mock_db(self):
         db = AsyncMock(spec=DatabaseManager)
         db.execute_query = AsyncMock()
-        return db
+        return run_transactions_inline(db)
 
     @pytest.fixture
     def mock_workout_data(self):
@@ -254,23 +263,13 @@ class TestVolumeCalculationFixes:
         # Mock workout exists and is not completed
         mock_db.execute_query.side_effect = [
             mock_workout_data,  # First call: get workout
-            [  # Second call: get workout sets with muscle engagement
-                {
-                    "volume_lbs": 250.0,  # Pre-calculated by database trigger
-                    "muscle_engagement_data": {"Pectoralis_Major": 80, "Triceps": 60}
-                }
-            ],
-            mock_completed_workout  # Third call: update completion, returns trigger-calculated values
+            mock_completed_workout  # Second call: update completion, returns trigger-calculated values
         ]
         
-        # Mock muscle state update
-        with patch('backend.app.api.workouts.update_muscle_states') as mock_update:
-            mock_update.return_value = None
-            
-            result = await complete_workout("workout-123", mock_db)
+        result = await complete_workout("workout-123", mock_db)
         
         # Verify the completion UPDATE query does NOT calculate volume manually
-        completion_call = mock_db.execute_query.call_args_list[2]  # Third call
+        completion_call = mock_db.execute_query.call_args_list[1]  # Second call
         completion_query = completion_call[0][0]
         
         # Critical Fix Validation: No manual volume calculation in UPDATE
@@ -285,36 +284,34 @@ class TestVolumeCalculationFixes:
 
     @pytest.mark.asyncio
     async def test_complete_workout_no_python_volume_calculation(self, mock_db, mock_workout_data, mock_completed_workout):
-        """Test that Python does not duplicate database trigger calculations"""
+        """Test that completion defers set processing to background jobs"""
         mock_db.execute_query.side_effect = [
             mock_workout_data,
-            [{"volume_lbs": 300.0, "muscle_engagement_data": {}}],
-            mock_completed_workout
+            {**mock_completed_workout, "post_processing_job_ids": ["job-1", "job-2"]}
         ]
         
-        with patch('backend.app.api.workouts.update_muscle_states'):
-            result = await complete_workout("workout-123", mock_db)
+        result = await complete_workout("workout-123", mock_db)
         
-        # Verify muscle fatigue calculation uses pre-calculated volume_lbs
-        # (not manually calculating weight * reps)
-        muscle_sets_call = mock_db.execute_query.call_args_list[1]
-        muscle_query = muscle_sets_call[0][0]
+        # Sets are not fetched or aggregated before responding
+        assert mock_db.execute_query.call_count == 2
+        for call in mock_db.execute_query.call_args_list:
+            assert "workout_sets" not in call[0][0], "Completion should not read sets inline"
         
-        # Query should select volume_lbs (pre-calculated by trigger)
-        assert "volume_lbs" in muscle_query or "ws.*" in muscle_query, \
-            "Should use pre-calculated volume_lbs from database"
+        # Follow-up work is queued in the same statement that completes the workout
+        completion_query = mock_db.execute_query.call_args_list[1][0][0]
+        assert "INSERT INTO background_jobs" in completion_query
+        assert result["post_processing"] == {"status": "queued", "job_ids": ["job-1", "job-2"]}
+        assert "post_processing_job_ids" not in result["workout"]
 
     @pytest.mark.asyncio
     async def test_workout_metrics_consistency(self, mock_db, mock_workout_data, mock_completed_workout):
         """Test that returned metrics match database-calculated values exactly"""
         mock_db.execute_query.side_effect = [
             mock_workout_data,
-            [{"volume_lbs": 100.0, "muscle_engagement_data": {}}],
             mock_completed_workout
         ]
         
-        with patch('backend.app.api.workouts.update_muscle_states'):
-            result = await complete_workout("workout-123", mock_db)
+        result = await complete_workout("workout-123", mock_db)
         
         # Verify metrics are extracted from database response, not calculated
         workout_data = result["workout"]
@@ -336,7 +333,7 @@ class TestDatabaseIntegration:
     @pytest.fixture
     def mock_db(self):
         db = AsyncMock(spec=DatabaseManager)
-        return db
+        return run_transactions_inline(db)
 
     @pytest.mark.asyncio
     async def test_get_workout_not_found_handling(self, mock_db):
@@ -392,6 +389,79 @@ class TestDatabaseIntegration:
         assert "Failed to retrieve workout" in exc_info.value.detail
 
 
+class TestDatabaseFanOut:
+    """
+    Concurrent independent reads via DatabaseManager.fan_out
+    """
+
+    @pytest.mark.asyncio
+    async def test_fan_out_respects_connection_budget(self):
+        """Queries overlap up to the budget and results keep query order"""
+        db = DatabaseManager()
+        in_flight, peak = 0, 0
+
+        async def fake_execute_query(query, *args, fetch=False, fetch_one=False, read_only=False):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {"query": query} if fetch_one else [query, *args]
+
+        db.execute_query = fake_execute_query
+        results = await db.fan_out(
+            [ReadQuery("q0", (1,), fetch_one=True)] + [ReadQuery(f"q{n}", (n,)) for n in range(1, 5)],
+            max_connections=2
+        )
+
+        assert results == [{"query": "q0"}, ["q1", 1], ["q2", 2], ["q3", 3], ["q4", 4]]
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_fan_out_failure_cancels_remaining_queries(self):
+        """The first HTTPException propagates and slower queries are cancelled"""
+        db = DatabaseManager()
+        cancelled = []
+
+        async def fake_execute_query(query, *args, fetch=False, fetch_one=False, read_only=False):
+            if query == "bad":
+                raise HTTPException(status_code=500, detail="Database operation failed")
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(query)
+                raise
+
+        db.execute_query = fake_execute_query
+        with pytest.raises(HTTPException):
+            await db.fan_out([ReadQuery("slow"), ReadQuery("bad")], max_connections=2)
+
+        assert cancelled == ["slow"]
+
+
+class TestStatementRegistry:
+    """
+    Named queries and query-builder normalization for the statement cache
+    """
+
+    def test_builder_shapes_normalize_to_one_statement(self):
+        """Indentation and line comments do not change the cache key; literals keep their spacing"""
+        a = "SELECT *\n    FROM workouts  -- hot path\n    WHERE user_id = $1 AND notes = 'a  b'"
+        b = "  SELECT * FROM workouts\nWHERE user_id = $1   AND notes = 'a  b'  "
+
+        assert normalize_sql(a) == normalize_sql(b)
+        assert normalize_sql(a) == "SELECT * FROM workouts WHERE user_id = $1 AND notes = 'a  b'"
+
+    def test_register_query_is_idempotent_per_name(self):
+        """Re-registering the same SQL returns an equal NamedQuery; different SQL is rejected"""
+        first = register_query("tests.by_id", "SELECT * FROM workouts WHERE id = $1")
+        again = register_query("tests.by_id", "SELECT *\n  FROM workouts WHERE id = $1")
+
+        assert isinstance(first, NamedQuery) and first == again and first.name == "tests.by_id"
+        with pytest.raises(ValueError):
+            register_query("tests.by_id", "SELECT id FROM workouts WHERE id = $1")
+
+
 class TestRegressionPrevention:
     """
     Test Suite 5: Regression Prevention
@@ -161,6 +161,101 @@ CREATE TABLE workout_sets (
     UNIQUE(workout_id, exercise_id, set_number)
 );
 
+-- ============================================================================
+-- WORKOUT_EXERCISE_COUNTS TABLE
+-- Per-workout set counts by exercise, maintained by update_workout_metrics()
+-- so workouts.exercises_count can be adjusted without COUNT(DISTINCT ...)
+-- ============================================================================
+CREATE TABLE workout_exercise_counts (
+    workout_id UUID NOT NULL REFERENCES workouts(id) ON DELETE CASCADE,
+    exercise_id TEXT NOT NULL,
+    set_count INTEGER NOT NULL DEFAULT 0,
+    
+    PRIMARY KEY (workout_id, exercise_id)
+);
+
+-- ============================================================================
+-- SYNC_OPERATIONS TABLE
+-- Idempotency keys of offline client writes applied through POST /api/sync
+-- ============================================================================
+CREATE TABLE sync_operations (
+    user_id UUID NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+    idempotency_key TEXT NOT NULL CHECK (length(idempotency_key) BETWEEN 1 AND 128),
+    operation_type TEXT NOT NULL CHECK (operation_type IN ('workout.create', 'set.create', 'workout.complete')),
+    
+    -- Compact result returned again when the client replays the same key
+    result JSONB NOT NULL DEFAULT '{}',
+    applied_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    
+    PRIMARY KEY (user_id, idempotency_key)
+);
+
+-- ============================================================================
+-- BACKGROUND_JOBS TABLE
+-- Durable queue for work deferred past the API response (claimed with SKIP LOCKED)
+-- ============================================================================
+CREATE TABLE background_jobs (
+    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    job_type TEXT NOT NULL,
+    payload JSONB NOT NULL DEFAULT '{}',
+    
+    -- Lifecycle: pending -> running -> done, or back to pending for a retry, or failed
+    status TEXT NOT NULL DEFAULT 'pending' CHECK (status IN ('pending', 'running', 'done', 'failed')),
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL DEFAULT 5 CHECK (max_attempts > 0),
+    last_error TEXT,
+    
+    -- Scheduling: not claimable before run_after; a running job is reclaimable after locked_until
+    run_after TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    locked_until TIMESTAMPTZ,
+    
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    started_at TIMESTAMPTZ,
+    finished_at TIMESTAMPTZ
+);
+
+-- ============================================================================
+-- USER_STATS TABLE
+-- Lifetime totals over completed workouts, maintained by update_user_stats()
+-- ============================================================================
+CREATE TABLE user_stats (
+    user_id UUID PRIMARY KEY REFERENCES users(id) ON DELETE CASCADE,
+    
+    -- Sums over completed workouts (workouts.total_* are themselves trigger-maintained)
+    total_workouts INTEGER NOT NULL DEFAULT 0,
+    total_volume_lbs NUMERIC(14,2) NOT NULL DEFAULT 0,
+    total_sets BIGINT NOT NULL DEFAULT 0,
+    total_reps BIGINT NOT NULL DEFAULT 0,
+    total_duration_seconds BIGINT NOT NULL DEFAULT 0,
+    timed_workouts INTEGER NOT NULL DEFAULT 0, -- Completed workouts with a duration, for the average
+    first_workout_at TIMESTAMPTZ,
+    last_workout_at TIMESTAMPTZ,
+    
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+-- ============================================================================
+-- USER_EXERCISE_STATS TABLE
+-- Per-exercise set count, volume and best set, maintained by update_user_exercise_stats()
+-- ============================================================================
+CREATE TABLE user_exercise_stats (
+    user_id UUID NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+    exercise_id TEXT NOT NULL REFERENCES exercises(id),
+    
+    -- Over all of the user's sets of the exercise
+    set_count INTEGER NOT NULL DEFAULT 0,
+    total_volume_lbs NUMERIC(14,2) NOT NULL DEFAULT 0,
+    
+    -- Highest-volume set, latest first on ties
+    best_set_id UUID,
+    best_volume_lbs NUMERIC(8,2),
+    best_weight_lbs NUMERIC(6,2),
+    best_reps INTEGER,
+    best_set_at TIMESTAMPTZ,
+    
+    PRIMARY KEY (user_id, exercise_id)
+);
+
 -- ============================================================================
 -- MUSCLE_STATES TABLE
 -- Calculated muscle fatigue and recovery data
@@ -238,54 +333,212 @@ CREATE INDEX idx_muscle_states_user_muscle ON muscle_states(user_id, muscle_name
 CREATE INDEX idx_muscle_states_calculation ON muscle_states(calculation_timestamp DESC);
 CREATE INDEX idx_muscle_states_fatigue ON muscle_states(user_id, fatigue_percentage DESC);
 
+-- Sync idempotency retention (prune applied keys by age)
+CREATE INDEX idx_sync_operations_applied_at ON sync_operations(applied_at);
+
+-- Job claiming (ready and lease-expired jobs) and retention pruning
+CREATE INDEX idx_background_jobs_claim ON background_jobs(run_after) WHERE status IN ('pending', 'running');
+CREATE INDEX idx_background_jobs_finished ON background_jobs(finished_at) WHERE status = 'done';
+
 -- ============================================================================
 -- FUNCTIONS FOR AUTOMATIC UPDATES
 -- Maintain calculated fields and enforce business logic
 -- ============================================================================
 
--- Function to update workout metrics when sets are added/updated
+-- Function to update workout metrics when sets are added/updated/deleted.
+-- Runs once per statement and applies deltas from the transition tables, so a
+-- bulk insert of N sets costs O(N) instead of re-aggregating the workout per row.
 CREATE OR REPLACE FUNCTION update_workout_metrics()
-RETURNS TRIGGER AS $$
+RETURNS TRIGGER
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+    delta_workout_ids UUID[];
+    delta_exercise_ids TEXT[];
+    delta_sets BIGINT[];
+    delta_volume NUMERIC[];
+    delta_reps BIGINT[];
 BEGIN
-    -- Update workout totals
-    UPDATE workouts SET
-        total_volume_lbs = (
-            SELECT COALESCE(SUM(volume_lbs), 0)
-            FROM workout_sets 
-            WHERE workout_id = COALESCE(NEW.workout_id, OLD.workout_id)
-        ),
-        total_sets = (
-            SELECT COUNT(*)
-            FROM workout_sets 
-            WHERE workout_id = COALESCE(NEW.workout_id, OLD.workout_id)
+    -- Inserts only add sets, so they take a shorter path straight off new_rows:
+    -- every count they touch ends up positive, an exercise is new to the workout
+    -- exactly when its count row is created, and the workout cannot be in the
+    -- middle of a cascade delete. A single-set insert, the app's most common
+    -- write, then runs one statement instead of two.
+    IF TG_OP = 'INSERT' THEN
+        WITH deltas AS (
+            SELECT workout_id, exercise_id,
+                   COUNT(*) AS d_sets,
+                   COALESCE(SUM(volume_lbs), 0) AS d_volume,
+                   COALESCE(SUM(reps), 0) AS d_reps
+            FROM new_rows
+            GROUP BY workout_id, exercise_id
         ),
-        total_reps = (
-            SELECT COALESCE(SUM(reps), 0)
-            FROM workout_sets 
-            WHERE workout_id = COALESCE(NEW.workout_id, OLD.workout_id)
+        counts AS (
+            INSERT INTO workout_exercise_counts AS c (workout_id, exercise_id, set_count)
+            SELECT workout_id, exercise_id, d_sets
+            FROM deltas
+            ON CONFLICT (workout_id, exercise_id)
+            DO UPDATE SET set_count = c.set_count + EXCLUDED.set_count
+            RETURNING c.workout_id, c.exercise_id, c.set_count
         ),
-        exercises_count = (
-            SELECT COUNT(DISTINCT exercise_id)
-            FROM workout_sets 
-            WHERE workout_id = COALESCE(NEW.workout_id, OLD.workout_id)
+        exercise_deltas AS (
+            SELECT counts.workout_id, COUNT(*) AS d_exercises
+            FROM counts
+            JOIN deltas USING (workout_id, exercise_id)
+            WHERE counts.set_count = deltas.d_sets
+            GROUP BY counts.workout_id
         ),
-        updated_at = NOW()
-    WHERE id = COALESCE(NEW.workout_id, OLD.workout_id);
+        workout_deltas AS (
+            SELECT workout_id,
+                   SUM(d_sets) AS d_sets,
+                   SUM(d_volume) AS d_volume,
+                   SUM(d_reps) AS d_reps
+            FROM deltas
+            GROUP BY workout_id
+        )
+        UPDATE workouts w SET
+            total_volume_lbs = COALESCE(w.total_volume_lbs, 0) + wd.d_volume,
+            total_sets = COALESCE(w.total_sets, 0) + wd.d_sets,
+            total_reps = COALESCE(w.total_reps, 0) + wd.d_reps,
+            exercises_count = COALESCE(w.exercises_count, 0) + COALESCE(ed.d_exercises, 0),
+            updated_at = NOW()
+        FROM workout_deltas wd
+        LEFT JOIN exercise_deltas ed USING (workout_id)
+        WHERE w.id = wd.workout_id;
+        
+        RETURN NULL;
+    END IF;
     
-    RETURN COALESCE(NEW, OLD);
+    -- Collapse the affected rows into one delta per (workout, exercise)
+    IF TG_OP = 'DELETE' THEN
+        SELECT array_agg(workout_id), array_agg(exercise_id),
+               array_agg(d_sets), array_agg(d_volume), array_agg(d_reps)
+        INTO delta_workout_ids, delta_exercise_ids, delta_sets, delta_volume, delta_reps
+        FROM (
+            SELECT workout_id, exercise_id,
+                   -COUNT(*) AS d_sets,
+                   -COALESCE(SUM(volume_lbs), 0) AS d_volume,
+                   -COALESCE(SUM(reps), 0) AS d_reps
+            FROM old_rows
+            GROUP BY workout_id, exercise_id
+        ) d;
+    ELSE
+        SELECT array_agg(workout_id), array_agg(exercise_id),
+               array_agg(d_sets), array_agg(d_volume), array_agg(d_reps)
+        INTO delta_workout_ids, delta_exercise_ids, delta_sets, delta_volume, delta_reps
+        FROM (
+            SELECT workout_id, exercise_id,
+                   SUM(d_sets) AS d_sets,
+                   SUM(d_volume) AS d_volume,
+                   SUM(d_reps) AS d_reps
+            FROM (
+                SELECT workout_id, exercise_id, 1 AS d_sets, volume_lbs AS d_volume, reps AS d_reps
+                FROM new_rows
+                UNION ALL
+                SELECT workout_id, exercise_id, -1, -volume_lbs, -reps
+                FROM old_rows
+            ) changes
+            GROUP BY workout_id, exercise_id
+        ) d
+        WHERE d_sets <> 0 OR d_volume <> 0 OR d_reps <> 0;
+    END IF;
+    
+    IF delta_workout_ids IS NULL THEN
+        RETURN NULL;
+    END IF;
+    
+    -- Apply deltas to the exercise-count map and the workout totals.
+    -- Workouts removed by an ON DELETE CASCADE no longer exist and are skipped.
+    WITH deltas AS (
+        SELECT d.workout_id, d.exercise_id, d.d_sets, d.d_volume, d.d_reps
+        FROM unnest(delta_workout_ids, delta_exercise_ids, delta_sets, delta_volume, delta_reps)
+            AS d(workout_id, exercise_id, d_sets, d_volume, d_reps)
+        JOIN workouts w ON w.id = d.workout_id
+    ),
+    counts AS (
+        INSERT INTO workout_exercise_counts AS c (workout_id, exercise_id, set_count)
+        SELECT workout_id, exercise_id, d_sets
+        FROM deltas
+        WHERE d_sets <> 0
+        ON CONFLICT (workout_id, exercise_id)
+        DO UPDATE SET set_count = c.set_count + EXCLUDED.set_count
+        RETURNING c.workout_id, c.exercise_id, c.set_count
+    ),
+    exercise_deltas AS (
+        -- An exercise appears when its count crosses from 0 to positive and
+        -- disappears when it drops back to 0
+        SELECT counts.workout_id,
+               SUM(
+                   CASE
+                       WHEN counts.set_count > 0 AND counts.set_count - deltas.d_sets <= 0 THEN 1
+                       WHEN counts.set_count <= 0 AND counts.set_count - deltas.d_sets > 0 THEN -1
+                       ELSE 0
+                   END
+               ) AS d_exercises
+        FROM counts
+        JOIN deltas USING (workout_id, exercise_id)
+        GROUP BY counts.workout_id
+    ),
+    workout_deltas AS (
+        SELECT workout_id,
+               SUM(d_sets) AS d_sets,
+               SUM(d_volume) AS d_volume,
+               SUM(d_reps) AS d_reps
+        FROM deltas
+        GROUP BY workout_id
+    )
+    UPDATE workouts w SET
+        total_volume_lbs = COALESCE(w.total_volume_lbs, 0) + wd.d_volume,
+        total_sets = COALESCE(w.total_sets, 0) + wd.d_sets,
+        total_reps = COALESCE(w.total_reps, 0) + wd.d_reps,
+        exercises_count = COALESCE(w.exercises_count, 0) + COALESCE(ed.d_exercises, 0),
+        updated_at = NOW()
+    FROM workout_deltas wd
+    LEFT JOIN exercise_deltas ed USING (workout_id)
+    WHERE w.id = wd.workout_id;
+    
+    -- Drop exercises that no longer have any sets in the workout
+    DELETE FROM workout_exercise_counts c
+    USING unnest(delta_workout_ids, delta_exercise_ids) AS d(workout_id, exercise_id)
+    WHERE c.workout_id = d.workout_id
+      AND c.exercise_id = d.exercise_id
+      AND c.set_count <= 0;
+    
+    RETURN NULL;
 END;
 $$ LANGUAGE plpgsql;
 
--- Trigger to update workout metrics automatically
-CREATE TRIGGER trigger_update_workout_metrics
-    AFTER INSERT OR UPDATE OR DELETE ON workout_sets
-    FOR EACH ROW
+-- Statement-level triggers to update workout metrics automatically
+-- (transition tables require one trigger per event)
+CREATE TRIGGER trigger_update_workout_metrics_insert
+    AFTER INSERT ON workout_sets
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION update_workout_metrics();
+
+CREATE TRIGGER trigger_update_workout_metrics_update
+    AFTER UPDATE ON workout_sets
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT
     EXECUTE FUNCTION update_workout_metrics();
 
--- Function to update user workout count
+CREATE TRIGGER trigger_update_workout_metrics_delete
+    AFTER DELETE ON workout_sets
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION update_workout_metrics();
+
+-- Function to update user workout count.
+-- Bulk imports set fitforge.defer_workout_count for their transaction and apply
+-- a single increment at the end instead of updating the user row per workout.
 CREATE OR REPLACE FUNCTION update_user_workout_count()
 RETURNS TRIGGER AS $$
 BEGIN
+    IF current_setting('fitforge.defer_workout_count', true) = 'on' THEN
+        RETURN NEW;
+    END IF;
+    
     IF TG_OP = 'INSERT' AND NEW.is_completed = TRUE THEN
         UPDATE users SET 
             workout_count = workout_count + 1,
@@ -320,6 +573,300 @@ CREATE TRIGGER trigger_update_user_workout_count
     FOR EACH ROW
     EXECUTE FUNCTION update_user_workout_count();
 
+-- Every completed workout contributes its totals; each statement adds the
+-- contribution of completed new rows and subtracts that of completed old rows.
+-- Set writes reach this through update_workout_metrics(), which updates the
+-- workout's totals. First/last workout only grow by delta; when a completed
+-- workout leaves (delete, un-complete, moved start) they are re-read.
+CREATE OR REPLACE FUNCTION update_user_stats()
+RETURNS TRIGGER
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+    delta_user_ids UUID[];
+    delta_workouts BIGINT[];
+    delta_volume NUMERIC[];
+    delta_sets BIGINT[];
+    delta_reps BIGINT[];
+    delta_duration BIGINT[];
+    delta_timed BIGINT[];
+    entered_first TIMESTAMPTZ[];
+    entered_last TIMESTAMPTZ[];
+    stale_user_ids UUID[];
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        SELECT array_agg(user_id), array_agg(d_workouts), array_agg(d_volume), array_agg(d_sets),
+               array_agg(d_reps), array_agg(d_duration), array_agg(d_timed),
+               array_agg(first_at), array_agg(last_at)
+        INTO delta_user_ids, delta_workouts, delta_volume, delta_sets,
+             delta_reps, delta_duration, delta_timed, entered_first, entered_last
+        FROM (
+            SELECT user_id,
+                   COUNT(*) AS d_workouts,
+                   COALESCE(SUM(total_volume_lbs), 0) AS d_volume,
+                   COALESCE(SUM(total_sets), 0) AS d_sets,
+                   COALESCE(SUM(total_reps), 0) AS d_reps,
+                   COALESCE(SUM(duration_seconds), 0) AS d_duration,
+                   COUNT(duration_seconds) AS d_timed,
+                   MIN(started_at) AS first_at,
+                   MAX(started_at) AS last_at
+            FROM new_rows
+            WHERE is_completed
+            GROUP BY user_id
+        ) d;
+    ELSIF TG_OP = 'DELETE' THEN
+        SELECT array_agg(user_id), array_agg(d_workouts), array_agg(d_volume), array_agg(d_sets),
+               array_agg(d_reps), array_agg(d_duration), array_agg(d_timed),
+               array_agg(NULL::timestamptz), array_agg(NULL::timestamptz), array_agg(user_id)
+        INTO delta_user_ids, delta_workouts, delta_volume, delta_sets,
+             delta_reps, delta_duration, delta_timed, entered_first, entered_last, stale_user_ids
+        FROM (
+            SELECT user_id,
+                   -COUNT(*) AS d_workouts,
+                   -COALESCE(SUM(total_volume_lbs), 0) AS d_volume,
+                   -COALESCE(SUM(total_sets), 0) AS d_sets,
+                   -COALESCE(SUM(total_reps), 0) AS d_reps,
+                   -COALESCE(SUM(duration_seconds), 0) AS d_duration,
+                   -COUNT(duration_seconds) AS d_timed
+            FROM old_rows
+            WHERE is_completed
+            GROUP BY user_id
+        ) d;
+    ELSE
+        SELECT array_agg(user_id), array_agg(d_workouts), array_agg(d_volume), array_agg(d_sets),
+               array_agg(d_reps), array_agg(d_duration), array_agg(d_timed),
+               array_agg(first_at), array_agg(last_at),
+               array_agg(user_id) FILTER (WHERE stale)
+        INTO delta_user_ids, delta_workouts, delta_volume, delta_sets,
+             delta_reps, delta_duration, delta_timed, entered_first, entered_last, stale_user_ids
+        FROM (
+            SELECT user_id,
+                   SUM(d_workouts) AS d_workouts,
+                   SUM(d_volume) AS d_volume,
+                   SUM(d_sets) AS d_sets,
+                   SUM(d_reps) AS d_reps,
+                   SUM(d_duration) AS d_duration,
+                   SUM(d_timed) AS d_timed,
+                   MIN(entered_at) AS first_at,
+                   MAX(entered_at) AS last_at,
+                   BOOL_OR(left_range) AS stale
+            FROM (
+                -- A completed row whose start is unchanged neither enters nor leaves the date range
+                SELECT n.user_id, 1 AS d_workouts, COALESCE(n.total_volume_lbs, 0) AS d_volume,
+                       COALESCE(n.total_sets, 0) AS d_sets, COALESCE(n.total_reps, 0) AS d_reps,
+                       COALESCE(n.duration_seconds, 0) AS d_duration, (n.duration_seconds IS NOT NULL)::int AS d_timed,
+                       CASE WHEN o.id IS NULL THEN n.started_at END AS entered_at, false AS left_range
+                FROM new_rows n
+                LEFT JOIN old_rows o ON o.id = n.id AND o.is_completed AND o.started_at = n.started_at
+                WHERE n.is_completed
+                UNION ALL
+                SELECT o.user_id, -1, -COALESCE(o.total_volume_lbs, 0),
+                       -COALESCE(o.total_sets, 0), -COALESCE(o.total_reps, 0),
+                       -COALESCE(o.duration_seconds, 0), -(o.duration_seconds IS NOT NULL)::int,
+                       NULL, n.id IS NULL
+                FROM old_rows o
+                LEFT JOIN new_rows n ON n.id = o.id AND n.is_completed AND n.started_at = o.started_at
+                WHERE o.is_completed
+            ) changes
+            GROUP BY user_id
+        ) d
+        WHERE d_workouts <> 0 OR d_volume <> 0 OR d_sets <> 0 OR d_reps <> 0
+           OR d_duration <> 0 OR d_timed <> 0 OR first_at IS NOT NULL OR stale;
+    END IF;
+
+    IF delta_user_ids IS NULL THEN
+        RETURN NULL;
+    END IF;
+
+    -- Users removed by an ON DELETE CASCADE no longer exist and are skipped
+    INSERT INTO user_stats AS s (
+        user_id, total_workouts, total_volume_lbs, total_sets, total_reps,
+        total_duration_seconds, timed_workouts, first_workout_at, last_workout_at, updated_at
+    )
+    SELECT d.user_id, d.d_workouts, d.d_volume, d.d_sets, d.d_reps,
+           d.d_duration, d.d_timed, d.first_at, d.last_at, NOW()
+    FROM unnest(
+        delta_user_ids, delta_workouts, delta_volume, delta_sets, delta_reps,
+        delta_duration, delta_timed, entered_first, entered_last
+    ) AS d(user_id, d_workouts, d_volume, d_sets, d_reps, d_duration, d_timed, first_at, last_at)
+    JOIN users u ON u.id = d.user_id
+    ON CONFLICT (user_id) DO UPDATE SET
+        total_workouts = s.total_workouts + EXCLUDED.total_workouts,
+        total_volume_lbs = s.total_volume_lbs + EXCLUDED.total_volume_lbs,
+        total_sets = s.total_sets + EXCLUDED.total_sets,
+        total_reps = s.total_reps + EXCLUDED.total_reps,
+        total_duration_seconds = s.total_duration_seconds + EXCLUDED.total_duration_seconds,
+        timed_workouts = s.timed_workouts + EXCLUDED.timed_workouts,
+        first_workout_at = LEAST(s.first_workout_at, EXCLUDED.first_workout_at),
+        last_workout_at = GREATEST(s.last_workout_at, EXCLUDED.last_workout_at),
+        updated_at = NOW();
+
+    IF stale_user_ids IS NOT NULL THEN
+        UPDATE user_stats s SET (first_workout_at, last_workout_at) = (
+            SELECT MIN(w.started_at), MAX(w.started_at)
+            FROM workouts w
+            WHERE w.user_id = s.user_id AND w.is_completed
+        )
+        WHERE s.user_id = ANY(stale_user_ids);
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trigger_update_user_stats_insert
+    AFTER INSERT ON workouts
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION update_user_stats();
+
+CREATE TRIGGER trigger_update_user_stats_update
+    AFTER UPDATE ON workouts
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION update_user_stats();
+
+CREATE TRIGGER trigger_update_user_stats_delete
+    AFTER DELETE ON workouts
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION update_user_stats();
+
+-- Set count and volume move by delta. The best set is promoted when a new or
+-- changed set beats it, and re-read from workout_sets only when the current
+-- best set itself is changed or deleted. Updates that leave user, exercise,
+-- volume and time alone (metric backfills, PB flags) are ignored.
+CREATE OR REPLACE FUNCTION update_user_exercise_stats()
+RETURNS TRIGGER
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+    delta_user_ids UUID[];
+    delta_exercise_ids TEXT[];
+    delta_sets BIGINT[];
+    delta_volume NUMERIC[];
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        SELECT array_agg(user_id), array_agg(exercise_id), array_agg(d_sets), array_agg(d_volume)
+        INTO delta_user_ids, delta_exercise_ids, delta_sets, delta_volume
+        FROM (
+            SELECT user_id, exercise_id, COUNT(*) AS d_sets, COALESCE(SUM(volume_lbs), 0) AS d_volume
+            FROM new_rows
+            GROUP BY user_id, exercise_id
+        ) d;
+    ELSIF TG_OP = 'DELETE' THEN
+        SELECT array_agg(user_id), array_agg(exercise_id), array_agg(d_sets), array_agg(d_volume)
+        INTO delta_user_ids, delta_exercise_ids, delta_sets, delta_volume
+        FROM (
+            SELECT user_id, exercise_id, -COUNT(*) AS d_sets, -COALESCE(SUM(volume_lbs), 0) AS d_volume
+            FROM old_rows
+            GROUP BY user_id, exercise_id
+        ) d;
+    ELSE
+        SELECT array_agg(user_id), array_agg(exercise_id), array_agg(d_sets), array_agg(d_volume)
+        INTO delta_user_ids, delta_exercise_ids, delta_sets, delta_volume
+        FROM (
+            SELECT user_id, exercise_id, SUM(d_sets) AS d_sets, SUM(d_volume) AS d_volume
+            FROM (
+                SELECT user_id, exercise_id, 1 AS d_sets, volume_lbs AS d_volume FROM new_rows
+                UNION ALL
+                SELECT user_id, exercise_id, -1, -volume_lbs FROM old_rows
+            ) changes
+            GROUP BY user_id, exercise_id
+        ) d
+        WHERE d_sets <> 0 OR d_volume <> 0;
+    END IF;
+
+    IF delta_user_ids IS NOT NULL THEN
+        INSERT INTO user_exercise_stats AS s (user_id, exercise_id, set_count, total_volume_lbs)
+        SELECT d.user_id, d.exercise_id, d.d_sets, d.d_volume
+        FROM unnest(delta_user_ids, delta_exercise_ids, delta_sets, delta_volume)
+            AS d(user_id, exercise_id, d_sets, d_volume)
+        JOIN users u ON u.id = d.user_id
+        ON CONFLICT (user_id, exercise_id) DO UPDATE SET
+            set_count = s.set_count + EXCLUDED.set_count,
+            total_volume_lbs = s.total_volume_lbs + EXCLUDED.total_volume_lbs;
+    END IF;
+
+    -- A changed or deleted best set: re-read the best remaining set
+    IF TG_OP = 'DELETE' THEN
+        UPDATE user_exercise_stats s SET
+            (best_set_id, best_volume_lbs, best_weight_lbs, best_reps, best_set_at) = (
+                SELECT ws.id, ws.volume_lbs, ws.weight_lbs, ws.reps, ws.created_at
+                FROM workout_sets ws
+                WHERE ws.user_id = s.user_id AND ws.exercise_id = s.exercise_id
+                ORDER BY ws.volume_lbs DESC, ws.created_at DESC, ws.id DESC
+                LIMIT 1
+            )
+        FROM old_rows o
+        WHERE s.best_set_id = o.id;
+    ELSIF TG_OP = 'UPDATE' THEN
+        UPDATE user_exercise_stats s SET
+            (best_set_id, best_volume_lbs, best_weight_lbs, best_reps, best_set_at) = (
+                SELECT ws.id, ws.volume_lbs, ws.weight_lbs, ws.reps, ws.created_at
+                FROM workout_sets ws
+                WHERE ws.user_id = s.user_id AND ws.exercise_id = s.exercise_id
+                ORDER BY ws.volume_lbs DESC, ws.created_at DESC, ws.id DESC
+                LIMIT 1
+            )
+        FROM old_rows o
+        JOIN new_rows n ON n.id = o.id
+        WHERE s.best_set_id = o.id
+          AND (n.user_id, n.exercise_id, n.volume_lbs, n.created_at)
+              IS DISTINCT FROM (o.user_id, o.exercise_id, o.volume_lbs, o.created_at);
+    END IF;
+
+    IF TG_OP <> 'INSERT' THEN
+        DELETE FROM user_exercise_stats s
+        USING old_rows o
+        WHERE s.user_id = o.user_id
+          AND s.exercise_id = o.exercise_id
+          AND s.set_count <= 0;
+    END IF;
+
+    -- A new or changed set that beats the current best takes its place
+    IF TG_OP <> 'DELETE' THEN
+        UPDATE user_exercise_stats s SET
+            best_set_id = c.id,
+            best_volume_lbs = c.volume_lbs,
+            best_weight_lbs = c.weight_lbs,
+            best_reps = c.reps,
+            best_set_at = c.created_at
+        FROM (
+            SELECT DISTINCT ON (user_id, exercise_id) id, user_id, exercise_id, volume_lbs, weight_lbs, reps, created_at
+            FROM new_rows
+            ORDER BY user_id, exercise_id, volume_lbs DESC, created_at DESC, id DESC
+        ) c
+        WHERE s.user_id = c.user_id
+          AND s.exercise_id = c.exercise_id
+          AND s.best_set_id IS DISTINCT FROM c.id
+          AND (s.best_set_id IS NULL OR (c.volume_lbs, c.created_at, c.id) > (s.best_volume_lbs, s.best_set_at, s.best_set_id));
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trigger_update_user_exercise_stats_insert
+    AFTER INSERT ON workout_sets
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION update_user_exercise_stats();
+
+CREATE TRIGGER trigger_update_user_exercise_stats_update
+    AFTER UPDATE ON workout_sets
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION update_user_exercise_stats();
+
+CREATE TRIGGER trigger_update_user_exercise_stats_delete
+    AFTER DELETE ON workout_sets
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION update_user_exercise_stats();
+
 -- ============================================================================
 -- VALIDATION FUNCTIONS
 -- Ensure data integrity beyond constraints
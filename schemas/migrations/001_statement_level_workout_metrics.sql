@@ -0,0 +1,265 @@
+-- FitForge Migration 001: Statement-level workout metrics trigger
+-- Created: October 19, 2026
+-- Purpose: Replace the per-row update_workout_metrics() trigger, which re-ran four
+-- aggregate subqueries over the whole workout for every set (O(N^2) for bulk inserts),
+-- with statement-level triggers that apply deltas from transition tables.
+--
+-- Apply with: psql "$DATABASE_URL" -f schemas/migrations/001_statement_level_workout_metrics.sql
+
+BEGIN;
+
+-- ============================================================================
+-- PER-WORKOUT EXERCISE COUNT MAP
+-- Replaces COUNT(DISTINCT exercise_id) for workouts.exercises_count
+-- ============================================================================
+CREATE TABLE IF NOT EXISTS workout_exercise_counts (
+    workout_id UUID NOT NULL REFERENCES workouts(id) ON DELETE CASCADE,
+    exercise_id TEXT NOT NULL,
+    set_count INTEGER NOT NULL DEFAULT 0,
+    
+    PRIMARY KEY (workout_id, exercise_id)
+);
+
+-- Supabase only: exercise counts are trigger-maintained, users can only read their own
+DO $$
+BEGIN
+    IF to_regprocedure('auth.uid()') IS NOT NULL THEN
+        ALTER TABLE workout_exercise_counts ENABLE ROW LEVEL SECURITY;
+        DROP POLICY IF EXISTS "Users can view own workout exercise counts" ON workout_exercise_counts;
+        CREATE POLICY "Users can view own workout exercise counts" ON workout_exercise_counts FOR SELECT USING (
+            EXISTS (SELECT 1 FROM workouts w WHERE w.id = workout_id AND w.user_id = auth.uid())
+        );
+    END IF;
+END;
+$$;
+
+-- ============================================================================
+-- REPLACE ROW-LEVEL TRIGGER
+-- ============================================================================
+DROP TRIGGER IF EXISTS trigger_update_workout_metrics ON workout_sets;
+DROP TRIGGER IF EXISTS trigger_update_workout_metrics_insert ON workout_sets;
+DROP TRIGGER IF EXISTS trigger_update_workout_metrics_update ON workout_sets;
+DROP TRIGGER IF EXISTS trigger_update_workout_metrics_delete ON workout_sets;
+
+-- Function to update workout metrics when sets are added/updated/deleted.
+-- Runs once per statement and applies deltas from the transition tables, so a
+-- bulk insert of N sets costs O(N) instead of re-aggregating the workout per row.
+CREATE OR REPLACE FUNCTION update_workout_metrics()
+RETURNS TRIGGER
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+    delta_workout_ids UUID[];
+    delta_exercise_ids TEXT[];
+    delta_sets BIGINT[];
+    delta_volume NUMERIC[];
+    delta_reps BIGINT[];
+BEGIN
+    -- Inserts only add sets, so they take a shorter path straight off new_rows:
+    -- every count they touch ends up positive, an exercise is new to the workout
+    -- exactly when its count row is created, and the workout cannot be in the
+    -- middle of a cascade delete. A single-set insert, the app's most common
+    -- write, then runs one statement instead of two.
+    IF TG_OP = 'INSERT' THEN
+        WITH deltas AS (
+            SELECT workout_id, exercise_id,
+                   COUNT(*) AS d_sets,
+                   COALESCE(SUM(volume_lbs), 0) AS d_volume,
+                   COALESCE(SUM(reps), 0) AS d_reps
+            FROM new_rows
+            GROUP BY workout_id, exercise_id
+        ),
+        counts AS (
+            INSERT INTO workout_exercise_counts AS c (workout_id, exercise_id, set_count)
+            SELECT workout_id, exercise_id, d_sets
+            FROM deltas
+            ON CONFLICT (workout_id, exercise_id)
+            DO UPDATE SET set_count = c.set_count + EXCLUDED.set_count
+            RETURNING c.workout_id, c.exercise_id, c.set_count
+        ),
+        exercise_deltas AS (
+            SELECT counts.workout_id, COUNT(*) AS d_exercises
+            FROM counts
+            JOIN deltas USING (workout_id, exercise_id)
+            WHERE counts.set_count = deltas.d_sets
+            GROUP BY counts.workout_id
+        ),
+        workout_deltas AS (
+            SELECT workout_id,
+                   SUM(d_sets) AS d_sets,
+                   SUM(d_volume) AS d_volume,
+                   SUM(d_reps) AS d_reps
+            FROM deltas
+            GROUP BY workout_id
+        )
+        UPDATE workouts w SET
+            total_volume_lbs = COALESCE(w.total_volume_lbs, 0) + wd.d_volume,
+            total_sets = COALESCE(w.total_sets, 0) + wd.d_sets,
+            total_reps = COALESCE(w.total_reps, 0) + wd.d_reps,
+            exercises_count = COALESCE(w.exercises_count, 0) + COALESCE(ed.d_exercises, 0),
+            updated_at = NOW()
+        FROM workout_deltas wd
+        LEFT JOIN exercise_deltas ed USING (workout_id)
+        WHERE w.id = wd.workout_id;
+        
+        RETURN NULL;
+    END IF;
+    
+    -- Collapse the affected rows into one delta per (workout, exercise)
+    IF TG_OP = 'DELETE' THEN
+        SELECT array_agg(workout_id), array_agg(exercise_id),
+               array_agg(d_sets), array_agg(d_volume), array_agg(d_reps)
+        INTO delta_workout_ids, delta_exercise_ids, delta_sets, delta_volume, delta_reps
+        FROM (
+            SELECT workout_id, exercise_id,
+                   -COUNT(*) AS d_sets,
+                   -COALESCE(SUM(volume_lbs), 0) AS d_volume,
+                   -COALESCE(SUM(reps), 0) AS d_reps
+            FROM old_rows
+            GROUP BY workout_id, exercise_id
+        ) d;
+    ELSE
+        SELECT array_agg(workout_id), array_agg(exercise_id),
+               array_agg(d_sets), array_agg(d_volume), array_agg(d_reps)
+        INTO delta_workout_ids, delta_exercise_ids, delta_sets, delta_volume, delta_reps
+        FROM (
+            SELECT workout_id, exercise_id,
+                   SUM(d_sets) AS d_sets,
+                   SUM(d_volume) AS d_volume,
+                   SUM(d_reps) AS d_reps
+            FROM (
+                SELECT workout_id, exercise_id, 1 AS d_sets, volume_lbs AS d_volume, reps AS d_reps
+                FROM new_rows
+                UNION ALL
+                SELECT workout_id, exercise_id, -1, -volume_lbs, -reps
+                FROM old_rows
+            ) changes
+            GROUP BY workout_id, exercise_id
+        ) d
+        WHERE d_sets <> 0 OR d_volume <> 0 OR d_reps <> 0;
+    END IF;
+    
+    IF delta_workout_ids IS NULL THEN
+        RETURN NULL;
+    END IF;
+    
+    -- Apply deltas to the exercise-count map and the workout totals.
+    -- Workouts removed by an ON DELETE CASCADE no longer exist and are skipped.
+    WITH deltas AS (
+        SELECT d.workout_id, d.exercise_id, d.d_sets, d.d_volume, d.d_reps
+        FROM unnest(delta_workout_ids, delta_exercise_ids, delta_sets, delta_volume, delta_reps)
+            AS d(workout_id, exercise_id, d_sets, d_volume, d_reps)
+        JOIN workouts w ON w.id = d.workout_id
+    ),
+    counts AS (
+        INSERT INTO workout_exercise_counts AS c (workout_id, exercise_id, set_count)
+        SELECT workout_id, exercise_id, d_sets
+        FROM deltas
+        WHERE d_sets <> 0
+        ON CONFLICT (workout_id, exercise_id)
+        DO UPDATE SET set_count = c.set_count + EXCLUDED.set_count
+        RETURNING c.workout_id, c.exercise_id, c.set_count
+    ),
+    exercise_deltas AS (
+        -- An exercise appears when its count crosses from 0 to positive and
+        -- disappears when it drops back to 0
+        SELECT counts.workout_id,
+               SUM(
+                   CASE
+                       WHEN counts.set_count > 0 AND counts.set_count - deltas.d_sets <= 0 THEN 1
+                       WHEN counts.set_count <= 0 AND counts.set_count - deltas.d_sets > 0 THEN -1
+                       ELSE 0
+                   END
+               ) AS d_exercises
+        FROM counts
+        JOIN deltas USING (workout_id, exercise_id)
+        GROUP BY counts.workout_id
+    ),
+    workout_deltas AS (
+        SELECT workout_id,
+               SUM(d_sets) AS d_sets,
+               SUM(d_volume) AS d_volume,
+               SUM(d_reps) AS d_reps
+        FROM deltas
+        GROUP BY workout_id
+    )
+    UPDATE workouts w SET
+        total_volume_lbs = COALESCE(w.total_volume_lbs, 0) + wd.d_volume,
+        total_sets = COALESCE(w.total_sets, 0) + wd.d_sets,
+        total_reps = COALESCE(w.total_reps, 0) + wd.d_reps,
+        exercises_count = COALESCE(w.exercises_count, 0) + COALESCE(ed.d_exercises, 0),
+        updated_at = NOW()
+    FROM workout_deltas wd
+    LEFT JOIN exercise_deltas ed USING (workout_id)
+    WHERE w.id = wd.workout_id;
+    
+    -- Drop exercises that no longer have any sets in the workout
+    DELETE FROM workout_exercise_counts c
+    USING unnest(delta_workout_ids, delta_exercise_ids) AS d(workout_id, exercise_id)
+    WHERE c.workout_id = d.workout_id
+      AND c.exercise_id = d.exercise_id
+      AND c.set_count <= 0;
+    
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Statement-level triggers to update workout metrics automatically
+-- (transition tables require one trigger per event)
+CREATE TRIGGER trigger_update_workout_metrics_insert
+    AFTER INSERT ON workout_sets
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION update_workout_metrics();
+
+CREATE TRIGGER trigger_update_workout_metrics_update
+    AFTER UPDATE ON workout_sets
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION update_workout_metrics();
+
+CREATE TRIGGER trigger_update_workout_metrics_delete
+    AFTER DELETE ON workout_sets
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION update_workout_metrics();
+
+
+-- ============================================================================
+-- BACKFILL
+-- Seed the count map and resync totals once so deltas start from a true baseline
+-- ============================================================================
+LOCK TABLE workout_sets IN SHARE MODE;
+
+TRUNCATE workout_exercise_counts;
+
+INSERT INTO workout_exercise_counts (workout_id, exercise_id, set_count)
+SELECT workout_id, exercise_id, COUNT(*)
+FROM workout_sets
+GROUP BY workout_id, exercise_id;
+
+UPDATE workouts w SET
+    total_volume_lbs = COALESCE(agg.total_volume, 0),
+    total_sets = COALESCE(agg.total_sets, 0),
+    total_reps = COALESCE(agg.total_reps, 0),
+    exercises_count = COALESCE(agg.exercises_count, 0)
+FROM workouts w2
+LEFT JOIN (
+    SELECT workout_id,
+           SUM(volume_lbs) AS total_volume,
+           COUNT(*) AS total_sets,
+           SUM(reps) AS total_reps,
+           COUNT(DISTINCT exercise_id) AS exercises_count
+    FROM workout_sets
+    GROUP BY workout_id
+) agg ON agg.workout_id = w2.id
+WHERE w.id = w2.id
+  AND (
+      w.total_volume_lbs IS DISTINCT FROM COALESCE(agg.total_volume, 0)
+      OR w.total_sets IS DISTINCT FROM COALESCE(agg.total_sets, 0)
+      OR w.total_reps IS DISTINCT FROM COALESCE(agg.total_reps, 0)
+      OR w.exercises_count IS DISTINCT FROM COALESCE(agg.exercises_count, 0)
+  );
+
+COMMIT;
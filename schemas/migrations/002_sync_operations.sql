@@ -0,0 +1,36 @@
+-- FitForge Migration 002: Offline sync idempotency keys
+-- Created: October 19, 2026
+-- Purpose: Track the idempotency keys applied by POST /api/sync so a reconnecting
+-- client can replay its whole offline queue and only new operations are applied.
+--
+-- Apply with: psql "$DATABASE_URL" -f schemas/migrations/002_sync_operations.sql
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS sync_operations (
+    user_id UUID NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+    idempotency_key TEXT NOT NULL CHECK (length(idempotency_key) BETWEEN 1 AND 128),
+    operation_type TEXT NOT NULL CHECK (operation_type IN ('workout.create', 'set.create', 'workout.complete')),
+
+    -- Compact result returned again when the client replays the same key
+    result JSONB NOT NULL DEFAULT '{}',
+    applied_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+
+    PRIMARY KEY (user_id, idempotency_key)
+);
+
+CREATE INDEX IF NOT EXISTS idx_sync_operations_applied_at ON sync_operations(applied_at);
+
+-- Row level security only exists on Supabase (auth.uid()); skip it on plain PostgreSQL
+DO $$
+BEGIN
+    IF to_regprocedure('auth.uid()') IS NOT NULL THEN
+        ALTER TABLE sync_operations ENABLE ROW LEVEL SECURITY;
+        DROP POLICY IF EXISTS "Users can view own sync operations" ON sync_operations;
+        CREATE POLICY "Users can view own sync operations" ON sync_operations
+            FOR SELECT USING (auth.uid() = user_id);
+    END IF;
+END;
+$$;
+
+COMMIT;
@@ -0,0 +1,47 @@
+-- FitForge Migration 003: Deferrable workout count trigger for bulk imports
+-- Created: October 19, 2026
+-- Purpose: Let POST /api/users/me/import (and scripts/import_workouts.py) insert
+-- thousands of historical workouts without a per-row UPDATE of the user row.
+-- The importer sets fitforge.defer_workout_count = 'on' with SET LOCAL and
+-- applies one workout_count increment when the merge is done.
+--
+-- Apply with: psql "$DATABASE_URL" -f schemas/migrations/003_deferrable_workout_count.sql
+
+BEGIN;
+
+CREATE OR REPLACE FUNCTION update_user_workout_count()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF current_setting('fitforge.defer_workout_count', true) = 'on' THEN
+        RETURN NEW;
+    END IF;
+    
+    IF TG_OP = 'INSERT' AND NEW.is_completed = TRUE THEN
+        UPDATE users SET 
+            workout_count = workout_count + 1,
+            feature_level = CASE 
+                WHEN workout_count + 1 >= 20 THEN 4
+                WHEN workout_count + 1 >= 10 THEN 3
+                WHEN workout_count + 1 >= 3 THEN 2
+                ELSE 1
+            END,
+            last_active_at = NOW()
+        WHERE id = NEW.user_id;
+    ELSIF TG_OP = 'UPDATE' AND OLD.is_completed = FALSE AND NEW.is_completed = TRUE THEN
+        UPDATE users SET 
+            workout_count = workout_count + 1,
+            feature_level = CASE 
+                WHEN workout_count + 1 >= 20 THEN 4
+                WHEN workout_count + 1 >= 10 THEN 3
+                WHEN workout_count + 1 >= 3 THEN 2
+                ELSE 1
+            END,
+            last_active_at = NOW()
+        WHERE id = NEW.user_id;
+    END IF;
+    
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+COMMIT;
@@ -0,0 +1,44 @@
+-- FitForge Migration 004: Background job queue
+-- Created: October 19, 2026
+-- Purpose: Durable queue for post-completion work (personal best repair, muscle
+-- state rollups). POST /api/workouts/{id}/complete inserts jobs in the same
+-- statement that completes the workout; backend workers claim them with
+-- FOR UPDATE SKIP LOCKED.
+--
+-- Apply with: psql "$DATABASE_URL" -f schemas/migrations/004_background_jobs.sql
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS background_jobs (
+    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    job_type TEXT NOT NULL,
+    payload JSONB NOT NULL DEFAULT '{}',
+
+    -- Lifecycle: pending -> running -> done, or back to pending for a retry, or failed
+    status TEXT NOT NULL DEFAULT 'pending' CHECK (status IN ('pending', 'running', 'done', 'failed')),
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL DEFAULT 5 CHECK (max_attempts > 0),
+    last_error TEXT,
+
+    -- Scheduling: not claimable before run_after; a running job is reclaimable after locked_until
+    run_after TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    locked_until TIMESTAMPTZ,
+
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    started_at TIMESTAMPTZ,
+    finished_at TIMESTAMPTZ
+);
+
+CREATE INDEX IF NOT EXISTS idx_background_jobs_claim ON background_jobs(run_after) WHERE status IN ('pending', 'running');
+CREATE INDEX IF NOT EXISTS idx_background_jobs_finished ON background_jobs(finished_at) WHERE status = 'done';
+
+-- Internal to the backend: on Supabase enable RLS with no user policies
+DO $$
+BEGIN
+    IF to_regprocedure('auth.uid()') IS NOT NULL THEN
+        ALTER TABLE background_jobs ENABLE ROW LEVEL SECURITY;
+    END IF;
+END;
+$$;
+
+COMMIT;
@@ -0,0 +1,409 @@
+-- FitForge Migration 005: Incrementally maintained user statistics
+-- Created: October 19, 2026
+-- Purpose: GET /api/users/me/stats re-aggregated every workout and set of the
+-- user on each call. user_stats (lifetime totals over completed workouts) and
+-- user_exercise_stats (per-exercise set count, volume and best set) are kept
+-- current by statement-level triggers that apply deltas from transition
+-- tables, the same approach as update_workout_metrics(). A periodic backend
+-- job (user_stats.reconcile) recomputes both from source rows and fixes drift.
+--
+-- Apply with: psql "$DATABASE_URL" -f schemas/migrations/005_user_stats.sql
+
+BEGIN;
+
+-- ============================================================================
+-- SUMMARY TABLES
+-- ============================================================================
+CREATE TABLE IF NOT EXISTS user_stats (
+    user_id UUID PRIMARY KEY REFERENCES users(id) ON DELETE CASCADE,
+
+    -- Sums over completed workouts (workouts.total_* are themselves trigger-maintained)
+    total_workouts INTEGER NOT NULL DEFAULT 0,
+    total_volume_lbs NUMERIC(14,2) NOT NULL DEFAULT 0,
+    total_sets BIGINT NOT NULL DEFAULT 0,
+    total_reps BIGINT NOT NULL DEFAULT 0,
+    total_duration_seconds BIGINT NOT NULL DEFAULT 0,
+    timed_workouts INTEGER NOT NULL DEFAULT 0, -- Completed workouts with a duration, for the average
+    first_workout_at TIMESTAMPTZ,
+    last_workout_at TIMESTAMPTZ,
+
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE TABLE IF NOT EXISTS user_exercise_stats (
+    user_id UUID NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+    exercise_id TEXT NOT NULL REFERENCES exercises(id),
+
+    -- Over all of the user's sets of the exercise
+    set_count INTEGER NOT NULL DEFAULT 0,
+    total_volume_lbs NUMERIC(14,2) NOT NULL DEFAULT 0,
+
+    -- Highest-volume set, latest first on ties
+    best_set_id UUID,
+    best_volume_lbs NUMERIC(8,2),
+    best_weight_lbs NUMERIC(6,2),
+    best_reps INTEGER,
+    best_set_at TIMESTAMPTZ,
+
+    PRIMARY KEY (user_id, exercise_id)
+);
+
+-- Supabase only: both tables are trigger-maintained, users can only read their own
+DO $$
+BEGIN
+    IF to_regprocedure('auth.uid()') IS NOT NULL THEN
+        ALTER TABLE user_stats ENABLE ROW LEVEL SECURITY;
+        ALTER TABLE user_exercise_stats ENABLE ROW LEVEL SECURITY;
+        DROP POLICY IF EXISTS "Users can view own stats" ON user_stats;
+        CREATE POLICY "Users can view own stats" ON user_stats FOR SELECT USING (auth.uid() = user_id);
+        DROP POLICY IF EXISTS "Users can view own exercise stats" ON user_exercise_stats;
+        CREATE POLICY "Users can view own exercise stats" ON user_exercise_stats FOR SELECT USING (auth.uid() = user_id);
+    END IF;
+END;
+$$;
+
+-- ============================================================================
+-- USER TOTALS FROM WORKOUTS
+-- ============================================================================
+
+-- Every completed workout contributes its totals; each statement adds the
+-- contribution of completed new rows and subtracts that of completed old rows.
+-- Set writes reach this through update_workout_metrics(), which updates the
+-- workout's totals. First/last workout only grow by delta; when a completed
+-- workout leaves (delete, un-complete, moved start) they are re-read.
+CREATE OR REPLACE FUNCTION update_user_stats()
+RETURNS TRIGGER
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+    delta_user_ids UUID[];
+    delta_workouts BIGINT[];
+    delta_volume NUMERIC[];
+    delta_sets BIGINT[];
+    delta_reps BIGINT[];
+    delta_duration BIGINT[];
+    delta_timed BIGINT[];
+    entered_first TIMESTAMPTZ[];
+    entered_last TIMESTAMPTZ[];
+    stale_user_ids UUID[];
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        SELECT array_agg(user_id), array_agg(d_workouts), array_agg(d_volume), array_agg(d_sets),
+               array_agg(d_reps), array_agg(d_duration), array_agg(d_timed),
+               array_agg(first_at), array_agg(last_at)
+        INTO delta_user_ids, delta_workouts, delta_volume, delta_sets,
+             delta_reps, delta_duration, delta_timed, entered_first, entered_last
+        FROM (
+            SELECT user_id,
+                   COUNT(*) AS d_workouts,
+                   COALESCE(SUM(total_volume_lbs), 0) AS d_volume,
+                   COALESCE(SUM(total_sets), 0) AS d_sets,
+                   COALESCE(SUM(total_reps), 0) AS d_reps,
+                   COALESCE(SUM(duration_seconds), 0) AS d_duration,
+                   COUNT(duration_seconds) AS d_timed,
+                   MIN(started_at) AS first_at,
+                   MAX(started_at) AS last_at
+            FROM new_rows
+            WHERE is_completed
+            GROUP BY user_id
+        ) d;
+    ELSIF TG_OP = 'DELETE' THEN
+        SELECT array_agg(user_id), array_agg(d_workouts), array_agg(d_volume), array_agg(d_sets),
+               array_agg(d_reps), array_agg(d_duration), array_agg(d_timed),
+               array_agg(NULL::timestamptz), array_agg(NULL::timestamptz), array_agg(user_id)
+        INTO delta_user_ids, delta_workouts, delta_volume, delta_sets,
+             delta_reps, delta_duration, delta_timed, entered_first, entered_last, stale_user_ids
+        FROM (
+            SELECT user_id,
+                   -COUNT(*) AS d_workouts,
+                   -COALESCE(SUM(total_volume_lbs), 0) AS d_volume,
+                   -COALESCE(SUM(total_sets), 0) AS d_sets,
+                   -COALESCE(SUM(total_reps), 0) AS d_reps,
+                   -COALESCE(SUM(duration_seconds), 0) AS d_duration,
+                   -COUNT(duration_seconds) AS d_timed
+            FROM old_rows
+            WHERE is_completed
+            GROUP BY user_id
+        ) d;
+    ELSE
+        SELECT array_agg(user_id), array_agg(d_workouts), array_agg(d_volume), array_agg(d_sets),
+               array_agg(d_reps), array_agg(d_duration), array_agg(d_timed),
+               array_agg(first_at), array_agg(last_at),
+               array_agg(user_id) FILTER (WHERE stale)
+        INTO delta_user_ids, delta_workouts, delta_volume, delta_sets,
+             delta_reps, delta_duration, delta_timed, entered_first, entered_last, stale_user_ids
+        FROM (
+            SELECT user_id,
+                   SUM(d_workouts) AS d_workouts,
+                   SUM(d_volume) AS d_volume,
+                   SUM(d_sets) AS d_sets,
+                   SUM(d_reps) AS d_reps,
+                   SUM(d_duration) AS d_duration,
+                   SUM(d_timed) AS d_timed,
+                   MIN(entered_at) AS first_at,
+                   MAX(entered_at) AS last_at,
+                   BOOL_OR(left_range) AS stale
+            FROM (
+                -- A completed row whose start is unchanged neither enters nor leaves the date range
+                SELECT n.user_id, 1 AS d_workouts, COALESCE(n.total_volume_lbs, 0) AS d_volume,
+                       COALESCE(n.total_sets, 0) AS d_sets, COALESCE(n.total_reps, 0) AS d_reps,
+                       COALESCE(n.duration_seconds, 0) AS d_duration, (n.duration_seconds IS NOT NULL)::int AS d_timed,
+                       CASE WHEN o.id IS NULL THEN n.started_at END AS entered_at, false AS left_range
+                FROM new_rows n
+                LEFT JOIN old_rows o ON o.id = n.id AND o.is_completed AND o.started_at = n.started_at
+                WHERE n.is_completed
+                UNION ALL
+                SELECT o.user_id, -1, -COALESCE(o.total_volume_lbs, 0),
+                       -COALESCE(o.total_sets, 0), -COALESCE(o.total_reps, 0),
+                       -COALESCE(o.duration_seconds, 0), -(o.duration_seconds IS NOT NULL)::int,
+                       NULL, n.id IS NULL
+                FROM old_rows o
+                LEFT JOIN new_rows n ON n.id = o.id AND n.is_completed AND n.started_at = o.started_at
+                WHERE o.is_completed
+            ) changes
+            GROUP BY user_id
+        ) d
+        WHERE d_workouts <> 0 OR d_volume <> 0 OR d_sets <> 0 OR d_reps <> 0
+           OR d_duration <> 0 OR d_timed <> 0 OR first_at IS NOT NULL OR stale;
+    END IF;
+
+    IF delta_user_ids IS NULL THEN
+        RETURN NULL;
+    END IF;
+
+    -- Users removed by an ON DELETE CASCADE no longer exist and are skipped
+    INSERT INTO user_stats AS s (
+        user_id, total_workouts, total_volume_lbs, total_sets, total_reps,
+        total_duration_seconds, timed_workouts, first_workout_at, last_workout_at, updated_at
+    )
+    SELECT d.user_id, d.d_workouts, d.d_volume, d.d_sets, d.d_reps,
+           d.d_duration, d.d_timed, d.first_at, d.last_at, NOW()
+    FROM unnest(
+        delta_user_ids, delta_workouts, delta_volume, delta_sets, delta_reps,
+        delta_duration, delta_timed, entered_first, entered_last
+    ) AS d(user_id, d_workouts, d_volume, d_sets, d_reps, d_duration, d_timed, first_at, last_at)
+    JOIN users u ON u.id = d.user_id
+    ON CONFLICT (user_id) DO UPDATE SET
+        total_workouts = s.total_workouts + EXCLUDED.total_workouts,
+        total_volume_lbs = s.total_volume_lbs + EXCLUDED.total_volume_lbs,
+        total_sets = s.total_sets + EXCLUDED.total_sets,
+        total_reps = s.total_reps + EXCLUDED.total_reps,
+        total_duration_seconds = s.total_duration_seconds + EXCLUDED.total_duration_seconds,
+        timed_workouts = s.timed_workouts + EXCLUDED.timed_workouts,
+        first_workout_at = LEAST(s.first_workout_at, EXCLUDED.first_workout_at),
+        last_workout_at = GREATEST(s.last_workout_at, EXCLUDED.last_workout_at),
+        updated_at = NOW();
+
+    IF stale_user_ids IS NOT NULL THEN
+        UPDATE user_stats s SET (first_workout_at, last_workout_at) = (
+            SELECT MIN(w.started_at), MAX(w.started_at)
+            FROM workouts w
+            WHERE w.user_id = s.user_id AND w.is_completed
+        )
+        WHERE s.user_id = ANY(stale_user_ids);
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trigger_update_user_stats_insert ON workouts;
+DROP TRIGGER IF EXISTS trigger_update_user_stats_update ON workouts;
+DROP TRIGGER IF EXISTS trigger_update_user_stats_delete ON workouts;
+
+CREATE TRIGGER trigger_update_user_stats_insert
+    AFTER INSERT ON workouts
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION update_user_stats();
+
+CREATE TRIGGER trigger_update_user_stats_update
+    AFTER UPDATE ON workouts
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION update_user_stats();
+
+CREATE TRIGGER trigger_update_user_stats_delete
+    AFTER DELETE ON workouts
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION update_user_stats();
+
+-- ============================================================================
+-- PER-EXERCISE STATS FROM SETS
+-- ============================================================================
+
+-- Set count and volume move by delta. The best set is promoted when a new or
+-- changed set beats it, and re-read from workout_sets only when the current
+-- best set itself is changed or deleted. Updates that leave user, exercise,
+-- volume and time alone (metric backfills, PB flags) are ignored.
+CREATE OR REPLACE FUNCTION update_user_exercise_stats()
+RETURNS TRIGGER
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+    delta_user_ids UUID[];
+    delta_exercise_ids TEXT[];
+    delta_sets BIGINT[];
+    delta_volume NUMERIC[];
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        SELECT array_agg(user_id), array_agg(exercise_id), array_agg(d_sets), array_agg(d_volume)
+        INTO delta_user_ids, delta_exercise_ids, delta_sets, delta_volume
+        FROM (
+            SELECT user_id, exercise_id, COUNT(*) AS d_sets, COALESCE(SUM(volume_lbs), 0) AS d_volume
+            FROM new_rows
+            GROUP BY user_id, exercise_id
+        ) d;
+    ELSIF TG_OP = 'DELETE' THEN
+        SELECT array_agg(user_id), array_agg(exercise_id), array_agg(d_sets), array_agg(d_volume)
+        INTO delta_user_ids, delta_exercise_ids, delta_sets, delta_volume
+        FROM (
+            SELECT user_id, exercise_id, -COUNT(*) AS d_sets, -COALESCE(SUM(volume_lbs), 0) AS d_volume
+            FROM old_rows
+            GROUP BY user_id, exercise_id
+        ) d;
+    ELSE
+        SELECT array_agg(user_id), array_agg(exercise_id), array_agg(d_sets), array_agg(d_volume)
+        INTO delta_user_ids, delta_exercise_ids, delta_sets, delta_volume
+        FROM (
+            SELECT user_id, exercise_id, SUM(d_sets) AS d_sets, SUM(d_volume) AS d_volume
+            FROM (
+                SELECT user_id, exercise_id, 1 AS d_sets, volume_lbs AS d_volume FROM new_rows
+                UNION ALL
+                SELECT user_id, exercise_id, -1, -volume_lbs FROM old_rows
+            ) changes
+            GROUP BY user_id, exercise_id
+        ) d
+        WHERE d_sets <> 0 OR d_volume <> 0;
+    END IF;
+
+    IF delta_user_ids IS NOT NULL THEN
+        INSERT INTO user_exercise_stats AS s (user_id, exercise_id, set_count, total_volume_lbs)
+        SELECT d.user_id, d.exercise_id, d.d_sets, d.d_volume
+        FROM unnest(delta_user_ids, delta_exercise_ids, delta_sets, delta_volume)
+            AS d(user_id, exercise_id, d_sets, d_volume)
+        JOIN users u ON u.id = d.user_id
+        ON CONFLICT (user_id, exercise_id) DO UPDATE SET
+            set_count = s.set_count + EXCLUDED.set_count,
+            total_volume_lbs = s.total_volume_lbs + EXCLUDED.total_volume_lbs;
+    END IF;
+
+    -- A changed or deleted best set: re-read the best remaining set
+    IF TG_OP = 'DELETE' THEN
+        UPDATE user_exercise_stats s SET
+            (best_set_id, best_volume_lbs, best_weight_lbs, best_reps, best_set_at) = (
+                SELECT ws.id, ws.volume_lbs, ws.weight_lbs, ws.reps, ws.created_at
+                FROM workout_sets ws
+                WHERE ws.user_id = s.user_id AND ws.exercise_id = s.exercise_id
+                ORDER BY ws.volume_lbs DESC, ws.created_at DESC, ws.id DESC
+                LIMIT 1
+            )
+        FROM old_rows o
+        WHERE s.best_set_id = o.id;
+    ELSIF TG_OP = 'UPDATE' THEN
+        UPDATE user_exercise_stats s SET
+            (best_set_id, best_volume_lbs, best_weight_lbs, best_reps, best_set_at) = (
+                SELECT ws.id, ws.volume_lbs, ws.weight_lbs, ws.reps, ws.created_at
+                FROM workout_sets ws
+                WHERE ws.user_id = s.user_id AND ws.exercise_id = s.exercise_id
+                ORDER BY ws.volume_lbs DESC, ws.created_at DESC, ws.id DESC
+                LIMIT 1
+            )
+        FROM old_rows o
+        JOIN new_rows n ON n.id = o.id
+        WHERE s.best_set_id = o.id
+          AND (n.user_id, n.exercise_id, n.volume_lbs, n.created_at)
+              IS DISTINCT FROM (o.user_id, o.exercise_id, o.volume_lbs, o.created_at);
+    END IF;
+
+    IF TG_OP <> 'INSERT' THEN
+        DELETE FROM user_exercise_stats s
+        USING old_rows o
+        WHERE s.user_id = o.user_id
+          AND s.exercise_id = o.exercise_id
+          AND s.set_count <= 0;
+    END IF;
+
+    -- A new or changed set that beats the current best takes its place
+    IF TG_OP <> 'DELETE' THEN
+        UPDATE user_exercise_stats s SET
+            best_set_id = c.id,
+            best_volume_lbs = c.volume_lbs,
+            best_weight_lbs = c.weight_lbs,
+            best_reps = c.reps,
+            best_set_at = c.created_at
+        FROM (
+            SELECT DISTINCT ON (user_id, exercise_id) id, user_id, exercise_id, volume_lbs, weight_lbs, reps, created_at
+            FROM new_rows
+            ORDER BY user_id, exercise_id, volume_lbs DESC, created_at DESC, id DESC
+        ) c
+        WHERE s.user_id = c.user_id
+          AND s.exercise_id = c.exercise_id
+          AND s.best_set_id IS DISTINCT FROM c.id
+          AND (s.best_set_id IS NULL OR (c.volume_lbs, c.created_at, c.id) > (s.best_volume_lbs, s.best_set_at, s.best_set_id));
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trigger_update_user_exercise_stats_insert ON workout_sets;
+DROP TRIGGER IF EXISTS trigger_update_user_exercise_stats_update ON workout_sets;
+DROP TRIGGER IF EXISTS trigger_update_user_exercise_stats_delete ON workout_sets;
+
+CREATE TRIGGER trigger_update_user_exercise_stats_insert
+    AFTER INSERT ON workout_sets
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION update_user_exercise_stats();
+
+CREATE TRIGGER trigger_update_user_exercise_stats_update
+    AFTER UPDATE ON workout_sets
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION update_user_exercise_stats();
+
+CREATE TRIGGER trigger_update_user_exercise_stats_delete
+    AFTER DELETE ON workout_sets
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION update_user_exercise_stats();
+
+-- ============================================================================
+-- INITIAL POPULATION
+-- Same aggregates as the user_stats.reconcile job
+-- ============================================================================
+INSERT INTO user_stats (
+    user_id, total_workouts, total_volume_lbs, total_sets, total_reps,
+    total_duration_seconds, timed_workouts, first_workout_at, last_workout_at
+)
+SELECT user_id, COUNT(*), COALESCE(SUM(total_volume_lbs), 0), COALESCE(SUM(total_sets), 0),
+       COALESCE(SUM(total_reps), 0), COALESCE(SUM(duration_seconds), 0), COUNT(duration_seconds),
+       MIN(started_at), MAX(started_at)
+FROM workouts
+WHERE is_completed
+GROUP BY user_id
+ON CONFLICT (user_id) DO NOTHING;
+
+INSERT INTO user_exercise_stats (
+    user_id, exercise_id, set_count, total_volume_lbs,
+    best_set_id, best_volume_lbs, best_weight_lbs, best_reps, best_set_at
+)
+SELECT totals.user_id, totals.exercise_id, totals.set_count, totals.total_volume_lbs,
+       best.id, best.volume_lbs, best.weight_lbs, best.reps, best.created_at
+FROM (
+    SELECT user_id, exercise_id, COUNT(*) AS set_count, COALESCE(SUM(volume_lbs), 0) AS total_volume_lbs
+    FROM workout_sets
+    GROUP BY user_id, exercise_id
+) totals
+JOIN (
+    SELECT DISTINCT ON (user_id, exercise_id) id, user_id, exercise_id, volume_lbs, weight_lbs, reps, created_at
+    FROM workout_sets
+    ORDER BY user_id, exercise_id, volume_lbs DESC, created_at DESC, id DESC
+) best USING (user_id, exercise_id)
+ON CONFLICT (user_id, exercise_id) DO NOTHING;
+
+COMMIT;